@@ -2,7 +2,7 @@
 
 import logging
 from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
@@ -10,12 +10,19 @@ from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserProm
 from app.agents.core.base import BaseAgent, ToolFunction
 from app.agents.core.dependencies import AgentDependencies
 from app.agents.core.event_stream.base import EventContext, EventStreamProcessor
+from app.agents.core.event_stream.text import TextStreamHandler
 from app.agents.core.event_stream.thinking import ThinkingHandler
 from app.agents.core.event_stream.tools import ToolEventHandler
-from app.agents.core.types import AgentType
+from app.agents.core.types import AgentType, PromptLayout
+from app.events.base import BaseCommand
 from app.events.commands.broadcast_commands import BroadcastNarrativeCommand
 from app.interfaces.events import IEventBus
-from app.interfaces.services.ai import IEventLoggerService, IToolCallExtractorService
+from app.interfaces.services.ai import (
+    IContextService,
+    IEventLoggerService,
+    IHistoryWindowService,
+    IToolCallExtractorService,
+)
 from app.interfaces.services.common import IActionService
 from app.interfaces.services.data import IRepositoryProvider
 from app.interfaces.services.game import (
@@ -29,6 +36,7 @@ from app.models.ai_response import NarrativeResponse, StreamEvent, StreamEventTy
 from app.models.game_state import GameState, MessageRole
 from app.services.ai.debug_logger import AgentDebugLogger
 from app.services.ai.message_converter_service import MessageConverterService
+from app.services.ai.prompt_layout import PromptPrefixTracker, arrange_prompt
 from app.services.common import ToolExecutionContext, ToolExecutionGuard
 from app.tools import combat_tools, dice_tools, entity_tools
 
@@ -53,6 +61,10 @@ class CombatAgent(BaseAgent):
     system_prompt: str
     tool_call_extractor: IToolCallExtractorService | None = None
     debug_logger: AgentDebugLogger | None = None
+    history_window: IHistoryWindowService | None = None
+    context_service: IContextService | None = None
+    prompt_tracker: PromptPrefixTracker = field(default_factory=PromptPrefixTracker)
+    streaming: bool = False
     _event_processor: EventStreamProcessor | None = None
 
     @property
@@ -69,8 +81,26 @@ class CombatAgent(BaseAgent):
             thinking_handler = ThinkingHandler(self.event_logger)
             self._event_processor.register_handler(thinking_handler)
 
+            self._event_processor.register_handler(TextStreamHandler(self._broadcast_text))
+
         return self._event_processor
 
+    async def _broadcast_text(self, text: str) -> None:
+        game_id = self.event_processor.context.game_id
+        await self.event_bus.submit_and_wait([BroadcastNarrativeCommand(game_id=game_id, content=text, is_chunk=True)])
+
+    def _response_text(self, output: str) -> str:
+        """Text clients saw: every streamed response of the run, or the final output when not streamed."""
+        streamed_text = self.event_processor.context.streamed_text
+        return "".join(streamed_text) if streamed_text else output
+
+    def _narrative_commands(self, game_id: str, content: str) -> list[BaseCommand]:
+        """Commands broadcasting the response; only the end marker when its text was streamed."""
+        complete = BroadcastNarrativeCommand(game_id=game_id, content="", is_complete=True)
+        if self.event_processor.context.streamed_text:
+            return [complete]
+        return [BroadcastNarrativeCommand(game_id=game_id, content=content, is_complete=False), complete]
+
     def get_required_tools(self) -> list[ToolFunction]:
         """Return list of combat-specific tools only."""
         return [
@@ -111,6 +141,7 @@ class CombatAgent(BaseAgent):
         """Process a combat action and yield stream events."""
         self.event_processor.context.clear()
         self.event_processor.context.game_id = game_state.game_id
+        self.event_processor.context.stream_text = stream and self.streaming
 
         self.event_logger.set_game_id(game_state.game_id)
         self.event_logger.set_agent_type(AgentType.COMBAT.value)
@@ -136,14 +167,19 @@ class CombatAgent(BaseAgent):
             tool_execution_guard=ToolExecutionGuard(),
         )
 
-        message_history = self.message_converter.to_pydantic_messages(
-            messages=game_state.conversation_history,
-            agent_type=AgentType.COMBAT,
-            game_state=game_state,
-            npc_id="",
-        )
+        if self.history_window is not None:
+            message_history = self.history_window.build_message_history(game_state, AgentType.COMBAT)
+        else:
+            message_history = self.message_converter.convert_history(game_state, AgentType.COMBAT)
 
-        full_prompt = f"\n\n{context}\n\nPlayer Action: {prompt}"
+        layout = self.context_service.get_prompt_layout() if self.context_service else PromptLayout.INLINE
+        stable_context = (
+            self.context_service.build_stable_context(game_state, AgentType.COMBAT) if self.context_service else ""
+        )
+        arranged = arrange_prompt(
+            layout, self.system_prompt, message_history, stable_context, context, f"Player Action: {prompt}"
+        )
+        self.prompt_tracker.record(f"{game_state.game_id}:{AgentType.COMBAT.value}", arranged.segments)
         logger.info(f"Combat agent processing: {prompt[:100]}... (stream={stream})")
 
         # Log agent call for debugging if enabled
@@ -181,9 +217,9 @@ class CombatAgent(BaseAgent):
 
         try:
             result = await self.agent.run(
-                full_prompt,
+                arranged.user_prompt,
                 deps=deps,
-                message_history=message_history,
+                message_history=arranged.message_history,
                 event_stream_handler=self.event_stream_handler,
             )
 
@@ -203,21 +239,17 @@ class CombatAgent(BaseAgent):
                         else:
                             logger.error(f"Failed to execute extracted tool: {tool_call.get('function')}")
 
+            narrative = self._response_text(result.output)
             # Broadcast combat narrative via SSE
-            await self.event_bus.submit_and_wait(
-                [
-                    BroadcastNarrativeCommand(game_id=game_state.game_id, content=result.output, is_complete=False),
-                    BroadcastNarrativeCommand(game_id=game_state.game_id, content="", is_complete=True),
-                ],
-            )
+            await self.event_bus.submit_and_wait(self._narrative_commands(game_state.game_id, narrative))
 
             # Record combat messages
             self.conversation_service.record_message(game_state, MessageRole.PLAYER, prompt, AgentType.COMBAT)
-            self.conversation_service.record_message(game_state, MessageRole.DM, result.output, AgentType.COMBAT)
+            self.conversation_service.record_message(game_state, MessageRole.DM, narrative, AgentType.COMBAT)
 
             yield StreamEvent(
                 type=StreamEventType.COMPLETE,
-                content=NarrativeResponse(narrative=result.output),
+                content=NarrativeResponse(narrative=narrative),
             )
 
         except Exception as e:
@@ -33,12 +33,16 @@ class EventContext:
     tool_calls_by_id: dict[str, str] = field(default_factory=dict)
     processed_tool_calls: set[str] = field(default_factory=set)
     combat_started: bool = False  # Track if combat was started this turn
+    stream_text: bool = False  # Forward response text as it arrives
+    streamed_text: list[str] = field(default_factory=list)
 
     def clear(self) -> None:
         """Clear the context for a new processing session."""
         self.tool_calls_by_id.clear()
         self.processed_tool_calls.clear()
         self.combat_started = False
+        self.stream_text = False
+        self.streamed_text.clear()
 
 
 class EventStreamProcessor:
@@ -0,0 +1,46 @@
+"""Handler forwarding streamed response text as it arrives."""
+
+import logging
+from collections.abc import Awaitable, Callable
+
+from pydantic_ai.messages import PartDeltaEvent, PartStartEvent, TextPart, TextPartDelta
+
+from app.agents.core.event_stream.base import EventContext, EventHandler
+
+logger = logging.getLogger(__name__)
+
+
+class TextStreamHandler(EventHandler):
+    """Forwards text deltas of model responses while the run is in progress.
+
+    Only active when the context has ``stream_text`` set. Text of every response in
+    the run is forwarded, so text a model writes before calling tools arrives ahead
+    of those tool calls' broadcasts.
+    """
+
+    def __init__(self, on_text: Callable[[str], Awaitable[None]]):
+        self.on_text = on_text
+
+    async def can_handle(self, event: object) -> bool:
+        if isinstance(event, PartStartEvent):
+            return isinstance(event.part, TextPart)
+        if isinstance(event, PartDeltaEvent):
+            return isinstance(event.delta, TextPartDelta)
+        return False
+
+    async def handle(self, event: object, context: EventContext) -> None:
+        if not context.stream_text:
+            return
+        text = self._extract_text(event)
+        if not text:
+            return
+        context.streamed_text.append(text)
+        await self.on_text(text)
+
+    @staticmethod
+    def _extract_text(event: object) -> str | None:
+        if isinstance(event, PartStartEvent) and isinstance(event.part, TextPart):
+            return event.part.content
+        if isinstance(event, PartDeltaEvent) and isinstance(event.delta, TextPartDelta):
+            return event.delta.content_delta
+        return None
@@ -1,4 +1,4 @@
-"""Types of specialized agents."""
+"""Types of specialized agents and how they are invoked."""
 
 from enum import Enum
 
@@ -12,3 +12,44 @@ class AgentType(Enum):
     NPC = "npc"
     PLAYER = "player"
     TOOL_SUGGESTOR = "tool_suggestor"
+
+
+class PromptLayout(str, Enum):
+    """Where the built context goes in an agent call.
+
+    INLINE sends the whole context in front of the player line, after the history.
+    PREFIX_STABLE orders input from most to least stable so consecutive calls share
+    the longest possible prefix: system prompt, stable context (scenario), history,
+    volatile context, player line.
+    """
+
+    INLINE = "inline"
+    PREFIX_STABLE = "prefix_stable"
+
+
+class NpcDialogueMode(str, Enum):
+    """How replies of several addressed NPCs are generated.
+
+    SEQUENTIAL runs the NPCs one after another, so each sees the replies before
+    its own (reactive). PARALLEL runs them concurrently from the same history
+    (independent) and records and broadcasts the replies in target order once
+    all are done.
+    """
+
+    SEQUENTIAL = "sequential"
+    PARALLEL = "parallel"
+
+
+class LlmCacheMode(str, Enum):
+    """How agent model calls are served.
+
+    OFF calls the model every time. RECORD calls the model and stores every
+    request with its response on disk. REPLAY serves recorded responses only and
+    fails on requests that were not recorded. CACHE keeps responses in memory for
+    a while, for agents whose output only depends on their input.
+    """
+
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+    CACHE = "cache"
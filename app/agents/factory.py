@@ -1,10 +1,12 @@
 """Factory for creating specialized agents."""
 
 import logging
+from collections.abc import Collection
 from typing import cast
 
 import httpx
 from pydantic_ai import Agent
+from pydantic_ai.models import Model
 from pydantic_ai.models.openai import OpenAIModel, OpenAIModelSettings
 from pydantic_ai.providers.openai import OpenAIProvider
 
@@ -22,6 +24,7 @@ from app.interfaces.events import IEventBus
 from app.interfaces.services.ai import (
     IContextService,
     IEventLoggerService,
+    IHistoryWindowService,
     IMessageService,
     IToolCallExtractorService,
     IToolSuggestionService,
@@ -36,9 +39,13 @@ from app.interfaces.services.game import (
 )
 from app.interfaces.services.scenario import IScenarioService
 from app.models.agent_config import AgentConfig
+from app.models.standin_script import StandInScript
 from app.services.ai import MessageConverterService
 from app.services.ai.config_loader import AgentConfigLoader
 from app.services.ai.debug_logger import AgentDebugLogger
+from app.services.ai.http_client import create_llm_http_client
+from app.services.ai.llm_cache import CachedModel, LlmCallCache
+from app.services.ai.standin_model import StandInModel
 
 logger = logging.getLogger(__name__)
 
@@ -46,46 +53,71 @@ logger = logging.getLogger(__name__)
 class AgentFactory:
     """Factory for creating specialized agents."""
 
-    def __init__(self, config_loader: AgentConfigLoader) -> None:
+    def __init__(
+        self,
+        config_loader: AgentConfigLoader,
+        history_window: IHistoryWindowService | None = None,
+        message_converter: MessageConverterService | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        llm_cache: LlmCallCache | None = None,
+        standin_script: StandInScript | None = None,
+        standin_agents: Collection[AgentType] = (),
+    ) -> None:
         """Initialize factory with configuration loader.
 
         Args:
             config_loader: Loader for agent configurations
+            history_window: Bounds the conversation history of created agents; None sends it in full
+            message_converter: Converter shared by created agents so their conversion caches are reused
+            http_client: Client whose connection pool all created agents share; created on first use when None
+            llm_cache: Records, replays or caches the model calls of the agent types it applies to
+            standin_script: Script of the local stand-in model; its defaults apply when None
+            standin_agents: Agent types served by the stand-in model instead of OpenRouter
 
         Raises:
             FileNotFoundError: If config files are missing
             ValueError: If config files are invalid
         """
         self.config_loader = config_loader
+        self.history_window = history_window
+        self.message_converter = message_converter or MessageConverterService()
+        self.http_client = http_client
+        self.llm_cache = llm_cache
+        self.standin_script = standin_script or StandInScript()
+        self.standin_agents = frozenset(standin_agents)
         self.narrative_config, self.narrative_prompt = config_loader.load_agent_config("narrative.json")
         self.combat_config, self.combat_prompt = config_loader.load_agent_config("combat.json")
         self.summarizer_config, self.summarizer_prompt = config_loader.load_agent_config("summarizer.json")
         self.npc_individual_config, self.npc_individual_prompt = config_loader.load_agent_config("npc_individual.json")
         self.npc_puppeteer_config, self.npc_puppeteer_prompt = config_loader.load_agent_config("npc_puppeteer.json")
 
-    def _create_model(self, model_name: str) -> OpenAIModel:
+    def _create_model(self, model_name: str, agent_type: AgentType) -> Model:
         """Create the AI model with proper configuration.
 
         Args:
             model_name: Specific model name
+            agent_type: Agent the model serves; decides whether its calls go through the LLM cache
         """
-        settings = get_settings()
-
-        headers = {
-            "HTTP-Referer": "http://localhost:8123",
-            "X-Title": "D&D AI Dungeon Master",
-        }
-
-        http_client = httpx.AsyncClient(headers=headers)
-
-        provider = OpenAIProvider(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=settings.openrouter_api_key,
-            http_client=http_client,
-        )
+        model: Model
+        if agent_type in self.standin_agents:
+            model = StandInModel(agent_type, self.standin_script)
+        else:
+            settings = get_settings()
+
+            if self.http_client is None:
+                self.http_client = create_llm_http_client()
+
+            provider = OpenAIProvider(
+                base_url="https://openrouter.ai/api/v1",
+                api_key=settings.openrouter_api_key,
+                http_client=self.http_client,
+            )
 
-        # Use provided model name
-        return OpenAIModel(model_name, provider=provider)
+            # Use provided model name
+            model = OpenAIModel(model_name, provider=provider)
+        if self.llm_cache is not None and self.llm_cache.applies_to(agent_type):
+            return CachedModel(model, self.llm_cache)
+        return model
 
     def _register_agent_tools(self, agent: Agent[AgentDependencies, str], tools: list[ToolFunction]) -> None:
         """Register tools with an agent."""
@@ -132,7 +164,7 @@ class AgentFactory:
         debug_logger = AgentDebugLogger(enabled=settings.debug_agent_context)
 
         if agent_type == AgentType.NARRATIVE:
-            model = self._create_model(settings.get_narrative_model())
+            model = self._create_model(settings.get_narrative_model(), AgentType.NARRATIVE)
             model_settings = self._config_to_model_settings(self.narrative_config)
 
             narrative_pydantic_agent: Agent[AgentDependencies, str] = Agent(
@@ -145,7 +177,9 @@ class AgentFactory:
 
             narrative_agent = NarrativeAgent(
                 agent=narrative_pydantic_agent,
-                message_converter=MessageConverterService(),
+                message_converter=self.message_converter,
+                history_window=self.history_window,
+                context_service=context_service,
                 event_logger=event_logger_service,
                 metadata_service=metadata_service,
                 event_bus=event_bus,
@@ -157,6 +191,7 @@ class AgentFactory:
                 action_service=action_service,
                 system_prompt=self.narrative_prompt,
                 debug_logger=debug_logger,
+                streaming=settings.agent_streaming,
             )
 
             # Register its required tools
@@ -165,7 +200,7 @@ class AgentFactory:
             return narrative_agent
 
         if agent_type == AgentType.COMBAT:
-            model = self._create_model(settings.get_combat_model())
+            model = self._create_model(settings.get_combat_model(), AgentType.COMBAT)
             model_settings = self._config_to_model_settings(self.combat_config)
 
             combat_pydantic_agent: Agent[AgentDependencies, str] = Agent(
@@ -178,7 +213,9 @@ class AgentFactory:
 
             combat_agent = CombatAgent(
                 agent=combat_pydantic_agent,
-                message_converter=MessageConverterService(),
+                message_converter=self.message_converter,
+                history_window=self.history_window,
+                context_service=context_service,
                 event_logger=event_logger_service,
                 metadata_service=metadata_service,
                 event_bus=event_bus,
@@ -191,6 +228,7 @@ class AgentFactory:
                 action_service=action_service,
                 system_prompt=self.combat_prompt,
                 debug_logger=debug_logger,
+                streaming=settings.agent_streaming,
             )
 
             # Register combat-specific tools only
@@ -199,7 +237,7 @@ class AgentFactory:
             return combat_agent
 
         if agent_type == AgentType.SUMMARIZER:
-            model = self._create_model(settings.get_summarizer_model())
+            model = self._create_model(settings.get_summarizer_model(), AgentType.SUMMARIZER)
             model_settings = self._config_to_model_settings(self.summarizer_config)
 
             # Summarizer doesn't need dependencies, so we create a simpler agent
@@ -238,7 +276,7 @@ class AgentFactory:
         debug: bool = False,
     ) -> IndividualMindAgent:
         settings = get_settings()
-        model = self._create_model(settings.get_individual_npc_model())
+        model = self._create_model(settings.get_individual_npc_model(), AgentType.NPC)
         model_settings = self._config_to_model_settings(self.npc_individual_config)
         debug_logger = AgentDebugLogger(enabled=settings.debug_agent_context)
 
@@ -253,7 +291,8 @@ class AgentFactory:
         individual_agent = IndividualMindAgent(
             agent=npc_agent_core,
             context_service=context_service,
-            message_converter=MessageConverterService(),
+            message_converter=self.message_converter,
+            history_window=self.history_window,
             event_logger=event_logger_service,
             metadata_service=metadata_service,
             event_bus=event_bus,
@@ -266,6 +305,7 @@ class AgentFactory:
             message_service=message_service,
             system_prompt=self.npc_individual_prompt,
             debug_logger=debug_logger,
+            streaming=settings.agent_streaming,
         )
 
         self._register_agent_tools(npc_agent_core, individual_agent.get_required_tools())
@@ -288,7 +328,7 @@ class AgentFactory:
         debug: bool = False,
     ) -> PuppeteerAgent:
         settings = get_settings()
-        model = self._create_model(settings.get_puppeteer_npc_model())
+        model = self._create_model(settings.get_puppeteer_npc_model(), AgentType.NPC)
         model_settings = self._config_to_model_settings(self.npc_puppeteer_config)
         debug_logger = AgentDebugLogger(enabled=settings.debug_agent_context)
 
@@ -303,7 +343,8 @@ class AgentFactory:
         puppeteer_agent = PuppeteerAgent(
             agent=puppeteer_core,
             context_service=context_service,
-            message_converter=MessageConverterService(),
+            message_converter=self.message_converter,
+            history_window=self.history_window,
             event_logger=event_logger_service,
             metadata_service=metadata_service,
             event_bus=event_bus,
@@ -316,6 +357,7 @@ class AgentFactory:
             message_service=message_service,
             system_prompt=self.npc_puppeteer_prompt,
             debug_logger=debug_logger,
+            streaming=settings.agent_streaming,
         )
 
         self._register_agent_tools(puppeteer_core, puppeteer_agent.get_required_tools())
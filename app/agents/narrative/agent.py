@@ -2,7 +2,7 @@
 
 import logging
 from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
@@ -10,12 +10,14 @@ from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserProm
 from app.agents.core.base import BaseAgent, ToolFunction
 from app.agents.core.dependencies import AgentDependencies
 from app.agents.core.event_stream.base import EventContext, EventStreamProcessor
+from app.agents.core.event_stream.text import TextStreamHandler
 from app.agents.core.event_stream.thinking import ThinkingHandler
 from app.agents.core.event_stream.tools import ToolEventHandler
-from app.agents.core.types import AgentType
+from app.agents.core.types import AgentType, PromptLayout
+from app.events.base import BaseCommand
 from app.events.commands.broadcast_commands import BroadcastNarrativeCommand
 from app.interfaces.events import IEventBus
-from app.interfaces.services.ai import IEventLoggerService
+from app.interfaces.services.ai import IContextService, IEventLoggerService, IHistoryWindowService
 from app.interfaces.services.common import IActionService
 from app.interfaces.services.data import IRepositoryProvider
 from app.interfaces.services.game import (
@@ -29,6 +31,7 @@ from app.models.ai_response import NarrativeResponse, StreamEvent, StreamEventTy
 from app.models.game_state import GameState, MessageRole
 from app.services.ai.debug_logger import AgentDebugLogger
 from app.services.ai.message_converter_service import MessageConverterService
+from app.services.ai.prompt_layout import PromptPrefixTracker, arrange_prompt
 from app.services.common import ToolExecutionContext, ToolExecutionGuard
 from app.tools import (
     combat_tools,
@@ -60,6 +63,10 @@ class NarrativeAgent(BaseAgent):
     action_service: IActionService
     system_prompt: str
     debug_logger: AgentDebugLogger | None = None
+    history_window: IHistoryWindowService | None = None
+    context_service: IContextService | None = None
+    prompt_tracker: PromptPrefixTracker = field(default_factory=PromptPrefixTracker)
+    streaming: bool = False
     _event_processor: EventStreamProcessor | None = None
 
     @property
@@ -76,8 +83,26 @@ class NarrativeAgent(BaseAgent):
             thinking_handler = ThinkingHandler(self.event_logger)
             self._event_processor.register_handler(thinking_handler)
 
+            self._event_processor.register_handler(TextStreamHandler(self._broadcast_text))
+
         return self._event_processor
 
+    async def _broadcast_text(self, text: str) -> None:
+        game_id = self.event_processor.context.game_id
+        await self.event_bus.submit_and_wait([BroadcastNarrativeCommand(game_id=game_id, content=text, is_chunk=True)])
+
+    def _response_text(self, output: str) -> str:
+        """Text clients saw: every streamed response of the run, or the final output when not streamed."""
+        streamed_text = self.event_processor.context.streamed_text
+        return "".join(streamed_text) if streamed_text else output
+
+    def _narrative_commands(self, game_id: str, content: str) -> list[BaseCommand]:
+        """Commands broadcasting the response; only the end marker when its text was streamed."""
+        complete = BroadcastNarrativeCommand(game_id=game_id, content="", is_complete=True)
+        if self.event_processor.context.streamed_text:
+            return [complete]
+        return [BroadcastNarrativeCommand(game_id=game_id, content=content, is_complete=False), complete]
+
     def get_required_tools(self) -> list[ToolFunction]:
         """Return list of tools this agent requires."""
         return [
@@ -127,6 +152,7 @@ class NarrativeAgent(BaseAgent):
         """Process a prompt and yield stream events."""
         self.event_processor.context.clear()
         self.event_processor.context.game_id = game_state.game_id
+        self.event_processor.context.stream_text = stream and self.streaming
 
         self.event_logger.set_game_id(game_state.game_id)
         self.event_logger.set_agent_type(AgentType.NARRATIVE.value)
@@ -152,14 +178,19 @@ class NarrativeAgent(BaseAgent):
             tool_execution_guard=ToolExecutionGuard(),
         )
 
-        message_history = self.message_converter.to_pydantic_messages(
-            messages=game_state.conversation_history,
-            agent_type=AgentType.NARRATIVE,
-            game_state=game_state,
-            npc_id="",
-        )
+        if self.history_window is not None:
+            message_history = self.history_window.build_message_history(game_state, AgentType.NARRATIVE)
+        else:
+            message_history = self.message_converter.convert_history(game_state, AgentType.NARRATIVE)
 
-        full_prompt = f"\n\n{context}\n\nPlayer: {prompt}"
+        layout = self.context_service.get_prompt_layout() if self.context_service else PromptLayout.INLINE
+        stable_context = (
+            self.context_service.build_stable_context(game_state, AgentType.NARRATIVE) if self.context_service else ""
+        )
+        arranged = arrange_prompt(
+            layout, self.system_prompt, message_history, stable_context, context, f"Player: {prompt}"
+        )
+        self.prompt_tracker.record(f"{game_state.game_id}:{AgentType.NARRATIVE.value}", arranged.segments)
         logger.debug(f"Processing prompt: {prompt[:100]}... (stream={stream})")
 
         # Log agent call for debugging if enabled
@@ -200,9 +231,9 @@ class NarrativeAgent(BaseAgent):
             logger.debug(f"Starting response generation (stream={stream})")
 
             result = await self.agent.run(
-                full_prompt,
+                arranged.user_prompt,
                 deps=deps,
-                message_history=message_history,
+                message_history=arranged.message_history,
                 event_stream_handler=self.event_stream_handler,
             )
 
@@ -213,15 +244,12 @@ class NarrativeAgent(BaseAgent):
                 # Minimal response when transitioning to combat
                 # The combat agent will handle the actual combat narrative
                 logger.info("Combat started during narrative turn - using minimal response")
-                short_msg = "Combat has begun!"
+                # Text already streamed to clients is kept, so the saved history matches what they saw
+                streamed = self.event_processor.context.streamed_text
+                short_msg = self._response_text(result.output) if streamed else "Combat has begun!"
 
                 # Broadcast minimal narrative
-                await self.event_bus.submit_and_wait(
-                    [
-                        BroadcastNarrativeCommand(game_id=game_state.game_id, content=short_msg, is_complete=False),
-                        BroadcastNarrativeCommand(game_id=game_state.game_id, content="", is_complete=True),
-                    ],
-                )
+                await self.event_bus.submit_and_wait(self._narrative_commands(game_state.game_id, short_msg))
 
                 # Record minimal messages
                 self.conversation_service.record_message(game_state, MessageRole.PLAYER, prompt, AgentType.NARRATIVE)
@@ -233,21 +261,17 @@ class NarrativeAgent(BaseAgent):
                 )
             else:
                 # Normal narrative response
+                narrative = self._response_text(result.output)
                 # Broadcast final narrative via SSE
-                await self.event_bus.submit_and_wait(
-                    [
-                        BroadcastNarrativeCommand(game_id=game_state.game_id, content=result.output, is_complete=False),
-                        BroadcastNarrativeCommand(game_id=game_state.game_id, content="", is_complete=True),
-                    ],
-                )
+                await self.event_bus.submit_and_wait(self._narrative_commands(game_state.game_id, narrative))
 
                 # Record messages
                 self.conversation_service.record_message(game_state, MessageRole.PLAYER, prompt, AgentType.NARRATIVE)
-                self.conversation_service.record_message(game_state, MessageRole.DM, result.output, AgentType.NARRATIVE)
+                self.conversation_service.record_message(game_state, MessageRole.DM, narrative, AgentType.NARRATIVE)
 
                 yield StreamEvent(
                     type=StreamEventType.COMPLETE,
-                    content=NarrativeResponse(narrative=result.output),
+                    content=NarrativeResponse(narrative=narrative),
                 )
 
         except Exception as e:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
 
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.messages import (
@@ -17,11 +18,12 @@ from pydantic_ai.messages import (
 from app.agents.core.base import BaseAgent, ToolFunction
 from app.agents.core.dependencies import AgentDependencies
 from app.agents.core.event_stream.base import EventContext, EventStreamProcessor
+from app.agents.core.event_stream.text import TextStreamHandler
 from app.agents.core.event_stream.thinking import ThinkingHandler
 from app.agents.core.event_stream.tools import ToolEventHandler
 from app.agents.core.types import AgentType
 from app.interfaces.events import IEventBus
-from app.interfaces.services.ai import IContextService, IEventLoggerService, IMessageService
+from app.interfaces.services.ai import IContextService, IEventLoggerService, IHistoryWindowService, IMessageService
 from app.interfaces.services.common import IActionService
 from app.interfaces.services.data import IRepositoryProvider
 from app.interfaces.services.game import (
@@ -42,6 +44,14 @@ from app.tools import inventory_tools, location_tools
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class NPCReply:
+    """Reply generated for an NPC, not yet broadcast or recorded."""
+
+    npc: NPCInstance
+    text: str
+
+
 class BaseNPCAgent(BaseAgent, ABC):
     """Common logic for NPC agents (individual minds & puppeteers)."""
 
@@ -63,10 +73,13 @@ class BaseNPCAgent(BaseAgent, ABC):
         message_service: IMessageService,
         debug_logger: AgentDebugLogger | None = None,
         system_prompt: str = "",
+        history_window: IHistoryWindowService | None = None,
+        streaming: bool = False,
     ) -> None:
         self.agent = agent
         self.context_service = context_service
         self.message_converter = message_converter
+        self.history_window = history_window
         self.event_logger = event_logger
         self.metadata_service = metadata_service
         self.event_bus = event_bus
@@ -81,6 +94,7 @@ class BaseNPCAgent(BaseAgent, ABC):
         self._event_processor: EventStreamProcessor | None = None
         self._active_npc: NPCInstance | None = None
         self._system_prompt = system_prompt
+        self.streaming = streaming
 
     @property
     def event_processor(self) -> EventStreamProcessor:
@@ -95,8 +109,20 @@ class BaseNPCAgent(BaseAgent, ABC):
             thinking_handler = ThinkingHandler(self.event_logger)
             self._event_processor.register_handler(thinking_handler)
 
+            self._event_processor.register_handler(TextStreamHandler(self._broadcast_text))
+
         return self._event_processor
 
+    async def _broadcast_text(self, text: str) -> None:
+        npc = self._require_active_npc()
+        await self.message_service.send_npc_dialogue(
+            game_id=self.event_processor.context.game_id,
+            npc_id=npc.instance_id,
+            npc_name=npc.display_name,
+            content=text,
+            complete=False,
+        )
+
     async def event_stream_handler(
         self,
         ctx: RunContext[AgentDependencies],
@@ -124,9 +150,28 @@ class BaseNPCAgent(BaseAgent, ABC):
         Note: The context parameter is unused for NPC agents. NPCs build their own
         context internally since it includes NPC-specific persona information.
         """
+        try:
+            reply = await self.generate_reply(prompt, game_state, stream=stream)
+        except Exception as exc:  # pragma: no cover - fail fast path mirrors other agents
+            self.event_logger.log_error(exc)
+            yield StreamEvent(
+                type=StreamEventType.ERROR,
+                content=str(exc),
+                metadata={"error_type": type(exc).__name__},
+            )
+            raise
+
+        yield await self.deliver_reply(game_state, reply)
+
+    async def generate_reply(self, prompt: str, game_state: GameState, stream: bool = True) -> NPCReply:
+        """Run the model for the prepared NPC without recording or broadcasting the final reply.
+
+        Text is still streamed to clients when streaming is enabled and ``stream`` is set.
+        """
         npc = self._require_active_npc()
         self.event_processor.context.clear()
         self.event_processor.context.game_id = game_state.game_id
+        self.event_processor.context.stream_text = stream and self.streaming
 
         self.event_logger.set_game_id(game_state.game_id)
         self.event_logger.set_agent_type(AgentType.NPC.value)
@@ -154,33 +199,28 @@ class BaseNPCAgent(BaseAgent, ABC):
                 message_history=message_history,
                 event_stream_handler=self.event_stream_handler,
             )
-        except Exception as exc:  # pragma: no cover - fail fast path mirrors other agents
-            self.event_logger.log_error(exc)
-            yield StreamEvent(
-                type=StreamEventType.ERROR,
-                content=str(exc),
-                metadata={"error_type": type(exc).__name__},
-            )
-            raise
         finally:
             self._active_npc = None
 
-        reply_text = result.output
-        logger.debug("NPC agent %s produced reply length=%s", npc.instance_id, len(reply_text))
+        logger.debug("NPC agent %s produced reply length=%s", npc.instance_id, len(result.output))
+        return NPCReply(npc=npc, text=result.output)
 
-        await self._broadcast_npc_dialogue(game_state, npc, reply_text)
+    async def deliver_reply(self, game_state: GameState, reply: NPCReply) -> StreamEvent:
+        """Broadcast and record a generated reply and return its completion event."""
+        npc = reply.npc
+        await self._broadcast_npc_dialogue(game_state, npc, reply.text)
         self.conversation_service.record_message(
             game_state,
             MessageRole.NPC,
-            reply_text,
+            reply.text,
             agent_type=AgentType.NPC,
             speaker_npc_id=npc.instance_id,
             speaker_npc_name=npc.display_name,
         )
 
-        yield StreamEvent(
+        return StreamEvent(
             type=StreamEventType.COMPLETE,
-            content=NarrativeResponse(narrative=reply_text),
+            content=NarrativeResponse(narrative=reply.text),
             metadata={"npc_id": npc.instance_id, "npc_name": npc.display_name},
         )
 
@@ -217,7 +257,11 @@ class BaseNPCAgent(BaseAgent, ABC):
         """Build the user prompt to send to the underlying model."""
 
     async def _broadcast_npc_dialogue(self, game_state: GameState, npc: NPCInstance, content: str) -> None:
-        """Send the NPC reply to connected clients via the message service."""
+        """Send the NPC reply to connected clients via the message service.
+
+        When the reply was streamed, this final message carries the full text and
+        replaces the streamed pieces on the client.
+        """
 
         await self.message_service.send_npc_dialogue(
             game_id=game_state.game_id,
@@ -238,12 +282,9 @@ class BaseNPCAgent(BaseAgent, ABC):
 
     def _build_message_history(self, game_state: GameState) -> list[ModelMessage]:
         active_npc = self._require_active_npc()
-        return self.message_converter.to_pydantic_messages(
-            messages=game_state.conversation_history,
-            agent_type=AgentType.NPC,
-            game_state=game_state,
-            npc_id=active_npc.instance_id,
-        )
+        if self.history_window is not None:
+            return self.history_window.build_message_history(game_state, AgentType.NPC, active_npc.instance_id)
+        return self.message_converter.convert_history(game_state, AgentType.NPC, active_npc.instance_id)
 
     def prepare_for_npc(self, npc: NPCInstance) -> None:
         """Assign the NPC this agent should embody for the next response."""
@@ -8,7 +8,7 @@ from app.agents.core.dependencies import AgentDependencies
 from app.agents.core.types import AgentType
 from app.agents.npc.base import BaseNPCAgent
 from app.interfaces.events import IEventBus
-from app.interfaces.services.ai import IContextService, IEventLoggerService, IMessageService
+from app.interfaces.services.ai import IContextService, IEventLoggerService, IHistoryWindowService, IMessageService
 from app.interfaces.services.common import IActionService
 from app.interfaces.services.data import IRepositoryProvider
 from app.interfaces.services.game import (
@@ -45,6 +45,8 @@ class PuppeteerAgent(BaseNPCAgent):
         message_service: IMessageService,
         system_prompt: str,
         debug_logger: AgentDebugLogger | None = None,
+        history_window: IHistoryWindowService | None = None,
+        streaming: bool = False,
     ) -> None:
         super().__init__(
             agent=agent,
@@ -62,6 +64,8 @@ class PuppeteerAgent(BaseNPCAgent):
             message_service=message_service,
             debug_logger=debug_logger,
             system_prompt=system_prompt,
+            history_window=history_window,
+            streaming=streaming,
         )
 
     def _build_context(self, game_state: GameState, npc: NPCInstance) -> str:
@@ -13,11 +13,25 @@ from app.interfaces.services.ai import IContextService
 from app.models.ai_response import StreamEvent
 from app.models.game_state import GameState, Message
 from app.models.instances.npc_instance import NPCInstance
-from app.models.memory import MemoryEventKind, WorldEventContext
+from app.models.memory import (
+    LocationExitSummary,
+    MemoryEntry,
+    MemoryEventKind,
+    NPCSessionSummary,
+    WorldEventContext,
+)
 from app.services.ai.debug_logger import AgentDebugLogger
+from app.utils.token_estimator import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
+# Newest messages of one selection (location session or NPC) sent in a transcript
+TRANSCRIPT_MAX_MESSAGES = 30
+
+# Bounds of the narrative sent when combat starts; older events are covered by the last memory
+COMBAT_ENTRY_MAX_MESSAGES = 30
+COMBAT_ENTRY_MAX_TOKENS = 1500
+
 
 @dataclass
 class SummarizerAgent(BaseAgent, ISummarizerAgent):
@@ -27,6 +41,8 @@ class SummarizerAgent(BaseAgent, ISummarizerAgent):
     context_service: IContextService
     system_prompt: str
     debug_logger: AgentDebugLogger | None = None
+    combat_entry_max_messages: int = COMBAT_ENTRY_MAX_MESSAGES
+    combat_entry_max_tokens: int = COMBAT_ENTRY_MAX_TOKENS
 
     def get_required_tools(self) -> list[ToolFunction]:
         """Summarizer doesn't need tools - it just summarizes text."""
@@ -51,17 +67,42 @@ class SummarizerAgent(BaseAgent, ISummarizerAgent):
                 logger.warning(f"Summarization attempt {attempt + 1} failed ({warn_label}): {e}")
         return fallback
 
+    def _combat_entry_window(self, game_state: GameState) -> tuple[MemoryEntry | None, list[Message]]:
+        """Return the latest world or current-location memory and the narrative messages after it.
+
+        At most ``combat_entry_max_messages`` of the newest messages are returned, so the
+        cost of a combat transition does not grow with the length of the campaign.
+        """
+        scenario_instance = game_state.scenario_instance
+        latest = [
+            memories[-1]
+            for memories in (
+                scenario_instance.world_memories,
+                game_state.get_location_state(scenario_instance.current_location_id).location_memories,
+            )
+            if memories and memories[-1].since_message_index is not None
+        ]
+        anchor = max(latest, key=lambda memory: memory.since_message_index or -1, default=None)
+        start = anchor.since_message_index + 1 if anchor and anchor.since_message_index is not None else 0
+
+        positions = game_state.message_index.for_agents([AgentType.NARRATIVE], start=start)
+        history = game_state.conversation_history
+        return anchor, [history[position] for position in positions[-self.combat_entry_max_messages :]]
+
     async def summarize_for_combat(self, game_state: GameState) -> str:
         # Build structured game context (ensures combat state is represented)
         context_text = self.context_service.build_context(game_state, AgentType.SUMMARIZER)
 
-        # Build recent narrative from conversation history (if available)
-        recent_messages = game_state.get_messages_for_agent(AgentType.NARRATIVE)
-        narrative_block = (
-            "Recent narrative context:\n" + "\n".join(f"- {msg.role}: {msg.content}" for msg in recent_messages)
-            if recent_messages
-            else ""
+        # Narrative since the last memory, newest lines first to fit the token cap
+        anchor, recent_messages = self._combat_entry_window(game_state)
+        lines = _fit_to_tokens(
+            [f"- {msg.role}: {msg.content}" for msg in recent_messages], self.combat_entry_max_tokens
         )
+        narrative_block = ""
+        if anchor:
+            narrative_block += f"Earlier events:\n{anchor.summary}\n\n"
+        if lines:
+            narrative_block += "Recent narrative context:\n" + "\n".join(lines)
 
         prompt = (
             "Summarize this context for combat in 2-3 sentences:\n"
@@ -200,6 +241,73 @@ class SummarizerAgent(BaseAgent, ISummarizerAgent):
             warn_label=f"npc:{npc.instance_id}",
         )
 
+    async def summarize_location_exit(
+        self,
+        game_state: GameState,
+        location_id: str,
+        messages: Sequence[Message],
+        npc_messages: Sequence[tuple[NPCInstance, Sequence[Message]]],
+    ) -> LocationExitSummary:
+        """Summarize the location session and every NPC present with one structured call.
+
+        The game snapshot is sent once instead of once per NPC, and the transcript is the
+        union of the newest messages of every selection, so each NPC keeps the window a
+        separate call would have had. If the structured call fails twice, the location and
+        each NPC are summarized separately from their own selections.
+        """
+        snapshot = self.context_service.build_context(game_state, AgentType.SUMMARIZER)
+        location = game_state.scenario_instance.sheet.get_location(location_id)
+        location_name = location.name if location else game_state.location
+        npcs = [npc for npc, _ in npc_messages]
+        merged = _merge_selections(game_state, [messages, *(selection for _, selection in npc_messages)])
+        transcript = self._format_messages(merged, limit=len(merged))
+        npc_lines = "\n".join(f"- {npc.display_name} (instance id: {npc.instance_id})" for npc in npcs)
+        prompt_parts = [
+            f"Summarize the party's recent time at '{location_name}' (id: {location_id}) in 2-3 sentences, "
+            "focusing on discoveries, challenges and NPC interactions.\n",
+        ]
+        if npc_lines:
+            prompt_parts.append(
+                "Then, for each NPC below, summarize the party's interactions with them in 2-3 sentences: "
+                "relationship shifts, promises, conflicts, and actionable follow-ups. "
+                "Use an empty summary for an NPC nothing happened with.\n"
+                f"NPCs:\n{npc_lines}\n"
+            )
+        prompt_parts.append("\n")
+        if snapshot:
+            prompt_parts.append(f"Game snapshot:\n{snapshot}\n\n")
+        prompt_parts.append(f"Conversation excerpts:\n{transcript}\n")
+        prompt_parts.append("Keep the summaries factual and neutral and avoid speculation.")
+        prompt = "".join(prompt_parts)
+
+        if self.debug_logger:
+            self.debug_logger.log_agent_call(
+                agent_type=AgentType.SUMMARIZER,
+                game_id=game_state.game_id,
+                system_prompt=self.system_prompt,
+                conversation_history=[msg.model_dump() for msg in merged],
+                user_prompt=prompt,
+                context=snapshot,
+            )
+
+        for attempt in range(2):
+            try:
+                result = await self.agent.run(prompt, output_type=LocationExitSummary)
+                output = result.output
+                if output.location_summary.strip():
+                    return output
+                raise ValueError("Empty location summary")
+            except Exception as e:
+                logger.warning(f"Batched summarization attempt {attempt + 1} failed (location-exit:{location_id}): {e}")
+
+        location_summary = await self.summarize_location_session(game_state, location_id, messages)
+        npc_summaries: list[NPCSessionSummary] = []
+        for npc, selection in npc_messages:
+            if selection:
+                summary = await self.summarize_npc_interactions(game_state, npc, selection)
+                npc_summaries.append(NPCSessionSummary(npc_id=npc.instance_id, summary=summary))
+        return LocationExitSummary(location_summary=location_summary, npc_summaries=npc_summaries)
+
     async def summarize_world_update(
         self,
         game_state: GameState,
@@ -242,6 +350,41 @@ class SummarizerAgent(BaseAgent, ISummarizerAgent):
             warn_label=f"world:{event_kind.value}",
         )
 
+    async def summarize_history(
+        self,
+        game_state: GameState,
+        previous_summary: str,
+        messages: Sequence[Message],
+        max_tokens: int,
+    ) -> str:
+        transcript = self._format_messages(messages, limit=len(messages))
+        prompt_parts = [
+            "Maintain a running summary of an ongoing D&D session so earlier turns can be dropped from the transcript.\n",
+            f"Merge the new excerpts into the existing summary in at most {max_tokens * 3 // 4} words.\n",
+            "Keep names, instance IDs, promises, quest hooks, items gained or lost and unresolved threads; "
+            "drop dice details and repetition.\n\n",
+        ]
+        if previous_summary:
+            prompt_parts.append(f"Existing summary:\n{previous_summary}\n\n")
+        prompt_parts.append(f"New conversation excerpts:\n{transcript}")
+        prompt = "".join(prompt_parts)
+
+        if self.debug_logger:
+            self.debug_logger.log_agent_call(
+                agent_type=AgentType.SUMMARIZER,
+                game_id=game_state.game_id,
+                system_prompt=self.system_prompt,
+                conversation_history=[msg.model_dump() for msg in messages],
+                user_prompt=prompt,
+                context=previous_summary,
+            )
+
+        return await self._summarize_with_retry(
+            prompt,
+            fallback="",
+            warn_label="history",
+        )
+
     async def process(
         self,
         prompt: str,
@@ -256,7 +399,7 @@ class SummarizerAgent(BaseAgent, ISummarizerAgent):
         yield  # type: ignore[unreachable]
 
     @staticmethod
-    def _format_messages(messages: Sequence[Message], limit: int = 30) -> str:
+    def _format_messages(messages: Sequence[Message], limit: int = TRANSCRIPT_MAX_MESSAGES) -> str:
         """Convert messages into a compact transcript."""
 
         if len(messages) > limit:
@@ -267,3 +410,31 @@ class SummarizerAgent(BaseAgent, ISummarizerAgent):
             role = msg.role.value.upper()
             lines.append(f"{role}: {msg.content.strip()}")
         return "\n".join(lines)
+
+
+def _merge_selections(game_state: GameState, selections: Sequence[Sequence[Message]]) -> list[Message]:
+    """Union of the newest messages of each selection, in conversation order."""
+    positions = {id(msg): position for position, msg in enumerate(game_state.conversation_history)}
+    chosen: dict[int, Message] = {}
+    for selection in selections:
+        for msg in selection[-TRANSCRIPT_MAX_MESSAGES:]:
+            chosen.setdefault(id(msg), msg)
+    return sorted(chosen.values(), key=lambda msg: positions.get(id(msg), len(positions)))
+
+
+def _fit_to_tokens(lines: Sequence[str], max_tokens: int) -> list[str]:
+    """Keep the newest lines whose estimated tokens fit max_tokens, cutting the newest line if it alone does not."""
+    kept: list[str] = []
+    total = 0
+    for line in reversed(lines):
+        tokens = estimate_tokens(line)
+        if total + tokens > max_tokens:
+            if not kept:
+                # Plain prose costs about a token per four characters; no text costs more than one per character
+                cut = line[: max_tokens * 4]
+                kept.append(cut if estimate_tokens(cut) <= max_tokens else line[:max_tokens])
+            break
+        kept.append(line)
+        total += tokens
+    kept.reverse()
+    return kept
@@ -4,6 +4,7 @@ from .catalogs import router as catalogs_router
 from .characters import router as characters_router
 from .content_packs import router as content_packs_router
 from .game import router as game_router
+from .metrics import router as metrics_router
 from .scenarios import router as scenarios_router
 
 __all__ = [
@@ -13,4 +14,5 @@ __all__ = [
     "characters_router",
     "catalogs_router",
     "content_packs_router",
+    "metrics_router",
 ]
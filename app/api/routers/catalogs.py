@@ -1,8 +1,10 @@
 """Read-only data catalog endpoints grouped under /catalogs/*."""
 
-import contextlib
+import json
+from collections.abc import Iterator
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from app.common.exceptions import RepositoryNotFoundError
 from app.container import container
@@ -13,6 +15,7 @@ from app.models.condition import Condition
 from app.models.damage_type import DamageType
 from app.models.feat import FeatDefinition as FeatDef
 from app.models.feature import FeatureDefinition as FeatureDef
+from app.models.game_state import GameState
 from app.models.item import ItemDefinition
 from app.models.language import Language
 from app.models.magic_school import MagicSchool
@@ -24,9 +27,20 @@ from app.models.skill import Skill
 from app.models.spell import SpellDefinition
 from app.models.trait import TraitDefinition as TraitDef
 from app.models.weapon_property import WeaponProperty
+from app.services.data.name_index import CATALOG_CATEGORIES
 
 router = APIRouter()
 
+# Maximum number of resolved names per NDJSON line of the streaming endpoint
+RESOLVE_NAMES_STREAM_CHUNK = 500
+
+
+def _get_game_for_resolution(game_id: str) -> GameState:
+    try:
+        return container.game_service.get_game(game_id)
+    except Exception as exc:
+        raise HTTPException(status_code=404, detail=f"Game '{game_id}' not found") from exc
+
 
 # Name resolution endpoint
 @router.post("/catalogs/resolve-names", response_model=ResolveNamesResponse)
@@ -35,127 +49,41 @@ async def resolve_names(request: ResolveNamesRequest) -> ResolveNamesResponse:
 
     This endpoint provides a unified way to get human-readable names
     for any type of game entity given their indexes, using the game's
-    content pack scope.
+    content pack scope. Lookups go through the scope's name index, so
+    unknown indexes are simply omitted from the response.
     """
-    response = ResolveNamesResponse()
+    game_state = _get_game_for_resolution(request.game_id)
+    name_index = container.repository_factory.get_name_index_for(game_state)
 
-    # Get the game state and game-scoped repositories
-    game_service = container.game_service
-    repository_factory = container.repository_factory
-    try:
-        game_state = game_service.get_game(request.game_id)
-    except Exception as exc:
-        raise HTTPException(status_code=404, detail=f"Game '{request.game_id}' not found") from exc
-
-    if request.items:
-        item_repo = repository_factory.get_item_repository_for(game_state)
-        for index in request.items:
-            with contextlib.suppress(Exception):
-                response.items[index] = item_repo.get_name(index)
-
-    if request.spells:
-        spell_repo = repository_factory.get_spell_repository_for(game_state)
-        for index in request.spells:
-            with contextlib.suppress(Exception):
-                response.spells[index] = spell_repo.get_name(index)
-
-    if request.monsters:
-        monster_repo = repository_factory.get_monster_repository_for(game_state)
-        for index in request.monsters:
-            with contextlib.suppress(Exception):
-                response.monsters[index] = monster_repo.get_name(index)
-
-    if request.classes:
-        class_repo = repository_factory.get_class_repository_for(game_state)
-        for index in request.classes:
-            with contextlib.suppress(Exception):
-                response.classes[index] = class_repo.get_name(index)
-
-    if request.races:
-        race_repo = repository_factory.get_race_repository_for(game_state)
-        for index in request.races:
-            with contextlib.suppress(Exception):
-                response.races[index] = race_repo.get_name(index)
-
-    if request.alignments:
-        alignment_repo = repository_factory.get_alignment_repository_for(game_state)
-        for index in request.alignments:
-            with contextlib.suppress(Exception):
-                response.alignments[index] = alignment_repo.get_name(index)
-
-    if request.backgrounds:
-        background_repo = repository_factory.get_background_repository_for(game_state)
-        for index in request.backgrounds:
-            with contextlib.suppress(Exception):
-                response.backgrounds[index] = background_repo.get_name(index)
-
-    if request.feats:
-        feat_repo = repository_factory.get_feat_repository_for(game_state)
-        for index in request.feats:
-            with contextlib.suppress(Exception):
-                response.feats[index] = feat_repo.get_name(index)
-
-    if request.features:
-        feature_repo = repository_factory.get_feature_repository_for(game_state)
-        for index in request.features:
-            with contextlib.suppress(Exception):
-                response.features[index] = feature_repo.get_name(index)
-
-    if request.traits:
-        trait_repo = repository_factory.get_trait_repository_for(game_state)
-        for index in request.traits:
-            with contextlib.suppress(Exception):
-                response.traits[index] = trait_repo.get_name(index)
-
-    if request.skills:
-        skill_repo = repository_factory.get_skill_repository_for(game_state)
-        for index in request.skills:
-            with contextlib.suppress(Exception):
-                response.skills[index] = skill_repo.get_name(index)
-
-    if request.conditions:
-        condition_repo = repository_factory.get_condition_repository_for(game_state)
-        for index in request.conditions:
-            with contextlib.suppress(Exception):
-                response.conditions[index] = condition_repo.get_name(index)
-
-    if request.languages:
-        language_repo = repository_factory.get_language_repository_for(game_state)
-        for index in request.languages:
-            with contextlib.suppress(Exception):
-                response.languages[index] = language_repo.get_name(index)
-
-    if request.damage_types:
-        damage_type_repo = repository_factory.get_damage_type_repository_for(game_state)
-        for index in request.damage_types:
-            with contextlib.suppress(Exception):
-                response.damage_types[index] = damage_type_repo.get_name(index)
-
-    if request.magic_schools:
-        magic_school_repo = repository_factory.get_magic_school_repository_for(game_state)
-        for index in request.magic_schools:
-            with contextlib.suppress(Exception):
-                response.magic_schools[index] = magic_school_repo.get_name(index)
-
-    if request.subclasses:
-        subclass_repo = repository_factory.get_subclass_repository_for(game_state)
-        for index in request.subclasses:
-            with contextlib.suppress(Exception):
-                response.subclasses[index] = subclass_repo.get_name(index)
-
-    if request.subraces:
-        race_subrace_repo = repository_factory.get_race_subrace_repository_for(game_state)
-        for index in request.subraces:
-            with contextlib.suppress(Exception):
-                response.subraces[index] = race_subrace_repo.get_name(index)
-
-    if request.weapon_properties:
-        weapon_property_repo = repository_factory.get_weapon_property_repository_for(game_state)
-        for index in request.weapon_properties:
-            with contextlib.suppress(Exception):
-                response.weapon_properties[index] = weapon_property_repo.get_name(index)
-
-    return response
+    resolved: dict[str, dict[str, str]] = {}
+    for category in CATALOG_CATEGORIES:
+        keys: list[str] | None = getattr(request, category)
+        if keys:
+            resolved[category] = name_index.resolve(category, keys)
+
+    return ResolveNamesResponse(**resolved)
+
+
+@router.post("/catalogs/resolve-names/stream")
+async def resolve_names_stream(request: ResolveNamesRequest) -> StreamingResponse:
+    """Resolve display names as newline-delimited JSON for very large batches.
+
+    Each line is ``{"category": ..., "names": {index: name}}`` holding at most
+    RESOLVE_NAMES_STREAM_CHUNK entries, so clients can consume results
+    incrementally instead of waiting for a single large response body.
+    """
+    game_state = _get_game_for_resolution(request.game_id)
+    name_index = container.repository_factory.get_name_index_for(game_state)
+
+    def generate() -> Iterator[str]:
+        for category in CATALOG_CATEGORIES:
+            keys: list[str] | None = getattr(request, category)
+            if not keys:
+                continue
+            for chunk in name_index.iter_resolved(category, keys, RESOLVE_NAMES_STREAM_CHUNK):
+                yield json.dumps({"category": category, "names": chunk}) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 # Items
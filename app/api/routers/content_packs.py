@@ -1,5 +1,6 @@
 """API endpoints for content pack management."""
 
+import asyncio
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -8,9 +9,11 @@ from app.api.dependencies import get_content_pack_registry
 from app.api.schemas.content_packs import (
     ContentPackDetailResponse,
     ContentPackListResponse,
+    ReloadPacksResponse,
     ValidatePacksRequest,
     ValidatePacksResponse,
 )
+from app.container import container
 from app.interfaces.services.common import IContentPackRegistry
 
 router = APIRouter(tags=["content-packs"])
@@ -86,3 +89,25 @@ async def validate_content_packs(
             error = str(e)
 
     return ValidatePacksResponse(valid=valid, error=error, ordered_packs=ordered_packs)
+
+
+@router.post("/content-packs/reload", response_model=ReloadPacksResponse)
+async def reload_content_packs() -> ReloadPacksResponse:
+    """Reload content packs whose files changed on disk.
+
+    Runs the same change check as the background watcher, so pack authors can
+    apply edits immediately instead of waiting for the next poll.
+
+    Returns:
+        What was reloaded, or reloaded=False when nothing changed
+    """
+    # Hashing and parsing pack files, and waiting on a watcher reload, must not block the event loop
+    result = await asyncio.to_thread(container.content_pack_reloader.check_for_changes)
+    if result is None:
+        return ReloadPacksResponse(reloaded=False)
+    return ReloadPacksResponse(
+        reloaded=True,
+        data_types=result.data_types,
+        repositories=result.repositories,
+        packs_refreshed=result.packs_refreshed,
+    )
@@ -0,0 +1,74 @@
+"""Runtime metrics endpoints grouped under /metrics/*."""
+
+from fastapi import APIRouter
+
+from app.api.schemas.metrics import (
+    AgentContextMetrics,
+    BuilderMetrics,
+    ContextMetricsResponse,
+    HttpPoolMetricsResponse,
+)
+from app.container import container
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics/context", response_model=ContextMetricsResponse)
+async def get_context_metrics() -> ContextMetricsResponse:
+    """Per-agent and per-builder context build time and size since startup.
+
+    Builders are listed by descending total time, so the ones dominating CPU
+    time come first; compare avg_tokens across releases to spot context growth.
+    With the prefix-stable layout the stable and volatile parts of an agent's
+    context are listed separately, each with one build per agent call.
+    """
+    agents: list[AgentContextMetrics] = []
+    for (agent_type, part), aggregate in sorted(container.context_build_metrics.snapshot().items()):
+        builders = sorted(aggregate.builders.items(), key=lambda item: item[1].seconds, reverse=True)
+        agents.append(
+            AgentContextMetrics(
+                agent_type=agent_type,
+                part=part.value,
+                builds=aggregate.builds,
+                avg_ms=aggregate.seconds * 1000 / aggregate.builds,
+                avg_tokens=aggregate.tokens / aggregate.builds,
+                max_tokens=aggregate.max_tokens,
+                builders=[
+                    BuilderMetrics(
+                        builder=name,
+                        runs=builder.runs,
+                        avg_ms=builder.seconds * 1000 / builder.runs,
+                        max_ms=builder.max_seconds * 1000,
+                        avg_chars=builder.chars / builder.runs,
+                        avg_tokens=builder.tokens / builder.runs,
+                        max_tokens=builder.max_tokens,
+                    )
+                    for name, builder in builders
+                ],
+            )
+        )
+    return ContextMetricsResponse(agents=agents)
+
+
+@router.get("/metrics/http", response_model=HttpPoolMetricsResponse)
+async def get_http_metrics() -> HttpPoolMetricsResponse:
+    """Usage of the connection pool shared by all LLM agents since startup.
+
+    A reuse_ratio near 1 means calls ride on kept-alive connections; utilization
+    is the share of pool connections busy right now, peak_in_flight the highest
+    concurrency seen (close to max_connections means calls may queue for the pool).
+    """
+    snapshot = container.llm_http_metrics.snapshot()
+    return HttpPoolMetricsResponse(
+        requests=snapshot.requests,
+        errors=snapshot.errors,
+        connections_opened=snapshot.connections_opened,
+        tls_handshakes=snapshot.tls_handshakes,
+        reused=snapshot.reused,
+        reuse_ratio=snapshot.reuse_ratio,
+        in_flight=snapshot.in_flight,
+        peak_in_flight=snapshot.peak_in_flight,
+        max_connections=snapshot.max_connections,
+        utilization=snapshot.utilization,
+        http_versions=snapshot.http_versions,
+    )
@@ -32,3 +32,10 @@ class ValidatePacksResponse(BaseModel):
     valid: bool
     error: str = ""
     ordered_packs: list[str] = Field(default_factory=list)
+
+
+class ReloadPacksResponse(BaseModel):
+    reloaded: bool
+    data_types: list[str] = Field(default_factory=list)
+    repositories: list[str] = Field(default_factory=list)
+    packs_refreshed: bool = False
@@ -0,0 +1,41 @@
+"""Pydantic schemas for runtime metrics endpoints."""
+
+from pydantic import BaseModel
+
+
+class BuilderMetrics(BaseModel):
+    builder: str
+    runs: int
+    avg_ms: float
+    max_ms: float
+    avg_chars: float
+    avg_tokens: float
+    max_tokens: int
+
+
+class AgentContextMetrics(BaseModel):
+    agent_type: str
+    part: str
+    builds: int
+    avg_ms: float
+    avg_tokens: float
+    max_tokens: int
+    builders: list[BuilderMetrics]
+
+
+class ContextMetricsResponse(BaseModel):
+    agents: list[AgentContextMetrics]
+
+
+class HttpPoolMetricsResponse(BaseModel):
+    requests: int
+    errors: int
+    connections_opened: int
+    tls_handshakes: int
+    reused: int
+    reuse_ratio: float
+    in_flight: int
+    peak_in_flight: int
+    max_connections: int
+    utilization: float
+    http_versions: dict[str, int]
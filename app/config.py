@@ -7,6 +7,8 @@ from typing import Any
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from app.agents.core.types import AgentType, LlmCacheMode, NpcDialogueMode, PromptLayout
+
 
 class Settings(BaseSettings):
     """Application settings with validation and defaults."""
@@ -27,6 +29,57 @@ class Settings(BaseSettings):
     # Application Configuration
     save_directory: Path = Field(default=Path("./saves"), alias="SAVE_DIRECTORY")
     port: int = Field(default=8123, alias="PORT")
+    # Seconds between content pack change scans; 0 disables hot reload
+    content_pack_watch_interval: float = Field(default=2.0, alias="CONTENT_PACK_WATCH_INTERVAL")
+    # Memory-mapped compiled catalogs shared by all workers; unset parses pack JSON per process
+    compiled_catalog_dir: Path | None = Field(default=None, alias="COMPILED_CATALOG_DIR")
+    # Single-file validated scenario bundles; unset assembles scenarios from their sources
+    scenario_bundle_dir: Path | None = Field(default=None, alias="SCENARIO_BUNDLE_DIR")
+
+    # Estimated token ceilings for the context built per agent; 0 disables trimming
+    context_token_budget_narrative: int = Field(default=6000, alias="CONTEXT_TOKEN_BUDGET_NARRATIVE")
+    context_token_budget_combat: int = Field(default=4000, alias="CONTEXT_TOKEN_BUDGET_COMBAT")
+    context_token_budget_summarizer: int = Field(default=2000, alias="CONTEXT_TOKEN_BUDGET_SUMMARIZER")
+    context_token_budget_npc: int = Field(default=3000, alias="CONTEXT_TOKEN_BUDGET_NPC")
+
+    # Conversation history sent to agents: recent player turns verbatim, older ones as a
+    # rolling summary; token ceilings per agent cover both (0 sends the full history)
+    history_recent_turns: int = Field(default=8, ge=1, alias="HISTORY_RECENT_TURNS")
+    history_token_budget_narrative: int = Field(default=4000, alias="HISTORY_TOKEN_BUDGET_NARRATIVE")
+    history_token_budget_combat: int = Field(default=2500, alias="HISTORY_TOKEN_BUDGET_COMBAT")
+    history_token_budget_npc: int = Field(default=2000, alias="HISTORY_TOKEN_BUDGET_NPC")
+
+    # Narrative/combat prompt layout: "inline" sends the context with the player line,
+    # "prefix_stable" orders input most-stable first for provider prompt caching
+    prompt_layout: PromptLayout = Field(default=PromptLayout.INLINE, alias="PROMPT_LAYOUT")
+    # With prefix_stable, combat turns send the changes since a full context refreshed
+    # every this many turns; 0 sends the full context every turn
+    context_delta_refresh_turns: int = Field(default=5, ge=0, alias="CONTEXT_DELTA_REFRESH_TURNS")
+
+    # Forward narrative, combat and NPC response text to clients as it is generated
+    agent_streaming: bool = Field(default=False, alias="AGENT_STREAMING")
+
+    # Replies of several addressed NPCs: sequential (reactive) or parallel (independent)
+    npc_dialogue_mode: NpcDialogueMode = Field(default=NpcDialogueMode.SEQUENTIAL, alias="NPC_DIALOGUE_MODE")
+
+    # HTTP connection pool shared by all LLM agents
+    llm_http2: bool = Field(default=True, alias="LLM_HTTP2")
+    llm_http_max_connections: int = Field(default=20, ge=1, alias="LLM_HTTP_MAX_CONNECTIONS")
+    llm_http_max_keepalive: int = Field(default=10, ge=0, alias="LLM_HTTP_MAX_KEEPALIVE")
+    llm_http_keepalive_expiry: float = Field(default=30.0, ge=0, alias="LLM_HTTP_KEEPALIVE_EXPIRY")
+
+    # Agent model calls: "off", "record" to a directory, "replay" from it offline, or
+    # "cache" responses in memory for the agents listed (comma-separated agent types)
+    llm_cache_mode: LlmCacheMode = Field(default=LlmCacheMode.OFF, alias="LLM_CACHE_MODE")
+    llm_cache_dir: Path = Field(default=Path("./llm_recordings"), alias="LLM_CACHE_DIR")
+    llm_cache_agents: str = Field(default="summarizer", alias="LLM_CACHE_AGENTS")
+    llm_cache_max_entries: int = Field(default=512, ge=1, alias="LLM_CACHE_MAX_ENTRIES")
+    llm_cache_ttl: float = Field(default=900.0, gt=0, alias="LLM_CACHE_TTL")
+
+    # Local stand-in model instead of OpenRouter for the agents listed (comma-separated agent
+    # types), playing the turns of a JSON StandInScript; for load and regression tests
+    llm_standin_agents: str = Field(default="", alias="LLM_STANDIN_AGENTS")
+    llm_standin_script: Path | None = Field(default=None, alias="LLM_STANDIN_SCRIPT")
 
     # Debug Configuration
     debug_ai: bool = Field(default=False, alias="DEBUG_AI")
@@ -64,6 +117,18 @@ class Settings(BaseSettings):
         """Get the puppeteer NPC agent model"""
         return self.puppeteer_npc_model
 
+    def get_llm_cache_agents(self) -> frozenset[AgentType]:
+        """Get the agent types whose responses are cached in cache mode"""
+        return _parse_agent_types(self.llm_cache_agents)
+
+    def get_llm_standin_agents(self) -> frozenset[AgentType]:
+        """Get the agent types served by the local stand-in model"""
+        return _parse_agent_types(self.llm_standin_agents)
+
+
+def _parse_agent_types(names: str) -> frozenset[AgentType]:
+    return frozenset(AgentType(name.strip()) for name in names.split(",") if name.strip())
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
@@ -4,7 +4,9 @@ from functools import cached_property
 from pathlib import Path
 from typing import cast
 
-from app.agents.core.types import AgentType
+import httpx
+
+from app.agents.core.types import AgentType, LlmCacheMode
 from app.agents.factory import AgentFactory
 from app.config import get_settings
 from app.events.event_bus import EventBus
@@ -23,6 +25,7 @@ from app.interfaces.services.ai import (
     IAIService,
     IContextService,
     IEventLoggerService,
+    IHistoryWindowService,
     IMessageService,
     IToolSuggestionService,
 )
@@ -43,6 +46,7 @@ from app.interfaces.services.data import ILoader, IRepository
 from app.interfaces.services.game import (
     ICombatService,
     IConversationService,
+    IEntityResolver,
     IEventManager,
     IGameEnrichmentService,
     IGameFactory,
@@ -64,11 +68,18 @@ from app.models.item import ItemDefinition
 from app.models.monster import MonsterSheet
 from app.models.scenario import ScenarioSheet
 from app.models.spell import SpellDefinition
+from app.models.standin_script import StandInScript
 from app.services.ai import AIService, MessageService
 from app.services.ai.agent_lifecycle_service import AgentLifecycleService
 from app.services.ai.config_loader import AgentConfigLoader
+from app.services.ai.context.build_metrics import ContextBuildMetrics
 from app.services.ai.context.context_service import ContextService
+from app.services.ai.debug_logger import AgentDebugLogger
 from app.services.ai.event_logger_service import EventLoggerService
+from app.services.ai.history_window_service import HistoryWindowPolicy, HistoryWindowService
+from app.services.ai.http_client import HttpPoolMetrics, create_llm_http_client
+from app.services.ai.llm_cache import LlmCallCache
+from app.services.ai.message_converter_service import MessageConverterService
 from app.services.ai.orchestration.default_pipeline import create_default_pipeline
 from app.services.ai.tool_call_extractor_service import ToolCallExtractorService
 from app.services.ai.tool_suggestion import ToolSuggestionService
@@ -80,8 +91,11 @@ from app.services.common import BroadcastService, DiceService
 from app.services.common.action_service import ActionService
 from app.services.common.path_resolver import PathResolver
 from app.services.data.content_pack_registry import ContentPackRegistry
+from app.services.data.content_pack_reloader import ContentPackReloader
+from app.services.data.content_pack_watcher import ContentPackWatcher
 from app.services.data.loaders.character_loader import CharacterLoader
 from app.services.data.loaders.scenario_loader import ScenarioLoader
+from app.services.data.name_index import CATALOG_CATEGORIES
 from app.services.data.repositories.alignment_repository import AlignmentRepository
 from app.services.data.repositories.background_repository import BackgroundRepository
 from app.services.data.repositories.class_repository import ClassRepository, SubclassRepository
@@ -104,6 +118,7 @@ from app.services.game import GameService
 from app.services.game.combat_service import CombatService
 from app.services.game.conversation_service import ConversationService
 from app.services.game.enrichment_service import GameEnrichmentService
+from app.services.game.entity_resolver import EntityResolver
 from app.services.game.event_manager import EventManager
 from app.services.game.game_factory import GameFactory
 from app.services.game.game_state_manager import GameStateManager
@@ -115,7 +130,7 @@ from app.services.game.party_service import PartyService
 from app.services.game.player_journal_service import PlayerJournalService
 from app.services.game.pre_save_sanitizer import PreSaveSanitizer
 from app.services.game.save_manager import SaveManager
-from app.services.scenario import ScenarioService
+from app.services.scenario import ScenarioBundleStore, ScenarioService
 
 
 class Container:
@@ -179,14 +194,21 @@ class Container:
     def entity_state_service(self) -> IEntityStateService:
         return EntityStateService(
             compute_service=self.character_compute_service,
+            entity_resolver=self.entity_resolver,
         )
 
+    @cached_property
+    def entity_resolver(self) -> IEntityResolver:
+        return EntityResolver()
+
     @cached_property
     def scenario_service(self) -> IScenarioService:
+        bundle_dir = get_settings().scenario_bundle_dir
         return ScenarioService(
             path_resolver=self.path_resolver,
             scenario_loader=self.scenario_loader,
             character_service=self.character_service,
+            bundle_store=ScenarioBundleStore(bundle_dir, self.scenario_loader) if bundle_dir else None,
         )
 
     @cached_property
@@ -199,7 +221,7 @@ class Container:
 
     @cached_property
     def content_pack_registry(self) -> IContentPackRegistry:
-        registry = ContentPackRegistry(self.path_resolver)
+        registry = ContentPackRegistry(self.path_resolver, compiled_catalog_dir=get_settings().compiled_catalog_dir)
         registry.discover_packs()
         return registry
 
@@ -244,7 +266,10 @@ class Container:
     def location_service(self) -> ILocationService:
         from app.services.game.location_service import LocationService
 
-        return LocationService(monster_manager_service=self.monster_manager_service)
+        return LocationService(
+            monster_manager_service=self.monster_manager_service,
+            entity_resolver=self.entity_resolver,
+        )
 
     @cached_property
     def party_service(self) -> IPartyService:
@@ -413,7 +438,7 @@ class Container:
 
     @cached_property
     def level_progression_service(self) -> ILevelProgressionService:
-        return LevelProgressionService(self.character_compute_service)
+        return LevelProgressionService(self.character_compute_service, self.entity_resolver)
 
     @cached_property
     def event_bus(self) -> IEventBus:
@@ -422,12 +447,17 @@ class Container:
         # Register all handlers
         event_bus.register_handler(
             "entity",
-            EntityHandler(self.entity_state_service, self.level_progression_service),
+            EntityHandler(self.entity_state_service, self.level_progression_service, self.entity_resolver),
         )
         event_bus.register_handler("dice", DiceHandler(self.dice_service))
         event_bus.register_handler(
             "inventory",
-            InventoryHandler(self.item_manager_service, self.entity_state_service, self.repository_factory),
+            InventoryHandler(
+                self.item_manager_service,
+                self.entity_state_service,
+                self.repository_factory,
+                self.entity_resolver,
+            ),
         )
         event_bus.register_handler("time", TimeHandler())
         event_bus.register_handler("broadcast", BroadcastHandler(self.message_service))
@@ -467,7 +497,72 @@ class Container:
 
     @cached_property
     def agent_factory(self) -> AgentFactory:
-        return AgentFactory(self.agent_config_loader)
+        return AgentFactory(
+            self.agent_config_loader,
+            history_window=self.history_window_service,
+            message_converter=self.message_converter_service,
+            http_client=self.llm_http_client,
+            llm_cache=self.llm_cache,
+            standin_script=self.standin_script,
+            standin_agents=get_settings().get_llm_standin_agents(),
+        )
+
+    @cached_property
+    def llm_http_metrics(self) -> HttpPoolMetrics:
+        return HttpPoolMetrics()
+
+    @cached_property
+    def llm_http_client(self) -> httpx.AsyncClient:
+        settings = get_settings()
+        return create_llm_http_client(
+            self.llm_http_metrics,
+            http2=settings.llm_http2,
+            max_connections=settings.llm_http_max_connections,
+            max_keepalive_connections=settings.llm_http_max_keepalive,
+            keepalive_expiry=settings.llm_http_keepalive_expiry,
+        )
+
+    @cached_property
+    def llm_cache(self) -> LlmCallCache | None:
+        settings = get_settings()
+        if settings.llm_cache_mode == LlmCacheMode.OFF:
+            return None
+        return LlmCallCache(
+            settings.llm_cache_mode,
+            directory=settings.llm_cache_dir,
+            max_entries=settings.llm_cache_max_entries,
+            ttl_seconds=settings.llm_cache_ttl,
+            cached_agents=settings.get_llm_cache_agents(),
+        )
+
+    @cached_property
+    def standin_script(self) -> StandInScript:
+        script_path = get_settings().llm_standin_script
+        if script_path is None:
+            return StandInScript()
+        return StandInScript.model_validate_json(script_path.read_text(encoding="utf-8"))
+
+    @cached_property
+    def message_converter_service(self) -> MessageConverterService:
+        return MessageConverterService()
+
+    @cached_property
+    def history_window_service(self) -> IHistoryWindowService:
+        settings = get_settings()
+        budgets = {
+            AgentType.NARRATIVE: settings.history_token_budget_narrative,
+            AgentType.COMBAT: settings.history_token_budget_combat,
+            AgentType.NPC: settings.history_token_budget_npc,
+        }
+        return HistoryWindowService(
+            self.message_converter_service,
+            lambda: self.summarizer_agent,
+            {
+                agent_type: HistoryWindowPolicy(recent_turns=settings.history_recent_turns, max_tokens=budget)
+                for agent_type, budget in budgets.items()
+                if budget > 0
+            },
+        )
 
     @cached_property
     def ai_service(self) -> IAIService:
@@ -526,6 +621,7 @@ class Container:
             agent_lifecycle_service=self.agent_lifecycle_service,
             event_manager=self.event_manager,
             event_bus=self.event_bus,
+            npc_dialogue_mode=settings.npc_dialogue_mode,
         )
 
         return AIService(pipeline)
@@ -602,16 +698,48 @@ class Container:
 
     @cached_property
     def memory_service(self) -> IMemoryService:
-        return MemoryService(lambda: self.summarizer_agent)
+        return MemoryService(lambda: self.summarizer_agent, lambda game_state: self.game_service.save_game(game_state))
 
     @cached_property
     def context_service(self) -> IContextService:
-        return ContextService(self.repository_factory)
+        settings = get_settings()
+        budgets = {
+            AgentType.NARRATIVE: settings.context_token_budget_narrative,
+            AgentType.COMBAT: settings.context_token_budget_combat,
+            AgentType.SUMMARIZER: settings.context_token_budget_summarizer,
+        }
+        return ContextService(
+            self.repository_factory,
+            token_budgets={agent_type: budget for agent_type, budget in budgets.items() if budget > 0},
+            npc_token_budget=settings.context_token_budget_npc or None,
+            prompt_layout=settings.prompt_layout,
+            delta_refresh_turns=settings.context_delta_refresh_turns or None,
+            build_metrics=self.context_build_metrics,
+            debug_logger=AgentDebugLogger(enabled=settings.debug_agent_context),
+        )
+
+    @cached_property
+    def context_build_metrics(self) -> ContextBuildMetrics:
+        return ContextBuildMetrics()
 
     @cached_property
     def repository_factory(self) -> RepositoryFactory:
         return RepositoryFactory(self.path_resolver, self.content_pack_registry)
 
+    @cached_property
+    def content_pack_reloader(self) -> ContentPackReloader:
+        registry = self.content_pack_registry
+        reloader = ContentPackReloader(
+            watcher=ContentPackWatcher(self.path_resolver.get_data_dir(), registry.get_user_packs_dir()),
+            content_pack_registry=registry,
+            repository_factory=self.repository_factory,
+            base_repositories={attr: getattr(self, attr) for attr in CATALOG_CATEGORIES.values()},
+            base_pack_ids=self.all_pack_ids,
+        )
+        # Context fragments embed catalog content (item and spell descriptions)
+        reloader.add_listener(lambda _attrs: self.context_service.clear_fragment_cache())
+        return reloader
+
     @cached_property
     def event_logger_service(self) -> IEventLoggerService:
         settings = get_settings()
@@ -19,6 +19,7 @@ from app.interfaces.services.game import ICombatService
 from app.models.attributes import EntityType
 from app.models.combat import CombatEntry, CombatParticipant
 from app.models.game_state import GameState
+from app.models.state_revisions import StateSection
 from app.models.tool_results import (
     AddParticipantResult,
     EndCombatResult,
@@ -229,6 +230,7 @@ class CombatHandler(BaseHandler):
 
             # Advance turn (this may set combat.is_active to False if no active participants)
             game_state.combat.next_turn()
+            game_state.bump_revision(StateSection.COMBAT)
             current = game_state.combat.get_current_turn()
 
             # Check if combat has no active participants
@@ -293,6 +295,7 @@ class CombatHandler(BaseHandler):
             if not game_state.combat.is_active:
                 raise ValueError("Cannot remove participant: no active combat")
             game_state.combat.remove_participant_by_id(command.entity_id)
+            game_state.bump_revision(StateSection.COMBAT)
             result.mutated = True
             result.data = RemoveParticipantResult(entity_id=command.entity_id, message="Removed from combat")
             result.add_command(BroadcastGameUpdateCommand(game_id=command.game_id))
@@ -13,6 +13,7 @@ from app.events.commands.entity_commands import (
 )
 from app.events.handlers.base_handler import BaseHandler
 from app.interfaces.services.character import IEntityStateService, ILevelProgressionService
+from app.interfaces.services.game import IEntityResolver
 from app.models.game_state import GameState
 from app.models.tool_results import (
     AddConditionResult,
@@ -21,7 +22,6 @@ from app.models.tool_results import (
     UpdateHPResult,
     UpdateSpellSlotsResult,
 )
-from app.utils.entity_resolver import resolve_entity_with_fallback
 
 logger = logging.getLogger(__name__)
 
@@ -41,9 +41,11 @@ class EntityHandler(BaseHandler):
         self,
         entity_state_service: IEntityStateService,
         level_service: ILevelProgressionService,
+        entity_resolver: IEntityResolver,
     ):
         self.entity_state_service = entity_state_service
         self.level_service = level_service
+        self.entity_resolver = entity_resolver
 
     async def handle(self, command: BaseCommand, game_state: GameState) -> CommandResult:
         """Handle character commands."""
@@ -62,7 +64,9 @@ class EntityHandler(BaseHandler):
 
         if isinstance(command, UpdateHPCommand):
             # Resolve entity with fallback and fuzzy matching
-            entity, resolved_type = resolve_entity_with_fallback(game_state, command.entity_id, command.entity_type)
+            entity, resolved_type = self.entity_resolver.resolve_entity_with_fallback(
+                game_state, command.entity_id, command.entity_type
+            )
             if not entity or not resolved_type:
                 etype = command.entity_type.value if command.entity_type else "unknown"
                 raise ValueError(f"Entity with ID '{command.entity_id}' of type '{etype}' not found")
@@ -92,7 +96,9 @@ class EntityHandler(BaseHandler):
             )
 
         elif isinstance(command, UpdateConditionCommand) and command.action == "add":
-            entity, resolved_type = resolve_entity_with_fallback(game_state, command.entity_id, command.entity_type)
+            entity, resolved_type = self.entity_resolver.resolve_entity_with_fallback(
+                game_state, command.entity_id, command.entity_type
+            )
             if not entity or not resolved_type:
                 etype = command.entity_type.value if command.entity_type else "unknown"
                 raise ValueError(f"Entity with ID '{command.entity_id}' of type '{etype}' not found")
@@ -111,7 +117,9 @@ class EntityHandler(BaseHandler):
             logger.debug(f"Condition Added: {entity.display_name} is now {command.condition}")
 
         elif isinstance(command, UpdateConditionCommand) and command.action == "remove":
-            entity, resolved_type = resolve_entity_with_fallback(game_state, command.entity_id, command.entity_type)
+            entity, resolved_type = self.entity_resolver.resolve_entity_with_fallback(
+                game_state, command.entity_id, command.entity_type
+            )
             if not entity or not resolved_type:
                 etype = command.entity_type.value if command.entity_type else "unknown"
                 raise ValueError(f"Entity with ID '{command.entity_id}' of type '{etype}' not found")
@@ -130,7 +138,9 @@ class EntityHandler(BaseHandler):
             logger.debug(f"Condition Removed: {entity.display_name} is no longer {command.condition}")
 
         elif isinstance(command, UpdateSpellSlotsCommand):
-            entity, resolved_type = resolve_entity_with_fallback(game_state, command.entity_id, command.entity_type)
+            entity, resolved_type = self.entity_resolver.resolve_entity_with_fallback(
+                game_state, command.entity_id, command.entity_type
+            )
             if not entity or not resolved_type:
                 etype = command.entity_type.value if command.entity_type else "unknown"
                 raise ValueError(f"Entity with ID '{command.entity_id}' of type '{etype}' not found")
@@ -154,7 +164,9 @@ class EntityHandler(BaseHandler):
             logger.debug(f"Spell Slots: Level {command.level} - {old_slots} → {new_slots}/{max_slots}")
 
         elif isinstance(command, LevelUpCommand):
-            entity, resolved_type = resolve_entity_with_fallback(game_state, command.entity_id, command.entity_type)
+            entity, resolved_type = self.entity_resolver.resolve_entity_with_fallback(
+                game_state, command.entity_id, command.entity_type
+            )
             if not entity or not resolved_type:
                 etype = command.entity_type.value if command.entity_type else "unknown"
                 raise ValueError(f"Entity with ID '{command.entity_id}' of type '{etype}' not found")
@@ -12,7 +12,7 @@ from app.events.commands.inventory_commands import (
 from app.events.handlers.base_handler import BaseHandler
 from app.interfaces.services.character import IEntityStateService
 from app.interfaces.services.data import IRepositoryProvider
-from app.interfaces.services.game import IItemManagerService
+from app.interfaces.services.game import IEntityResolver, IItemManagerService
 from app.models.attributes import EntityType
 from app.models.equipment_slots import EquipmentSlotType
 from app.models.game_state import GameState
@@ -22,7 +22,6 @@ from app.models.tool_results import (
     ModifyCurrencyResult,
     RemoveItemResult,
 )
-from app.utils.entity_resolver import resolve_entity_with_fallback
 
 logger = logging.getLogger(__name__)
 
@@ -35,10 +34,12 @@ class InventoryHandler(BaseHandler):
         item_manager_service: IItemManagerService,
         entity_state_service: IEntityStateService,
         repository_provider: IRepositoryProvider,
+        entity_resolver: IEntityResolver,
     ):
         self.item_manager_service = item_manager_service
         self.entity_state_service = entity_state_service
         self.repository_provider = repository_provider
+        self.entity_resolver = entity_resolver
 
     supported_commands = (
         ModifyCurrencyCommand,
@@ -55,12 +56,15 @@ class InventoryHandler(BaseHandler):
             if command.entity_type == EntityType.MONSTER:
                 raise ValueError("Inventory operations are not supported for monsters")
 
-            entity, resolved_type = resolve_entity_with_fallback(game_state, command.entity_id, command.entity_type)
+            entity, resolved_type = self.entity_resolver.resolve_entity_with_fallback(
+                game_state, command.entity_id, command.entity_type
+            )
             if not entity or not resolved_type:
                 etype = command.entity_type.value if command.entity_type else "unknown"
                 raise ValueError(f"Entity with ID '{command.entity_id}' of type '{etype}' not found")
 
             npc_or_char = entity.state
+            entity_instance_id = entity.instance_id
 
         if isinstance(command, ModifyCurrencyCommand):
             # Modify currency for the entity
@@ -110,6 +114,7 @@ class InventoryHandler(BaseHandler):
                 )
                 npc_or_char.inventory.append(new_item)
 
+            game_state.bump_entity_revision(entity_instance_id)
             result.mutated = True
 
             result.data = AddItemResult(
@@ -143,6 +148,7 @@ class InventoryHandler(BaseHandler):
             if existing_item.quantity == 0:
                 npc_or_char.inventory.remove(existing_item)
 
+            game_state.bump_entity_revision(entity_instance_id)
             result.mutated = True
 
             result.data = RemoveItemResult(
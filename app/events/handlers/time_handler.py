@@ -13,6 +13,7 @@ from app.events.commands.time_commands import (
 )
 from app.events.handlers.base_handler import BaseHandler
 from app.models.game_state import GameState
+from app.models.state_revisions import StateSection
 from app.models.tool_results import (
     AdvanceTimeResult,
     LongRestResult,
@@ -54,6 +55,8 @@ class TimeHandler(BaseHandler):
                     game_state.game_time.hour -= 24
                     game_state.game_time.day += 1
 
+            game_state.bump_revision(StateSection.CHARACTER)
+            game_state.bump_revision(StateSection.LOCATION)
             result.mutated = True
             result.recompute_state = True
 
@@ -90,6 +93,8 @@ class TimeHandler(BaseHandler):
                 game_state.game_time.hour -= 24
                 game_state.game_time.day += 1
 
+            game_state.bump_revision(StateSection.CHARACTER)
+            game_state.bump_revision(StateSection.LOCATION)
             result.mutated = True
             result.recompute_state = True
 
@@ -118,6 +123,7 @@ class TimeHandler(BaseHandler):
                     game_state.game_time.hour -= 24
                     game_state.game_time.day += 1
 
+            game_state.bump_revision(StateSection.LOCATION)
             new_time = (
                 f"Day {game_state.game_time.day}, {game_state.game_time.hour:02d}:{game_state.game_time.minute:02d}"
             )
@@ -8,7 +8,7 @@ from typing import Protocol
 from app.agents.core.base import ToolFunction
 from app.models.game_state import GameState, Message
 from app.models.instances.npc_instance import NPCInstance
-from app.models.memory import MemoryEventKind, WorldEventContext
+from app.models.memory import LocationExitSummary, MemoryEventKind, WorldEventContext
 
 
 class ISummarizerAgent(Protocol):
@@ -80,6 +80,26 @@ class ISummarizerAgent(Protocol):
         """
         ...
 
+    async def summarize_location_exit(
+        self,
+        game_state: GameState,
+        location_id: str,
+        messages: Sequence[Message],
+        npc_messages: Sequence[tuple[NPCInstance, Sequence[Message]]],
+    ) -> LocationExitSummary:
+        """Summarize a location session and the interactions with each NPC present in one call.
+
+        Args:
+            game_state: Game state providing scenario metadata for the location.
+            location_id: Scenario location identifier being summarized.
+            messages: Conversation history slice relevant to the location session.
+            npc_messages: Each NPC present at the location with the history slice referencing it.
+
+        Returns:
+            The location summary plus one summary per NPC; empty strings where nothing was produced.
+        """
+        ...
+
     async def summarize_world_update(
         self,
         game_state: GameState,
@@ -99,3 +119,23 @@ class ISummarizerAgent(Protocol):
             A short summary string suitable for storing in world memories.
         """
         ...
+
+    async def summarize_history(
+        self,
+        game_state: GameState,
+        previous_summary: str,
+        messages: Sequence[Message],
+        max_tokens: int,
+    ) -> str:
+        """Extend a rolling conversation summary with messages leaving the history window.
+
+        Args:
+            game_state: Game state the conversation belongs to.
+            previous_summary: Summary of everything folded so far (may be empty).
+            messages: Messages to fold in, oldest first.
+            max_tokens: Approximate size ceiling for the returned summary.
+
+        Returns:
+            The updated summary, or an empty string if summarization failed.
+        """
+        ...
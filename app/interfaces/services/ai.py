@@ -2,8 +2,10 @@ from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator, AsyncIterator
 from typing import Any
 
+from pydantic_ai.messages import ModelMessage
+
 from app.agents.core.base import BaseAgent
-from app.agents.core.types import AgentType
+from app.agents.core.types import AgentType, PromptLayout
 from app.common.types import JSONSerializable
 from app.models.ai_response import AIResponse
 from app.models.combat import CombatSuggestion
@@ -195,6 +197,18 @@ class IContextService(ABC):
         """
         pass
 
+    @abstractmethod
+    def build_stable_context(self, game_state: GameState, agent_type: AgentType) -> str:
+        """Build the rarely changing context that build_context leaves out.
+
+        Only non-empty under the PREFIX_STABLE layout, where agents send it ahead of
+        the conversation history.
+        """
+
+    @abstractmethod
+    def get_prompt_layout(self) -> PromptLayout:
+        """Return how agents should arrange the context in their calls."""
+
     @abstractmethod
     def build_context_for_npc(self, game_state: GameState, npc: NPCInstance) -> str:
         """Build shared context slice for NPC agents.
@@ -211,6 +225,35 @@ class IContextService(ABC):
     def build_npc_persona(self, npc: NPCInstance) -> str:
         """Build persona description for a specific NPC."""
 
+    @abstractmethod
+    def clear_fragment_cache(self) -> None:
+        """Drop reused builder output, e.g. after catalog content changed."""
+
+
+class IHistoryWindowService(ABC):
+    """Bounded conversation history for agent calls."""
+
+    @abstractmethod
+    def build_message_history(
+        self,
+        game_state: GameState,
+        agent_type: AgentType,
+        npc_id: str = "",
+    ) -> list[ModelMessage]:
+        """Return the message history an agent should receive this turn.
+
+        Older messages are represented by a rolling summary instead of verbatim;
+        keeping that summary current happens in the background.
+
+        Args:
+            game_state: Current game state
+            agent_type: Agent requesting its history
+            npc_id: NPC instance ID for NPC agents, "" otherwise
+
+        Returns:
+            Messages in PydanticAI format, oldest first
+        """
+
 
 class IAgentLifecycleService(ABC):
     """Lifecycle management for dynamic NPC agents."""
@@ -212,6 +212,14 @@ class IContentPackRegistry(ABC):
         """
         pass
 
+    @abstractmethod
+    def refresh(self) -> None:
+        """Re-scan content pack metadata, even if discovery already ran.
+
+        Picks up packs that were added, removed or edited since discovery.
+        """
+        pass
+
     @abstractmethod
     def get_pack(self, pack_id: str) -> ContentPackMetadata | None:
         """Get metadata for a specific content pack.
@@ -264,6 +272,20 @@ class IContentPackRegistry(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_compiled_catalog_dir(self) -> Path | None:
+        """Get the directory holding compiled, memory-mapped catalogs.
+
+        Returns:
+            Directory path, or None when repositories should parse pack JSON directly
+        """
+        pass
+
+    @abstractmethod
+    def get_user_packs_dir(self) -> Path:
+        """Get the directory scanned for user-created content packs."""
+        pass
+
     @abstractmethod
     def get_pack_data_path(self, pack_id: str, data_type: str) -> Path | None:
         """Get the path to a specific data file within a content pack.
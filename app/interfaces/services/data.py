@@ -98,6 +98,20 @@ class IRepository(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    def find_similar_keys(self, key: str, limit: int = 3, threshold: float = 0.0) -> list[str]:
+        """Return existing keys most similar to a possibly misspelled key.
+
+        Args:
+            key: The key that failed to resolve
+            limit: Maximum number of keys to return
+            threshold: Minimum similarity ratio (0-1) for a key to be returned
+
+        Returns:
+            Matching keys, best match first
+        """
+        pass
+
     @abstractmethod
     def get_item_pack_id(self, key: str) -> str | None:
         """Return the content pack id that provided this key, if known.
@@ -113,6 +127,15 @@ class IRepository(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    def reload(self) -> None:
+        """Re-read the backing content pack data, replacing cached items in place.
+
+        Used when content pack files change on disk; callers holding this
+        repository see the new content without being re-wired.
+        """
+        pass
+
     @abstractmethod
     def filter(self, *predicates: Callable[[T], bool]) -> list[T]:
         """Filter repository items using one or more predicate functions.
@@ -2,6 +2,7 @@
 
 from app.interfaces.services.game.combat_service import ICombatService
 from app.interfaces.services.game.conversation_service import IConversationService
+from app.interfaces.services.game.entity_resolver import IEntityResolver
 from app.interfaces.services.game.event_manager import IEventManager
 from app.interfaces.services.game.game_enrichment_service import IGameEnrichmentService
 from app.interfaces.services.game.game_factory import IGameFactory
@@ -19,6 +20,7 @@ from app.interfaces.services.game.save_manager import ISaveManager
 __all__ = [
     "ICombatService",
     "IConversationService",
+    "IEntityResolver",
     "IEventManager",
     "IGameEnrichmentService",
     "IGameFactory",
@@ -0,0 +1,63 @@
+"""Interface for entity resolver."""
+
+from abc import ABC, abstractmethod
+
+from app.models.attributes import EntityType
+from app.models.entity import IEntity
+from app.models.game_state import GameState
+from app.utils.fuzzy_index import DEFAULT_SIMILARITY_THRESHOLD, FuzzyMatch
+
+
+class IEntityResolver(ABC):
+    """Resolve entity IDs in a game, tolerating typos through fuzzy matching."""
+
+    @abstractmethod
+    def find_similar_instance_ids(
+        self,
+        game_state: GameState,
+        entity_type: EntityType,
+        entity_id: str,
+        limit: int = 3,
+        similarity_threshold: float = 0.0,
+    ) -> list[FuzzyMatch]:
+        """Return the instance IDs of one entity type most similar to entity_id, best first."""
+        pass
+
+    @abstractmethod
+    def find_similar_entity(
+        self,
+        game_state: GameState,
+        entity_type: EntityType,
+        entity_id: str,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> IEntity | None:
+        """Find an entity by ID with fuzzy matching for typos.
+
+        Logs once if a fuzzy match is used. Returns the entity if a match is found.
+        """
+        pass
+
+    @abstractmethod
+    def resolve_entity_with_fallback(
+        self,
+        game_state: GameState,
+        entity_id: str,
+        entity_type: EntityType | None = None,
+    ) -> tuple[IEntity | None, EntityType | None]:
+        """Resolve an entity with multiple fallback strategies.
+
+        1. If entity_id is "player", map to player's actual ID
+        2. Try exact match with specified entity_type
+        3. Try fuzzy match with specified entity_type
+        4. If no entity_type specified, try all types with exact match
+        5. If no entity_type specified, try all types with fuzzy match
+
+        Args:
+            game_state: Current game state
+            entity_id: The entity ID to resolve
+            entity_type: Optional entity type hint
+
+        Returns:
+            Tuple of (entity or None, resolved_entity_type or None)
+        """
+        pass
@@ -15,11 +15,14 @@ class IMemoryService(ABC):
     async def on_location_exit(self, game_state: GameState) -> None:
         """Summarize the current location session and record NPC memories before moving.
 
+        Implementations may capture what to summarize now and append the entries later;
+        use wait_for_pending to observe them.
+
         Args:
             game_state: Mutable game state containing conversation history and scenario data.
 
         Returns:
-            None. Implementations append memory entries directly to the game state.
+            None. Implementations append memory entries to the game state.
         """
 
     @abstractmethod
@@ -40,7 +43,15 @@ class IMemoryService(ABC):
             context: Structured metadata about related locations and NPCs.
 
         Returns:
-            None. Implementations append memory entries directly to the game state.
+            None. Implementations append memory entries to the game state, possibly later.
+        """
+
+    @abstractmethod
+    async def wait_for_pending(self, game_id: str | None = None) -> None:
+        """Wait until scheduled memory captures have been applied and their games saved.
+
+        Args:
+            game_id: Only wait for this game's captures; None waits for all games.
         """
 
     @abstractmethod
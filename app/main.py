@@ -2,11 +2,16 @@
 FastAPI application entry point for D&D 5e AI Dungeon Master.
 """
 
+import asyncio
+import contextlib
 import logging
 import sys
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
@@ -17,6 +22,9 @@ from fastapi.staticfiles import StaticFiles
 from app.api.routes import router as api_router
 from app.config import get_settings
 from app.container import container
+from app.interfaces.services.data import IRepository
+from app.services.data.name_index import CATALOG_CATEGORIES
+from app.services.data.warmup import DataWarmup, WarmupTask
 
 # Configure logging
 logging.basicConfig(
@@ -34,6 +42,55 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+def _count_keys(repository: IRepository[Any]) -> int:
+    return len(repository.list_keys())
+
+
+def _load_characters() -> int:
+    return len(container.character_service.get_all_characters())
+
+
+def _load_scenarios() -> int:
+    scenarios = container.scenario_service.list_scenarios()
+    if scenarios:
+        # Get first scenario to validate its structure
+        _ = container.scenario_service.get_scenario(scenarios[0].id)
+    return len(scenarios)
+
+
+def _warm_up_game_data() -> None:
+    """Load every catalog, character and scenario concurrently and log per-source timings."""
+    # Resolve repositories on this thread so only their data loading runs in the pool
+    repository_tasks: dict[str, WarmupTask] = {
+        attr.removesuffix("_repository"): partial(_count_keys, getattr(container, attr))
+        for attr in CATALOG_CATEGORIES.values()
+    }
+    stages: list[dict[str, WarmupTask]] = [
+        {**repository_tasks, "characters": _load_characters},
+        # Scenarios depend on the character service
+        {"scenarios": _load_scenarios},
+    ]
+
+    started = time.perf_counter()
+    results = DataWarmup(stages).run()
+    DataWarmup.log_results(results, time.perf_counter() - started)
+
+    failures = [result for result in results if not result.ok]
+    if failures:
+        raise RuntimeError("; ".join(f"{result.name}: {result.error}" for result in failures))
+
+
+async def _watch_content_packs(interval: float) -> None:
+    """Poll content pack files and hot-reload changed catalogs."""
+    reloader = container.content_pack_reloader
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(reloader.check_for_changes)
+        except Exception as e:
+            logger.error(f"Content pack reload failed: {e}", exc_info=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
@@ -49,21 +106,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Trigger agent config loading on startup
         _ = container.agent_factory
 
+        # Pre-cache and validate all game data before services start using it
+        logger.info("Pre-caching and validating all game data...")
+        _warm_up_game_data()
+
         # Trigger creation of all services on startup
         _ = container.game_service
         _ = container.ai_service
-
-        # Pre-cache and validate all game data
-        logger.info("Pre-caching and validating all game data...")
-        _ = container.item_repository.list_keys()
-        _ = container.spell_repository.list_keys()
-        _ = container.monster_repository.list_keys()
-        # Character data is loaded via character_service
-        # For scenario service, validate default scenario
-        scenarios = container.scenario_service.list_scenarios()
-        if scenarios:
-            # Get first scenario to validate its structure
-            _ = container.scenario_service.get_scenario(scenarios[0].id)
         logger.info("Data validation successful!")
 
         logger.info(f"Save directory: {settings.save_directory}")
@@ -76,12 +125,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         raise RuntimeError(f"Configuration or data validation error: {e}") from e
 
+    watch_task: asyncio.Task[None] | None = None
+    if settings.content_pack_watch_interval > 0:
+        # Snapshot pack files now so only edits made after startup trigger a reload
+        _ = container.content_pack_reloader
+        watch_task = asyncio.create_task(_watch_content_packs(settings.content_pack_watch_interval))
+
     logger.info("Application started successfully!")
 
     yield
 
     # Shutdown
     logger.info("Shutting down D&D 5e AI Dungeon Master...")
+    if watch_task is not None:
+        watch_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await watch_task
+    # Apply (and save) memory captures still running before their LLM client closes
+    await container.memory_service.wait_for_pending()
+    await container.llm_http_client.aclose()
 
 
 # Create FastAPI app instance
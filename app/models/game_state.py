@@ -3,20 +3,23 @@
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from app.agents.core.types import AgentType
 from app.common.types import JSONSerializable
 from app.models.attributes import EntityType
 from app.models.combat import CombatState
 from app.models.entity import IEntity
+from app.models.history_summary import HistorySummary
 from app.models.instances.character_instance import CharacterInstance
 from app.models.instances.monster_instance import MonsterInstance
 from app.models.instances.npc_instance import NPCInstance
 from app.models.instances.scenario_instance import ScenarioInstance
 from app.models.location import LocationState
+from app.models.message_index import MessageIndex
 from app.models.party import PartyState
 from app.models.player_journal import PlayerJournalEntry
+from app.models.state_revisions import StateRevisions, StateSection
 
 
 class MessageRole(str, Enum):
@@ -149,6 +152,9 @@ class GameState(BaseModel):
     # Conversation history (player/DM/NPC dialogue)
     conversation_history: list[Message] = Field(default_factory=list)
 
+    # Rolling summaries of history older than each agent's window, keyed by history view
+    history_summaries: dict[str, HistorySummary] = Field(default_factory=dict)
+
     # Game events (mechanics and tool calls)
     game_events: list[GameEvent] = Field(default_factory=list)
 
@@ -162,6 +168,29 @@ class GameState(BaseModel):
     session_number: int = Field(ge=1, default=1)
     total_play_time_minutes: int = Field(ge=0, default=0)
 
+    # Runtime revision counters per section for cache invalidation (never persisted)
+    revisions: StateRevisions = Field(default_factory=StateRevisions, exclude=True)
+
+    # Runtime positions of conversation messages per view, extended as the history grows
+    _message_index: MessageIndex = PrivateAttr(default_factory=MessageIndex)
+
+    def bump_revision(self, section: StateSection, npc_id: str | None = None) -> int:
+        """Record that a section changed; see StateRevisions.bump."""
+        return self.revisions.bump(section, npc_id)
+
+    def bump_entity_revision(self, entity_id: str) -> None:
+        """Record a change to the player, one NPC or the monsters, by instance ID."""
+        if entity_id == self.character.instance_id:
+            self.revisions.bump(StateSection.CHARACTER)
+        elif self.get_npc_by_id(entity_id) is not None:
+            self.revisions.bump(StateSection.NPC, entity_id)
+        else:
+            self.revisions.bump(StateSection.MONSTERS)
+
+    def version_vector(self) -> dict[str, int]:
+        """Return the revision of every section, with one entry per current NPC."""
+        return self.revisions.version_vector([npc.instance_id for npc in self.npcs])
+
     def get_entity_by_id(self, entity_type: EntityType, entity_id: str) -> IEntity | None:
         """Resolve an entity by type and instance id for all operations (combat, HP, conditions, etc)."""
         match entity_type:
@@ -199,13 +228,21 @@ class GameState(BaseModel):
         """Add a note to the story log."""
         self.story_notes.append(f"[Day {self.game_time.day}] {note}")
 
+    @property
+    def message_index(self) -> MessageIndex:
+        """Message positions per view, synced with any messages appended since the last access."""
+        self._message_index.sync(self.conversation_history)
+        return self._message_index
+
     def get_messages_for_agent(self, agent_type: AgentType) -> list[Message]:
         """Get conversation history filtered for a specific agent."""
-        return [msg for msg in self.conversation_history if msg.agent_type == agent_type]
+        history = self.conversation_history
+        return [history[position] for position in self.message_index.for_agents([agent_type])]
 
     def get_messages_for_combat(self, occurrence: int) -> list[Message]:
         """Get conversation history for a specific combat occurrence."""
-        return [msg for msg in self.conversation_history if msg.combat_occurrence == occurrence]
+        history = self.conversation_history
+        return [history[position] for position in self.message_index.for_combat(occurrence)]
 
     def update_save_time(self) -> None:
         """Update the last saved timestamp."""
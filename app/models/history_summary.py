@@ -0,0 +1,19 @@
+"""Rolling summaries of conversation history that fell out of an agent's window."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class HistorySummary(BaseModel):
+    """Summary of the older part of one agent view of the conversation.
+
+    Attributes:
+        summary: Condensed account of every folded message
+        covered_messages: Number of leading conversation_history entries folded into summary
+        updated_at: When the summary was last extended
+    """
+
+    summary: str = ""
+    covered_messages: int = Field(ge=0, default=0)
+    updated_at: datetime = Field(default_factory=datetime.now)
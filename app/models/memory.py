@@ -43,3 +43,20 @@ class MemoryEntry(BaseModel):
     encounter_id: str | None = None
     since_timestamp: datetime | None = None
     since_message_index: int | None = None
+
+
+class NPCSessionSummary(BaseModel):
+    """Summary of the party's interactions with one NPC during a location session."""
+
+    npc_id: str = Field(description="Instance id of the NPC exactly as listed in the prompt")
+    summary: str = Field(description="2-3 sentences; empty when nothing noteworthy happened with this NPC")
+
+
+class LocationExitSummary(BaseModel):
+    """Location and per-NPC summaries of one location session, produced in a single call."""
+
+    location_summary: str = Field(description="2-3 sentences about the party's time at the location")
+    npc_summaries: list[NPCSessionSummary] = Field(default_factory=list)
+
+    def summary_for(self, npc_id: str) -> str:
+        return next((entry.summary for entry in self.npc_summaries if entry.npc_id == npc_id), "")
@@ -0,0 +1,63 @@
+"""Append-maintained positions of conversation messages per view."""
+
+import heapq
+from bisect import bisect_left
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from app.agents.core.types import AgentType
+
+if TYPE_CHECKING:
+    from app.models.game_state import Message
+
+
+class MessageIndex:
+    """Positions in conversation_history grouped by agent type, NPC speaker and combat occurrence.
+
+    The history is append-only, so syncing only visits messages added since the
+    previous sync. Assigning a new list (e.g. on load) or shrinking it triggers a
+    full rebuild; replacing entries in place is not detected.
+    """
+
+    def __init__(self) -> None:
+        self._history: list[Message] | None = None
+        self._count = 0
+        self._by_agent: dict[AgentType, list[int]] = {}
+        self._by_speaker: dict[str, list[int]] = {}
+        self._by_combat: dict[int, list[int]] = {}
+
+    def sync(self, history: list["Message"]) -> None:
+        """Index messages appended to history since the last sync."""
+        if history is not self._history or len(history) < self._count:
+            self._history = history
+            self._count = 0
+            self._by_agent = {}
+            self._by_speaker = {}
+            self._by_combat = {}
+
+        for position in range(self._count, len(history)):
+            message = history[position]
+            self._by_agent.setdefault(message.agent_type, []).append(position)
+            if message.speaker_npc_id:
+                self._by_speaker.setdefault(message.speaker_npc_id, []).append(position)
+            if message.combat_occurrence is not None:
+                self._by_combat.setdefault(message.combat_occurrence, []).append(position)
+        self._count = len(history)
+
+    def for_agents(self, agent_types: Iterable[AgentType], start: int = 0) -> list[int]:
+        """Return ascending positions of messages from any of the agent types, from start on."""
+        return self._merge([self._by_agent.get(agent_type, []) for agent_type in agent_types], start)
+
+    def for_speaker(self, npc_id: str, start: int = 0) -> list[int]:
+        return self._merge([self._by_speaker.get(npc_id, [])], start)
+
+    def for_combat(self, occurrence: int, start: int = 0) -> list[int]:
+        return self._merge([self._by_combat.get(occurrence, [])], start)
+
+    @staticmethod
+    def _merge(position_lists: list[list[int]], start: int) -> list[int]:
+        tails = [positions[bisect_left(positions, start) :] for positions in position_lists]
+        tails = [tail for tail in tails if tail]
+        if len(tails) == 1:
+            return tails[0]
+        return list(heapq.merge(*tails))
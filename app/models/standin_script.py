@@ -0,0 +1,83 @@
+"""Script models for the local stand-in model used instead of a real LLM in load tests."""
+
+import math
+import random
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from app.agents.core.types import AgentType
+
+
+class LatencyDistribution(str, Enum):
+    """Shape of the simulated time to first token."""
+
+    FIXED = "fixed"
+    UNIFORM = "uniform"
+    NORMAL = "normal"
+    LOGNORMAL = "lognormal"
+
+
+class LatencyProfile(BaseModel):
+    """Time to first token of a stand-in response."""
+
+    distribution: LatencyDistribution = Field(default=LatencyDistribution.FIXED, description="Sampling distribution")
+    mean_ms: float = Field(default=0.0, ge=0.0, description="Mean (median for lognormal) in milliseconds")
+    spread_ms: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Half-width for uniform, standard deviation for normal and lognormal, in milliseconds",
+    )
+
+    def sample(self, rng: random.Random) -> float:
+        """Return one latency in seconds, never negative."""
+        if self.distribution == LatencyDistribution.UNIFORM:
+            ms = rng.uniform(self.mean_ms - self.spread_ms, self.mean_ms + self.spread_ms)
+        elif self.distribution == LatencyDistribution.NORMAL:
+            ms = rng.gauss(self.mean_ms, self.spread_ms)
+        elif self.distribution == LatencyDistribution.LOGNORMAL and self.mean_ms > 0:
+            ms = rng.lognormvariate(math.log(self.mean_ms), self.spread_ms / self.mean_ms)
+        else:
+            ms = self.mean_ms
+        return max(ms, 0.0) / 1000
+
+
+class ScriptedToolCall(BaseModel):
+    """One tool call of a scripted turn.
+
+    String arguments may use placeholders filled from the game the agent runs for:
+    {player_id}, {location_id}, {enemy_id}, {npc_id}; an argument that is exactly
+    "{enemy_ids}" becomes the list of living monsters at the location. A call whose
+    tool the agent does not have, or whose placeholders cannot be filled, is skipped.
+    """
+
+    tool: str = Field(..., description="Tool name, e.g. 'roll_dice'")
+    args: dict[str, Any] = Field(default_factory=dict, description="Tool arguments")
+
+
+class ScriptedTurn(BaseModel):
+    """One agent run: tool calls in order, one per model response, then the final text."""
+
+    tool_calls: list[ScriptedToolCall] = Field(default_factory=list)
+    text: str = Field(default="The story continues.", description="Final response text")
+
+
+class AgentScript(BaseModel):
+    """Turns of one agent type, used in rotation; latency and throughput override the script's."""
+
+    turns: list[ScriptedTurn] = Field(default_factory=lambda: [ScriptedTurn()], min_length=1)
+    latency: LatencyProfile | None = None
+    tokens_per_second: float | None = Field(default=None, ge=0.0)
+
+
+class StandInScript(BaseModel):
+    """Behaviour of the stand-in model for every agent type it replaces."""
+
+    seed: int | None = Field(default=None, description="Seed for reproducible latencies")
+    latency: LatencyProfile = Field(default_factory=LatencyProfile)
+    tokens_per_second: float = Field(default=0.0, ge=0.0, description="Text output throughput; 0 streams instantly")
+    agents: dict[AgentType, AgentScript] = Field(default_factory=dict)
+
+    def for_agent(self, agent_type: AgentType) -> AgentScript:
+        return self.agents.get(agent_type) or AgentScript()
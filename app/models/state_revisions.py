@@ -0,0 +1,81 @@
+"""Revision counters for the sections of a game state."""
+
+import itertools
+from collections.abc import Iterable
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+# Process-wide clock: every bump and every new GameState draws a fresh value, so a
+# revision never repeats even when a game is reloaded from disk under the same ID.
+_revision_clock = itertools.count(1)
+
+
+def _next_revision() -> int:
+    return next(_revision_clock)
+
+
+class StateSection(str, Enum):
+    """Independently versioned parts of a GameState."""
+
+    CHARACTER = "character"
+    NPC = "npc"  # One counter per NPC instance
+    MONSTERS = "monsters"
+    COMBAT = "combat"
+    PARTY = "party"
+    LOCATION = "location"  # Current location, game time and per-location state
+    MEMORIES = "memories"
+    HISTORY = "history"
+
+
+class StateRevisions(BaseModel):
+    """Monotonic revision counters per GameState section.
+
+    Counters are runtime-only (not persisted): a freshly constructed state starts
+    every section at a new base revision. Downstream caches key on
+    ``(section, revision)`` or on the whole ``version_vector()``.
+
+    Attributes:
+        base: Revision of every section that was not bumped yet
+        sections: Latest revision of each bumped section (NPCs excluded)
+        npcs: Latest revision of each bumped NPC instance
+    """
+
+    base: int = Field(default_factory=_next_revision)
+    sections: dict[StateSection, int] = Field(default_factory=dict)
+    npcs: dict[str, int] = Field(default_factory=dict)
+
+    def bump(self, section: StateSection, npc_id: str | None = None) -> int:
+        """Record a change to a section and return its new revision.
+
+        Args:
+            section: Section that changed
+            npc_id: NPC instance ID, required for StateSection.NPC
+        """
+        revision = _next_revision()
+        if section == StateSection.NPC:
+            if npc_id is None:
+                raise ValueError("npc_id is required to bump an NPC revision")
+            self.npcs[npc_id] = revision
+        else:
+            self.sections[section] = revision
+        return revision
+
+    def get(self, section: StateSection, npc_id: str | None = None) -> int:
+        """Return the current revision of a section (or of one NPC)."""
+        if section == StateSection.NPC:
+            if npc_id is None:
+                raise ValueError("npc_id is required to read an NPC revision")
+            return self.npcs.get(npc_id, self.base)
+        return self.sections.get(section, self.base)
+
+    def version_vector(self, npc_ids: Iterable[str] = ()) -> dict[str, int]:
+        """Return a compact {section: revision} mapping.
+
+        Args:
+            npc_ids: NPC instances to include, keyed ``npc:<instance_id>``
+        """
+        vector = {section.value: self.get(section) for section in StateSection if section != StateSection.NPC}
+        for npc_id in npc_ids:
+            vector[f"{StateSection.NPC.value}:{npc_id}"] = self.npcs.get(npc_id, self.base)
+        return vector
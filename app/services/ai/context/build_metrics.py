@@ -0,0 +1,113 @@
+"""Per-builder timing and size aggregates of context builds."""
+
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from enum import Enum
+
+
+@dataclass(frozen=True)
+class BuilderTiming:
+    """One builder run within a context build.
+
+    Attributes:
+        builder: Builder name, e.g. "Spell"
+        entity_id: Instance the builder ran for, None for game-state builders
+        seconds: Wall time spent producing the section (cache lookups included)
+        chars: Characters of the section as sent (0 when empty or omitted)
+        tokens: Estimated tokens of the section as sent
+        level: "full", "summary", "omitted", or "empty" when the builder produced nothing
+    """
+
+    builder: str
+    entity_id: str | None
+    seconds: float
+    chars: int
+    tokens: int
+    level: str
+
+
+class ContextPart(str, Enum):
+    """Which part of an agent's context a build produced.
+
+    Under the prefix-stable layout each agent call builds the stable prefix and
+    the volatile remainder separately; they are aggregated apart so each keeps
+    one build per call.
+    """
+
+    FULL = "full"
+    STABLE = "stable"
+    VOLATILE = "volatile"
+
+
+@dataclass
+class BuilderAggregate:
+    """Cumulated runs of one builder for one agent type."""
+
+    runs: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    chars: int = 0
+    tokens: int = 0
+    max_tokens: int = 0
+
+    def add(self, timing: BuilderTiming) -> None:
+        self.runs += 1
+        self.seconds += timing.seconds
+        self.max_seconds = max(self.max_seconds, timing.seconds)
+        self.chars += timing.chars
+        self.tokens += timing.tokens
+        self.max_tokens = max(self.max_tokens, timing.tokens)
+
+
+@dataclass
+class AgentContextAggregate:
+    """Cumulated context builds of one agent type."""
+
+    builds: int = 0
+    seconds: float = 0.0
+    tokens: int = 0
+    max_tokens: int = 0
+    builders: dict[str, BuilderAggregate] = field(default_factory=dict)
+
+
+class ContextBuildMetrics:
+    """Aggregate builder timings per agent type and context part since startup (or the last reset).
+
+    Aggregates are keyed by agent type, context part and builder name only, so their
+    size does not grow with the number of games or entities.
+    """
+
+    def __init__(self) -> None:
+        self._agents: dict[tuple[str, ContextPart], AgentContextAggregate] = {}
+        self._lock = threading.Lock()
+
+    def record(self, agent: str, timings: Sequence[BuilderTiming], part: ContextPart = ContextPart.FULL) -> None:
+        """Add one context build of an agent."""
+        tokens = sum(timing.tokens for timing in timings)
+        with self._lock:
+            aggregate = self._agents.setdefault((agent, part), AgentContextAggregate())
+            aggregate.builds += 1
+            aggregate.seconds += sum(timing.seconds for timing in timings)
+            aggregate.tokens += tokens
+            aggregate.max_tokens = max(aggregate.max_tokens, tokens)
+            for timing in timings:
+                aggregate.builders.setdefault(timing.builder, BuilderAggregate()).add(timing)
+
+    def snapshot(self) -> dict[tuple[str, ContextPart], AgentContextAggregate]:
+        """Return a copy of the aggregates per agent type and context part."""
+        with self._lock:
+            return {
+                key: AgentContextAggregate(
+                    builds=aggregate.builds,
+                    seconds=aggregate.seconds,
+                    tokens=aggregate.tokens,
+                    max_tokens=aggregate.max_tokens,
+                    builders={name: replace(builder) for name, builder in aggregate.builders.items()},
+                )
+                for key, aggregate in self._agents.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._agents.clear()
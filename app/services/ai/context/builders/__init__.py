@@ -1,6 +1,6 @@
 from .accumulator import ContextAccumulator
 from .actions_builder import ActionsContextBuilder
-from .base import ContextBuilder, DetailLevel, EntityContextBuilder
+from .base import ContextBuilder, ContextPriority, DetailLevel, EntityContextBuilder
 from .combat_builder import CombatContextBuilder
 from .inventory_builder import InventoryContextBuilder
 from .location_builder import LocationContextBuilder
@@ -18,6 +18,7 @@ __all__ = [
     "ActionsContextBuilder",
     "ContextAccumulator",
     "ContextBuilder",
+    "ContextPriority",
     "DetailLevel",
     "EntityContextBuilder",
     "PartyOverviewBuilder",
@@ -5,8 +5,9 @@ import logging
 from app.models.game_state import GameState
 from app.models.instances.character_instance import CharacterInstance
 from app.models.instances.npc_instance import NPCInstance
+from app.models.state_revisions import StateSection
 
-from .base import BuildContext, EntityContextBuilder
+from .base import BuildContext, ContextPriority, EntityContextBuilder
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,9 @@ class ActionsContextBuilder(EntityContextBuilder):
     Critical for combat agents to understand entity capabilities.
     """
 
+    depends_on = frozenset[StateSection]()  # Only the entity itself
+    priority = ContextPriority.HIGH
+
     MAX_ACTIONS = 10
 
     def build(
@@ -55,3 +59,17 @@ class ActionsContextBuilder(EntityContextBuilder):
             context_parts.append(", ".join(parts))
 
         return "\n".join(context_parts)
+
+    def build_summary(
+        self,
+        game_state: GameState,
+        context: BuildContext,
+        entity: CharacterInstance | NPCInstance,
+    ) -> str | None:
+        entity_name = entity.display_name if isinstance(entity, NPCInstance) else entity.sheet.name
+
+        attacks = entity.state.attacks
+        if not attacks:
+            return None
+        actions = ", ".join(f"{attack.name} +{attack.attack_roll_bonus}" for attack in attacks[: self.MAX_ACTIONS])
+        return f"Available Actions ({entity_name}): {actions}"
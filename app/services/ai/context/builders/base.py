@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
+from typing import ClassVar
 
 from app.interfaces.services.data import IRepository
 from app.models.background import BackgroundDefinition
@@ -9,6 +10,7 @@ from app.models.instances.character_instance import CharacterInstance
 from app.models.instances.npc_instance import NPCInstance
 from app.models.item import ItemDefinition
 from app.models.spell import SpellDefinition
+from app.models.state_revisions import StateSection
 
 
 class DetailLevel(str, Enum):
@@ -18,6 +20,18 @@ class DetailLevel(str, Enum):
     SUMMARY = "summary"
 
 
+class ContextPriority(IntEnum):
+    """How long a section survives when a context exceeds its token budget.
+
+    Higher values are degraded first; REQUIRED sections are never trimmed.
+    """
+
+    REQUIRED = 0
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+
 @dataclass
 class BuildContext:
     """Type-safe container for all context builder dependencies."""
@@ -28,6 +42,12 @@ class BuildContext:
 
 
 class ContextBuilder(ABC):
+    # State sections the output depends on; None means never reuse a previous build
+    depends_on: ClassVar[frozenset[StateSection] | None] = None
+    priority: ClassVar[ContextPriority] = ContextPriority.NORMAL
+    # Output rarely changes during play; the prefix-stable prompt layout places it before the history
+    stable: ClassVar[bool] = False
+
     @abstractmethod
     def build(self, game_state: GameState, context: BuildContext) -> str | None:
         """Build a specific part of the AI context string.
@@ -41,6 +61,15 @@ class ContextBuilder(ABC):
         """
         raise NotImplementedError
 
+    def build_summary(self, game_state: GameState, context: BuildContext) -> str | None:
+        """Build a shorter variant used when the context is over its token budget.
+
+        Returns:
+            Summary string, or None when the builder has no summary (the section
+            is then omitted directly)
+        """
+        return None
+
 
 class EntityContextBuilder(ABC):
     """Base class for builders that require a specific entity.
@@ -49,6 +78,13 @@ class EntityContextBuilder(ABC):
     rather than deriving information from game state alone.
     """
 
+    # State sections the output depends on besides the entity itself (whose revision
+    # is always checked); None means never reuse a previous build
+    depends_on: ClassVar[frozenset[StateSection] | None] = None
+    priority: ClassVar[ContextPriority] = ContextPriority.NORMAL
+    # Output rarely changes during play; the prefix-stable prompt layout places it before the history
+    stable: ClassVar[bool] = False
+
     @abstractmethod
     def build(
         self,
@@ -67,3 +103,17 @@ class EntityContextBuilder(ABC):
             Context string or None if not applicable
         """
         raise NotImplementedError
+
+    def build_summary(
+        self,
+        game_state: GameState,
+        context: BuildContext,
+        entity: CharacterInstance | NPCInstance,
+    ) -> str | None:
+        """Build a shorter variant used when the context is over its token budget.
+
+        Returns:
+            Summary string, or None when the builder has no summary (the section
+            is then omitted directly)
+        """
+        return None
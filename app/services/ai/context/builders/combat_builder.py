@@ -1,12 +1,16 @@
 from app.models.attributes import EntityType
 from app.models.game_state import GameState
+from app.models.state_revisions import StateSection
 
-from .base import BuildContext, ContextBuilder
+from .base import BuildContext, ContextBuilder, ContextPriority
 
 
 class CombatContextBuilder(ContextBuilder):
     """Build detailed combat context including turn order and monster details."""
 
+    depends_on = frozenset({StateSection.COMBAT, StateSection.MONSTERS})
+    priority = ContextPriority.REQUIRED
+
     def build(self, game_state: GameState, context: BuildContext) -> str | None:
         if not game_state.combat.is_active:
             return None
@@ -1,6 +1,7 @@
 from app.models.game_state import GameState
 from app.models.instances.character_instance import CharacterInstance
 from app.models.instances.npc_instance import NPCInstance
+from app.models.state_revisions import StateSection
 
 from .base import BuildContext, EntityContextBuilder
 
@@ -11,6 +12,8 @@ class InventoryContextBuilder(EntityContextBuilder):
     Builds inventory context for any entity (player or NPC).
     """
 
+    depends_on = frozenset[StateSection]()  # Only the entity itself
+
     MAX_INVENTORY_ITEMS = 20
 
     def build(
@@ -30,3 +33,17 @@ class InventoryContextBuilder(EntityContextBuilder):
         for item in inv[: self.MAX_INVENTORY_ITEMS]:
             lines.append(f"  - {item.index} x{item.quantity}")
         return "\n".join(lines)
+
+    def build_summary(
+        self,
+        game_state: GameState,
+        context: BuildContext,
+        entity: CharacterInstance | NPCInstance,
+    ) -> str | None:
+        entity_name = f"{entity.display_name}'s" if isinstance(entity, NPCInstance) else "Player's"
+
+        inv = entity.state.inventory
+        if not inv:
+            return None
+        items = ", ".join(f"{item.index} x{item.quantity}" for item in inv[: self.MAX_INVENTORY_ITEMS])
+        return f"{entity_name} Inventory: {items}"
@@ -2,8 +2,9 @@ import logging
 
 from app.models.game_state import GameState
 from app.models.scenario import ScenarioSheet
+from app.models.state_revisions import StateSection
 
-from .base import BuildContext, ContextBuilder
+from .base import BuildContext, ContextBuilder, ContextPriority
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +12,9 @@ logger = logging.getLogger(__name__)
 class LocationContextBuilder(ContextBuilder):
     """Build enhanced location context with connections, encounters, and loot."""
 
+    depends_on = frozenset({StateSection.LOCATION})
+    priority = ContextPriority.REQUIRED
+
     MAX_ENCOUNTERS = 5
     MAX_LOOT = 3
 
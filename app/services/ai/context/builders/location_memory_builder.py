@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 
 from app.models.game_state import GameState
+from app.models.state_revisions import StateSection
 
 from .base import BuildContext, ContextBuilder
 
@@ -12,9 +13,18 @@ from .base import BuildContext, ContextBuilder
 class LocationMemoryContextBuilder(ContextBuilder):
     """Render recent location memories for the current location."""
 
+    depends_on = frozenset({StateSection.LOCATION, StateSection.MEMORIES})
+
     MAX_ENTRIES = 3
+    SUMMARY_ENTRIES = 1
 
     def build(self, game_state: GameState, context: BuildContext) -> str | None:
+        return self._render(game_state, self.MAX_ENTRIES)
+
+    def build_summary(self, game_state: GameState, context: BuildContext) -> str | None:
+        return self._render(game_state, self.SUMMARY_ENTRIES)
+
+    def _render(self, game_state: GameState, max_entries: int) -> str | None:
         if not game_state.scenario_instance.is_in_known_location():
             return None
 
@@ -23,7 +33,7 @@ class LocationMemoryContextBuilder(ContextBuilder):
         if not location_state.location_memories:
             return None
 
-        entries = location_state.location_memories[-self.MAX_ENTRIES :]
+        entries = location_state.location_memories[-max_entries:]
         lines = [f"Recent Location Memories ({game_state.location}):"]
         for entry in reversed(entries):
             timestamp = self._format_timestamp(entry.created_at)
@@ -1,11 +1,15 @@
 from app.models.game_state import GameState
+from app.models.state_revisions import StateSection
 
-from .base import BuildContext, ContextBuilder
+from .base import BuildContext, ContextBuilder, ContextPriority
 
 
 class MonstersAtLocationContextBuilder(ContextBuilder):
     """Build context for monsters present at the current location (runtime instances)."""
 
+    depends_on = frozenset({StateSection.LOCATION, StateSection.MONSTERS})
+    priority = ContextPriority.HIGH
+
     def build(self, game_state: GameState, context: BuildContext) -> str | None:
         if not game_state.scenario_instance.is_in_known_location():
             return None
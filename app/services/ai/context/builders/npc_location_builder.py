@@ -2,8 +2,9 @@
 
 from app.models.game_state import GameState
 from app.models.instances.npc_instance import NPCInstance
+from app.models.state_revisions import StateSection
 
-from .base import BuildContext, ContextBuilder
+from .base import BuildContext, ContextBuilder, ContextPriority
 
 
 class NPCLocationContextBuilder(ContextBuilder):
@@ -13,6 +14,9 @@ class NPCLocationContextBuilder(ContextBuilder):
     Non-party NPCs: Full details including stats, items, and conditions
     """
 
+    depends_on = frozenset({StateSection.LOCATION, StateSection.NPC, StateSection.PARTY})
+    priority = ContextPriority.HIGH
+
     MAX_ITEMS_PER_NPC = 10
 
     def build(self, game_state: GameState, context: BuildContext) -> str | None:
@@ -38,6 +42,21 @@ class NPCLocationContextBuilder(ContextBuilder):
 
         return "\n".join(lines)
 
+    def build_summary(self, game_state: GameState, context: BuildContext) -> str | None:
+        if not game_state.scenario_instance.is_in_known_location():
+            return None
+
+        current_loc_id = game_state.scenario_instance.current_location_id
+        npcs_here = [npc for npc in game_state.npcs if npc.current_location_id == current_loc_id]
+        if not npcs_here:
+            return None
+
+        lines = ["NPCs Present:"]
+        for npc in npcs_here:
+            marker = " [IN PARTY]" if game_state.party.has_member(npc.instance_id) else f" ({npc.sheet.role})"
+            lines.append(f"- {npc.display_name} [{npc.instance_id}]{marker}")
+        return "\n".join(lines)
+
     def _build_npc_details(self, npc: NPCInstance, context: BuildContext) -> list[str]:
         """Build detailed information for a non-party NPC.
 
@@ -1,8 +1,9 @@
 """Builder for party overview context showing player and party members."""
 
 from app.models.game_state import GameState
+from app.models.state_revisions import StateSection
 
-from .base import BuildContext, ContextBuilder, DetailLevel
+from .base import BuildContext, ContextBuilder, ContextPriority, DetailLevel
 
 
 class PartyOverviewBuilder(ContextBuilder):
@@ -13,6 +14,9 @@ class PartyOverviewBuilder(ContextBuilder):
     - SUMMARY: Basic info (names and status only)
     """
 
+    depends_on = frozenset({StateSection.CHARACTER, StateSection.NPC, StateSection.PARTY, StateSection.LOCATION})
+    priority = ContextPriority.HIGH
+
     def __init__(self, detail_level: DetailLevel = DetailLevel.FULL) -> None:
         self.detail_level = detail_level
 
@@ -31,6 +35,11 @@ class PartyOverviewBuilder(ContextBuilder):
         else:
             return self._build_summary(game_state)
 
+    def build_summary(self, game_state: GameState, context: BuildContext) -> str | None:
+        if self.detail_level == DetailLevel.FULL:
+            return self._build_summary(game_state)
+        return None
+
     def _build_full(self, game_state: GameState) -> str:
         """Build full detail party overview."""
         lines = ["Party Overview:"]
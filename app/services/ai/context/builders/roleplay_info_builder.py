@@ -7,8 +7,9 @@ from app.common.exceptions import RepositoryNotFoundError
 from app.models.game_state import GameState
 from app.models.instances.character_instance import CharacterInstance
 from app.models.instances.npc_instance import NPCInstance
+from app.models.state_revisions import StateSection
 
-from .base import BuildContext, EntityContextBuilder
+from .base import BuildContext, ContextPriority, EntityContextBuilder
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,9 @@ class RoleplayInfoBuilder(EntityContextBuilder):
     - Recent memories (for NPCs only)
     """
 
+    depends_on = frozenset[StateSection]()  # Only the entity itself
+    priority = ContextPriority.LOW
+
     MAX_MEMORIES = 3
 
     def build(
@@ -92,6 +96,29 @@ class RoleplayInfoBuilder(EntityContextBuilder):
 
         return "\n".join(context_parts)
 
+    def build_summary(
+        self,
+        game_state: GameState,
+        context: BuildContext,
+        entity: CharacterInstance | NPCInstance,
+    ) -> str | None:
+        if isinstance(entity, NPCInstance):
+            char_sheet = entity.sheet.character
+            entity_name = entity.display_name
+        else:
+            char_sheet = entity.sheet
+            entity_name = char_sheet.name
+
+        if not char_sheet.background:
+            return None
+
+        parts = [f"Background: {char_sheet.background}"]
+        if char_sheet.alignment:
+            parts.append(f"Alignment: {char_sheet.alignment}")
+        if char_sheet.personality.traits:
+            parts.append(f"Traits: {', '.join(char_sheet.personality.traits)}")
+        return f"Roleplay Info for {entity_name}: {'; '.join(parts)}"
+
     @staticmethod
     def _format_timestamp(dt: datetime) -> str:
         """Format timestamp for memory entries."""
@@ -1,13 +1,18 @@
 """Builder for scenario header and current location context."""
 
 from app.models.game_state import GameState
+from app.models.state_revisions import StateSection
 
-from .base import BuildContext, ContextBuilder
+from .base import BuildContext, ContextBuilder, ContextPriority
 
 
 class ScenarioContextBuilder(ContextBuilder):
     """Build scenario header with title, description, and current location info."""
 
+    depends_on = frozenset({StateSection.LOCATION})
+    priority = ContextPriority.REQUIRED
+    stable = True
+
     def build(self, game_state: GameState, context: BuildContext) -> str | None:
         if not game_state.scenario_instance.is_in_known_location():
             return None
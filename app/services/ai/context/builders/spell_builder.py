@@ -4,6 +4,7 @@ from app.common.exceptions import RepositoryNotFoundError
 from app.models.game_state import GameState
 from app.models.instances.character_instance import CharacterInstance
 from app.models.instances.npc_instance import NPCInstance
+from app.models.state_revisions import StateSection
 
 from .base import BuildContext, EntityContextBuilder
 
@@ -16,6 +17,8 @@ class SpellContextBuilder(EntityContextBuilder):
     Builds spell context for any entity with spellcasting abilities.
     """
 
+    depends_on = frozenset[StateSection]()  # Only the entity itself
+
     MAX_SPELLS = 10
     MAX_DESCRIPTION_LENGTH = 200
 
@@ -48,3 +51,16 @@ class SpellContextBuilder(EntityContextBuilder):
                 context_parts.append(f"  • {spell_name} [NOT IN REPOSITORY - Improvise mechanics as needed]")
 
         return "\n".join(context_parts)
+
+    def build_summary(
+        self,
+        game_state: GameState,
+        context: BuildContext,
+        entity: CharacterInstance | NPCInstance,
+    ) -> str | None:
+        entity_name = entity.display_name if isinstance(entity, NPCInstance) else entity.sheet.name
+
+        spellcasting = entity.state.spellcasting
+        if not spellcasting or not spellcasting.spells_known:
+            return None
+        return f"Known Spells ({entity_name}): {', '.join(spellcasting.spells_known[: self.MAX_SPELLS])}"
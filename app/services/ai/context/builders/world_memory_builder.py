@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 
 from app.models.game_state import GameState
+from app.models.state_revisions import StateSection
 
 from .base import BuildContext, ContextBuilder
 
@@ -12,14 +13,23 @@ from .base import BuildContext, ContextBuilder
 class WorldMemoryContextBuilder(ContextBuilder):
     """Render recent world-level memories."""
 
+    depends_on = frozenset({StateSection.MEMORIES})
+
     MAX_ENTRIES = 3
+    SUMMARY_ENTRIES = 1
 
     def build(self, game_state: GameState, context: BuildContext) -> str | None:
+        return self._render(game_state, self.MAX_ENTRIES)
+
+    def build_summary(self, game_state: GameState, context: BuildContext) -> str | None:
+        return self._render(game_state, self.SUMMARY_ENTRIES)
+
+    def _render(self, game_state: GameState, max_entries: int) -> str | None:
         world_memories = game_state.scenario_instance.world_memories
         if not world_memories:
             return None
 
-        entries = world_memories[-self.MAX_ENTRIES :]
+        entries = world_memories[-max_entries:]
         lines = ["World Memory Highlights:"]
         for entry in reversed(entries):
             timestamp = self._format_timestamp(entry.created_at)
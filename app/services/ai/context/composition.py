@@ -4,14 +4,24 @@ Type-safe, fluent API for configuring which context builders each agent uses.
 Mirrors the orchestration Pipeline pattern for consistency.
 """
 
+import logging
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 
 from app.models.game_state import GameState
 from app.models.instances.character_instance import CharacterInstance
 from app.models.instances.npc_instance import NPCInstance
+from app.services.ai.context.build_metrics import BuilderTiming
 from app.services.ai.context.builders.accumulator import ContextAccumulator
-from app.services.ai.context.builders.base import BuildContext, ContextBuilder, EntityContextBuilder
+from app.services.ai.context.builders.base import (
+    BuildContext,
+    ContextBuilder,
+    ContextPriority,
+    DetailLevel,
+    EntityContextBuilder,
+)
 from app.services.ai.context.builders.combat_builder import CombatContextBuilder
 from app.services.ai.context.builders.inventory_builder import InventoryContextBuilder
 from app.services.ai.context.builders.location_builder import LocationContextBuilder
@@ -24,6 +34,10 @@ from app.services.ai.context.builders.roleplay_info_builder import RoleplayInfoB
 from app.services.ai.context.builders.scenario_builder import ScenarioContextBuilder
 from app.services.ai.context.builders.spell_builder import SpellContextBuilder
 from app.services.ai.context.builders.world_memory_builder import WorldMemoryContextBuilder
+from app.services.ai.context.fragment_cache import ContextFragmentCache, FragmentCacheStats, revision_key
+from app.utils.token_estimator import estimate_tokens
+
+logger = logging.getLogger(__name__)
 
 # Type alias for entity selector functions
 EntitySelector = Callable[[GameState], list[CharacterInstance | NPCInstance]]
@@ -53,96 +67,312 @@ class BuilderRegistry:
     actions: EntityContextBuilder
 
 
+@dataclass
+class _Section:
+    """One non-empty builder output within a composed context."""
+
+    builder: ContextBuilder | EntityContextBuilder
+    entity: CharacterInstance | NPCInstance | None
+    priority: ContextPriority
+    summarize: Callable[[], str | None]
+    text: str
+    seconds: float = 0.0
+    tokens: int = 0
+    level: DetailLevel | None = DetailLevel.FULL  # None once omitted
+
+    @property
+    def name(self) -> str:
+        return _builder_name(self.builder)
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}[{self.entity.instance_id}]" if self.entity is not None else self.name
+
+
+def _builder_name(builder: ContextBuilder | EntityContextBuilder) -> str:
+    return type(builder).__name__.removesuffix("ContextBuilder").removesuffix("Builder")
+
+
 class ContextComposition:
     """Fluent API for composing context builders.
 
     Configure which builders execute for an agent type using method chaining.
     Supports game-state builders, single-entity builders, and multi-entity
     builders with selector functions. Reusable across multiple executions.
+
+    With a token budget, sections are degraded along full → summary → omitted,
+    lowest priority (and within a priority, latest section) first, until the
+    estimated total fits. REQUIRED sections are never degraded.
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty composition."""
-        self._game_state_builders: list[ContextBuilder] = []
-        self._entity_builders: list[tuple[EntityContextBuilder, CharacterInstance | NPCInstance]] = []
-        self._multi_entity_builders: list[tuple[EntityContextBuilder, EntitySelector]] = []
+    def __init__(self, token_budget: int | None = None) -> None:
+        """Initialize an empty composition.
 
-    def add(self, builder: ContextBuilder) -> "ContextComposition":
+        Args:
+            token_budget: Estimated token ceiling for the built context; None disables trimming
+        """
+        self.token_budget = token_budget
+        self._game_state_builders: list[tuple[ContextBuilder, ContextPriority]] = []
+        self._entity_builders: list[tuple[EntityContextBuilder, CharacterInstance | NPCInstance, ContextPriority]] = []
+        self._multi_entity_builders: list[tuple[EntityContextBuilder, EntitySelector, ContextPriority]] = []
+
+    def add(self, builder: ContextBuilder, priority: ContextPriority | None = None) -> "ContextComposition":
         """Add a game-state builder (operates on GameState only).
 
         Args:
             builder: ContextBuilder instance (scenario, combat, etc.)
+            priority: Trimming priority, defaults to the builder's own
 
         Returns:
             Self for chaining
         """
-        self._game_state_builders.append(builder)
+        self._game_state_builders.append((builder, builder.priority if priority is None else priority))
         return self
 
     def add_for_entity(
         self,
         builder: EntityContextBuilder,
         entity: CharacterInstance | NPCInstance,
+        priority: ContextPriority | None = None,
     ) -> "ContextComposition":
         """Add entity builder for a single entity.
 
         Args:
             builder: EntityContextBuilder (spells, inventory, roleplay, etc.)
             entity: Character or NPC instance
+            priority: Trimming priority, defaults to the builder's own
 
         Returns:
             Self for chaining
         """
-        self._entity_builders.append((builder, entity))
+        self._entity_builders.append((builder, entity, builder.priority if priority is None else priority))
         return self
 
     def add_for_entities(
         self,
         builder: EntityContextBuilder,
         selector: EntitySelector,
+        priority: ContextPriority | None = None,
     ) -> "ContextComposition":
         """Add entity builder for multiple entities via selector function.
 
         Args:
             builder: EntityContextBuilder to apply to each entity
             selector: Lambda extracting entities from game state
+            priority: Trimming priority, defaults to the builder's own
 
         Returns:
             Self for chaining
         """
-        self._multi_entity_builders.append((builder, selector))
+        self._multi_entity_builders.append((builder, selector, builder.priority if priority is None else priority))
         return self
 
-    def build(self, game_state: GameState, context: BuildContext) -> str:
+    def build(
+        self,
+        game_state: GameState,
+        context: BuildContext,
+        cache: ContextFragmentCache | None = None,
+        stable: bool | None = None,
+        timings: list[BuilderTiming] | None = None,
+    ) -> str:
         """Execute all builders and return concatenated context string.
 
         Executes in order: game-state builders → single-entity → multi-entity.
         Builders returning None are filtered. Sections joined with double newlines.
+        With a cache, a builder declaring its state dependencies is only re-run when
+        one of those sections (or its entity) changed revision.
 
         Args:
             game_state: Current game state
             context: Builder dependencies (repositories)
+            cache: Optional fragment cache shared across builds
+            stable: Only run builders whose ``stable`` flag matches; None runs all
+            timings: When given, receives one entry per builder run
 
         Returns:
             Final context string for agent
         """
         acc = ContextAccumulator()
+        for section in self._collect(game_state, context, cache, stable, timings):
+            acc.add(section.text)
+        return acc.build()
+
+    def build_sections(
+        self,
+        game_state: GameState,
+        context: BuildContext,
+        cache: ContextFragmentCache | None = None,
+        stable: bool | None = None,
+        timings: list[BuilderTiming] | None = None,
+    ) -> list[tuple[str, str]]:
+        """Execute all builders like build, but return the kept sections unjoined.
+
+        Returns:
+            (label, text) per section, e.g. ("Spell[hero-inst]", ...), in build order
+        """
+        return [(section.label, section.text) for section in self._collect(game_state, context, cache, stable, timings)]
+
+    def _collect(
+        self,
+        game_state: GameState,
+        context: BuildContext,
+        cache: ContextFragmentCache | None,
+        stable: bool | None,
+        timings: list[BuilderTiming] | None,
+    ) -> list[_Section]:
+        stats = FragmentCacheStats()
+        sections: list[_Section] = []
+        runs: list[_Section | BuilderTiming] = []  # Build order, empty builders as their timing
+
+        def collect(
+            builder: ContextBuilder | EntityContextBuilder,
+            entity: CharacterInstance | NPCInstance | None,
+            priority: ContextPriority,
+            build: Callable[[], str | None],
+            summarize: Callable[[], str | None],
+        ) -> None:
+            if stable is not None and builder.stable is not stable:
+                return
+            started = time.perf_counter()
+            text = self._build_fragment(game_state, cache, stats, builder, entity, DetailLevel.FULL, build)
+            seconds = time.perf_counter() - started
+            if text:
+                summary = partial(
+                    self._build_fragment, game_state, cache, stats, builder, entity, DetailLevel.SUMMARY, summarize
+                )
+                section = _Section(builder, entity, priority, summary, text, seconds)
+                sections.append(section)
+                runs.append(section)
+            elif timings is not None:
+                entity_id = entity.instance_id if entity is not None else None
+                runs.append(BuilderTiming(_builder_name(builder), entity_id, seconds, 0, 0, "empty"))
 
         # Execute game-state builders
-        for game_state_builder in self._game_state_builders:
-            acc.add(game_state_builder.build(game_state, context))
+        for game_state_builder, priority in self._game_state_builders:
+            collect(
+                game_state_builder,
+                None,
+                priority,
+                partial(game_state_builder.build, game_state, context),
+                partial(game_state_builder.build_summary, game_state, context),
+            )
 
         # Execute single-entity builders
-        for entity_builder, entity in self._entity_builders:
-            acc.add(entity_builder.build(game_state, context, entity))
+        for entity_builder, entity, priority in self._entity_builders:
+            collect(
+                entity_builder,
+                entity,
+                priority,
+                partial(entity_builder.build, game_state, context, entity),
+                partial(entity_builder.build_summary, game_state, context, entity),
+            )
 
         # Execute multi-entity builders with selectors
-        for entity_builder, selector in self._multi_entity_builders:
+        for entity_builder, selector, priority in self._multi_entity_builders:
+            if stable is not None and entity_builder.stable is not stable:
+                continue
             entities = selector(game_state)
-            for entity in entities:
-                acc.add(entity_builder.build(game_state, context, entity))
+            for selected in entities:
+                collect(
+                    entity_builder,
+                    selected,
+                    priority,
+                    partial(entity_builder.build, game_state, context, selected),
+                    partial(entity_builder.build_summary, game_state, context, selected),
+                )
 
-        return acc.build()
+        if self.token_budget is not None:
+            total = self._fit_to_budget(sections, self.token_budget)
+            layout = ", ".join(
+                f"{section.label}={section.level.value if section.level else 'omitted'}:{section.tokens}"
+                for section in sections
+            )
+            logger.debug(f"Context for {game_state.game_id}: ~{total}/{self.token_budget} tokens [{layout}]")
+
+        if cache is not None:
+            cache.record(stats)
+            logger.debug(
+                f"Context fragments for {game_state.game_id}: {stats.hits}/{stats.total} reused "
+                f"({stats.hit_rate:.0%}), {stats.misses} rebuilt, {stats.uncached} uncached"
+            )
+
+        if timings is not None:
+            for run in runs:
+                if isinstance(run, BuilderTiming):
+                    timings.append(run)
+                    continue
+                kept = run.level is not None
+                timings.append(
+                    BuilderTiming(
+                        builder=run.name,
+                        entity_id=run.entity.instance_id if run.entity is not None else None,
+                        seconds=run.seconds,
+                        chars=len(run.text) if kept else 0,
+                        tokens=(run.tokens or estimate_tokens(run.text)) if kept else 0,
+                        level=run.level.value if run.level is not None else "omitted",
+                    )
+                )
+
+        return [section for section in sections if section.level is not None]
+
+    @staticmethod
+    def _fit_to_budget(sections: list[_Section], budget: int) -> int:
+        """Degrade sections in place until their estimated tokens fit the budget.
+
+        Every trimmable section is summarized before any section is omitted.
+
+        Returns:
+            Estimated token total of the kept sections
+        """
+        for section in sections:
+            section.tokens = estimate_tokens(section.text)
+        total = sum(section.tokens for section in sections)
+
+        trimmable = sorted(
+            (index for index, section in enumerate(sections) if section.priority != ContextPriority.REQUIRED),
+            key=lambda index: (-sections[index].priority, -index),
+        )
+        for index in trimmable:
+            if total <= budget:
+                return total
+            section = sections[index]
+            started = time.perf_counter()
+            summary = section.summarize()
+            section.seconds += time.perf_counter() - started
+            if summary:
+                summary_tokens = estimate_tokens(summary)
+                if summary_tokens < section.tokens:
+                    total -= section.tokens - summary_tokens
+                    section.text, section.tokens, section.level = summary, summary_tokens, DetailLevel.SUMMARY
+
+        for index in trimmable:
+            if total <= budget:
+                break
+            section = sections[index]
+            total -= section.tokens
+            section.tokens, section.level = 0, None
+
+        if total > budget:
+            logger.warning(f"Required context sections alone exceed the token budget: ~{total}/{budget}")
+        return total
+
+    @staticmethod
+    def _build_fragment(
+        game_state: GameState,
+        cache: ContextFragmentCache | None,
+        stats: FragmentCacheStats,
+        builder: ContextBuilder | EntityContextBuilder,
+        entity: CharacterInstance | NPCInstance | None,
+        level: DetailLevel,
+        build: Callable[[], str | None],
+    ) -> str | None:
+        if cache is None or builder.depends_on is None:
+            stats.uncached += 1
+            return build()
+
+        slot = (id(builder), entity.instance_id if entity is not None else None, level)
+        key = revision_key(game_state, builder.depends_on, entity)
+        return cache.get_or_build(game_state.game_id, slot, key, build, stats)
 
 
 __all__ = [
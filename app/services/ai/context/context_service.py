@@ -1,14 +1,18 @@
 """Service for building AI context using composable builders (Strategy pattern)."""
 
-from app.agents.core.types import AgentType
+from collections.abc import Mapping
+
+from app.agents.core.types import AgentType, PromptLayout
 from app.interfaces.services.ai import IContextService
 from app.interfaces.services.data import IRepositoryProvider
 from app.models.game_state import GameState
 from app.models.instances.character_instance import CharacterInstance
 from app.models.instances.npc_instance import NPCInstance
+from app.services.ai.context.build_metrics import BuilderTiming, ContextBuildMetrics, ContextPart
 from app.services.ai.context.builders import (
     ActionsContextBuilder,
     CombatContextBuilder,
+    ContextPriority,
     DetailLevel,
     InventoryContextBuilder,
     LocationContextBuilder,
@@ -24,6 +28,9 @@ from app.services.ai.context.builders import (
 )
 from app.services.ai.context.builders.base import BuildContext
 from app.services.ai.context.composition import BuilderRegistry, ContextComposition
+from app.services.ai.context.delta import ContextDeltaTracker
+from app.services.ai.context.fragment_cache import ContextFragmentCache
+from app.services.ai.debug_logger import AgentDebugLogger
 
 
 class ContextService(IContextService):
@@ -31,11 +38,51 @@ class ContextService(IContextService):
 
     Uses declarative composition pattern to configure context for each agent type.
     Each agent type has an explicit, self-documenting composition that specifies
-    which builders to use and in what order.
+    which builders to use and in what order. Builder output is reused across
+    calls while the state sections it depends on keep their revision. Each
+    agent's context is trimmed to its token budget, party members' details
+    degrading before the player's. Under the PREFIX_STABLE layout the narrative
+    and combat contexts are split: stable builders (scenario) are built separately
+    so agents can send them ahead of the conversation history. With delta context
+    on, the combat agent's full context joins that prefix as a baseline refreshed
+    every few turns, and each turn only sends the changes since the baseline.
+    Every build records per-builder wall time and size into build_metrics.
     """
 
-    def __init__(self, repository_provider: IRepositoryProvider):
+    # Agents whose context is split under the PREFIX_STABLE layout
+    PREFIX_STABLE_AGENTS = frozenset({AgentType.NARRATIVE, AgentType.COMBAT})
+    # Agents that receive baseline plus changes when delta context is on
+    DELTA_AGENTS = frozenset({AgentType.COMBAT})
+
+    def __init__(
+        self,
+        repository_provider: IRepositoryProvider,
+        token_budgets: Mapping[AgentType, int] | None = None,
+        npc_token_budget: int | None = None,
+        prompt_layout: PromptLayout = PromptLayout.INLINE,
+        delta_refresh_turns: int | None = None,
+        build_metrics: ContextBuildMetrics | None = None,
+        debug_logger: AgentDebugLogger | None = None,
+    ):
+        """Initialize the context service.
+
+        Args:
+            repository_provider: Provider of per-game repositories
+            token_budgets: Estimated token ceiling per agent type; missing types are not trimmed
+            npc_token_budget: Estimated token ceiling for NPC agent context; None disables trimming
+            prompt_layout: How narrative and combat agents arrange the context in their calls
+            delta_refresh_turns: Turns served from one baseline under PREFIX_STABLE; None sends full context
+            build_metrics: Receives per-builder timings and sizes of every build
+            debug_logger: Also writes each build's timings to the agent debug JSONL when enabled
+        """
         self.repository_provider = repository_provider
+        self.token_budgets = dict(token_budgets or {})
+        self.npc_token_budget = npc_token_budget
+        self.prompt_layout = prompt_layout
+        self.delta_tracker = ContextDeltaTracker(delta_refresh_turns) if delta_refresh_turns else None
+        self.build_metrics = build_metrics or ContextBuildMetrics()
+        self.debug_logger = debug_logger
+        self.fragment_cache = ContextFragmentCache()
 
         # Initialize all builders once
         self._builders = self._create_builders()
@@ -81,7 +128,7 @@ class ContextService(IContextService):
         return {
             # NARRATIVE: Full story context with world state and all party details
             AgentType.NARRATIVE: (
-                ContextComposition()
+                ContextComposition(self.token_budgets.get(AgentType.NARRATIVE))
                 # World and scenario context
                 .add(b.scenario)
                 .add(b.location)
@@ -97,13 +144,13 @@ class ContextService(IContextService):
                 .add_for_entities(b.spells, lambda gs: [gs.character])
                 .add_for_entities(b.inventory, lambda gs: [gs.character])
                 # Party member details (roleplay, spells, inventory)
-                .add_for_entities(b.roleplay, self._get_party_members)
-                .add_for_entities(b.spells, self._get_party_members)
-                .add_for_entities(b.inventory, self._get_party_members)
+                .add_for_entities(b.roleplay, self._get_party_members, ContextPriority.LOW)
+                .add_for_entities(b.spells, self._get_party_members, ContextPriority.LOW)
+                .add_for_entities(b.inventory, self._get_party_members, ContextPriority.LOW)
             ),
             # COMBAT: Tactical context with combat state and character abilities
             AgentType.COMBAT: (
-                ContextComposition()
+                ContextComposition(self.token_budgets.get(AgentType.COMBAT))
                 # Combat state and turn order
                 .add(b.combat)
                 .add(b.party_full)
@@ -113,17 +160,45 @@ class ContextService(IContextService):
                 .add_for_entities(b.inventory, lambda gs: [gs.character])
                 # Party member abilities (actions, spells, inventory)
                 .add_for_entities(b.actions, self._get_party_members)
-                .add_for_entities(b.spells, self._get_party_members)
-                .add_for_entities(b.inventory, self._get_party_members)
+                .add_for_entities(b.spells, self._get_party_members, ContextPriority.LOW)
+                .add_for_entities(b.inventory, self._get_party_members, ContextPriority.LOW)
             ),
             # SUMMARIZER: Minimal context for summarization tasks
-            AgentType.SUMMARIZER: (ContextComposition().add(b.party_summary).add(b.combat)),
+            AgentType.SUMMARIZER: (
+                ContextComposition(self.token_budgets.get(AgentType.SUMMARIZER)).add(b.party_summary).add(b.combat)
+            ),
         }
 
     def build_context(self, game_state: GameState, agent_type: AgentType) -> str:
         build_ctx = self._create_build_context(game_state)
         composition = self._compositions[agent_type]
-        return composition.build(game_state, build_ctx)
+        stable = False if self._splits_context(agent_type) else None
+        part = ContextPart.FULL if stable is None else ContextPart.VOLATILE
+        timings: list[BuilderTiming] = []
+        if self.delta_tracker is None or not self._uses_delta(agent_type):
+            context = composition.build(game_state, build_ctx, self.fragment_cache, stable, timings)
+            self._record_build(agent_type, game_state, timings, part=part)
+            return context
+
+        sections = composition.build_sections(game_state, build_ctx, self.fragment_cache, stable, timings)
+        self._record_build(agent_type, game_state, timings, part=part)
+        epoch = (game_state.combat.is_active, game_state.combat.combat_occurrence)
+        return self.delta_tracker.render(self._view(game_state, agent_type), epoch, sections).changes
+
+    def build_stable_context(self, game_state: GameState, agent_type: AgentType) -> str:
+        if not self._splits_context(agent_type):
+            return ""
+        build_ctx = self._create_build_context(game_state)
+        timings: list[BuilderTiming] = []
+        stable = self._compositions[agent_type].build(game_state, build_ctx, self.fragment_cache, True, timings)
+        self._record_build(agent_type, game_state, timings, part=ContextPart.STABLE)
+        if self.delta_tracker is None or not self._uses_delta(agent_type):
+            return stable
+        baseline = self.delta_tracker.baseline(self._view(game_state, agent_type))
+        return "\n\n".join(part for part in (stable, baseline) if part)
+
+    def get_prompt_layout(self) -> PromptLayout:
+        return self.prompt_layout
 
     def build_context_for_npc(self, game_state: GameState, npc: NPCInstance) -> str:
         build_ctx = self._create_build_context(game_state)
@@ -135,7 +210,7 @@ class ContextService(IContextService):
 
         # Build NPC-specific composition
         composition = (
-            ContextComposition()
+            ContextComposition(self.npc_token_budget)
             # Party overview (full if in party, summary otherwise)
             .add(party_builder)
             # Combat context (turn order, initiative, combat state)
@@ -155,7 +230,13 @@ class ContextService(IContextService):
             .add(b.monsters_location)
         )
 
-        return composition.build(game_state, build_ctx)
+        timings: list[BuilderTiming] = []
+        context = composition.build(game_state, build_ctx, self.fragment_cache, timings=timings)
+        self._record_build(AgentType.NPC, game_state, timings, npc.instance_id)
+        return context
+
+    def clear_fragment_cache(self) -> None:
+        self.fragment_cache.clear()
 
     def build_npc_persona(self, npc: NPCInstance) -> str:
         """Build persona description for a specific NPC.
@@ -168,6 +249,29 @@ class ContextService(IContextService):
         """
         return self._builders.npc_persona.build(npc)
 
+    def _splits_context(self, agent_type: AgentType) -> bool:
+        return self.prompt_layout is PromptLayout.PREFIX_STABLE and agent_type in self.PREFIX_STABLE_AGENTS
+
+    def _uses_delta(self, agent_type: AgentType) -> bool:
+        # The baseline only stays in view when it is sent ahead of the history
+        return self._splits_context(agent_type) and agent_type in self.DELTA_AGENTS
+
+    @staticmethod
+    def _view(game_state: GameState, agent_type: AgentType) -> str:
+        return f"{game_state.game_id}:{agent_type.value}"
+
+    def _record_build(
+        self,
+        agent_type: AgentType,
+        game_state: GameState,
+        timings: list[BuilderTiming],
+        npc_instance_id: str | None = None,
+        part: ContextPart = ContextPart.FULL,
+    ) -> None:
+        self.build_metrics.record(agent_type.value, timings, part)
+        if self.debug_logger is not None:
+            self.debug_logger.log_context_build(agent_type, game_state.game_id, timings, npc_instance_id)
+
     def _create_build_context(self, game_state: GameState) -> BuildContext:
         """Create BuildContext with per-game repositories.
 
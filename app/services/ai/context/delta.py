@@ -0,0 +1,156 @@
+"""Render agent context as a full baseline plus the changes since it was sent."""
+
+import difflib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+
+from app.utils.token_estimator import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Agent turns served from one baseline before the full context is sent again
+FULL_REFRESH_TURNS = 5
+
+# Views (game and agent) whose baseline is kept; least recently used are dropped first
+MAX_TRACKED_VIEWS = 256
+
+BASELINE_HEADER = "# Full context as of your last refresh"
+CHANGES_HEADER = "# Changes since the full context above (- removed line, + added line)"
+NO_CHANGES = "No changes since the full context above."
+
+
+@dataclass(frozen=True)
+class ContextDelta:
+    """What an agent receives for one turn.
+
+    Attributes:
+        baseline: Full context at the last refresh, sent ahead of the conversation history
+        changes: Changes since the baseline; empty on the turn the baseline is refreshed
+        refreshed: Whether this turn started a new baseline
+    """
+
+    baseline: str
+    changes: str
+    refreshed: bool
+
+
+@dataclass
+class _Baseline:
+    epoch: Hashable
+    sections: dict[str, str]
+    text: str
+    turns: int = 0
+
+
+class ContextDeltaTracker:
+    """Remember the last full context each agent view received and diff against it.
+
+    The baseline is kept until ``refresh_turns`` turns were served from it, the view's
+    epoch changes (e.g. a new combat started) or the changes grow as large as the full
+    context, whichever comes first. Changed sections are rendered as line diffs (or in
+    full when that is shorter); new and removed sections are listed as such.
+    """
+
+    def __init__(self, refresh_turns: int = FULL_REFRESH_TURNS, max_views: int = MAX_TRACKED_VIEWS) -> None:
+        self.refresh_turns = refresh_turns
+        self.max_views = max_views
+        self._baselines: OrderedDict[str, _Baseline] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, view: str, epoch: Hashable, sections: Sequence[tuple[str, str]]) -> ContextDelta:
+        """Return the baseline and changes to send for one agent turn.
+
+        Args:
+            view: Identifies the receiving agent, e.g. "<game_id>:combat"
+            epoch: Value whose change forces a refresh
+            sections: (label, text) per context section
+        """
+        current = _unique_labels(sections)
+        full_text = "\n\n".join(current.values())
+
+        with self._lock:
+            baseline = self._baselines.get(view)
+            changes = ""
+            if baseline is not None and baseline.epoch == epoch and baseline.turns < self.refresh_turns:
+                diff = self._diff(baseline.sections, current)
+                if not diff:
+                    changes = f"{CHANGES_HEADER}\n{NO_CHANGES}"
+                elif estimate_tokens(diff) < estimate_tokens(full_text):
+                    changes = diff
+
+            if baseline is not None and changes:
+                baseline.turns += 1
+                refreshed = False
+            else:
+                baseline = _Baseline(epoch=epoch, sections=current, text=f"{BASELINE_HEADER}\n\n{full_text}")
+                self._baselines[view] = baseline
+                refreshed = True
+            self._baselines.move_to_end(view)
+            while len(self._baselines) > self.max_views:
+                self._baselines.popitem(last=False)
+
+        logger.debug(
+            f"Context for {view}: "
+            + (
+                "full refresh"
+                if refreshed
+                else f"~{estimate_tokens(changes)} tokens of changes (turn {baseline.turns})"
+            )
+        )
+        return ContextDelta(baseline=baseline.text, changes=changes, refreshed=refreshed)
+
+    def baseline(self, view: str) -> str:
+        """Return the baseline last rendered for a view, or "" when there is none."""
+        with self._lock:
+            baseline = self._baselines.get(view)
+            return baseline.text if baseline is not None else ""
+
+    def clear(self, view: str | None = None) -> None:
+        """Forget one view's baseline, or all of them."""
+        with self._lock:
+            if view is None:
+                self._baselines.clear()
+            else:
+                self._baselines.pop(view, None)
+
+    @staticmethod
+    def _diff(previous: dict[str, str], current: dict[str, str]) -> str:
+        parts: list[str] = []
+        for label, text in current.items():
+            old = previous.get(label)
+            if old is None:
+                parts.append(f"## {label} (new)\n{text}")
+            elif old != text:
+                parts.append(f"## {label} (changed)\n{_line_diff(old, text)}")
+        parts.extend(f"## {label} (removed)" for label in previous if label not in current)
+        return "\n\n".join([CHANGES_HEADER, *parts]) if parts else ""
+
+
+def _unique_labels(sections: Sequence[tuple[str, str]]) -> dict[str, str]:
+    unique: dict[str, str] = {}
+    for label, text in sections:
+        key = label
+        suffix = 2
+        while key in unique:
+            key = f"{label}#{suffix}"
+            suffix += 1
+        unique[key] = text
+    return unique
+
+
+def _line_diff(old: str, new: str) -> str:
+    """Return "- old" / "+ new" lines for the changed lines, or the new text when shorter."""
+    old_lines = old.splitlines()
+    new_lines = new.splitlines()
+    diff: list[str] = []
+    matcher = difflib.SequenceMatcher(a=old_lines, b=new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        diff.extend(f"- {line}" for line in old_lines[i1:i2])
+        diff.extend(f"+ {line}" for line in new_lines[j1:j2])
+    rendered = "\n".join(diff)
+    return rendered if len(rendered) < len(new) else new
@@ -0,0 +1,114 @@
+"""Reuse of context builder output across agent calls while its inputs are unchanged."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+from app.models.game_state import GameState
+from app.models.instances.character_instance import CharacterInstance
+from app.models.instances.npc_instance import NPCInstance
+from app.models.state_revisions import StateSection
+
+# Games whose fragments are kept; least recently built are dropped first
+MAX_CACHED_GAMES = 256
+
+
+@dataclass
+class FragmentCacheStats:
+    """Fragment reuse counters, for one build or cumulated."""
+
+    hits: int = 0
+    misses: int = 0
+    uncached: int = 0  # Builders that declare no dependencies always run
+
+    @property
+    def total(self) -> int:
+        return self.hits + self.misses + self.uncached
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.total if self.total else 0.0
+
+    def merge(self, other: "FragmentCacheStats") -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+        self.uncached += other.uncached
+
+
+def revision_key(
+    game_state: GameState,
+    sections: frozenset[StateSection],
+    entity: CharacterInstance | NPCInstance | None = None,
+) -> Hashable:
+    """Return the revisions of the given sections (and of the entity itself).
+
+    StateSection.NPC stands for every NPC instance, so NPCs joining or leaving
+    the game also change the key.
+    """
+    revisions = game_state.revisions
+    parts: list[Hashable] = []
+    for section in sorted(sections):
+        if section == StateSection.NPC:
+            parts.append(tuple((npc.instance_id, revisions.get(section, npc.instance_id)) for npc in game_state.npcs))
+        else:
+            parts.append(revisions.get(section))
+    if isinstance(entity, NPCInstance):
+        parts.append((entity.instance_id, revisions.get(StateSection.NPC, entity.instance_id)))
+    elif entity is not None:
+        parts.append((entity.instance_id, revisions.get(StateSection.CHARACTER)))
+    return tuple(parts)
+
+
+class ContextFragmentCache:
+    """Latest fragment per (game, builder, entity) slot, tagged with its revision key.
+
+    A slot holds a single fragment: a new revision key replaces it, so memory
+    stays bounded by the number of slots per game.
+    """
+
+    def __init__(self, max_games: int = MAX_CACHED_GAMES) -> None:
+        self.max_games = max_games
+        self.totals = FragmentCacheStats()
+        self._games: OrderedDict[str, dict[Hashable, tuple[Hashable, str | None]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self,
+        game_id: str,
+        slot: Hashable,
+        key: Hashable,
+        build: Callable[[], str | None],
+        stats: FragmentCacheStats,
+    ) -> str | None:
+        """Return the cached fragment for slot if built under the same key, else build and store it."""
+        with self._lock:
+            fragments = self._games.get(game_id)
+            if fragments is not None:
+                self._games.move_to_end(game_id)
+                cached = fragments.get(slot)
+                if cached is not None and cached[0] == key:
+                    stats.hits += 1
+                    return cached[1]
+
+        fragment = build()
+        stats.misses += 1
+        with self._lock:
+            fragments = self._games.setdefault(game_id, {})
+            fragments[slot] = (key, fragment)
+            while len(self._games) > self.max_games:
+                self._games.popitem(last=False)
+        return fragment
+
+    def record(self, stats: FragmentCacheStats) -> None:
+        """Add one build's counters to the totals."""
+        with self._lock:
+            self.totals.merge(stats)
+
+    def clear(self, game_id: str | None = None) -> None:
+        """Drop cached fragments for one game, or for all games."""
+        with self._lock:
+            if game_id is None:
+                self._games.clear()
+            else:
+                self._games.pop(game_id, None)
@@ -2,10 +2,12 @@
 
 import json
 import logging
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 
 from app.agents.core.types import AgentType
+from app.services.ai.context.build_metrics import BuilderTiming
 
 logger = logging.getLogger(__name__)
 
@@ -102,7 +104,7 @@ class AgentDebugLogger:
 
         # Truncate system prompt, limit message history for readability. Full context for debug.
         # VSCode Extension recommanded: toiroakr.jsonl-editor (displays text as multiline strings)
-        log_entry = {
+        log_entry: dict[str, object] = {
             "type": "agent_call",
             "timestamp": timestamp,
             "agent_type": agent_type.value,
@@ -122,6 +124,57 @@ class AgentDebugLogger:
         if npc_instance_id:
             log_entry["npc_instance_id"] = npc_instance_id
 
+        self._append(log_entry, game_id, agent_type, npc_instance_id)
+
+    def log_context_build(
+        self,
+        agent_type: AgentType,
+        game_id: str,
+        timings: Sequence[BuilderTiming],
+        npc_instance_id: str | None = None,
+    ) -> None:
+        """Log per-builder wall time and size of one context build.
+
+        Args:
+            agent_type: Type of agent the context was built for
+            game_id: Game ID for this session
+            timings: One entry per builder run
+            npc_instance_id: Optional NPC instance ID for individual NPC agents
+        """
+        if not self.enabled:
+            return
+
+        log_entry: dict[str, object] = {
+            "type": "context_build",
+            "timestamp": datetime.now().isoformat(),
+            "agent_type": agent_type.value,
+            "game_id": game_id,
+            "total_ms": round(sum(timing.seconds for timing in timings) * 1000, 3),
+            "total_tokens": sum(timing.tokens for timing in timings),
+            "builders": [
+                {
+                    "builder": timing.builder,
+                    "entity_id": timing.entity_id,
+                    "ms": round(timing.seconds * 1000, 3),
+                    "chars": timing.chars,
+                    "tokens": timing.tokens,
+                    "level": timing.level,
+                }
+                for timing in timings
+            ],
+        }
+        if npc_instance_id:
+            log_entry["npc_instance_id"] = npc_instance_id
+
+        self._append(log_entry, game_id, agent_type, npc_instance_id)
+
+    def _append(
+        self,
+        log_entry: dict[str, object],
+        game_id: str,
+        agent_type: AgentType,
+        npc_instance_id: str | None,
+    ) -> None:
         try:
             log_path = self._get_log_file_path(game_id, agent_type.value, npc_instance_id)
 
@@ -130,6 +183,6 @@ class AgentDebugLogger:
                 json.dump(log_entry, f, default=str)
                 f.write("\n")
 
-            logger.debug(f"Agent call appended to {log_path}")
+            logger.debug(f"{log_entry['type']} entry appended to {log_path}")
         except Exception as e:
             logger.error(f"Failed to write agent debug log: {e}")
@@ -0,0 +1,207 @@
+"""Sliding-window conversation history with a rolling summary of older turns."""
+
+import asyncio
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+
+from pydantic_ai.messages import ModelMessage, ModelRequest, UserPromptPart
+
+from app.agents.core.types import AgentType
+from app.interfaces.agents.summarizer import ISummarizerAgent
+from app.interfaces.services.ai import IHistoryWindowService
+from app.models.game_state import GameState, Message, MessageRole
+from app.models.history_summary import HistorySummary
+from app.models.state_revisions import StateSection
+from app.services.ai.message_converter_service import MessageConverterService
+from app.utils.token_estimator import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Turns allowed past the window before they are folded, so the summarizer runs every
+# few turns instead of after every single one
+COMPACTION_BATCH_TURNS = 4
+
+SUMMARY_HEADER = "Summary of the earlier conversation:"
+
+
+@dataclass(frozen=True)
+class HistoryWindowPolicy:
+    """How much conversation an agent receives verbatim.
+
+    Attributes:
+        recent_turns: Player turns kept verbatim once older ones are summarized
+        max_tokens: Estimated ceiling for the summary plus verbatim messages
+    """
+
+    recent_turns: int
+    max_tokens: int
+
+    @property
+    def summary_tokens(self) -> int:
+        return self.max_tokens // 4
+
+
+class HistoryWindowService(IHistoryWindowService):
+    """Give agents the last turns verbatim plus a rolling summary of everything older.
+
+    Each agent view of the conversation (narrative, combat, one per NPC) keeps a
+    HistorySummary on the game state recording how many leading history entries it
+    already folds in. Messages past that point are sent verbatim, newest first
+    until the token ceiling. Once more than ``recent_turns + COMPACTION_BATCH_TURNS``
+    turns (or more tokens than the ceiling) are pending, the summarizer folds all
+    but the last ``recent_turns`` turns into the summary in a background task; the
+    current call never waits for it.
+    """
+
+    def __init__(
+        self,
+        message_converter: MessageConverterService,
+        summarizer_provider: Callable[[], ISummarizerAgent],
+        policies: Mapping[AgentType, HistoryWindowPolicy],
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            message_converter: Converter to PydanticAI messages
+            summarizer_provider: Lazily resolves the summarizer agent
+            policies: Window policy per agent type; agents without one get the full history
+        """
+        self.message_converter = message_converter
+        self.summarizer_provider = summarizer_provider
+        self.policies = dict(policies)
+        self._tasks: dict[tuple[str, str], asyncio.Task[None]] = {}
+
+    @staticmethod
+    def view_key(agent_type: AgentType, npc_id: str = "") -> str:
+        return f"{agent_type.value}:{npc_id}" if npc_id else agent_type.value
+
+    def build_message_history(
+        self,
+        game_state: GameState,
+        agent_type: AgentType,
+        npc_id: str = "",
+    ) -> list[ModelMessage]:
+        policy = self.policies.get(agent_type)
+        if policy is None:
+            return self.message_converter.convert_history(game_state, agent_type, npc_id)
+
+        view = self.view_key(agent_type, npc_id)
+        summary = game_state.history_summaries.get(view)
+        covered = summary.covered_messages if summary else 0
+        summary_text = summary.summary if summary else ""
+        allowed = self.message_converter.visible_agent_types(agent_type, game_state, npc_id)
+        conversation = game_state.conversation_history
+        pending = [
+            (position, conversation[position])
+            for position in game_state.message_index.for_agents(allowed, start=covered)
+        ]
+
+        # Newest messages first until the ceiling; the latest one is always kept
+        budget = policy.max_tokens - estimate_tokens(summary_text)
+        kept_from = len(pending)
+        used = 0
+        for position in range(len(pending) - 1, -1, -1):
+            cost = estimate_tokens(pending[position][1].content)
+            if used + cost > budget and kept_from < len(pending):
+                break
+            used += cost
+            kept_from = position
+        if kept_from:
+            logger.info(f"History for {view} in {game_state.game_id}: {kept_from} messages awaiting summary dropped")
+
+        history: list[ModelMessage] = []
+        if summary_text:
+            history.append(ModelRequest(parts=[UserPromptPart(content=f"{SUMMARY_HEADER}\n{summary_text}")]))
+        if kept_from < len(pending):
+            history.extend(
+                self.message_converter.convert_history(game_state, agent_type, npc_id, start=pending[kept_from][0])
+            )
+
+        fold_to = self._fold_point(pending, policy, kept_from)
+        if fold_to:
+            self._schedule_compaction(
+                game_state,
+                view,
+                summary_text,
+                covered,
+                [msg for _, msg in pending[:fold_to]],
+                pending[fold_to][0] if fold_to < len(pending) else len(game_state.conversation_history),
+                policy,
+            )
+        return history
+
+    async def wait_for_compactions(self) -> None:
+        """Block until every scheduled summary update finished."""
+        pending = list(self._tasks.values())
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    @staticmethod
+    def _fold_point(pending: Sequence[tuple[int, Message]], policy: HistoryWindowPolicy, kept_from: int) -> int:
+        """Return how many pending messages to fold into the summary (0 for none yet)."""
+        turn_starts = [position for position, (_, msg) in enumerate(pending) if msg.role == MessageRole.PLAYER]
+        over_turns = len(turn_starts) > policy.recent_turns + COMPACTION_BATCH_TURNS
+        if not over_turns and not kept_from:
+            return 0
+        window_start = turn_starts[-policy.recent_turns] if len(turn_starts) >= policy.recent_turns else 0
+        # Messages dropped for the token ceiling are folded even inside the turn window
+        return max(window_start, kept_from)
+
+    def _schedule_compaction(
+        self,
+        game_state: GameState,
+        view: str,
+        previous_summary: str,
+        previous_covered: int,
+        messages: list[Message],
+        covered_to: int,
+        policy: HistoryWindowPolicy,
+    ) -> None:
+        task_key = (game_state.game_id, view)
+        running = self._tasks.get(task_key)
+        if running is not None and not running.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Synchronous caller: the next call from an agent schedules it instead
+            return
+
+        task = loop.create_task(
+            self._compact(game_state, view, previous_summary, previous_covered, messages, covered_to, policy)
+        )
+        self._tasks[task_key] = task
+        task.add_done_callback(
+            lambda done: self._tasks.pop(task_key, None) if self._tasks.get(task_key) is done else None
+        )
+
+    async def _compact(
+        self,
+        game_state: GameState,
+        view: str,
+        previous_summary: str,
+        previous_covered: int,
+        messages: list[Message],
+        covered_to: int,
+        policy: HistoryWindowPolicy,
+    ) -> None:
+        try:
+            summary = await self.summarizer_provider().summarize_history(
+                game_state, previous_summary, messages, policy.summary_tokens
+            )
+        except Exception as e:
+            logger.warning(f"History summary for {view} in {game_state.game_id} failed: {e}")
+            return
+        if not summary:
+            return
+
+        current = game_state.history_summaries.get(view)
+        if (current.covered_messages if current else 0) != previous_covered:
+            return
+        game_state.history_summaries[view] = HistorySummary(summary=summary, covered_messages=covered_to)
+        game_state.bump_revision(StateSection.HISTORY)
+        logger.info(
+            f"Folded {len(messages)} messages into the {view} history summary of {game_state.game_id} "
+            f"(~{estimate_tokens(summary)} tokens)"
+        )
@@ -0,0 +1,225 @@
+"""Shared HTTP client for LLM providers with connection pool metrics."""
+
+import importlib.util
+import logging
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool defaults; agents share one pool, so size it for concurrent calls across games
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 30.0
+
+DEFAULT_HEADERS = {
+    "HTTP-Referer": "http://localhost:8123",
+    "X-Title": "D&D AI Dungeon Master",
+}
+
+TraceCallback = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class HttpPoolSnapshot:
+    """Connection pool usage since startup (or the last reset).
+
+    Attributes:
+        requests: Requests sent
+        errors: Requests that failed without a response
+        connections_opened: New TCP connections; requests - connections_opened reused one
+        tls_handshakes: TLS sessions established
+        in_flight: Requests currently holding a connection (until their body is closed)
+        peak_in_flight: Highest in_flight seen
+        max_connections: Pool limit
+        http_versions: Responses per protocol, e.g. {"HTTP/2": 12}
+    """
+
+    requests: int
+    errors: int
+    connections_opened: int
+    tls_handshakes: int
+    in_flight: int
+    peak_in_flight: int
+    max_connections: int
+    http_versions: dict[str, int]
+
+    @property
+    def reused(self) -> int:
+        return max(self.requests - self.connections_opened, 0)
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.reused / self.requests if self.requests else 0.0
+
+    @property
+    def utilization(self) -> float:
+        return self.in_flight / self.max_connections if self.max_connections else 0.0
+
+
+class HttpPoolMetrics:
+    """Thread-safe counters fed by InstrumentedTransport."""
+
+    def __init__(self, max_connections: int = MAX_CONNECTIONS) -> None:
+        self.max_connections = max_connections
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._requests = 0
+        self._errors = 0
+        self._connections_opened = 0
+        self._tls_handshakes = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._http_versions: dict[str, int] = {}
+
+    def request_started(self) -> None:
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def request_finished(self, http_version: str | None = None, failed: bool = False) -> None:
+        with self._lock:
+            self._in_flight = max(self._in_flight - 1, 0)
+            if failed:
+                self._errors += 1
+            if http_version:
+                self._http_versions[http_version] = self._http_versions.get(http_version, 0) + 1
+
+    def connection_opened(self) -> None:
+        with self._lock:
+            self._connections_opened += 1
+
+    def tls_handshake(self) -> None:
+        with self._lock:
+            self._tls_handshakes += 1
+
+    def snapshot(self) -> HttpPoolSnapshot:
+        with self._lock:
+            return HttpPoolSnapshot(
+                requests=self._requests,
+                errors=self._errors,
+                connections_opened=self._connections_opened,
+                tls_handshakes=self._tls_handshakes,
+                in_flight=self._in_flight,
+                peak_in_flight=self._peak_in_flight,
+                max_connections=self.max_connections,
+                http_versions=dict(self._http_versions),
+            )
+
+    def reset(self) -> None:
+        """Clear the counters; requests in flight stay counted."""
+        with self._lock:
+            in_flight = self._in_flight
+            self._reset()
+            self._in_flight = in_flight
+            self._peak_in_flight = in_flight
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """Response body that reports when its connection is released."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._on_close()
+        await self._stream.aclose()
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Wrap a transport to count requests, new connections and TLS handshakes.
+
+    New connections are detected through the httpcore ``trace`` request extension;
+    a request that completes without opening one reused a pooled connection.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: HttpPoolMetrics) -> None:
+        self._transport = transport
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.extensions["trace"] = self._trace(request.extensions.get("trace"))
+        self.metrics.request_started()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self.metrics.request_finished(failed=True)
+            raise
+
+        raw_version = response.extensions.get("http_version")
+        http_version = raw_version.decode("ascii") if isinstance(raw_version, bytes) else None
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_TrackedStream(response.stream, lambda: self.metrics.request_finished(http_version)),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def _trace(self, inner: TraceCallback | None) -> TraceCallback:
+        async def trace(event: str, info: dict[str, Any]) -> None:
+            if event == "connection.connect_tcp.complete":
+                self.metrics.connection_opened()
+            elif event == "connection.start_tls.complete":
+                self.metrics.tls_handshake()
+            if inner is not None:
+                await inner(event, info)
+
+        return trace
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_llm_http_client(
+    metrics: HttpPoolMetrics | None = None,
+    http2: bool = True,
+    max_connections: int = MAX_CONNECTIONS,
+    max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = KEEPALIVE_EXPIRY,
+) -> httpx.AsyncClient:
+    """Create the client shared by all LLM providers.
+
+    Args:
+        metrics: Receives pool usage; a new instance is created when None
+        http2: Negotiate HTTP/2 when the h2 package is installed, HTTP/1.1 otherwise
+        max_connections: Upper bound of open connections
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection is kept
+    """
+    if http2 and not http2_available():
+        logger.warning("HTTP/2 requested for LLM calls but the h2 package is missing; using HTTP/1.1")
+        http2 = False
+
+    metrics = metrics or HttpPoolMetrics(max_connections)
+    metrics.max_connections = max_connections
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+    logger.info(
+        f"LLM HTTP client: {'HTTP/2' if http2 else 'HTTP/1.1'}, {max_connections} connections, "
+        f"{max_keepalive_connections} kept alive for {keepalive_expiry:g}s"
+    )
+    return httpx.AsyncClient(headers=DEFAULT_HEADERS, transport=InstrumentedTransport(transport, metrics))
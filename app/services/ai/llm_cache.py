@@ -0,0 +1,344 @@
+"""Record, replay and cache agent model calls, deduplicating identical calls in flight."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter
+from pydantic_ai import RunContext
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelMessagesTypeAdapter,
+    ModelResponse,
+    ModelResponseStreamEvent,
+    TextPart,
+    ThinkingPart,
+    ToolCallPart,
+)
+from pydantic_ai.models import Model, ModelRequestParameters, StreamedResponse
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+from app.agents.core.types import AgentType, LlmCacheMode
+
+logger = logging.getLogger(__name__)
+
+# In-memory cache defaults for CACHE mode
+MAX_CACHED_RESPONSES = 512
+CACHE_TTL_SECONDS = 900.0
+
+# Fields that differ between otherwise identical requests and must not affect the key
+_VOLATILE_FIELDS = frozenset({"timestamp", "usage", "provider_request_id", "provider_details"})
+
+_REQUEST_PARAMETERS_ADAPTER = TypeAdapter(ModelRequestParameters)
+
+
+class LlmReplayMissError(LookupError):
+    """Raised in REPLAY mode for a request that was never recorded."""
+
+
+def request_key(
+    model_name: str,
+    messages: list[ModelMessage],
+    model_settings: ModelSettings | None,
+    model_request_parameters: ModelRequestParameters,
+) -> str:
+    """Return the content hash identifying a model request.
+
+    Timestamps and usage are left out, so a request repeated later with the same
+    prompt, history, settings and tools maps to the same key.
+    """
+    payload = {
+        "model": model_name,
+        "messages": _without_volatile(ModelMessagesTypeAdapter.dump_python(messages, mode="json")),
+        "settings": model_settings or {},
+        "parameters": _REQUEST_PARAMETERS_ADAPTER.dump_python(model_request_parameters, mode="json"),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _without_volatile(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _without_volatile(item) for key, item in value.items() if key not in _VOLATILE_FIELDS}
+    if isinstance(value, list):
+        return [_without_volatile(item) for item in value]
+    return value
+
+
+def _has_answer(response: ModelResponse) -> bool:
+    return any(
+        isinstance(part, ToolCallPart) or (isinstance(part, TextPart) and part.content.strip())
+        for part in response.parts
+    )
+
+
+@dataclass
+class _CachedResponse:
+    response: ModelResponse
+    expires_at: float
+
+
+@dataclass
+class LlmCacheStats:
+    """Counters since startup.
+
+    Attributes:
+        hits: Requests served from the cache or recordings
+        misses: Requests sent to the model
+        shared: Requests that waited for an identical request in flight instead
+    """
+
+    hits: int = 0
+    misses: int = 0
+    shared: int = 0
+
+
+@dataclass
+class _Flight:
+    future: asyncio.Future[ModelResponse]
+    response: ModelResponse | None = field(default=None)
+
+
+class LlmCallCache:
+    """Response store for one cache mode, plus single-flight for identical requests.
+
+    RECORD writes one JSON file per request key with the messages and the response;
+    REPLAY reads them back. CACHE keeps up to ``max_entries`` responses in memory,
+    each for ``ttl_seconds``, dropping the least recently used first, and only for
+    ``cached_agents``, and never a response without text or a tool call, so a retry
+    after an empty answer reaches the model again. In every mode, a request identical to one already in flight
+    waits for its response instead of calling the model again.
+    """
+
+    def __init__(
+        self,
+        mode: LlmCacheMode,
+        directory: Path | None = None,
+        max_entries: int = MAX_CACHED_RESPONSES,
+        ttl_seconds: float = CACHE_TTL_SECONDS,
+        cached_agents: Collection[AgentType] = (AgentType.SUMMARIZER,),
+    ) -> None:
+        if mode in (LlmCacheMode.RECORD, LlmCacheMode.REPLAY) and directory is None:
+            raise ValueError(f"LLM cache mode '{mode.value}' needs a recording directory")
+        self.mode = mode
+        self.directory = directory
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.cached_agents = frozenset(cached_agents)
+        self.stats = LlmCacheStats()
+        self._entries: OrderedDict[str, _CachedResponse] = OrderedDict()
+        self._in_flight: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def applies_to(self, agent_type: AgentType) -> bool:
+        """Whether calls of an agent type go through the cache."""
+        if self.mode == LlmCacheMode.CACHE:
+            return agent_type in self.cached_agents
+        return self.mode != LlmCacheMode.OFF
+
+    def lookup(self, key: str) -> ModelResponse | None:
+        """Return the stored response for a key, or None (RECORD never serves stored responses)."""
+        if self.mode == LlmCacheMode.REPLAY:
+            return self._read_recording(key)
+        if self.mode != LlmCacheMode.CACHE:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry.response
+
+    def store(self, key: str, messages: list[ModelMessage], response: ModelResponse) -> None:
+        if self.mode == LlmCacheMode.RECORD:
+            self._write_recording(key, messages, response)
+        elif self.mode == LlmCacheMode.CACHE and _has_answer(response):
+            with self._lock:
+                self._entries[key] = _CachedResponse(response, time.monotonic() + self.ttl_seconds)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    async def join(self, key: str) -> ModelResponse | None:
+        """Return a stored response or the response of an identical request in flight.
+
+        Raises:
+            LlmReplayMissError: In REPLAY mode when the request was not recorded
+        """
+        response = self.lookup(key)
+        if response is not None:
+            self.stats.hits += 1
+            return response
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            self.stats.shared += 1
+            return await asyncio.shield(flight.future)
+        if self.mode == LlmCacheMode.REPLAY:
+            raise LlmReplayMissError(f"No recorded response for LLM request {key} in {self.directory}")
+        return None
+
+    @contextmanager
+    def lead(self, key: str, messages: list[ModelMessage]) -> Iterator[_Flight]:
+        """Register the caller as the one request in flight for a key.
+
+        Set ``response`` on the yielded flight once the model answered; it is stored and
+        handed to the requests that joined. If the block fails, they fail with it.
+        """
+        self.stats.misses += 1
+        flight = _Flight(asyncio.get_running_loop().create_future())
+        self._in_flight[key] = flight
+        try:
+            yield flight
+            if flight.response is None:
+                raise RuntimeError(f"LLM request {key} finished without a response")
+            self.store(key, messages, flight.response)
+            flight.future.set_result(flight.response)
+        except asyncio.CancelledError:
+            flight.future.cancel()
+            raise
+        except BaseException as e:
+            flight.future.set_exception(e)
+            # Retrieve it so a flight nobody joined does not log "exception was never retrieved"
+            flight.future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+    async def fetch(
+        self,
+        key: str,
+        messages: list[ModelMessage],
+        call: Callable[[], Awaitable[ModelResponse]],
+    ) -> ModelResponse:
+        """Return the stored or shared response for a key, calling the model only when there is none."""
+        response = await self.join(key)
+        if response is not None:
+            return response
+        with self.lead(key, messages) as flight:
+            flight.response = await call()
+        assert flight.response is not None
+        return flight.response
+
+    def _recording_path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{key}.json"
+
+    def _read_recording(self, key: str) -> ModelResponse | None:
+        path = self._recording_path(key)
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        response = ModelMessagesTypeAdapter.validate_python([data["response"]])[0]
+        assert isinstance(response, ModelResponse)
+        return response
+
+    def _write_recording(self, key: str, messages: list[ModelMessage], response: ModelResponse) -> None:
+        path = self._recording_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "key": key,
+            "recorded_at": datetime.now().isoformat(),
+            "messages": ModelMessagesTypeAdapter.dump_python(messages, mode="json"),
+            "response": ModelMessagesTypeAdapter.dump_python([response], mode="json")[0],
+        }
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        temp_path.replace(path)
+        logger.debug(f"Recorded LLM response {key}")
+
+
+@dataclass
+class _ReplayedStreamedResponse(StreamedResponse):
+    """Streams a stored response part by part, as the model would have."""
+
+    _response: ModelResponse
+    _model_name: str
+    _provider_name: str | None
+    _timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc), init=False)
+
+    async def _get_event_iterator(self) -> AsyncIterator[ModelResponseStreamEvent]:
+        self._usage = self._response.usage
+        for index, part in enumerate(self._response.parts):
+            if isinstance(part, TextPart):
+                event = self._parts_manager.handle_text_delta(vendor_part_id=index, content=part.content)
+                if event is not None:
+                    yield event
+            elif isinstance(part, ThinkingPart):
+                yield self._parts_manager.handle_thinking_delta(vendor_part_id=index, content=part.content)
+            elif isinstance(part, ToolCallPart):
+                yield self._parts_manager.handle_tool_call_part(
+                    vendor_part_id=index, tool_name=part.tool_name, args=part.args, tool_call_id=part.tool_call_id
+                )
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    @property
+    def provider_name(self) -> str | None:
+        return self._provider_name
+
+    @property
+    def timestamp(self) -> datetime:
+        return self._timestamp
+
+
+class CachedModel(WrapperModel):
+    """Model that serves its requests through an LlmCallCache."""
+
+    def __init__(self, wrapped: Model, cache: LlmCallCache) -> None:
+        super().__init__(wrapped)
+        self.cache = cache
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        key = request_key(self.model_name, messages, model_settings, model_request_parameters)
+        return await self.cache.fetch(
+            key,
+            messages,
+            lambda: self.wrapped.request(messages, model_settings, model_request_parameters),
+        )
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        key = request_key(self.model_name, messages, model_settings, model_request_parameters)
+        response = await self.cache.join(key)
+        if response is not None:
+            yield _ReplayedStreamedResponse(
+                model_request_parameters=model_request_parameters,
+                _response=response,
+                _model_name=self.model_name,
+                _provider_name=self.system,
+            )
+            return
+
+        with self.cache.lead(key, messages) as flight:
+            async with self.wrapped.request_stream(
+                messages, model_settings, model_request_parameters, run_context
+            ) as streamed_response:
+                yield streamed_response
+                flight.response = streamed_response.get()
@@ -1,5 +1,10 @@
 """Service for converting between message formats."""
 
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
 from pydantic_ai.messages import (
     ModelMessage,
     ModelRequest,
@@ -11,31 +16,78 @@ from pydantic_ai.messages import (
 from app.agents.core.types import AgentType
 from app.models.game_state import GameState, Message, MessageRole
 
+# Converted history views kept; least recently used are dropped first
+MAX_CACHED_VIEWS = 512
+
+
+@dataclass
+class _ConvertedView:
+    """Converted messages of one history view, extended as the history grows."""
+
+    history: list[Message]
+    synced: int = 0
+    positions: list[int] = field(default_factory=list)
+    messages: list[ModelMessage] = field(default_factory=list)
+
 
 class MessageConverterService:
     """Service for converting between message formats."""
 
-    @staticmethod
-    def to_pydantic_messages(
-        messages: list[Message],
-        agent_type: AgentType,
+    def __init__(self, max_views: int = MAX_CACHED_VIEWS) -> None:
+        self.max_views = max_views
+        self._views: OrderedDict[tuple[str, frozenset[AgentType]], _ConvertedView] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def convert_history(
+        self,
         game_state: GameState,
-        npc_id: str,
+        agent_type: AgentType,
+        npc_id: str = "",
+        start: int = 0,
     ) -> list[ModelMessage]:
-        """
-        Convert internal Message format to PydanticAI's ModelMessage format.
+        """Convert the part of game_state.conversation_history visible to an agent.
+
+        Conversions are cached per view (game and visible agent types), so a call
+        only converts the messages appended since the previous one.
 
         Args:
-            messages: List of messages to convert
             agent_type: Agent type requesting the messages
             game_state: Current game state for party membership checks
             npc_id: NPC instance ID (required for NPC agents, use "" for others)
+            start: First conversation_history position to include
 
         Returns:
             List of ModelMessage objects for PydanticAI
         """
-        pydantic_messages: list[ModelMessage] = []
+        allowed_agent_types = frozenset(self.visible_agent_types(agent_type, game_state, npc_id))
+        history = game_state.conversation_history
+        key = (game_state.game_id, allowed_agent_types)
+
+        with self._lock:
+            view = self._views.get(key)
+            if view is None or view.history is not history or view.synced > len(history):
+                view = _ConvertedView(history=history)
+                self._views[key] = view
+            self._views.move_to_end(key)
+            while len(self._views) > self.max_views:
+                self._views.popitem(last=False)
 
+            for position in game_state.message_index.for_agents(allowed_agent_types, start=view.synced):
+                view.positions.append(position)
+                view.messages.append(self._convert(history[position]))
+            view.synced = len(history)
+
+            return view.messages[bisect_left(view.positions, start) :]
+
+    @staticmethod
+    def visible_agent_types(agent_type: AgentType, game_state: GameState, npc_id: str) -> set[AgentType]:
+        """Return the agent types whose messages the given agent sees in its history.
+
+        Args:
+            agent_type: Agent type requesting the messages
+            game_state: Current game state for party membership checks
+            npc_id: NPC instance ID (required for NPC agents, use "" for others)
+        """
         allowed_agent_types = {agent_type}
 
         # Narrative agent includes NPC messages
@@ -46,22 +98,19 @@ class MessageConverterService:
         if agent_type is AgentType.NPC and npc_id and npc_id in game_state.party.member_ids:
             allowed_agent_types.add(AgentType.NARRATIVE)
 
-        for msg in messages:
-            if msg.agent_type not in allowed_agent_types:
-                continue
-
-            if msg.role == MessageRole.PLAYER:
-                pydantic_messages.append(ModelRequest(parts=[UserPromptPart(content=msg.content)]))
-            elif msg.role == MessageRole.NPC:
-                speaker = msg.speaker_npc_name or msg.speaker_npc_id
-                content = msg.content
-                if speaker:
-                    trimmed_content = content.lstrip()
-                    prefix = f"{speaker}:"
-                    if not trimmed_content.startswith(prefix):
-                        content = f"{speaker}: {content}"
-                pydantic_messages.append(ModelResponse(parts=[TextPart(content=content)]))
-            elif msg.role == MessageRole.DM:
-                pydantic_messages.append(ModelResponse(parts=[TextPart(content=msg.content)]))
-
-        return pydantic_messages
+        return allowed_agent_types
+
+    @staticmethod
+    def _convert(msg: Message) -> ModelMessage:
+        if msg.role == MessageRole.PLAYER:
+            return ModelRequest(parts=[UserPromptPart(content=msg.content)])
+        if msg.role == MessageRole.NPC:
+            speaker = msg.speaker_npc_name or msg.speaker_npc_id
+            content = msg.content
+            if speaker:
+                trimmed_content = content.lstrip()
+                prefix = f"{speaker}:"
+                if not trimmed_content.startswith(prefix):
+                    content = f"{speaker}: {content}"
+            return ModelResponse(parts=[TextPart(content=content)])
+        return ModelResponse(parts=[TextPart(content=msg.content)])
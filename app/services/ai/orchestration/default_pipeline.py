@@ -7,6 +7,7 @@ NPC dialogue, combat transitions, and combat auto-run loops.
 import logging
 
 from app.agents.core.base import BaseAgent
+from app.agents.core.types import NpcDialogueMode
 from app.agents.tool_suggestor.agent import ToolSuggestorAgent
 from app.interfaces.agents.summarizer import ISummarizerAgent
 from app.interfaces.events import IEventBus
@@ -72,6 +73,7 @@ def create_default_pipeline(
     agent_lifecycle_service: IAgentLifecycleService,
     event_manager: IEventManager,
     event_bus: IEventBus,
+    npc_dialogue_mode: NpcDialogueMode = NpcDialogueMode.SEQUENTIAL,
 ) -> Pipeline:
     """Create the default orchestration pipeline.
 
@@ -98,7 +100,7 @@ def create_default_pipeline(
             has_npc_targets,
             steps=[
                 BeginDialogueSession(),
-                ExecuteNpcDialogue(agent_lifecycle_service, conversation_service),
+                ExecuteNpcDialogue(agent_lifecycle_service, conversation_service, npc_dialogue_mode),
                 # ExecuteNpcDialogue returns HALT outcome to stop pipeline
             ],
         )
@@ -1,15 +1,17 @@
 """Step to execute NPC dialogue interactions."""
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import cast
 
-from app.agents.core.types import AgentType
-from app.agents.npc.base import BaseNPCAgent
+from app.agents.core.types import AgentType, NpcDialogueMode
+from app.agents.npc.base import BaseNPCAgent, NPCReply
 from app.interfaces.services.ai import IAgentLifecycleService
 from app.interfaces.services.game import IConversationService
 from app.models.ai_response import StreamEvent
 from app.models.game_state import MessageRole
+from app.models.instances.npc_instance import NPCInstance
 from app.services.ai.orchestration.context import OrchestrationContext
 from app.services.ai.orchestration.step import StepResult
 
@@ -23,10 +25,12 @@ class ExecuteNpcDialogue:
         self,
         agent_lifecycle_service: IAgentLifecycleService,
         conversation_service: IConversationService,
+        mode: NpcDialogueMode = NpcDialogueMode.SEQUENTIAL,
     ):
         """Initialize with agent lifecycle service and conversation service."""
         self.agent_lifecycle_service = agent_lifecycle_service
         self.conversation_service = conversation_service
+        self.mode = mode
 
     async def run(self, ctx: OrchestrationContext) -> StepResult:
         """Execute dialogue with each targeted NPC."""
@@ -42,36 +46,79 @@ class ExecuteNpcDialogue:
             agent_type=AgentType.NPC,
         )
 
-        # Process each targeted NPC
-        accumulated_events: list[StreamEvent] = []
+        targets = [(npc, self._get_agent(ctx, npc)) for npc in self._resolve_targets(ctx)]
+        if self.mode is NpcDialogueMode.PARALLEL and len(targets) > 1:
+            accumulated_events = await self._run_parallel(ctx, targets)
+        else:
+            accumulated_events = await self._run_sequential(ctx, targets)
 
+        # Update context with accumulated events and return HALT
+        updated_ctx = ctx.add_events(accumulated_events)
+
+        logger.info("Completed dialogue with %d NPC(s)", len(ctx.flags.npc_targets))
+
+        return StepResult.halt(updated_ctx, "NPC dialogue completed")
+
+    @staticmethod
+    def _resolve_targets(ctx: OrchestrationContext) -> list[NPCInstance]:
+        npcs: list[NPCInstance] = []
         for npc_id in ctx.flags.npc_targets:
             npc = ctx.game_state.get_npc_by_id(npc_id)
             if npc is None:
                 error_msg = f"NPC with id '{npc_id}' not found"
                 logger.error(error_msg)
                 raise ValueError(error_msg)
+            npcs.append(npc)
+        return npcs
 
-            # Get NPC agent from lifecycle service
-            agent = cast(
-                BaseNPCAgent,
-                self.agent_lifecycle_service.get_npc_agent(ctx.game_state, npc),
-            )
-            agent.prepare_for_npc(npc)
+    def _get_agent(self, ctx: OrchestrationContext, npc: NPCInstance) -> BaseNPCAgent:
+        return cast(BaseNPCAgent, self.agent_lifecycle_service.get_npc_agent(ctx.game_state, npc))
 
+    async def _run_sequential(
+        self,
+        ctx: OrchestrationContext,
+        targets: list[tuple[NPCInstance, BaseNPCAgent]],
+    ) -> list[StreamEvent]:
+        """Each NPC replies after the previous reply was recorded, so it can react to it."""
+        events: list[StreamEvent] = []
+        for npc, agent in targets:
+            agent.prepare_for_npc(npc)
             # NPC agents build their own context internally (includes persona)
-            events: list[StreamEvent] = []
             async for event in agent.process(ctx.user_message, ctx.game_state, context="", stream=True):
                 events.append(event)
 
-            accumulated_events.extend(events)
-
             # Update session timestamp
             ctx.game_state.dialogue_session.last_interaction_at = datetime.now()
+        return events
 
-        # Update context with accumulated events and return HALT
-        updated_ctx = ctx.add_events(accumulated_events)
-
-        logger.info("Completed dialogue with %d NPC(s)", len(ctx.flags.npc_targets))
-
-        return StepResult.halt(updated_ctx, "NPC dialogue completed")
+    async def _run_parallel(
+        self,
+        ctx: OrchestrationContext,
+        targets: list[tuple[NPCInstance, BaseNPCAgent]],
+    ) -> list[StreamEvent]:
+        """Generate all replies concurrently, then record and broadcast them in target order.
+
+        NPCs served by the same agent instance (minor NPCs share the game's puppeteer)
+        hold per-call state on it, so they still take turns on that agent. Text is not
+        streamed, as concurrent replies would interleave on the client.
+        """
+        replies: list[NPCReply | None] = [None] * len(targets)
+        groups: dict[int, list[int]] = {}
+        for position, (_, agent) in enumerate(targets):
+            groups.setdefault(id(agent), []).append(position)
+
+        async def run_group(positions: list[int]) -> None:
+            for position in positions:
+                npc, agent = targets[position]
+                agent.prepare_for_npc(npc)
+                replies[position] = await agent.generate_reply(ctx.user_message, ctx.game_state, stream=False)
+
+        logger.info("Generating %d NPC replies on %d agent(s) concurrently", len(targets), len(groups))
+        await asyncio.gather(*(run_group(positions) for positions in groups.values()))
+
+        events: list[StreamEvent] = []
+        for (_, agent), reply in zip(targets, replies, strict=True):
+            assert reply is not None
+            events.append(await agent.deliver_reply(ctx.game_state, reply))
+        ctx.game_state.dialogue_session.last_interaction_at = datetime.now()
+        return events
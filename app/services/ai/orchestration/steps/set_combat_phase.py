@@ -3,6 +3,7 @@
 import logging
 
 from app.models.combat import CombatPhase
+from app.models.state_revisions import StateSection
 from app.services.ai.orchestration.context import OrchestrationContext
 from app.services.ai.orchestration.step import StepResult
 
@@ -20,6 +21,7 @@ class SetCombatPhase:
         """Set the combat phase in game state."""
         old_phase = ctx.game_state.combat.phase
         ctx.game_state.combat.phase = self.target_phase
+        ctx.game_state.bump_revision(StateSection.COMBAT)
 
         logger.info("Combat phase: %s → %s", old_phase.value, self.target_phase.value)
 
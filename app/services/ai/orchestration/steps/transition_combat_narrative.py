@@ -11,6 +11,7 @@ from app.interfaces.events import IEventBus
 from app.interfaces.services.ai import IContextService
 from app.models.ai_response import StreamEvent
 from app.models.game_state import Message, MessageRole
+from app.models.state_revisions import StateSection
 from app.services.ai.orchestration.context import OrchestrationContext
 from app.services.ai.orchestration.step import StepResult
 
@@ -52,6 +53,7 @@ class TransitionCombatToNarrative:
                     combat_occurrence=None,
                 )
                 ctx.game_state.conversation_history.append(summary_message)
+                ctx.game_state.bump_revision(StateSection.HISTORY)
 
                 # Broadcast summary to frontend (matching transitions.py lines 54-62)
                 await self.event_bus.submit_and_wait(
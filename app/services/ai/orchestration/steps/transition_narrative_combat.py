@@ -8,6 +8,7 @@ from app.events.commands.broadcast_commands import BroadcastNarrativeCommand
 from app.interfaces.agents.summarizer import ISummarizerAgent
 from app.interfaces.events import IEventBus
 from app.models.game_state import Message, MessageRole
+from app.models.state_revisions import StateSection
 from app.services.ai.orchestration.context import OrchestrationContext
 from app.services.ai.orchestration.step import StepResult
 
@@ -50,6 +51,7 @@ class TransitionNarrativeToCombat:
                 ),
             )
             ctx.game_state.conversation_history.append(summary_message)
+            ctx.game_state.bump_revision(StateSection.HISTORY)
 
             # Broadcast summary to frontend (transitions.py lines 54-62)
             await self.event_bus.submit_and_wait(
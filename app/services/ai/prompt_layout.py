@@ -0,0 +1,133 @@
+"""Arrange agent prompts by layout and track prefix reuse for provider-side prompt caching."""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from pydantic_ai.messages import ModelMessage, ModelRequest, ModelRequestPart, SystemPromptPart, UserPromptPart
+
+from app.agents.core.types import PromptLayout
+from app.utils.token_estimator import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Views (game and agent) whose last prompt fingerprints are remembered
+MAX_TRACKED_VIEWS = 256
+
+
+@dataclass(frozen=True)
+class PromptSegment:
+    """A named slice of the input sent to the model, in send order."""
+
+    name: str
+    text: str
+
+    @property
+    def fingerprint(self) -> str:
+        return hashlib.sha256(self.text.encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass(frozen=True)
+class ArrangedPrompt:
+    """Message history and user prompt to pass to the agent run."""
+
+    message_history: list[ModelMessage]
+    user_prompt: str
+    segments: list[PromptSegment]
+
+
+def arrange_prompt(
+    layout: PromptLayout,
+    system_prompt: str,
+    history: Sequence[ModelMessage],
+    stable_context: str,
+    volatile_context: str,
+    player_line: str,
+) -> ArrangedPrompt:
+    """Lay out one agent call.
+
+    In the PREFIX_STABLE layout the system prompt and the stable context are sent as
+    the first history message: PydanticAI only adds the agent's system prompt itself
+    when the history is empty.
+
+    Args:
+        layout: Prompt layout to apply
+        system_prompt: Agent system prompt
+        history: Converted conversation history
+        stable_context: Context that rarely changes (empty when the volatile context has it all)
+        volatile_context: Context rebuilt every turn
+        player_line: Final line carrying the player's message
+    """
+    history_segments = [
+        PromptSegment(f"history[{position}]", _message_text(msg)) for position, msg in enumerate(history)
+    ]
+
+    if layout is PromptLayout.INLINE:
+        context = "\n\n".join(part for part in (stable_context, volatile_context) if part)
+        user_prompt = f"\n\n{context}\n\n{player_line}"
+        segments = [
+            PromptSegment("system", system_prompt),
+            *history_segments,
+            PromptSegment("prompt", user_prompt),
+        ]
+        return ArrangedPrompt(list(history), user_prompt, segments)
+
+    prefix_parts: list[ModelRequestPart] = [SystemPromptPart(content=system_prompt)]
+    if stable_context:
+        prefix_parts.append(UserPromptPart(content=stable_context))
+    user_prompt = f"{volatile_context}\n\n{player_line}" if volatile_context else player_line
+    segments = [
+        PromptSegment("system", system_prompt),
+        PromptSegment("stable_context", stable_context),
+        *history_segments,
+        PromptSegment("volatile_context", volatile_context),
+        PromptSegment("player", player_line),
+    ]
+    return ArrangedPrompt([ModelRequest(parts=prefix_parts), *history], user_prompt, segments)
+
+
+class PromptPrefixTracker:
+    """Measure how much of each prompt repeats the start of the previous one.
+
+    Providers cache prompts by exact prefix, so the leading segments shared with the
+    previous call of the same view approximate the cacheable part. Each call logs the
+    segment fingerprints along with the reused segment and token counts.
+    """
+
+    def __init__(self, max_views: int = MAX_TRACKED_VIEWS) -> None:
+        self.max_views = max_views
+        self._last: OrderedDict[str, list[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, view: str, segments: Sequence[PromptSegment]) -> int:
+        """Remember the fingerprints of a call and return how many leading segments were reused."""
+        fingerprints = [segment.fingerprint for segment in segments]
+        with self._lock:
+            previous = self._last.pop(view, [])
+            self._last[view] = fingerprints
+            while len(self._last) > self.max_views:
+                self._last.popitem(last=False)
+
+        reused = 0
+        for current, last in zip(fingerprints, previous, strict=False):
+            if current != last:
+                break
+            reused += 1
+
+        tokens = [estimate_tokens(segment.text) for segment in segments]
+        layout = ", ".join(
+            f"{segment.name}={fingerprint}" for segment, fingerprint in zip(segments, fingerprints, strict=True)
+        )
+        logger.debug(
+            f"Prompt prefix for {view}: {reused}/{len(segments)} segments reused "
+            f"(~{sum(tokens[:reused])}/{sum(tokens)} tokens) [{layout}]"
+        )
+        return reused
+
+
+def _message_text(message: ModelMessage) -> str:
+    # Only content reaches the provider; timestamps and metadata are left out
+    return "\n".join(str(content) for part in message.parts if (content := getattr(part, "content", None)) is not None)
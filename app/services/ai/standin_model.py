@@ -0,0 +1,254 @@
+"""Local stand-in for the LLM that plays scripted turns with simulated latency and throughput."""
+
+import asyncio
+import logging
+import random
+import re
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from pydantic_ai import RunContext
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    ModelResponsePart,
+    ModelResponseStreamEvent,
+    TextPart,
+    ToolCallPart,
+    UserPromptPart,
+)
+from pydantic_ai.models import Model, ModelRequestParameters, StreamedResponse
+from pydantic_ai.settings import ModelSettings
+from pydantic_ai.usage import RequestUsage
+
+from app.agents.core.types import AgentType
+from app.models.game_state import GameState
+from app.models.standin_script import ScriptedToolCall, ScriptedTurn, StandInScript
+from app.utils.token_estimator import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Tool call ids carry the turn and call index, so a run resumes its turn from the history alone
+_TOOL_CALL_ID = re.compile(r"^standin-(\d+)-(\d+)$")
+_PLACEHOLDER = re.compile(r"^\{(\w+)\}$")
+_TEXT_CHUNK = re.compile(r"\S+\s*")
+
+
+class StandInModel(Model):
+    """Model that answers from a StandInScript instead of calling a provider.
+
+    Every agent run plays the next scripted turn of its agent type: each scripted
+    tool call the agent has is sent as its own response, then the turn's text (or,
+    for structured output, an output tool call built from the text). Responses wait
+    a sampled time to first token, then stream their text at the scripted tokens per
+    second.
+
+    Placeholders such as ``{enemy_id}`` are filled from the run's game state, which
+    only streamed runs pass to the model; non-streamed runs skip calls that need them.
+    """
+
+    def __init__(self, agent_type: AgentType, script: StandInScript) -> None:
+        super().__init__()
+        self.agent_type = agent_type
+        agent_script = script.for_agent(agent_type)
+        self.turns = agent_script.turns
+        self.latency = agent_script.latency or script.latency
+        self.tokens_per_second = (
+            agent_script.tokens_per_second if agent_script.tokens_per_second is not None else script.tokens_per_second
+        )
+        self._rng = random.Random(script.seed)
+        self._next_turn = 0
+
+    @property
+    def model_name(self) -> str:
+        return f"standin:{self.agent_type.value}"
+
+    @property
+    def system(self) -> str:
+        return "standin"
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        # Model.request gets no run context, so there is no game state to fill placeholders from
+        part = self._next_part(messages, model_request_parameters, None)
+        await asyncio.sleep(self.latency.sample(self._rng) + self._generation_seconds(part))
+        return ModelResponse(
+            parts=[part],
+            usage=_usage(messages, part),
+            model_name=self.model_name,
+            provider_name=self.system,
+        )
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        game_state = getattr(run_context.deps, "game_state", None) if run_context else None
+        part = self._next_part(messages, model_request_parameters, game_state)
+        yield _StandInStreamedResponse(
+            model_request_parameters=model_request_parameters,
+            _part=part,
+            _usage_estimate=_usage(messages, part),
+            _latency=self.latency.sample(self._rng),
+            _tokens_per_second=self.tokens_per_second,
+            _model_name=self.model_name,
+        )
+
+    def _generation_seconds(self, part: ModelResponsePart) -> float:
+        if not self.tokens_per_second or not isinstance(part, TextPart):
+            return 0.0
+        return estimate_tokens(part.content) / self.tokens_per_second
+
+    def _next_part(
+        self,
+        messages: list[ModelMessage],
+        params: ModelRequestParameters,
+        game_state: GameState | None,
+    ) -> ModelResponsePart:
+        turn_index, start = self._resume(messages)
+        turn = self.turns[turn_index % len(self.turns)]
+        tool_names = {tool.name for tool in params.function_tools}
+        values = _placeholder_values(game_state) if isinstance(game_state, GameState) else {}
+
+        for index in range(start, len(turn.tool_calls)):
+            call = turn.tool_calls[index]
+            args = _fill_args(call, values) if call.tool in tool_names else None
+            if args is not None:
+                return ToolCallPart(call.tool, args, tool_call_id=f"standin-{turn_index}-{index}")
+            logger.debug(f"Stand-in {self.agent_type.value} skips scripted call {call.tool}")
+        return _final_part(turn, params)
+
+    def _resume(self, messages: list[ModelMessage]) -> tuple[int, int]:
+        """Return the turn of the current run and the index of its next scripted tool call."""
+        for message in reversed(messages):
+            if isinstance(message, ModelRequest) and any(isinstance(p, UserPromptPart) for p in message.parts):
+                break
+            if isinstance(message, ModelResponse):
+                for part in reversed(message.parts):
+                    match = _TOOL_CALL_ID.match(part.tool_call_id) if isinstance(part, ToolCallPart) else None
+                    if match:
+                        return int(match.group(1)), int(match.group(2)) + 1
+        turn_index = self._next_turn
+        self._next_turn += 1
+        return turn_index, 0
+
+
+@dataclass
+class _StandInStreamedResponse(StreamedResponse):
+    _part: ModelResponsePart
+    _usage_estimate: RequestUsage
+    _latency: float
+    _tokens_per_second: float
+    _model_name: str
+    _timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc), init=False)
+
+    async def _get_event_iterator(self) -> AsyncIterator[ModelResponseStreamEvent]:
+        await asyncio.sleep(self._latency)
+        self._usage = self._usage_estimate
+        if isinstance(self._part, TextPart):
+            for chunk in _TEXT_CHUNK.findall(self._part.content) or [""]:
+                if self._tokens_per_second:
+                    await asyncio.sleep(estimate_tokens(chunk) / self._tokens_per_second)
+                event = self._parts_manager.handle_text_delta(vendor_part_id="text", content=chunk)
+                if event is not None:
+                    yield event
+        elif isinstance(self._part, ToolCallPart):
+            yield self._parts_manager.handle_tool_call_part(
+                vendor_part_id=self._part.tool_call_id,
+                tool_name=self._part.tool_name,
+                args=self._part.args,
+                tool_call_id=self._part.tool_call_id,
+            )
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    @property
+    def provider_name(self) -> str:
+        return "standin"
+
+    @property
+    def timestamp(self) -> datetime:
+        return self._timestamp
+
+
+def _usage(messages: list[ModelMessage], part: ModelResponsePart) -> RequestUsage:
+    prompt = " ".join(str(p.content) for m in messages if isinstance(m, ModelRequest) for p in m.parts)
+    output = part.content if isinstance(part, TextPart) else str(part.args) if isinstance(part, ToolCallPart) else ""
+    return RequestUsage(input_tokens=estimate_tokens(prompt), output_tokens=estimate_tokens(output))
+
+
+def _placeholder_values(game_state: GameState) -> dict[str, Any]:
+    location_id = game_state.scenario_instance.current_location_id
+    values: dict[str, Any] = {"player_id": game_state.character.instance_id, "location_id": location_id}
+    enemy_ids = [
+        monster.instance_id
+        for monster in game_state.monsters
+        if monster.current_location_id == location_id and monster.is_alive()
+    ]
+    if enemy_ids:
+        values["enemy_id"] = enemy_ids[0]
+        values["enemy_ids"] = enemy_ids
+    npc_ids = [npc.instance_id for npc in game_state.npcs if npc.current_location_id == location_id]
+    if npc_ids:
+        values["npc_id"] = npc_ids[0]
+    return values
+
+
+def _fill_args(call: ScriptedToolCall, values: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the call's arguments with placeholders filled, or None when one is unknown."""
+    filled: dict[str, Any] = {}
+    for name, value in call.args.items():
+        if not isinstance(value, str):
+            filled[name] = value
+            continue
+        whole = _PLACEHOLDER.match(value)
+        try:
+            filled[name] = values[whole.group(1)] if whole else value.format_map(values)
+        except (KeyError, ValueError):
+            return None
+    return filled
+
+
+def _final_part(turn: ScriptedTurn, params: ModelRequestParameters) -> ModelResponsePart:
+    if params.output_tools and not params.allow_text_output:
+        output_tool = params.output_tools[0]
+        schema = output_tool.parameters_json_schema
+        return ToolCallPart(output_tool.name, _sample(schema, schema, turn.text), tool_call_id="standin-output")
+    return TextPart(turn.text)
+
+
+def _sample(schema: dict[str, Any], root: dict[str, Any], text: str) -> Any:
+    """Build a minimal value valid for a JSON schema, using text for every string."""
+    if "$ref" in schema:
+        return _sample(root.get("$defs", {}).get(schema["$ref"].rsplit("/", 1)[-1], {}), root, text)
+    for variant in schema.get("anyOf", [])[:1]:
+        return _sample(variant, root, text)
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type")
+    if kind == "object":
+        properties = schema.get("properties", {})
+        return {name: _sample(properties[name], root, text) for name in schema.get("required", properties)}
+    if kind == "array":
+        return []
+    if kind in ("integer", "number"):
+        return schema.get("minimum", 0)
+    if kind == "boolean":
+        return False
+    if kind == "null":
+        return None
+    return text
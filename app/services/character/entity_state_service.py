@@ -3,6 +3,7 @@
 import logging
 
 from app.interfaces.services.character import ICharacterComputeService, IEntityStateService
+from app.interfaces.services.game import IEntityResolver
 from app.models.attributes import EntityType
 from app.models.character import Currency
 from app.models.equipment_slots import EquipmentSlotType
@@ -10,7 +11,7 @@ from app.models.game_state import GameState
 from app.models.instances.character_instance import CharacterInstance
 from app.models.instances.monster_instance import MonsterInstance
 from app.models.instances.npc_instance import NPCInstance
-from app.utils.entity_resolver import resolve_entity_with_fallback
+from app.models.state_revisions import StateSection
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +27,16 @@ class EntityStateService(IEntityStateService):
     def __init__(
         self,
         compute_service: ICharacterComputeService,
+        entity_resolver: IEntityResolver,
     ):
         """Initialize entity state service.
 
         Args:
             compute_service: Service for computing character values
+            entity_resolver: Resolver for (possibly misspelled) entity IDs
         """
         self.compute_service = compute_service
+        self.entity_resolver = entity_resolver
 
     def update_hp(
         self,
@@ -41,7 +45,7 @@ class EntityStateService(IEntityStateService):
         amount: int,
     ) -> tuple[int, int, int]:
         # Use centralized entity resolver
-        entity, entity_type = resolve_entity_with_fallback(game_state, entity_id)
+        entity, entity_type = self.entity_resolver.resolve_entity_with_fallback(game_state, entity_id)
         if not entity:
             raise ValueError(f"Entity '{entity_id}' not found")
 
@@ -55,12 +59,15 @@ class EntityStateService(IEntityStateService):
         max_hp = state.hit_points.maximum
         new_hp = min(old_hp + amount, max_hp) if amount > 0 else max(0, old_hp + amount)
         state.hit_points.current = new_hp
+        if new_hp != old_hp:
+            game_state.bump_entity_revision(actual_entity_id)
 
         # Update combat participant active status if in combat and HP reaches 0
         if game_state.combat.is_active and new_hp == 0:
             for participant in game_state.combat.participants:
                 if participant.entity_id == actual_entity_id:
                     participant.is_active = False
+                    game_state.bump_revision(StateSection.COMBAT)
                     logger.debug(f"Combat participant {participant.name} marked as inactive (0 HP)")
                     break
 
@@ -77,7 +84,7 @@ class EntityStateService(IEntityStateService):
         condition: str,
     ) -> bool:
         # Use centralized entity resolver
-        entity, entity_type = resolve_entity_with_fallback(game_state, entity_id)
+        entity, entity_type = self.entity_resolver.resolve_entity_with_fallback(game_state, entity_id)
         if not entity:
             raise ValueError(f"Entity '{entity_id}' not found")
 
@@ -85,6 +92,7 @@ class EntityStateService(IEntityStateService):
 
         if condition not in state.conditions:
             state.conditions.append(condition)
+            game_state.bump_entity_revision(entity.instance_id)
             # Touch player if it was modified
             if entity.instance_id == game_state.character.instance_id:
                 game_state.character.touch()
@@ -98,7 +106,7 @@ class EntityStateService(IEntityStateService):
         condition: str,
     ) -> bool:
         # Use centralized entity resolver
-        entity, entity_type = resolve_entity_with_fallback(game_state, entity_id)
+        entity, entity_type = self.entity_resolver.resolve_entity_with_fallback(game_state, entity_id)
         if not entity:
             raise ValueError(f"Entity '{entity_id}' not found")
 
@@ -106,6 +114,7 @@ class EntityStateService(IEntityStateService):
 
         if condition in state.conditions:
             state.conditions.remove(condition)
+            game_state.bump_entity_revision(entity.instance_id)
             # Touch player if it was modified
             if entity.instance_id == game_state.character.instance_id:
                 game_state.character.touch()
@@ -121,7 +130,7 @@ class EntityStateService(IEntityStateService):
         copper: int = 0,
     ) -> tuple[Currency, Currency]:
         # Use centralized entity resolver
-        entity, entity_type = resolve_entity_with_fallback(game_state, entity_id)
+        entity, entity_type = self.entity_resolver.resolve_entity_with_fallback(game_state, entity_id)
         if not entity:
             raise ValueError(f"Entity '{entity_id}' not found")
 
@@ -145,6 +154,8 @@ class EntityStateService(IEntityStateService):
             silver=state.currency.silver,
             copper=state.currency.copper,
         )
+        if new_currency != old_currency:
+            game_state.bump_entity_revision(entity.instance_id)
 
         # Touch player if it was modified
         if entity.instance_id == game_state.character.instance_id:
@@ -160,7 +171,7 @@ class EntityStateService(IEntityStateService):
         slot: EquipmentSlotType | None = None,
         unequip: bool = False,
     ) -> None:
-        entity, entity_type = resolve_entity_with_fallback(game_state, entity_id)
+        entity, entity_type = self.entity_resolver.resolve_entity_with_fallback(game_state, entity_id)
         if not entity:
             raise ValueError(f"Entity '{entity_id}' not found")
 
@@ -180,6 +191,7 @@ class EntityStateService(IEntityStateService):
                 if monster.instance_id == entity.instance_id:
                     monster.state = updated
                     break
+        game_state.bump_entity_revision(entity.instance_id)
 
     def update_spell_slots(
         self,
@@ -188,7 +200,7 @@ class EntityStateService(IEntityStateService):
         level: int,
         amount: int,
     ) -> tuple[int, int, int]:
-        entity, entity_type = resolve_entity_with_fallback(game_state, entity_id)
+        entity, entity_type = self.entity_resolver.resolve_entity_with_fallback(game_state, entity_id)
         if not entity:
             raise ValueError(f"Entity '{entity_id}' not found")
 
@@ -207,6 +219,8 @@ class EntityStateService(IEntityStateService):
         slot.current = max(0, min(slot.total, old_slots + amount))
         new_slots = slot.current
         max_slots = slot.total
+        if new_slots != old_slots:
+            game_state.bump_entity_revision(entity.instance_id)
 
         # Touch player if it was modified
         if entity.instance_id == game_state.character.instance_id:
@@ -215,7 +229,7 @@ class EntityStateService(IEntityStateService):
         return old_slots, new_slots, max_slots
 
     def recompute_entity_state(self, game_state: GameState, entity_id: str) -> None:
-        entity, entity_type = resolve_entity_with_fallback(game_state, entity_id)
+        entity, entity_type = self.entity_resolver.resolve_entity_with_fallback(game_state, entity_id)
         if not entity:
             raise ValueError(f"Entity '{entity_id}' not found")
         if entity_type == EntityType.PLAYER:
@@ -226,12 +240,16 @@ class EntityStateService(IEntityStateService):
                     f"Player entity ID mismatch: {entity.instance_id} != {game_state.character.instance_id}"
                 )
             new_state = self.compute_service.recompute_entity_state(game_state, entity.sheet, entity.state)
+            if new_state != entity.state:
+                game_state.bump_revision(StateSection.CHARACTER)
             entity.state = new_state
             entity.touch()
         elif entity_type == EntityType.NPC:
             if not isinstance(entity, NPCInstance):
                 raise TypeError(f"Entity type mismatch: EntityType.NPC but got {type(entity).__name__}")
             new_state = self.compute_service.recompute_entity_state(game_state, entity.sheet.character, entity.state)
+            if new_state != entity.state:
+                game_state.bump_revision(StateSection.NPC, entity.instance_id)
             entity.state = new_state
         elif entity_type == EntityType.MONSTER:
             if not isinstance(entity, MonsterInstance):
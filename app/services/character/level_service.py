@@ -1,18 +1,19 @@
 """Minimal entity level-up progression service."""
 
 from app.interfaces.services.character import ICharacterComputeService, ILevelProgressionService
+from app.interfaces.services.game import IEntityResolver
 from app.models.game_state import GameState
-from app.utils.entity_resolver import resolve_entity_with_fallback
 
 
 class LevelProgressionService(ILevelProgressionService):
     """Provides minimal single-class level-up behavior for entities."""
 
-    def __init__(self, compute_service: ICharacterComputeService) -> None:
+    def __init__(self, compute_service: ICharacterComputeService, entity_resolver: IEntityResolver) -> None:
         self.compute_service = compute_service
+        self.entity_resolver = entity_resolver
 
     def level_up_entity(self, game_state: GameState, entity_id: str) -> None:
-        entity, entity_type = resolve_entity_with_fallback(game_state, entity_id)
+        entity, entity_type = self.entity_resolver.resolve_entity_with_fallback(game_state, entity_id)
         if not entity:
             raise ValueError(f"Entity '{entity_id}' not found")
 
@@ -52,3 +53,4 @@ class LevelProgressionService(ILevelProgressionService):
                 # Monsters typically don't level up, but if needed, just increase level and HP
                 state.hit_points.maximum += 5
                 state.hit_points.current = min(state.hit_points.maximum, state.hit_points.current + 5)
+        game_state.bump_entity_revision(entity.instance_id)
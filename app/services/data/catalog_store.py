@@ -0,0 +1,179 @@
+"""Memory-mapped compiled catalog files shared across processes.
+
+File layout (little endian)::
+
+    magic        8 bytes   b"DNDCAT01"
+    count        uint32    number of entries
+    strings_len  uint32    size of the string section
+    table        count * (key_off uint32, key_len uint16, pack_off uint32, pack_len uint16,
+                          payload_off uint64, payload_len uint32)
+    strings      utf-8 keys and pack ids
+    payloads     one compact JSON object per entry
+
+Only the offset table and strings are read eagerly. Payloads stay in the page
+cache, shared by every process mapping the same file, and are decoded when an
+entry is first accessed.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import weakref
+from collections.abc import Callable, Iterator, MutableMapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+MAGIC = b"DNDCAT01"
+_HEADER = struct.Struct("<8sII")
+_ENTRY = struct.Struct("<IHIHQI")
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """One entry to write into a compiled catalog."""
+
+    key: str
+    pack_id: str
+    data: dict[str, Any]
+
+
+def write_catalog(path: Path, entries: Sequence[CatalogEntry]) -> None:
+    """Write entries to a compiled catalog file atomically.
+
+    The file is written next to its destination and renamed into place, so
+    concurrent readers never observe a partial file.
+    """
+    strings = bytearray()
+    payloads = bytearray()
+    table = bytearray()
+    table_size = _ENTRY.size * len(entries)
+
+    encoded = [
+        (entry.key.encode("utf-8"), entry.pack_id.encode("utf-8"), json.dumps(entry.data, separators=(",", ":")))
+        for entry in entries
+    ]
+    strings_len = sum(len(key) + len(pack) for key, pack, _ in encoded)
+    payload_base = _HEADER.size + table_size + strings_len
+
+    for key, pack, payload in encoded:
+        payload_bytes = payload.encode("utf-8")
+        key_off = len(strings)
+        strings += key
+        pack_off = len(strings)
+        strings += pack
+        table += _ENTRY.pack(key_off, len(key), pack_off, len(pack), payload_base + len(payloads), len(payload_bytes))
+        payloads += payload_bytes
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, len(entries), strings_len))
+            f.write(table)
+            f.write(strings)
+            f.write(payloads)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class CompiledCatalog:
+    """Read-only view over a memory-mapped compiled catalog file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # Unmapped once the last reader drops the catalog, so a replaced catalog stays readable
+        self._finalizer = weakref.finalize(self, self._mmap.close)
+
+        magic, count, strings_len = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a compiled catalog")
+
+        strings_start = _HEADER.size + _ENTRY.size * count
+        strings = self._mmap[strings_start : strings_start + strings_len]
+        self._offsets: dict[str, tuple[int, int]] = {}
+        self._pack_ids: dict[str, str] = {}
+        for key_off, key_len, pack_off, pack_len, payload_off, payload_len in _ENTRY.iter_unpack(
+            self._mmap[_HEADER.size : strings_start]
+        ):
+            key = strings[key_off : key_off + key_len].decode("utf-8")
+            self._offsets[key] = (payload_off, payload_len)
+            self._pack_ids[key] = strings[pack_off : pack_off + pack_len].decode("utf-8")
+
+    def keys(self) -> list[str]:
+        return list(self._offsets)
+
+    def pack_ids(self) -> dict[str, str]:
+        """Return key -> content pack id for every entry."""
+        return dict(self._pack_ids)
+
+    def read(self, key: str) -> dict[str, Any]:
+        """Decode the raw payload of one entry.
+
+        Raises:
+            KeyError: If the key is not in the catalog
+        """
+        offset, length = self._offsets[key]
+        data: dict[str, Any] = json.loads(self._mmap[offset : offset + length])
+        return data
+
+    def close(self) -> None:
+        """Unmap the file now; entries not decoded yet can no longer be read."""
+        self._finalizer()
+
+    @property
+    def closed(self) -> bool:
+        return self._mmap.closed
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+
+class LazyCatalogCache(MutableMapping[str, T], Generic[T]):
+    """Repository cache that parses compiled catalog entries on first access."""
+
+    def __init__(self, catalog: CompiledCatalog, parse: Callable[[dict[str, Any]], T]) -> None:
+        self._catalog = catalog
+        self._parse = parse
+        self._decoded: dict[str, T] = {}
+
+    def __getitem__(self, key: str) -> T:
+        item = self._decoded.get(key)
+        if item is None:
+            item = self._parse(self._catalog.read(key))
+            self._decoded[key] = item
+        return item
+
+    def __setitem__(self, key: str, value: T) -> None:
+        self._decoded[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("Compiled catalog caches are read-only")
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._catalog or key in self._decoded
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._catalog.keys()
+        yield from (key for key in self._decoded if key not in self._catalog)
+
+    def __len__(self) -> int:
+        return len(self._catalog) + sum(1 for key in self._decoded if key not in self._catalog)
+
+    @property
+    def decoded_count(self) -> int:
+        return len(self._decoded)
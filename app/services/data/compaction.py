@@ -0,0 +1,126 @@
+"""Compact in-memory representation of parsed catalog definitions.
+
+Catalog entries repeat the same strings (schools, damage types, sizes,
+ability names) and the same small sub-objects (abilities blocks, speeds,
+damage dice) thousands of times. Compaction interns every string and makes
+structurally equal nested models and lists share a single instance, so a
+repository holds each distinct value once.
+
+Compacted items share sub-objects and must be treated as read-only; copy
+them (``model_copy(deep=True)``) before embedding them in mutable game state.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class CatalogCompactor:
+    """Intern strings and share equal nested models and lists across catalog items."""
+
+    def __init__(self) -> None:
+        self._shared: dict[Hashable, BaseModel] = {}
+        self._shared_lists: dict[Hashable, list[Any]] = {}
+
+    def compact(self, item: M) -> M:
+        """Compact one top-level catalog item in place and return it.
+
+        The item itself is never replaced by another entry, only its nested
+        values are.
+        """
+        self._compact_fields(item)
+        return item
+
+    def _compact_fields(self, model: BaseModel) -> Hashable:
+        values = model.__dict__
+        key_parts: list[Hashable] = [type(model), frozenset(model.model_fields_set)]
+        for name, value in values.items():
+            compacted, value_key = self._compact_value(value)
+            values[name] = compacted
+            key_parts.append((name, value_key))
+        extra = model.__pydantic_extra__
+        if extra:
+            for name, value in extra.items():
+                compacted, value_key = self._compact_value(value)
+                extra[name] = compacted
+                key_parts.append(("extra", name, value_key))
+        return tuple(key_parts)
+
+    def _compact_value(self, value: Any) -> tuple[Any, Hashable]:
+        """Return the compacted value and a structural key identifying it."""
+        if type(value) is str:
+            interned = sys.intern(value)
+            return interned, (str, interned)
+        if isinstance(value, BaseModel):
+            key = self._compact_fields(value)
+            shared = self._shared.setdefault(key, value)
+            return shared, (BaseModel, id(shared))
+        if isinstance(value, list):
+            keys = []
+            for index, element in enumerate(value):
+                value[index], element_key = self._compact_value(element)
+                keys.append(element_key)
+            list_key = (list, tuple(keys))
+            return self._shared_lists.setdefault(list_key, value), list_key
+        if isinstance(value, dict):
+            compacted: dict[Any, Any] = {}
+            keys = []
+            for k, v in value.items():
+                new_k = sys.intern(k) if type(k) is str else k
+                compacted[new_k], v_key = self._compact_value(v)
+                keys.append((new_k, v_key))
+            return compacted, (dict, tuple(keys))
+        if isinstance(value, tuple | set | frozenset):
+            # Rare in catalog models; keep as is and never share their owner
+            return value, (type(value), id(value))
+        # Numbers, bools, enums and None: include the type so 1, 1.0 and True stay distinct
+        try:
+            hash(value)
+        except TypeError:
+            return value, (type(value), id(value))
+        return value, (type(value), value)
+
+
+@dataclass(frozen=True)
+class CatalogMemoryUsage:
+    """Approximate retained size of one repository's parsed items."""
+
+    repository: str
+    entries: int
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def saved_ratio(self) -> float:
+        return 1 - self.bytes_after / self.bytes_before if self.bytes_before else 0.0
+
+
+def deep_sizeof(objects: Iterable[Any]) -> int:
+    """Approximate the bytes retained by objects, counting shared objects once."""
+    seen: set[int] = set()
+    total = 0
+    stack = list(objects)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, BaseModel):
+            stack.append(obj.__dict__)
+            stack.append(obj.__pydantic_fields_set__)
+            if obj.__pydantic_extra__:
+                stack.append(obj.__pydantic_extra__)
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset):
+            stack.extend(obj)
+    return total
@@ -17,36 +17,57 @@ class ContentPackRegistry(IContentPackRegistry):
     handling dependencies and load order resolution.
     """
 
-    def __init__(self, path_resolver: IPathResolver):
+    def __init__(self, path_resolver: IPathResolver, compiled_catalog_dir: Path | None = None):
         """Initialize the content pack registry.
 
         Args:
             path_resolver: Service for resolving file paths
+            compiled_catalog_dir: Where repositories keep memory-mapped compiled
+                catalogs; None makes them parse pack JSON directly
         """
         self.path_resolver = path_resolver
+        self.compiled_catalog_dir = compiled_catalog_dir
         self._packs: dict[str, ContentPackMetadata] = {}
         self._pack_paths: dict[str, Path] = {}
         self._discovered = False
 
+    def get_compiled_catalog_dir(self) -> Path | None:
+        """Get the compiled catalog directory, or None when compiled catalogs are disabled."""
+        return self.compiled_catalog_dir
+
+    def get_user_packs_dir(self) -> Path:
+        """Get the directory holding user-created content packs."""
+        return self.path_resolver.get_data_dir().parent / "user-data" / "packs"
+
     def discover_packs(self) -> None:
         """Discover all available content packs."""
         if self._discovered:
             return
 
-        # Clear existing data
-        self._packs.clear()
-        self._pack_paths.clear()
+        self._scan_packs()
+        self._discovered = True
+        logger.info(f"Discovered {len(self._packs)} content packs: {list(self._packs.keys())}")
+
+    def refresh(self) -> None:
+        """Re-scan pack metadata so added, removed or edited packs are picked up."""
+        self._scan_packs()
+        self._discovered = True
+        logger.info(f"Refreshed content packs: {list(self._packs.keys())}")
+
+    def _scan_packs(self) -> None:
+        """Scan SRD and user packs, then replace the known packs in one step."""
+        packs: dict[str, ContentPackMetadata] = {}
+        pack_paths: dict[str, Path] = {}
 
         # Discover SRD pack (base content)
-        self._discover_srd_pack()
+        self._discover_srd_pack(packs, pack_paths)
 
         # Discover user packs
-        self._discover_user_packs()
+        self._discover_user_packs(packs, pack_paths)
 
-        self._discovered = True
-        logger.info(f"Discovered {len(self._packs)} content packs: {list(self._packs.keys())}")
+        self._packs, self._pack_paths = packs, pack_paths
 
-    def _discover_srd_pack(self) -> None:
+    def _discover_srd_pack(self, packs: dict[str, ContentPackMetadata], pack_paths: dict[str, Path]) -> None:
         """Discover the SRD base content pack."""
         data_dir = self.path_resolver.get_data_dir()
         metadata_file = data_dir / "metadata.json"
@@ -56,15 +77,15 @@ class ContentPackRegistry(IContentPackRegistry):
                 with open(metadata_file, encoding="utf-8") as f:
                     metadata_data = json.load(f)
                 metadata = ContentPackMetadata(**metadata_data)
-                self._packs[metadata.id] = metadata
-                self._pack_paths[metadata.id] = data_dir
+                packs[metadata.id] = metadata
+                pack_paths[metadata.id] = data_dir
                 logger.debug(f"Loaded SRD pack: {metadata.id}")
             except Exception as e:
                 logger.error(f"Failed to load SRD pack metadata: {e}")
 
-    def _discover_user_packs(self) -> None:
+    def _discover_user_packs(self, packs: dict[str, ContentPackMetadata], pack_paths: dict[str, Path]) -> None:
         """Discover user-created content packs."""
-        user_data_dir = self.path_resolver.get_data_dir().parent / "user-data" / "packs"
+        user_data_dir = self.get_user_packs_dir()
 
         if not user_data_dir.exists():
             logger.debug("User data packs directory does not exist")
@@ -92,8 +113,8 @@ class ContentPackRegistry(IContentPackRegistry):
                     )
                     continue
 
-                self._packs[metadata.id] = metadata
-                self._pack_paths[metadata.id] = pack_dir
+                packs[metadata.id] = metadata
+                pack_paths[metadata.id] = pack_dir
                 logger.debug(f"Loaded user pack: {metadata.id}")
 
             except Exception as e:
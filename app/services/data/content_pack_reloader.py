@@ -0,0 +1,117 @@
+"""Hot reload of content packs without a server restart."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from app.interfaces.services.common import IContentPackRegistry
+from app.interfaces.services.data import IRepository
+from app.services.data.content_pack_watcher import ContentPackChanges, ContentPackWatcher
+from app.services.data.repository_factory import DATA_TYPE_REPOSITORIES, RepositoryFactory, repositories_to_reload
+
+logger = logging.getLogger(__name__)
+
+# Called with the reloaded repository attribute names once a reload completes
+ReloadListener = Callable[[Sequence[str]], None]
+
+
+@dataclass(frozen=True)
+class ContentPackReloadResult:
+    """Summary of a completed reload."""
+
+    data_types: list[str]
+    repositories: list[str]
+    packs_refreshed: bool
+
+
+class ContentPackReloader:
+    """Reload only the repositories whose content pack files changed.
+
+    Base repositories (all packs, owned by the container) and every per-game
+    scope of the repository factory are reloaded in place, dependencies first,
+    after which derived caches are invalidated and listeners notified.
+    """
+
+    def __init__(
+        self,
+        watcher: ContentPackWatcher,
+        content_pack_registry: IContentPackRegistry,
+        repository_factory: RepositoryFactory,
+        base_repositories: Mapping[str, IRepository[Any]],
+        base_pack_ids: list[str],
+    ) -> None:
+        """Initialize the reloader.
+
+        Args:
+            watcher: Detects changed pack files
+            content_pack_registry: Registry refreshed when pack metadata changes
+            repository_factory: Factory whose cached scopes are reloaded
+            base_repositories: Container-level repositories keyed by scope attribute name
+            base_pack_ids: Pack list shared by the base repositories, updated in place
+        """
+        self.watcher = watcher
+        self.content_pack_registry = content_pack_registry
+        self.repository_factory = repository_factory
+        self.base_repositories = base_repositories
+        self.base_pack_ids = base_pack_ids
+        self._listeners: list[ReloadListener] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: ReloadListener) -> None:
+        """Register a callback invalidating a cache derived from repository content."""
+        self._listeners.append(listener)
+
+    def check_for_changes(self) -> ContentPackReloadResult | None:
+        """Poll the watcher and reload what changed.
+
+        Returns:
+            The reload result, or None when nothing changed
+        """
+        with self._lock:
+            changes = self.watcher.poll()
+            if not changes:
+                return None
+            return self._apply(changes)
+
+    def _apply(self, changes: ContentPackChanges) -> ContentPackReloadResult:
+        if changes.metadata_changed:
+            # Pack set or dependencies changed: order may differ for every data type
+            self.content_pack_registry.refresh()
+            self._refresh_base_pack_ids()
+            repository_attrs = repositories_to_reload(DATA_TYPE_REPOSITORIES)
+        else:
+            repository_attrs = repositories_to_reload(changes.data_types)
+
+        for attr in repository_attrs:
+            repository = self.base_repositories.get(attr)
+            if repository is not None:
+                repository.reload()
+        self.repository_factory.reload_repositories(repository_attrs)
+
+        for listener in self._listeners:
+            try:
+                listener(repository_attrs)
+            except Exception as e:
+                logger.error(f"Content pack reload listener failed: {e}", exc_info=True)
+
+        result = ContentPackReloadResult(
+            data_types=sorted(changes.data_types),
+            repositories=repository_attrs,
+            packs_refreshed=changes.metadata_changed,
+        )
+        logger.info(f"Reloaded content packs: {result}")
+        return result
+
+    def _refresh_base_pack_ids(self) -> None:
+        ids = [summary.id for summary in self.content_pack_registry.list_packs()]
+        try:
+            ordered = self.content_pack_registry.get_pack_order(ids)
+        except ValueError as e:
+            logger.warning(f"Failed to order refreshed content packs: {e}")
+            ordered = ids
+        # Base repositories share this list, so updating it in place re-scopes them all
+        self.base_pack_ids[:] = ordered
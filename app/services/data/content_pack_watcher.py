@@ -0,0 +1,97 @@
+"""Change detection for content pack files on disk."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+METADATA_FILE = "metadata.json"
+
+
+@dataclass(frozen=True)
+class _FileSignature:
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+@dataclass(frozen=True)
+class ContentPackChanges:
+    """Content pack files that changed since the previous scan."""
+
+    data_types: frozenset[str] = field(default_factory=frozenset)
+    metadata_changed: bool = False
+    paths: tuple[Path, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.data_types) or self.metadata_changed
+
+
+class ContentPackWatcher:
+    """Poll content pack directories for changed JSON files.
+
+    A file's (mtime, size) pair is checked first; only when it moved is the file
+    hashed, so touching a file without editing it does not trigger a reload.
+    Packs are the SRD data directory plus every directory under user packs;
+    scenario directories are not watched.
+    """
+
+    def __init__(self, data_dir: Path, user_packs_dir: Path) -> None:
+        self.data_dir = data_dir
+        self.user_packs_dir = user_packs_dir
+        self._snapshot: dict[Path, _FileSignature] = self._scan({})
+
+    def poll(self) -> ContentPackChanges:
+        """Scan pack files and report what changed since the last poll."""
+        previous = self._snapshot
+        current = self._scan(previous)
+        self._snapshot = current
+
+        changed = [path for path in current.keys() | previous.keys() if current.get(path) != previous.get(path)]
+        # Same content under a new mtime is not a change
+        changed = [
+            path
+            for path in changed
+            if path not in current or path not in previous or current[path].digest != previous[path].digest
+        ]
+        if not changed:
+            return ContentPackChanges()
+
+        data_types = frozenset(path.stem for path in changed if path.name != METADATA_FILE)
+        metadata_changed = any(path.name == METADATA_FILE for path in changed)
+        # A pack appearing or disappearing changes pack order even without a metadata edit
+        if not metadata_changed:
+            metadata_changed = self._pack_dirs(current) != self._pack_dirs(previous)
+        logger.info(f"Detected content pack changes: {sorted(str(path) for path in changed)}")
+        return ContentPackChanges(data_types=data_types, metadata_changed=metadata_changed, paths=tuple(changed))
+
+    def _pack_files(self) -> list[Path]:
+        files = sorted(self.data_dir.glob("*.json"))
+        if self.user_packs_dir.is_dir():
+            files.extend(sorted(self.user_packs_dir.glob("*/*.json")))
+        return files
+
+    def _scan(self, previous: dict[Path, _FileSignature]) -> dict[Path, _FileSignature]:
+        snapshot: dict[Path, _FileSignature] = {}
+        for path in self._pack_files():
+            try:
+                stat = path.stat()
+                known = previous.get(path)
+                if known is not None and (known.mtime_ns, known.size) == (stat.st_mtime_ns, stat.st_size):
+                    snapshot[path] = known
+                    continue
+                digest = hashlib.sha1(path.read_bytes()).hexdigest()
+            except OSError as e:
+                # File vanished or is mid-write; the next poll will see its final state
+                logger.debug(f"Skipping {path} during content pack scan: {e}")
+                continue
+            snapshot[path] = _FileSignature(mtime_ns=stat.st_mtime_ns, size=stat.st_size, digest=digest)
+        return snapshot
+
+    @staticmethod
+    def _pack_dirs(snapshot: dict[Path, _FileSignature]) -> set[Path]:
+        return {path.parent for path in snapshot}
@@ -21,6 +21,31 @@ from app.services.data.loaders.base_loader import BaseLoader
 logger = logging.getLogger(__name__)
 
 
+def parse_scenario_monster(raw: dict[str, Any], scenario_id: str) -> ScenarioMonster:
+    """Parse a scenario monster file, normalizing authored shorthand.
+
+    Skills may be authored as a {"Stealth": 6} dict, and monsters are tagged with
+    their scenario's virtual content pack.
+    """
+    # Parse skills from dict to list format if needed
+    if "monster" in raw and "skills" in raw["monster"]:
+        skills_data = raw["monster"]["skills"]
+        if isinstance(skills_data, dict):
+            # Convert dict format to list of SkillValue
+            skills_list = []
+            for skill_name, modifier in skills_data.items():
+                # Normalize skill name to index format
+                skill_index = skill_name.lower().replace(" ", "-")
+                skills_list.append({"index": skill_index, "value": modifier})
+            raw["monster"]["skills"] = skills_list
+
+    # Inject content_pack field for scenario-specific monsters
+    if "monster" in raw:
+        raw["monster"]["content_pack"] = f"scenario:{scenario_id}"
+
+    return ScenarioMonster(**raw)
+
+
 class ScenarioLoader(BaseLoader[ScenarioSheet]):
     """Loader for scenario data with modular components."""
 
@@ -215,23 +240,7 @@ class ScenarioLoader(BaseLoader[ScenarioSheet]):
                 with open(file_path, encoding="utf-8") as f:
                     raw = json.load(f)
 
-                # Parse skills from dict to list format if needed
-                if "monster" in raw and "skills" in raw["monster"]:
-                    skills_data = raw["monster"]["skills"]
-                    if isinstance(skills_data, dict):
-                        # Convert dict format to list of SkillValue
-                        skills_list = []
-                        for skill_name, modifier in skills_data.items():
-                            # Normalize skill name to index format
-                            skill_index = skill_name.lower().replace(" ", "-")
-                            skills_list.append({"index": skill_index, "value": modifier})
-                        raw["monster"]["skills"] = skills_list
-
-                # Inject content_pack field for scenario-specific monsters
-                if "monster" in raw:
-                    raw["monster"]["content_pack"] = f"scenario:{scenario_id}"
-
-                sm = ScenarioMonster(**raw)
+                sm = parse_scenario_monster(raw, scenario_id)
                 m_map[sm.id] = sm
             except Exception as e:
                 logger.warning(f"Failed to load scenario monster from {file_path}: {e}")
@@ -0,0 +1,93 @@
+"""Cross-catalog display name index for a repository scope."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+from app.common.exceptions import RepositoryNotFoundError
+from app.interfaces.services.data import IRepository
+
+logger = logging.getLogger(__name__)
+
+# Resolve-names category -> GameRepositoryScope attribute
+CATALOG_CATEGORIES: dict[str, str] = {
+    "items": "item_repository",
+    "spells": "spell_repository",
+    "monsters": "monster_repository",
+    "classes": "class_repository",
+    "races": "race_repository",
+    "alignments": "alignment_repository",
+    "backgrounds": "background_repository",
+    "feats": "feat_repository",
+    "features": "feature_repository",
+    "traits": "trait_repository",
+    "skills": "skill_repository",
+    "conditions": "condition_repository",
+    "languages": "language_repository",
+    "damage_types": "damage_type_repository",
+    "magic_schools": "magic_school_repository",
+    "subclasses": "subclass_repository",
+    "subraces": "race_subrace_repository",
+    "weapon_properties": "weapon_property_repository",
+}
+
+
+class CatalogNameIndex:
+    """Read-only key -> display name lookup across every catalog of a scope.
+
+    Built once per scope so name resolution becomes plain dict lookups instead
+    of per-key repository calls.
+    """
+
+    def __init__(self, names: Mapping[str, Mapping[str, str]]) -> None:
+        self._names: dict[str, dict[str, str]] = {category: dict(entries) for category, entries in names.items()}
+
+    @classmethod
+    def build(cls, repositories: Mapping[str, IRepository[Any]]) -> CatalogNameIndex:
+        """Build the index from category -> repository mapping."""
+        names: dict[str, dict[str, str]] = {}
+        for category, repository in repositories.items():
+            entries: dict[str, str] = {}
+            for key in repository.list_keys():
+                try:
+                    entries[key] = repository.get_name(key)
+                except (RepositoryNotFoundError, ValueError) as e:
+                    logger.debug(f"Skipping {category} '{key}' in name index: {e}")
+            names[category] = entries
+        return cls(names)
+
+    def categories(self) -> list[str]:
+        return list(self._names)
+
+    def get(self, category: str, key: str) -> str | None:
+        entries = self._names.get(category)
+        return entries.get(key) if entries is not None else None
+
+    def resolve(self, category: str, keys: Iterable[str]) -> dict[str, str]:
+        """Resolve keys of one category, silently dropping unknown keys."""
+        entries = self._names.get(category)
+        if not entries:
+            return {}
+        return {key: entries[key] for key in keys if key in entries}
+
+    def iter_resolved(self, category: str, keys: Iterable[str], chunk_size: int) -> Iterator[dict[str, str]]:
+        """Resolve keys of one category in chunks of at most chunk_size entries."""
+        entries = self._names.get(category)
+        if not entries:
+            return
+        chunk: dict[str, str] = {}
+        for key in keys:
+            name = entries.get(key)
+            if name is None:
+                continue
+            chunk[key] = name
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = {}
+        if chunk:
+            yield chunk
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._names.values())
@@ -1,9 +1,12 @@
 """Base repository pattern for data access."""
 
+import copy
+import hashlib
 import json
 import logging
+import threading
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, MutableMapping
 from pathlib import Path
 from typing import Any, Generic, TypeVar
 
@@ -12,6 +15,9 @@ from pydantic import BaseModel
 from app.common.exceptions import RepositoryNotFoundError
 from app.interfaces.services.common import IContentPackRegistry
 from app.interfaces.services.data import IRepository
+from app.services.data.catalog_store import CatalogEntry, CompiledCatalog, LazyCatalogCache, write_catalog
+from app.services.data.compaction import CatalogCompactor, CatalogMemoryUsage, deep_sizeof
+from app.utils.fuzzy_index import FuzzyIndex
 
 logger = logging.getLogger(__name__)
 
@@ -45,10 +51,13 @@ class BaseRepository(IRepository[T], ABC, Generic[T]):
         self.cache_enabled = cache_enabled
         self.content_pack_registry = content_pack_registry
         self.content_packs = content_packs
-        self._cache: dict[str, T] = {}
+        self._cache: MutableMapping[str, T] = {}
         self._pack_cache: dict[str, dict[str, T]] = {}  # Pack-specific caches
         self._item_pack_map: dict[str, str] = {}  # Track which pack each item came from
         self._initialized = False
+        # Guards lazy loading so concurrent warm-up threads load each repository once
+        self._init_lock = threading.RLock()
+        self._key_index: FuzzyIndex | None = None  # Built on the first fuzzy lookup
 
     def get(self, key: str) -> T:
         if not self._initialized:
@@ -92,6 +101,16 @@ class BaseRepository(IRepository[T], ABC, Generic[T]):
 
         return self._check_key_exists(key)
 
+    def find_similar_keys(self, key: str, limit: int = 3, threshold: float = 0.0) -> list[str]:
+        index = self._key_index
+        if index is None:
+            with self._init_lock:
+                index = self._key_index
+                if index is None:
+                    index = FuzzyIndex(self.list_keys())
+                    self._key_index = index
+        return [match.key for match in index.search(key, limit, threshold)]
+
     def _get_ordered_packs(self) -> list[str]:
         """Get content packs in correct loading order.
 
@@ -104,13 +123,16 @@ class BaseRepository(IRepository[T], ABC, Generic[T]):
             logger.warning(f"Failed to resolve pack order: {e}. Using provided order.")
             return self.content_packs
 
-    def _merge_pack_data(self, data_by_pack: dict[str, list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    def _merge_pack_data(
+        self, data_by_pack: dict[str, list[dict[str, Any]]], item_pack_map: dict[str, str]
+    ) -> list[dict[str, Any]]:
         """Merge data from multiple packs with conflict resolution.
 
         Later packs override earlier ones for items with the same key.
 
         Args:
             data_by_pack: Dictionary mapping pack IDs to their data items
+            item_pack_map: Receives the pack each merged item came from
 
         Returns:
             Merged list of data items
@@ -128,8 +150,7 @@ class BaseRepository(IRepository[T], ABC, Generic[T]):
                 if key:
                     merged[key] = item
                     # Track which pack this item came from
-                    if self.cache_enabled:
-                        self._item_pack_map[key] = pack_id
+                    item_pack_map[key] = pack_id
 
         return list(merged.values())
 
@@ -300,12 +321,70 @@ class BaseRepository(IRepository[T], ABC, Generic[T]):
 
     def _initialize(self) -> None:
         """Initialize the repository, loading data if cache is enabled."""
-        if self.cache_enabled:
-            self._load_all_items()
-        self._initialized = True
+        with self._init_lock:
+            if self._initialized:
+                return
+            if self.cache_enabled:
+                self._load_all_items()
+            self._initialized = True
+
+    def reload(self) -> None:
+        """Re-read pack data and atomically replace the cached items.
+
+        Items are parsed into fresh dictionaries first, so readers keep seeing the
+        previous data until the swap; the repository object itself is unchanged and
+        services holding a reference pick up the new content. A replaced compiled
+        catalog stays mapped until the last reader holding it is gone.
+        """
+        with self._init_lock:
+            if self.cache_enabled:
+                self._cache, self._item_pack_map = self._read_all_items()
+            self._key_index = None
+            self._initialized = True
+        logger.info(f"Reloaded {self._get_data_type()} ({len(self._cache)} entries)")
+
+    def memory_usage(self) -> CatalogMemoryUsage:
+        """Measure the cached items against a fresh, uncompacted parse of the same data.
+
+        Decodes every entry of a compiled catalog, so this is meant for reports,
+        not request paths.
+        """
+        if not self._initialized:
+            self._initialize()
+        merged_items, _ = self._read_merged_items()
+        uncompacted = [item for _, _, item in self._parse_merged_items(merged_items)]
+        cached = [self._cache[key] for key in list(self._cache)]
+        return CatalogMemoryUsage(
+            repository=type(self).__name__,
+            entries=len(cached),
+            bytes_before=deep_sizeof(uncompacted),
+            bytes_after=deep_sizeof(cached),
+        )
 
     def _load_all_items(self) -> None:
         """Load all items from content packs into cache."""
+        self._cache, self._item_pack_map = self._read_all_items()
+
+    def _read_all_items(self) -> tuple[MutableMapping[str, T], dict[str, str]]:
+        """Read all items from content packs into a new cache and pack map.
+
+        When the registry provides a compiled catalog directory, items come from a
+        memory-mapped compiled catalog and are parsed on first access; otherwise
+        every item is parsed now.
+        """
+        catalog_dir = self.content_pack_registry.get_compiled_catalog_dir()
+        if catalog_dir is not None:
+            return self._read_compiled_items(catalog_dir)
+
+        merged_items, item_pack_map = self._read_merged_items()
+        compactor = CatalogCompactor()
+        cache: dict[str, T] = {}
+        for key, _, item in self._parse_merged_items(merged_items):
+            cache[key] = compactor.compact(item)
+        return cache, item_pack_map
+
+    def _read_merged_items(self) -> tuple[list[dict[str, Any]], dict[str, str]]:
+        """Read raw item data from all packs, merged in pack order."""
         data_by_pack: dict[str, list[dict[str, Any]]] = {}
 
         for pack_id in self._get_ordered_packs():
@@ -313,16 +392,66 @@ class BaseRepository(IRepository[T], ABC, Generic[T]):
             if pack_items:
                 data_by_pack[pack_id] = pack_items
 
-        # Merge and load items
-        merged_items = self._merge_pack_data(data_by_pack)
+        item_pack_map: dict[str, str] = {}
+        merged_items = self._merge_pack_data(data_by_pack, item_pack_map)
+        return merged_items, item_pack_map
+
+    def _parse_merged_items(self, merged_items: list[dict[str, Any]]) -> list[tuple[str, dict[str, Any], T]]:
+        """Parse merged raw items, skipping (and logging) invalid ones."""
+        parsed: list[tuple[str, dict[str, Any], T]] = []
         for item_data in merged_items:
             try:
                 item = self._parse_item(item_data)
                 key = self._get_item_key(item_data)
                 if key:
-                    self._cache[key] = item
+                    parsed.append((key, item_data, item))
             except Exception as e:
                 logger.warning(f"Failed to load {self._get_data_type()} item: {e}")
+        return parsed
+
+    def _read_compiled_items(self, catalog_dir: Path) -> tuple[MutableMapping[str, T], dict[str, str]]:
+        """Open (compiling first if missing or stale) the compiled catalog for this repository."""
+        ordered_packs = self._get_ordered_packs()
+        scope_key = hashlib.sha1("|".join([type(self).__name__, *ordered_packs]).encode()).hexdigest()[:10]
+        prefix = f"{self._get_data_type()}-{scope_key}-"
+        path = catalog_dir / f"{prefix}{self._source_fingerprint(ordered_packs)}.cat"
+
+        if not path.exists():
+            merged_items, item_pack_map = self._read_merged_items()
+            # Parsing may normalize the raw dicts in place, so compile untouched copies
+            raw_items = {self._get_item_key(item_data): copy.deepcopy(item_data) for item_data in merged_items}
+            # Only entries that parse are compiled, so decoding on access cannot fail
+            entries = [
+                CatalogEntry(key=key, pack_id=item_pack_map.get(key, ""), data=raw_items[key])
+                for key, _, _ in self._parse_merged_items(merged_items)
+            ]
+            write_catalog(path, entries)
+            logger.info(f"Compiled {len(entries)} {self._get_data_type()} entries into {path.name}")
+            # Drop catalogs compiled from older versions of the same sources
+            for stale in catalog_dir.glob(f"{prefix}*.cat"):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+
+        catalog = CompiledCatalog(path)
+        pack_ids = {key: pack_id for key, pack_id in catalog.pack_ids().items() if pack_id}
+        compactor = CatalogCompactor()
+        return LazyCatalogCache(catalog, lambda data: compactor.compact(self._parse_item(data))), pack_ids
+
+    def _source_fingerprint(self, ordered_packs: list[str]) -> str:
+        """Fingerprint the files this repository reads, by path, size and mtime."""
+        data_type = self._get_data_type()
+        data_types = [data_type, "magic_items"] if data_type == "items" else [data_type]
+        sources: list[str] = []
+        for pack_id in ordered_packs:
+            for source_type in data_types:
+                source = self.content_pack_registry.get_pack_data_path(pack_id, source_type)
+                if source is None:
+                    continue
+                files = sorted(source.glob("*.json")) if source.is_dir() else [source]
+                for file in files:
+                    stat = file.stat()
+                    sources.append(f"{pack_id}:{file}:{stat.st_size}:{stat.st_mtime_ns}")
+        return hashlib.sha1("\n".join(sources).encode()).hexdigest()[:16]
 
     def _load_item(self, key: str) -> T | None:
         """Load a single item by key.
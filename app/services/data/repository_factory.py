@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection, Iterable
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
 
 from app.interfaces.services.common import IContentPackRegistry, IPathResolver
 from app.interfaces.services.data import IRepository, IRepositoryProvider
@@ -24,6 +27,7 @@ from app.models.skill import Skill
 from app.models.spell import SpellDefinition
 from app.models.trait import TraitDefinition
 from app.models.weapon_property import WeaponProperty
+from app.services.data.name_index import CATALOG_CATEGORIES, CatalogNameIndex
 from app.services.data.repositories.alignment_repository import AlignmentRepository
 from app.services.data.repositories.background_repository import BackgroundRepository
 from app.services.data.repositories.class_repository import ClassRepository, SubclassRepository
@@ -42,6 +46,50 @@ from app.services.data.repositories.spell_repository import SpellRepository
 from app.services.data.repositories.trait_repository import TraitRepository
 from app.services.data.repositories.weapon_property_repository import WeaponPropertyRepository
 
+# Content pack data file stem -> scope repositories parsed from it
+DATA_TYPE_REPOSITORIES: dict[str, tuple[str, ...]] = {
+    "items": ("item_repository",),
+    "magic_items": ("item_repository",),
+    "monsters": ("monster_repository",),
+    "spells": ("spell_repository",),
+    "magic_schools": ("magic_school_repository",),
+    "alignments": ("alignment_repository",),
+    "conditions": ("condition_repository",),
+    "languages": ("language_repository",),
+    "skills": ("skill_repository",),
+    "classes": ("class_repository",),
+    "subclasses": ("subclass_repository",),
+    "races": ("race_repository",),
+    "subraces": ("race_subrace_repository",),
+    "backgrounds": ("background_repository",),
+    "traits": ("trait_repository",),
+    "features": ("feature_repository",),
+    "feats": ("feat_repository",),
+    "damage_types": ("damage_type_repository",),
+    "weapon_properties": ("weapon_property_repository",),
+}
+
+# Repository -> repositories that validate references against it while parsing
+REPOSITORY_DEPENDENTS: dict[str, tuple[str, ...]] = {
+    "magic_school_repository": ("spell_repository",),
+    "alignment_repository": ("monster_repository",),
+    "condition_repository": ("monster_repository",),
+    "language_repository": ("monster_repository",),
+    "skill_repository": ("monster_repository",),
+}
+
+
+def repositories_to_reload(data_types: Iterable[str]) -> list[str]:
+    """Return the repositories affected by changed data types, dependencies first."""
+    affected: set[str] = set()
+    for data_type in data_types:
+        for attr in DATA_TYPE_REPOSITORIES.get(data_type, ()):
+            affected.add(attr)
+            affected.update(REPOSITORY_DEPENDENTS.get(attr, ()))
+    dependents = {dependent for deps in REPOSITORY_DEPENDENTS.values() for dependent in deps}
+    # Dependencies must hold fresh data before dependents re-validate against them
+    return sorted(affected, key=lambda attr: (attr in dependents, attr))
+
 
 @dataclass
 class GameRepositoryScope:
@@ -69,6 +117,26 @@ class GameRepositoryScope:
     damage_type_repository: IRepository[DamageType]
     weapon_property_repository: IRepository[WeaponProperty]
 
+    @cached_property
+    def name_index(self) -> CatalogNameIndex:
+        """Display name index over every catalog in this scope, built on first use."""
+        return CatalogNameIndex.build({category: getattr(self, attr) for category, attr in CATALOG_CATEGORIES.items()})
+
+    def reload(self, repository_attrs: Collection[str]) -> None:
+        """Reload the given repositories in place and drop derived caches.
+
+        Args:
+            repository_attrs: Repository attribute names, in reload order
+        """
+        for attr in repository_attrs:
+            repository: IRepository[Any] = getattr(self, attr)
+            repository.reload()
+        self.invalidate_derived_caches()
+
+    def invalidate_derived_caches(self) -> None:
+        """Forget indexes computed from repository content."""
+        self.__dict__.pop("name_index", None)
+
 
 class RepositoryFactory(IRepositoryProvider):
     """Creates repositories limited to a set of content packs."""
@@ -262,3 +330,16 @@ class RepositoryFactory(IRepositoryProvider):
     def get_weapon_property_repository_for(self, game_state: GameState) -> IRepository[WeaponProperty]:
         """Get a weapon property repository scoped to the game's content packs."""
         return self._get_or_create_scope(game_state).weapon_property_repository
+
+    def list_scopes(self) -> list[GameRepositoryScope]:
+        """Return every scope created so far."""
+        return list(self._repository_cache.values())
+
+    def reload_repositories(self, repository_attrs: Collection[str]) -> None:
+        """Reload repositories in every cached scope after content pack changes."""
+        for scope in self.list_scopes():
+            scope.reload(repository_attrs)
+
+    def get_name_index_for(self, game_state: GameState) -> CatalogNameIndex:
+        """Get the cross-catalog name index for the game's content packs."""
+        return self._get_or_create_scope(game_state).name_index
@@ -0,0 +1,73 @@
+"""Concurrent warm-up of catalog repositories and startup data."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# A warm-up task loads one data source and returns how many entries it holds
+WarmupTask = Callable[[], int]
+
+
+@dataclass(frozen=True)
+class WarmupResult:
+    """Outcome of a single warm-up task."""
+
+    name: str
+    seconds: float
+    count: int = 0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class DataWarmup:
+    """Run warm-up tasks concurrently, stage by stage.
+
+    Tasks inside a stage run on a thread pool; stages run one after another so a
+    stage can rely on data loaded by the previous one (e.g. scenarios need the
+    character service). Loading is mostly file I/O plus Pydantic validation in
+    pydantic-core, so threads overlap well and scale further on free-threaded
+    interpreters.
+    """
+
+    def __init__(self, stages: Sequence[Mapping[str, WarmupTask]], max_workers: int | None = None) -> None:
+        self.stages = stages
+        self.max_workers = max_workers
+
+    def run(self) -> list[WarmupResult]:
+        """Run every stage and return per-task results in submission order."""
+        results: list[WarmupResult] = []
+        for stage in self.stages:
+            if not stage:
+                continue
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="warmup") as executor:
+                futures = [executor.submit(self._run_task, name, task) for name, task in stage.items()]
+                results.extend(future.result() for future in futures)
+        return results
+
+    @staticmethod
+    def _run_task(name: str, task: WarmupTask) -> WarmupResult:
+        started = time.perf_counter()
+        try:
+            count = task()
+        except Exception as e:
+            return WarmupResult(name=name, seconds=time.perf_counter() - started, error=f"{type(e).__name__}: {e}")
+        return WarmupResult(name=name, seconds=time.perf_counter() - started, count=count)
+
+    @staticmethod
+    def log_results(results: Sequence[WarmupResult], total_seconds: float) -> None:
+        """Log per-task timings, slowest first."""
+        for result in sorted(results, key=lambda r: r.seconds, reverse=True):
+            if result.ok:
+                logger.info(f"  - {result.name}: {result.count} entries in {result.seconds * 1000:.1f}ms")
+            else:
+                logger.error(f"  - {result.name}: failed after {result.seconds * 1000:.1f}ms ({result.error})")
+        logger.info(f"Warm-up finished in {total_seconds * 1000:.1f}ms ({len(results)} sources)")
@@ -17,6 +17,8 @@ from app.models.instances.character_instance import CharacterInstance
 from app.models.instances.monster_instance import MonsterInstance
 from app.models.instances.npc_instance import NPCInstance
 from app.models.location import EncounterParticipantSpawn, SpawnType
+from app.models.state_revisions import StateSection
+from app.utils.fuzzy_index import DEFAULT_SIMILARITY_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +89,7 @@ class CombatService(ICombatService):
             entity_type=etype,
             faction=faction,
         )
+        game_state.bump_revision(StateSection.COMBAT)
 
         # Return a corresponding participant value-object for result payloads
         return CombatParticipant(
@@ -292,18 +295,25 @@ class CombatService(ICombatService):
         try:
             # Use per-game content packs
             monster_repo = self.repository_provider.get_monster_repository_for(game_state)
+            if not monster_repo.validate_reference(monster_name):
+                close = monster_repo.find_similar_keys(monster_name, limit=1, threshold=DEFAULT_SIMILARITY_THRESHOLD)
+                if close:
+                    logger.warning(f"Fuzzy matched monster '{monster_name}' to '{close[0]}'")
+                    monster_name = close[0]
             monster_data = monster_repo.get(monster_name)
             # Create runtime instance and add to game state (dedup name)
             inst = self.monster_manager_service.create(monster_data, game_state.scenario_instance.current_location_id)
             _ = self.monster_manager_service.add_monster_to_game(game_state, inst)
             return inst
         except RepositoryNotFoundError:
-            logger.warning(f"Monster '{monster_name}' not found in repository")
+            suggestions = monster_repo.find_similar_keys(monster_name)
+            logger.warning(f"Monster '{monster_name}' not found in repository (did you mean: {suggestions})")
             return None
 
     def start_combat(self, game_state: GameState) -> CombatState:
         # Increment combat occurrence counter for tracking
         game_state.combat = CombatState(is_active=True, combat_occurrence=game_state.combat.combat_occurrence + 1)
+        game_state.bump_revision(StateSection.COMBAT)
         return game_state.combat
 
     def end_combat(self, game_state: GameState) -> None:
@@ -316,3 +326,5 @@ class CombatService(ICombatService):
             game_state.combat.participants.clear()
             game_state.combat.round_number = 1
             game_state.combat.turn_index = 0
+            game_state.bump_revision(StateSection.COMBAT)
+            game_state.bump_revision(StateSection.MONSTERS)
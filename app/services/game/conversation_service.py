@@ -5,6 +5,7 @@ from datetime import datetime
 from app.agents.core.types import AgentType
 from app.interfaces.services.game import IConversationService, IMetadataService, ISaveManager
 from app.models.game_state import GameState, Message, MessageRole
+from app.models.state_revisions import StateSection
 
 
 class ConversationService(IConversationService):
@@ -79,4 +80,5 @@ class ConversationService(IConversationService):
             speaker_npc_name=speaker_npc_name,
         )
         game_state.conversation_history.append(message)
+        game_state.bump_revision(StateSection.HISTORY)
         return message
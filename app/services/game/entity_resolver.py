@@ -0,0 +1,167 @@
+"""Entity resolution with fuzzy matching for handling typos in entity IDs."""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from app.interfaces.services.game import IEntityResolver
+from app.models.attributes import EntityType
+from app.models.entity import IEntity
+from app.models.game_state import GameState
+from app.models.state_revisions import StateSection
+from app.utils.fuzzy_index import DEFAULT_SIMILARITY_THRESHOLD, FuzzyIndex, FuzzyMatch
+
+logger = logging.getLogger(__name__)
+
+# Games whose instance ID indexes are kept; least recently resolved are dropped first
+MAX_INDEXED_GAMES = 256
+
+
+def _instance_ids(game_state: GameState, entity_type: EntityType) -> set[str]:
+    match entity_type:
+        case EntityType.PLAYER:
+            return {game_state.character.instance_id}
+        case EntityType.NPC:
+            return {npc.instance_id for npc in game_state.npcs}
+        case EntityType.MONSTER:
+            return {mon.instance_id for mon in game_state.monsters}
+
+
+def _membership_token(game_state: GameState, entity_type: EntityType) -> Hashable:
+    """Cheap token that changes whenever the instances of one entity type may have changed.
+
+    Monsters are added and removed through paths that bump StateSection.MONSTERS. NPC
+    instances are only added while a game is created or loaded, and a loaded game is a
+    new GameState with a new base revision.
+    """
+    match entity_type:
+        case EntityType.PLAYER:
+            return game_state.character.instance_id
+        case EntityType.NPC:
+            return game_state.revisions.base, len(game_state.npcs)
+        case EntityType.MONSTER:
+            return game_state.revisions.get(StateSection.MONSTERS), len(game_state.monsters)
+
+
+class _GameIndex:
+    """Fuzzy index of one entity type in one game and the token it was synced at."""
+
+    def __init__(self) -> None:
+        self.index = FuzzyIndex()
+        self.token: Hashable = None
+
+
+class EntityResolver(IEntityResolver):
+    """Resolve entity IDs against per-game fuzzy indexes of instance IDs.
+
+    Indexes persist per game and are re-synced only when the game's instances may
+    have changed, so a lookup costs a trigram search rather than a scan of every
+    instance.
+    """
+
+    def __init__(self, max_games: int = MAX_INDEXED_GAMES) -> None:
+        self.max_games = max_games
+        self._games: OrderedDict[str, dict[EntityType, _GameIndex]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_instance_index(self, game_state: GameState, entity_type: EntityType) -> FuzzyIndex:
+        with self._lock:
+            indexes = self._games.get(game_state.game_id)
+            if indexes is None:
+                indexes = {}
+                self._games[game_state.game_id] = indexes
+                while len(self._games) > self.max_games:
+                    self._games.popitem(last=False)
+            else:
+                self._games.move_to_end(game_state.game_id)
+            entry = indexes.setdefault(entity_type, _GameIndex())
+
+            token = _membership_token(game_state, entity_type)
+            if token != entry.token:
+                current = _instance_ids(game_state, entity_type)
+                for stale in [key for key in entry.index if key not in current]:
+                    entry.index.discard(stale)
+                for key in current:
+                    entry.index.add(key)
+                entry.token = token
+            return entry.index
+
+    def find_similar_instance_ids(
+        self,
+        game_state: GameState,
+        entity_type: EntityType,
+        entity_id: str,
+        limit: int = 3,
+        similarity_threshold: float = 0.0,
+    ) -> list[FuzzyMatch]:
+        return self._get_instance_index(game_state, entity_type).search(entity_id, limit, similarity_threshold)
+
+    def find_similar_entity(
+        self,
+        game_state: GameState,
+        entity_type: EntityType,
+        entity_id: str,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> IEntity | None:
+        # First try exact match
+        entity = game_state.get_entity_by_id(entity_type, entity_id)
+        if entity:
+            return entity
+
+        matches = self.find_similar_instance_ids(game_state, entity_type, entity_id, 1, similarity_threshold)
+        if not matches:
+            return None
+
+        best = matches[0]
+        entity = game_state.get_entity_by_id(entity_type, best.key)
+        if entity:
+            logger.warning(
+                f"Fuzzy matched entity ID '{entity_id}' to '{best.key}' "
+                f"(similarity: {best.score:.2%}) for {entity_type.value}"
+            )
+        return entity
+
+    def resolve_entity_with_fallback(
+        self,
+        game_state: GameState,
+        entity_id: str,
+        entity_type: EntityType | None = None,
+    ) -> tuple[IEntity | None, EntityType | None]:
+        # Special case: "player" maps to actual player ID
+        if entity_id.lower() == "player":
+            return game_state.character, EntityType.PLAYER
+
+        # If entity_type is specified, try that first
+        if entity_type:
+            entity = self.find_similar_entity(game_state, entity_type, entity_id)
+            if entity:
+                return entity, entity_type
+
+        # Try auto-detecting entity type by searching all types
+        else:
+            # First pass: exact matches
+            for etype in EntityType:
+                entity = game_state.get_entity_by_id(etype, entity_id)
+                if entity:
+                    return entity, etype
+
+            # Second pass: best fuzzy match across all types
+            best: FuzzyMatch | None = None
+            best_type: EntityType | None = None
+            for etype in EntityType:
+                matches = self.find_similar_instance_ids(game_state, etype, entity_id, 1, DEFAULT_SIMILARITY_THRESHOLD)
+                if matches and (best is None or matches[0].score > best.score):
+                    best = matches[0]
+                    best_type = etype
+
+            if best is not None and best_type is not None:
+                best_entity = game_state.get_entity_by_id(best_type, best.key)
+                if best_entity:
+                    logger.warning(
+                        f"Fuzzy matched entity ID '{entity_id}' to '{best.key}' "
+                        f"(similarity: {best.score:.2%}) for {best_type.value}"
+                    )
+                    return best_entity, best_type
+
+        return None, None
@@ -7,6 +7,7 @@ from app.interfaces.services.data import IRepositoryProvider
 from app.interfaces.services.game.item_manager_service import IItemManagerService
 from app.models.game_state import GameState
 from app.models.item import InventoryItem, ItemDefinition, ItemRarity, ItemType
+from app.utils.fuzzy_index import DEFAULT_SIMILARITY_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,13 @@ class ItemManagerService(IItemManagerService):
     ) -> InventoryItem:
         item_repo = self.repository_provider.get_item_repository_for(game_state)
 
+        if not item_repo.validate_reference(item_index):
+            # Misspelled catalog key (e.g. "potion-of-healng") rather than an invented item
+            close = item_repo.find_similar_keys(item_index, limit=1, threshold=DEFAULT_SIMILARITY_THRESHOLD)
+            if close:
+                logger.warning(f"Fuzzy matched item index '{item_index}' to '{close[0]}'")
+                item_index = close[0]
+
         # Validation stays in repository
         if item_repo.validate_reference(item_index):
             try:
@@ -4,14 +4,14 @@ from __future__ import annotations
 
 import logging
 
-from app.interfaces.services.game import ILocationService, IMonsterManagerService
+from app.interfaces.services.game import IEntityResolver, ILocationService, IMonsterManagerService
 from app.models.attributes import EntityType
 from app.models.game_state import GameState
 from app.models.instances.monster_instance import MonsterInstance
 from app.models.instances.npc_instance import NPCInstance
 from app.models.location import DangerLevel, LocationState
 from app.models.scenario import ScenarioLocation, ScenarioMonster
-from app.utils.entity_resolver import resolve_entity_with_fallback
+from app.models.state_revisions import StateSection
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +19,9 @@ logger = logging.getLogger(__name__)
 class LocationService(ILocationService):
     """Default implementation for location-related operations."""
 
-    def __init__(self, monster_manager_service: IMonsterManagerService) -> None:
+    def __init__(self, monster_manager_service: IMonsterManagerService, entity_resolver: IEntityResolver) -> None:
         self.monster_manager_service = monster_manager_service
+        self.entity_resolver = entity_resolver
 
     def validate_traversal(
         self,
@@ -104,9 +105,10 @@ class LocationService(ILocationService):
             game_state.location = resolved_name
             game_state.description = resolved_desc
             game_state.add_story_note(f"Moved to {resolved_name}")
+            game_state.bump_revision(StateSection.LOCATION)
         else:
             # Moving an NPC or monster
-            entity, entity_type = resolve_entity_with_fallback(game_state, entity_id)
+            entity, entity_type = self.entity_resolver.resolve_entity_with_fallback(game_state, entity_id)
             if not entity:
                 raise ValueError(f"Entity with id '{entity_id}' not found")
             # Validate target location exists in scenario
@@ -121,10 +123,12 @@ class LocationService(ILocationService):
                     raise TypeError(f"Entity type mismatch: EntityType.NPC but got {type(entity).__name__}")
                 entity.current_location_id = to_location_id
                 entity.touch()
+                game_state.bump_revision(StateSection.NPC, entity.instance_id)
             elif entity_type == EntityType.MONSTER:
                 if not isinstance(entity, MonsterInstance):
                     raise TypeError(f"Entity type mismatch: EntityType.MONSTER but got {type(entity).__name__}")
                 entity.current_location_id = to_location_id
+                game_state.bump_revision(StateSection.MONSTERS)
             else:
                 raise ValueError(f"Cannot move entity of type {entity_type.value if entity_type else 'unknown'}")
 
@@ -160,6 +164,7 @@ class LocationService(ILocationService):
         current_loc = game_state.scenario_instance.current_location_id
         location_state = game_state.get_location_state(current_loc)
         location_state.discover_secret(secret_id)
+        game_state.bump_revision(StateSection.LOCATION)
 
         # Use provided description or default to the secret ID
         return secret_description or f"Secret '{secret_id}'"
@@ -203,4 +208,6 @@ class LocationService(ILocationService):
             location_state.active_effects.append(add_effect)
             updates.append(f"Added effect: {add_effect}")
 
+        if updates:
+            game_state.bump_revision(StateSection.LOCATION)
         return location_id, updates
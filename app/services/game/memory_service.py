@@ -2,23 +2,67 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import datetime
 
 from app.interfaces.agents.summarizer import ISummarizerAgent
 from app.interfaces.services.memory import IMemoryService
 from app.models.game_state import GameState, Message
+from app.models.instances.npc_instance import NPCInstance
 from app.models.memory import MemoryEntry, MemoryEventKind, MemorySource, WorldEventContext
+from app.models.state_revisions import StateSection
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _LocationCapture:
+    """What to summarize for a location exit, fixed when the player leaves."""
+
+    location_id: str
+    location_name: str
+    until: int
+    npc_ids: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class _WorldCapture:
+    """What to summarize for a world event, fixed when it happens."""
+
+    event_kind: MemoryEventKind
+    tags: tuple[str, ...]
+    context: WorldEventContext
+    location_id: str | None
+    until: int
+
+
 class MemoryService(IMemoryService):
-    """Summarises conversation history into scoped memories."""
+    """Summarises conversation history into scoped memories.
 
-    def __init__(self, summarizer_provider: Callable[[], ISummarizerAgent]) -> None:
+    Triggers only record what to summarize (the history length and the NPCs present
+    at that moment) and return; the summarizer calls run in a background task. A
+    location exit is summarized together with its NPCs in one summarizer call. Each
+    game has one queue, so its captures are applied in trigger order. A capture reads
+    the message cursors when it runs and only applies entries whose cursor it saw
+    unchanged, so repeated or overlapping captures never duplicate a memory.
+
+    Captures often finish after the turn that triggered them was saved, so a game is
+    saved again once a capture adds entries to it; a game whose save failed is
+    retried by wait_for_pending.
+    """
+
+    def __init__(
+        self,
+        summarizer_provider: Callable[[], ISummarizerAgent],
+        save_game: Callable[[GameState], object] | None = None,
+    ) -> None:
         self._summarizer_provider = summarizer_provider
+        self._save_game = save_game
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._unsaved: dict[str, GameState] = {}
 
     async def on_location_exit(self, game_state: GameState) -> None:
         scenario_instance = game_state.scenario_instance
@@ -26,22 +70,128 @@ class MemoryService(IMemoryService):
             raise ValueError("Cannot capture location memory: current location is unknown")
 
         location_id = scenario_instance.current_location_id
-        location_name = game_state.location
+        capture = _LocationCapture(
+            location_id=location_id,
+            location_name=game_state.location,
+            until=len(game_state.conversation_history),
+            npc_ids=tuple(npc.instance_id for npc in game_state.npcs if npc.current_location_id == location_id),
+        )
+        self._enqueue(game_state, f"location:{location_id}", lambda: self._capture_location(game_state, capture))
+
+    async def on_world_event(
+        self,
+        game_state: GameState,
+        event_kind: MemoryEventKind,
+        *,
+        tags: list[str] | None = None,
+        context: WorldEventContext | None = None,
+    ) -> None:
+        scenario_instance = game_state.scenario_instance
+        context = context or WorldEventContext()
+        location_id = context.location_id
+        if location_id is None and scenario_instance.is_in_known_location():
+            location_id = scenario_instance.current_location_id
+
+        capture = _WorldCapture(
+            event_kind=event_kind,
+            tags=tuple(tags or ()),
+            context=context,
+            location_id=location_id,
+            until=len(game_state.conversation_history),
+        )
+        self._enqueue(game_state, f"world:{event_kind.value}", lambda: self._capture_world(game_state, capture))
+
+    async def wait_for_pending(self, game_id: str | None = None) -> None:
+        pending = [task for key, task in self._tasks.items() if game_id is None or key == game_id]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        for unsaved in [state for key, state in self._unsaved.items() if game_id is None or key == game_id]:
+            self._persist(unsaved)
+
+    def _enqueue(self, game_state: GameState, label: str, capture: Callable[[], Awaitable[bool]]) -> None:
+        game_id = game_state.game_id
+        previous = self._tasks.get(game_id)
+        task = asyncio.get_running_loop().create_task(self._run_after(previous, game_state, label, capture))
+        self._tasks[game_id] = task
+        task.add_done_callback(
+            lambda done: self._tasks.pop(game_id, None) if self._tasks.get(game_id) is done else None
+        )
+
+    async def _run_after(
+        self,
+        previous: asyncio.Task[None] | None,
+        game_state: GameState,
+        label: str,
+        capture: Callable[[], Awaitable[bool]],
+    ) -> None:
+        if previous is not None:
+            await asyncio.gather(previous, return_exceptions=True)
+        try:
+            applied = await capture()
+        except Exception:
+            logger.warning("Memory capture %s for game %s failed", label, game_state.game_id, exc_info=True)
+            return
+        if applied:
+            self._persist(game_state)
+
+    def _persist(self, game_state: GameState) -> None:
+        """Save a game whose memories changed, keeping it for a retry if the save fails."""
+        if self._save_game is None:
+            return
+        try:
+            self._save_game(game_state)
+        except Exception:
+            self._unsaved[game_state.game_id] = game_state
+            logger.warning("Saving memories of game %s failed", game_state.game_id, exc_info=True)
+        else:
+            self._unsaved.pop(game_state.game_id, None)
+
+    async def _capture_location(self, game_state: GameState, capture: _LocationCapture) -> bool:
+        """Summarize a location exit; return whether any memory was added."""
+        scenario_instance = game_state.scenario_instance
+        location_id = capture.location_id
         since_idx = scenario_instance.last_location_message_index.get(location_id, -1)
-        summarizer = self._summarizer()
         indexed_messages = self._select_messages_since_index(
             game_state,
             since_idx,
-            location_name=location_name,
+            capture.until,
+            location_name=capture.location_name,
         )
         if not indexed_messages:
-            return
+            return False
 
-        messages = [msg for _, msg in indexed_messages]
-        summary = await summarizer.summarize_location_session(game_state, location_id, messages)
+        npc_selections: list[tuple[NPCInstance, int, list[tuple[int, Message]]]] = []
+        for npc_id in capture.npc_ids:
+            npc = game_state.get_npc_by_id(npc_id)
+            if npc is None:
+                continue
+            npc_since_idx = scenario_instance.last_npc_message_index.get(npc.instance_id, -1)
+            npc_indexed_messages = self._select_messages_since_index(
+                game_state,
+                npc_since_idx,
+                capture.until,
+                location_name=capture.location_name,
+                npc_name=npc.sheet.character.name,
+                include_context_window=True,
+            )
+            if npc_indexed_messages:
+                npc_selections.append((npc, npc_since_idx, npc_indexed_messages))
+
+        # One call covers the location and every NPC, each with its own selection
+        result = await self._summarizer().summarize_location_exit(
+            game_state,
+            location_id,
+            [msg for _, msg in indexed_messages],
+            [(npc, [msg for _, msg in npc_indexed_messages]) for npc, _, npc_indexed_messages in npc_selections],
+        )
+        summary = result.location_summary
         if not summary:
             logger.warning("Skipping location memory for %s: summarizer returned empty output", location_id)
-            return
+            return False
+
+        if scenario_instance.last_location_message_index.get(location_id, -1) != since_idx:
+            logger.info("Skipping location memory for %s: already captured", location_id)
+            return False
 
         last_idx = indexed_messages[-1][0]
         entry = self._build_entry(
@@ -56,23 +206,11 @@ class MemoryService(IMemoryService):
         location_state = game_state.get_location_state(location_id)
         location_state.location_memories.append(entry)
         scenario_instance.last_location_message_index[location_id] = last_idx
+        game_state.bump_revision(StateSection.MEMORIES)
 
-        npc_candidates = [npc for npc in game_state.npcs if npc.current_location_id == location_id]
-        for npc in npc_candidates:
+        for npc, npc_since_idx, npc_indexed_messages in npc_selections:
             npc_name = npc.sheet.character.name
-            npc_since_idx = scenario_instance.last_npc_message_index.get(npc.instance_id, -1)
-            npc_indexed_messages = self._select_messages_since_index(
-                game_state,
-                npc_since_idx,
-                location_name=location_name,
-                npc_name=npc_name,
-                include_context_window=True,
-            )
-            if not npc_indexed_messages:
-                continue
-
-            npc_messages = [msg for _, msg in npc_indexed_messages]
-            npc_summary = await summarizer.summarize_npc_interactions(game_state, npc, npc_messages)
+            npc_summary = result.summary_for(npc.instance_id)
             if not npc_summary:
                 logger.warning(
                     "Skipping NPC memory for %s (%s): summarizer returned empty output",
@@ -80,6 +218,8 @@ class MemoryService(IMemoryService):
                     npc_name,
                 )
                 continue
+            if scenario_instance.last_npc_message_index.get(npc.instance_id, -1) != npc_since_idx:
+                continue
 
             npc_last_idx = npc_indexed_messages[-1][0]
             npc_entry = self._build_entry(
@@ -93,50 +233,45 @@ class MemoryService(IMemoryService):
             )
             npc.npc_memories.append(npc_entry)
             scenario_instance.last_npc_message_index[npc.instance_id] = npc_last_idx
+            game_state.bump_revision(StateSection.MEMORIES)
+            game_state.bump_revision(StateSection.NPC, npc.instance_id)
+        return True
 
-    async def on_world_event(
-        self,
-        game_state: GameState,
-        event_kind: MemoryEventKind,
-        *,
-        tags: list[str] | None = None,
-        context: WorldEventContext | None = None,
-    ) -> None:
+    async def _capture_world(self, game_state: GameState, capture: _WorldCapture) -> bool:
+        """Summarize a world event; return whether the memory was added."""
         scenario_instance = game_state.scenario_instance
         since_idx = scenario_instance.last_world_message_index
-        indexed_messages = self._select_messages_since_index(game_state, since_idx)
+        indexed_messages = self._select_messages_since_index(game_state, since_idx, capture.until)
         if not indexed_messages:
-            return
+            return False
 
         summarizer = self._summarizer()
         messages = [msg for _, msg in indexed_messages]
-        context = context or WorldEventContext()
-        summary = await summarizer.summarize_world_update(game_state, event_kind, messages, context)
+        summary = await summarizer.summarize_world_update(game_state, capture.event_kind, messages, capture.context)
         if not summary:
-            logger.warning("Skipping world memory for %s: summarizer returned empty output", event_kind)
-            return
+            logger.warning("Skipping world memory for %s: summarizer returned empty output", capture.event_kind)
+            return False
+        if scenario_instance.last_world_message_index != since_idx:
+            logger.info("Skipping world memory for %s: already captured", capture.event_kind)
+            return False
 
         last_idx = indexed_messages[-1][0]
-        normalized_tags = ["world", f"event:{event_kind.value}"]
-        if tags:
-            normalized_tags.extend(tags)
-
-        location_id = context.location_id
-        if location_id is None and scenario_instance.is_in_known_location():
-            location_id = scenario_instance.current_location_id
+        normalized_tags = ["world", f"event:{capture.event_kind.value}", *capture.tags]
 
         entry = self._build_entry(
             source=MemorySource.WORLD,
             summary=summary,
             tags=normalized_tags,
-            location_id=location_id,
-            npc_ids=context.npc_ids,
-            encounter_id=context.encounter_id,
+            location_id=capture.location_id,
+            npc_ids=capture.context.npc_ids,
+            encounter_id=capture.context.encounter_id,
             since_timestamp=indexed_messages[0][1].timestamp,
             since_message_index=last_idx,
         )
         scenario_instance.world_memories.append(entry)
         scenario_instance.last_world_message_index = last_idx
+        game_state.bump_revision(StateSection.MEMORIES)
+        return True
 
     def prune(self, game_state: GameState) -> None:  # pragma: no cover - intentionally empty hook
         # Hook for future retention policies (max entries, expiration, etc.)
@@ -149,18 +284,20 @@ class MemoryService(IMemoryService):
         self,
         game_state: GameState,
         since_idx: int,
+        until: int,
         *,
         location_name: str | None = None,
         npc_name: str | None = None,
         include_context_window: bool = False,
     ) -> list[tuple[int, Message]]:
         history = game_state.conversation_history
-        if not history:
+        until = min(until, len(history))
+        if not until:
             return []
 
         start = max(since_idx + 1, 0)
         matching_indexes: list[int] = []
-        for idx in range(start, len(history)):
+        for idx in range(start, until):
             message = history[idx]
             if location_name is not None and message.location != location_name:
                 continue
@@ -180,7 +317,7 @@ class MemoryService(IMemoryService):
                     if location_name is None or prev_message.location == location_name:
                         context_indexes.add(prev_idx)
                 next_idx = idx + 1
-                if next_idx < len(history):
+                if next_idx < until:
                     next_message = history[next_idx]
                     if location_name is None or next_message.location == location_name:
                         context_indexes.add(next_idx)
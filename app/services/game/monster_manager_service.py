@@ -13,6 +13,7 @@ from app.models.game_state import GameState
 from app.models.instances.entity_state import EntityState, HitDice, HitPoints
 from app.models.instances.monster_instance import MonsterInstance
 from app.models.monster import MonsterSheet
+from app.models.state_revisions import StateSection
 from app.utils.id_generator import generate_instance_id
 from app.utils.names import dedupe_display_name
 
@@ -99,4 +100,5 @@ class MonsterManagerService(IMonsterManagerService):
         monster.sheet.name = final_name
 
         game_state.monsters.append(monster)
+        game_state.bump_revision(StateSection.MONSTERS)
         return final_name
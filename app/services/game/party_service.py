@@ -9,6 +9,7 @@ from app.interfaces.services.game import IPartyService
 from app.models.game_state import GameState
 from app.models.instances.npc_instance import NPCInstance
 from app.models.npc import NPCImportance
+from app.models.state_revisions import StateSection
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,7 @@ class PartyService(IPartyService):
         # Validate not full and not duplicate (PartyState handles this)
         try:
             game_state.party.add_member(npc_id)
+            game_state.bump_revision(StateSection.PARTY)
             logger.info(f"Added {npc.display_name} to party")
         except ValueError as e:
             raise ValueError(f"Cannot add {npc.display_name} to party: {e}") from e
@@ -55,6 +57,7 @@ class PartyService(IPartyService):
         npc_name = npc.display_name if npc else npc_id
         try:
             game_state.party.remove_member(npc_id)
+            game_state.bump_revision(StateSection.PARTY)
             logger.info(f"Removed {npc_name} from party")
         except ValueError as e:
             raise ValueError(f"Cannot remove {npc_name} from party: {e}") from e
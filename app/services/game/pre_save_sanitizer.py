@@ -4,6 +4,7 @@ import logging
 
 from app.interfaces.services.game import IPreSaveSanitizer
 from app.models.game_state import GameState
+from app.models.state_revisions import StateSection
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,7 @@ class PreSaveSanitizer(IPreSaveSanitizer):
         initial_monster_count = len(game_state.monsters)
         game_state.monsters = [m for m in game_state.monsters if m.is_alive()]
         if initial_monster_count != len(game_state.monsters):
+            game_state.bump_revision(StateSection.MONSTERS)
             logger.debug(
                 "PreSaveSanitizer: removed %d dead monsters before saving game %s",
                 initial_monster_count - len(game_state.monsters),
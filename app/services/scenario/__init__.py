@@ -1,5 +1,6 @@
 """Scenario domain services."""
 
+from app.services.scenario.scenario_bundle import ScenarioBundleStore
 from app.services.scenario.scenario_service import ScenarioService
 
-__all__ = ["ScenarioService"]
+__all__ = ["ScenarioBundleStore", "ScenarioService"]
@@ -0,0 +1,185 @@
+"""Compiled single-file scenario bundles with a source manifest."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from app.interfaces.services.data import ILoader
+from app.models.scenario import ScenarioSheet
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT = 2
+
+# Called with a freshly rebuilt scenario once a background rebuild succeeds
+RebuildCallback = Callable[[ScenarioSheet], None]
+
+
+@cache
+def bundle_format() -> str:
+    """Bundle layout version plus a digest of the ScenarioSheet schema.
+
+    Bundles written before a model change no longer match and are rebuilt from source.
+    """
+    schema = json.dumps(ScenarioSheet.model_json_schema(), sort_keys=True)
+    return f"{BUNDLE_FORMAT}:{hashlib.sha1(schema.encode()).hexdigest()[:12]}"
+
+
+class ScenarioBundleStore:
+    """Load scenarios from validated bundles instead of their many source files.
+
+    A bundle holds the validated ScenarioSheet plus a manifest of every source
+    JSON file (size, mtime and content hash). A fresh bundle costs one read;
+    freshness only stats the sources and hashes the ones whose size or mtime
+    moved. A stale bundle is still served while a background rebuild from
+    source replaces it; a missing bundle is built synchronously.
+    """
+
+    def __init__(self, bundle_dir: Path, scenario_loader: ILoader[ScenarioSheet]) -> None:
+        """Initialize the bundle store.
+
+        Args:
+            bundle_dir: Directory where scenario bundles are written
+            scenario_loader: Loader assembling a scenario from its source files
+        """
+        self.bundle_dir = bundle_dir
+        self.scenario_loader = scenario_loader
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scenario-bundle")
+        self._pending: dict[str, Future[None]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, scenario_dir: Path, on_rebuilt: RebuildCallback) -> ScenarioSheet:
+        """Load a scenario, preferring its bundle.
+
+        Args:
+            scenario_dir: Scenario source directory (containing scenario.json)
+            on_rebuilt: Receives the new scenario when a stale bundle is rebuilt
+
+        Raises:
+            Any loader error when no bundle exists and the sources are invalid
+        """
+        bundle_path = self._bundle_path(scenario_dir)
+        bundle = self._read_bundle(bundle_path)
+        if bundle is None:
+            return self._build(scenario_dir, self._current_files(scenario_dir, {}))
+
+        try:
+            manifest_files: dict[str, list[Any]] = bundle["manifest"]["files"]
+            scenario = ScenarioSheet.model_validate(bundle["scenario"])
+            current_files = self._current_files(scenario_dir, manifest_files)
+            fresh = self._digests(current_files) == self._digests(manifest_files)
+        except (KeyError, TypeError, IndexError, ValidationError) as e:
+            logger.warning(f"Ignoring invalid scenario bundle for {scenario_dir.name}; rebuilding: {e}")
+            return self._build(scenario_dir, self._current_files(scenario_dir, {}))
+
+        if not fresh:
+            logger.info(f"Scenario bundle for {scenario_dir.name} is stale; rebuilding in background")
+            self._schedule_rebuild(scenario_dir, current_files, on_rebuilt)
+        elif current_files != manifest_files:
+            # Sources were touched but not edited; record the new stats so they are not re-hashed next start
+            try:
+                self._write_payload(bundle_path, self._manifest(current_files), bundle["scenario"])
+            except OSError as e:
+                logger.warning(f"Could not refresh scenario bundle manifest {bundle_path}: {e}")
+        return scenario
+
+    def wait_for_rebuilds(self) -> None:
+        """Block until every scheduled background rebuild finished."""
+        with self._lock:
+            pending = list(self._pending.values())
+        for future in pending:
+            future.result()
+
+    def _build(self, scenario_dir: Path, files: dict[str, list[Any]]) -> ScenarioSheet:
+        scenario = self.scenario_loader.load(scenario_dir / "scenario.json")
+        self._write_bundle(self._bundle_path(scenario_dir), scenario, files)
+        return scenario
+
+    def _schedule_rebuild(self, scenario_dir: Path, files: dict[str, list[Any]], on_rebuilt: RebuildCallback) -> None:
+        with self._lock:
+            if scenario_dir.name in self._pending and not self._pending[scenario_dir.name].done():
+                return
+
+            def rebuild() -> None:
+                try:
+                    scenario = self._build(scenario_dir, files)
+                except Exception as e:
+                    # Keep serving the previous bundle; the next load retries
+                    logger.error(f"Background rebuild of scenario {scenario_dir.name} failed: {e}", exc_info=True)
+                    return
+                on_rebuilt(scenario)
+                logger.info(f"Rebuilt scenario bundle for {scenario_dir.name}")
+
+            self._pending[scenario_dir.name] = self._executor.submit(rebuild)
+
+    def _bundle_path(self, scenario_dir: Path) -> Path:
+        return self.bundle_dir / f"{scenario_dir.name}.bundle.json"
+
+    @staticmethod
+    def _read_bundle(bundle_path: Path) -> dict[str, Any] | None:
+        if not bundle_path.exists():
+            return None
+        try:
+            with open(bundle_path, encoding="utf-8") as f:
+                bundle: dict[str, Any] = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable scenario bundle {bundle_path}: {e}")
+            return None
+        manifest = bundle.get("manifest") if isinstance(bundle, dict) else None
+        if not isinstance(manifest, dict) or manifest.get("format") != bundle_format():
+            return None
+        return bundle
+
+    def _write_bundle(self, bundle_path: Path, scenario: ScenarioSheet, files: dict[str, list[Any]]) -> None:
+        self._write_payload(bundle_path, self._manifest(files), scenario.model_dump(mode="json"))
+
+    def _manifest(self, files: dict[str, list[Any]]) -> dict[str, Any]:
+        return {"format": bundle_format(), "source_hash": self._source_hash(files), "files": files}
+
+    @staticmethod
+    def _write_payload(bundle_path: Path, manifest: dict[str, Any], scenario_data: dict[str, Any]) -> None:
+        payload = {"manifest": manifest, "scenario": scenario_data}
+        bundle_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=bundle_path.parent, prefix=f".{bundle_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_name, bundle_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _current_files(scenario_dir: Path, known: dict[str, list[Any]]) -> dict[str, list[Any]]:
+        """Describe source files as relpath -> [size, mtime_ns, sha1], hashing only changed files."""
+        files: dict[str, list[Any]] = {}
+        for path in sorted(scenario_dir.rglob("*.json")):
+            rel = path.relative_to(scenario_dir).as_posix()
+            stat = path.stat()
+            previous = known.get(rel)
+            if previous is not None and previous[:2] == [stat.st_size, stat.st_mtime_ns]:
+                files[rel] = previous
+            else:
+                files[rel] = [stat.st_size, stat.st_mtime_ns, hashlib.sha1(path.read_bytes()).hexdigest()]
+        return files
+
+    @staticmethod
+    def _digests(files: dict[str, list[Any]]) -> dict[str, str]:
+        return {rel: str(entry[2]) for rel, entry in files.items()}
+
+    @classmethod
+    def _source_hash(cls, files: dict[str, list[Any]]) -> str:
+        digests = cls._digests(files)
+        return hashlib.sha1("\n".join(f"{rel}:{digests[rel]}" for rel in sorted(digests)).encode()).hexdigest()
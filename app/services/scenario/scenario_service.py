@@ -2,6 +2,7 @@
 
 import json
 import logging
+from dataclasses import dataclass, field
 
 from app.interfaces.services.character import ICharacterService
 from app.interfaces.services.common import IPathResolver
@@ -9,11 +10,22 @@ from app.interfaces.services.data import ILoader
 from app.interfaces.services.scenario import IScenarioService
 from app.models.monster import MonsterSheet
 from app.models.npc import NPCSheet
-from app.models.scenario import ScenarioMonster, ScenarioSheet
+from app.models.scenario import ScenarioSheet
+from app.services.data.loaders.scenario_loader import parse_scenario_monster
+from app.services.scenario.scenario_bundle import ScenarioBundleStore
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _ScenarioSheets:
+    """Parsed and validated sheets of one scenario, keyed by file id."""
+
+    npcs: dict[str, NPCSheet] = field(default_factory=dict)
+    npc_errors: dict[str, str] = field(default_factory=dict)
+    monsters: dict[str, MonsterSheet | None] = field(default_factory=dict)
+
+
 class ScenarioService(IScenarioService):
     """Service for loading and managing scenarios."""
 
@@ -22,6 +34,7 @@ class ScenarioService(IScenarioService):
         path_resolver: IPathResolver,
         scenario_loader: ILoader[ScenarioSheet],
         character_service: ICharacterService,
+        bundle_store: ScenarioBundleStore | None = None,
     ):
         """
         Initialize scenario service.
@@ -30,11 +43,14 @@ class ScenarioService(IScenarioService):
             path_resolver: Service for resolving file paths
             scenario_loader: Loader for scenario data
             character_service: Service for character validation
+            bundle_store: Optional compiled bundle store used instead of assembling sources
         """
         self.path_resolver = path_resolver
         self.scenario_loader = scenario_loader
         self.character_service = character_service
+        self.bundle_store = bundle_store
         self._scenarios: dict[str, ScenarioSheet] = {}
+        self._sheets: dict[str, _ScenarioSheets] = {}
         self._load_all_scenarios()
 
     def _load_all_scenarios(self) -> None:
@@ -49,12 +65,20 @@ class ScenarioService(IScenarioService):
                     scenario_file = scenario_dir / "scenario.json"
                     if scenario_file.exists():
                         try:
-                            scenario = self.scenario_loader.load(scenario_file)
+                            if self.bundle_store is not None:
+                                scenario = self.bundle_store.load(scenario_dir, self._on_scenario_rebuilt)
+                            else:
+                                scenario = self.scenario_loader.load(scenario_file)
                             self._scenarios[scenario.id] = scenario
                         except Exception as e:
                             logger.error(f"Failed to load critical scenario data from {scenario_file}: {e}")
                             raise RuntimeError(f"Critical data validation failed for scenario {scenario_id}") from e
 
+    def _on_scenario_rebuilt(self, scenario: ScenarioSheet) -> None:
+        """Swap in a scenario rebuilt from changed sources."""
+        self._scenarios[scenario.id] = scenario
+        self._sheets.pop(scenario.id, None)
+
     def get_scenario(self, scenario_id: str) -> ScenarioSheet | None:
         return self._scenarios.get(scenario_id)
 
@@ -62,61 +86,67 @@ class ScenarioService(IScenarioService):
         return list(self._scenarios.values())
 
     def get_scenario_npc(self, scenario_id: str, npc_id: str) -> NPCSheet | None:
-        try:
-            npc_path = self.path_resolver.get_scenario_dir(scenario_id) / "npcs" / f"{npc_id}.json"
-            if not npc_path.exists():
-                return None
-            import json
+        sheets = self._get_scenario_sheets(scenario_id)
+        error = sheets.npc_errors.get(npc_id)
+        if error is not None:
+            raise ValueError(error)
+        npc = sheets.npcs.get(npc_id)
+        # Callers may mutate what they get back, so hand out copies of the cached sheet
+        return npc.model_copy(deep=True) if npc else None
 
-            with open(npc_path, encoding="utf-8") as f:
-                data = json.load(f)
-            npc = NPCSheet(**data)
-
-            errors = self.character_service.validate_character_references(npc.character)
-            if errors:
-                raise ValueError(f"NPC {npc.id} has invalid references: {', '.join(errors)}")
+    def get_scenario_monster(self, scenario_id: str, monster_id: str) -> MonsterSheet | None:
+        sheets = self._get_scenario_sheets(scenario_id)
+        if monster_id not in sheets.monsters:
+            sheets.monsters[monster_id] = self._load_scenario_monster(scenario_id, monster_id)
+        monster = sheets.monsters[monster_id]
+        return monster.model_copy(deep=True) if monster else None
 
-            return npc
+    def list_scenario_npcs(self, scenario_id: str) -> list[NPCSheet]:
+        try:
+            sheets = self._get_scenario_sheets(scenario_id)
         except Exception as e:
-            logger.error(f"Failed to load NPC {npc_id} from scenario {scenario_id}: {e}")
-            raise
-
-    def get_scenario_monster(self, scenario_id: str, monster_id: str) -> MonsterSheet | None:
+            logger.error(f"Failed to list NPCs for scenario {scenario_id}: {e}")
+            return []
+        return [npc.model_copy(deep=True) for npc in sheets.npcs.values()]
+
+    def _get_scenario_sheets(self, scenario_id: str) -> _ScenarioSheets:
+        """Get the sheet cache of a scenario, loading and validating its NPCs on first use."""
+        sheets = self._sheets.get(scenario_id)
+        if sheets is None:
+            sheets = _ScenarioSheets()
+            self._load_scenario_npcs(scenario_id, sheets)
+            self._sheets[scenario_id] = sheets
+        return sheets
+
+    def _load_scenario_npcs(self, scenario_id: str, sheets: _ScenarioSheets) -> None:
+        npcs_dir = self.path_resolver.get_scenario_dir(scenario_id) / "npcs"
+        if not npcs_dir.exists():
+            return
+
+        for npc_file in sorted(npcs_dir.glob("*.json")):
+            npc_id = npc_file.stem
+            try:
+                with open(npc_file, encoding="utf-8") as f:
+                    data = json.load(f)
+                npc = NPCSheet(**data)
+
+                errors = self.character_service.validate_character_references(npc.character)
+                if errors:
+                    raise ValueError(f"NPC {npc.id} has invalid references: {', '.join(errors)}")
+
+                sheets.npcs[npc_id] = npc
+            except Exception as e:
+                # Memoize the failure so repeated lookups do not re-read and re-validate the file
+                logger.warning(f"Failed to load NPC {npc_id} from scenario {scenario_id}: {e}")
+                sheets.npc_errors[npc_id] = f"Failed to load NPC {npc_id} from scenario {scenario_id}: {e}"
+
+    def _load_scenario_monster(self, scenario_id: str, monster_id: str) -> MonsterSheet | None:
         try:
             m_path = self.path_resolver.get_scenario_dir(scenario_id) / "monsters" / f"{monster_id}.json"
             if not m_path.exists():
                 return None
             with open(m_path, encoding="utf-8") as f:
                 data = json.load(f)
-            sm = ScenarioMonster(**data)
-            return sm.monster
+            return parse_scenario_monster(data, scenario_id).monster
         except Exception:
             return None
-
-    def list_scenario_npcs(self, scenario_id: str) -> list[NPCSheet]:
-        npcs: list[NPCSheet] = []
-        try:
-            npcs_dir = self.path_resolver.get_scenario_dir(scenario_id) / "npcs"
-            if not npcs_dir.exists():
-                return npcs
-
-            for npc_file in npcs_dir.glob("*.json"):
-                try:
-                    with open(npc_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                    npc = NPCSheet(**data)
-
-                    errors = self.character_service.validate_character_references(npc.character)
-                    if errors:
-                        logger.warning(f"NPC {npc.id} has invalid references: {', '.join(errors)}")
-                        continue
-
-                    npcs.append(npc)
-                except Exception as e:
-                    logger.warning(f"Failed to load NPC from {npc_file}: {e}")
-                    continue
-
-            return npcs
-        except Exception as e:
-            logger.error(f"Failed to list NPCs for scenario {scenario_id}: {e}")
-            return []
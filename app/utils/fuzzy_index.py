@@ -0,0 +1,101 @@
+"""Incremental character-trigram index for approximate key lookup."""
+
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from difflib import SequenceMatcher
+from typing import NamedTuple
+
+# Similarity above which a misspelled key is treated as the existing key
+DEFAULT_SIMILARITY_THRESHOLD = 0.85
+
+# Candidate sets up to this size are scored in full, matching plain difflib results
+_FULL_SCORING_CANDIDATES = 256
+# Beyond that, candidates scored with SequenceMatcher per requested result
+_CANDIDATES_PER_RESULT = 4
+_MIN_CANDIDATES = 16
+
+
+class FuzzyMatch(NamedTuple):
+    key: str
+    score: float
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"${text}$"
+    if len(padded) < 3:
+        return {padded}
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class FuzzyIndex:
+    """Approximate string lookup over a changing set of keys.
+
+    Keys are lowercased and split into padded character trigrams held in posting
+    lists. A query only looks at keys sharing at least one trigram and computes the
+    (costly) SequenceMatcher ratio for them, so scores stay comparable with plain
+    difflib matching while lookups no longer scan every key. When more than
+    _FULL_SCORING_CANDIDATES keys share a trigram, only the ones sharing the most
+    trigrams are scored, trading a little recall for bounded cost.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()) -> None:
+        self._postings: dict[str, set[str]] = {}
+        self._grams: dict[str, set[str]] = {}
+        for key in keys:
+            self.add(key)
+
+    def add(self, key: str) -> None:
+        if key in self._grams:
+            return
+        grams = _trigrams(key.lower())
+        self._grams[key] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+
+    def discard(self, key: str) -> None:
+        grams = self._grams.pop(key, None)
+        if grams is None:
+            return
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[gram]
+
+    def search(self, query: str, limit: int = 5, threshold: float = 0.0) -> list[FuzzyMatch]:
+        """Return up to limit keys most similar to query, best first.
+
+        Args:
+            query: Possibly misspelled key
+            limit: Maximum number of matches
+            threshold: Minimum SequenceMatcher ratio (0-1) for a match
+        """
+        normalized = query.lower()
+        overlap: Counter[str] = Counter()
+        for gram in _trigrams(normalized):
+            overlap.update(self._postings.get(gram, ()))
+        if not overlap:
+            return []
+
+        if len(overlap) <= _FULL_SCORING_CANDIDATES:
+            candidates: list[str] = list(overlap)
+        else:
+            most_common = overlap.most_common(max(limit * _CANDIDATES_PER_RESULT, _MIN_CANDIDATES))
+            candidates = [key for key, _ in most_common]
+        matches = []
+        for key in candidates:
+            score = SequenceMatcher(None, normalized, key.lower()).ratio()
+            if score >= threshold:
+                matches.append(FuzzyMatch(key, score))
+        matches.sort(key=lambda match: (-match.score, match.key))
+        return matches[:limit]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._grams))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._grams
+
+    def __len__(self) -> int:
+        return len(self._grams)
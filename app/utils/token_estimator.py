@@ -0,0 +1,23 @@
+"""Fast local estimate of how many LLM tokens a text costs."""
+
+import re
+
+# Words (letters, digits, underscore) and single punctuation/symbol characters
+_PIECE_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+# Average characters per token for English words under common BPE vocabularies
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text without a tokenizer.
+
+    Each word costs one token per started four characters and each punctuation
+    or symbol character costs one token, which tracks BPE tokenizers closely
+    enough for budgeting while staying deterministic and model independent.
+    """
+    tokens = 0
+    for match in _PIECE_PATTERN.finditer(text):
+        piece = match.group()
+        tokens += -(-len(piece) // _CHARS_PER_TOKEN)
+    return tokens
@@ -8,6 +8,8 @@ let sseSource = null;
 let isProcessing = false; // Track if agent is processing
 let selectedMemberId = 'player'; // Track selected party member ('player' or NPC ID)
 let currentSuggestion = null; // Track current combat suggestion
+let streamingNarrative = null; // DM message receiving streamed text ({ element, text })
+let streamingNpcBubbles = {}; // NPC id -> bubble receiving streamed dialogue ({ element, text })
 
 // DOM elements - cached for performance
 const elements = {};
@@ -718,6 +720,8 @@ function initializeSSE() {
     sseSource.addEventListener('tool_call', (event) => {
         const data = JSON.parse(event.data);
         console.log('[SSE] Tool call received:', data);
+        // Text streamed after the tool call starts a new message below it
+        finishStreamingNarrative();
         
         // Format the tool call display
         let toolMessage = `🎲 ${data.tool_name}`;
@@ -831,12 +835,25 @@ function initializeSSE() {
         }
     });
     
-    // Narrative text (non-streaming for MVP)
+    // Narrative text: complete content at once, or streamed pieces ("word") ended by "complete"
     sseSource.addEventListener('narrative', (event) => {
         console.log('[SSE] Narrative event received');
         const data = JSON.parse(event.data);
-        
-        // For non-streaming, we get the complete content at once
+
+        if (data.word) {
+            if (!streamingNarrative) {
+                streamingNarrative = { element: addMessage('', 'dm'), text: '' };
+            }
+            streamingNarrative.text += data.word;
+            streamingNarrative.element.querySelector('p').textContent = streamingNarrative.text;
+            elements.chatMessages.scrollTop = elements.chatMessages.scrollHeight;
+            return;
+        }
+
+        if (data.complete) {
+            finishStreamingNarrative();
+        }
+
         if (data.content) {
             console.log(`[SSE] Adding narrative: ${data.content.substring(0, 50)}...`);
             addMessage(data.content, 'dm');
@@ -848,6 +865,25 @@ function initializeSSE() {
         const data = JSON.parse(event.data);
         const speaker = data.npc_name || 'NPC';
         const content = data.content || '';
+        const streaming = streamingNpcBubbles[data.npc_id];
+
+        if (data.complete === false) {
+            if (!streaming) {
+                streamingNpcBubbles[data.npc_id] = { element: addNpcDialogueBubble(speaker, content), text: content };
+            } else {
+                streaming.text += content;
+                streaming.element.querySelector('p').textContent = streaming.text;
+                elements.chatMessages.scrollTop = elements.chatMessages.scrollHeight;
+            }
+            return;
+        }
+
+        if (streaming) {
+            // The final message carries the full reply
+            streaming.element.querySelector('p').textContent = content;
+            delete streamingNpcBubbles[data.npc_id];
+            return;
+        }
         addNpcDialogueBubble(speaker, content);
     });
 
@@ -1005,6 +1041,16 @@ function parseMarkdown(text) {
     return html;
 }
 
+// Render markdown for the streamed DM message once its text is complete
+function finishStreamingNarrative() {
+    if (!streamingNarrative) {
+        return;
+    }
+    const escapedText = escapeHtml(streamingNarrative.text);
+    streamingNarrative.element.querySelector('p').innerHTML = parseMarkdown(escapedText);
+    streamingNarrative = null;
+}
+
 // Add message to chat
 function addMessage(text, type) {
     console.log(`[CHAT] Adding ${type} message: ${text.substring(0, 50)}...`);
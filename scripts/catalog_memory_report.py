@@ -0,0 +1,39 @@
+"""Report the memory retained by each catalog repository before and after compaction.
+
+Usage: python scripts/catalog_memory_report.py
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.container import container  # noqa: E402
+from app.services.data.repositories.base_repository import BaseRepository  # noqa: E402
+from app.services.data.repository_factory import DATA_TYPE_REPOSITORIES  # noqa: E402
+
+
+def main() -> None:
+    scope = container.repository_factory.create_scope(container.all_pack_ids)
+    attrs = sorted({attr for attrs in DATA_TYPE_REPOSITORIES.values() for attr in attrs})
+
+    total_before = total_after = 0
+    print(f"{'repository':<28} {'entries':>7} {'before':>12} {'after':>12} {'saved':>6}")
+    for attr in attrs:
+        repository = getattr(scope, attr)
+        if not isinstance(repository, BaseRepository):
+            continue
+        usage = repository.memory_usage()
+        total_before += usage.bytes_before
+        total_after += usage.bytes_after
+        print(
+            f"{attr:<28} {usage.entries:>7} {usage.bytes_before:>12,} {usage.bytes_after:>12,} {usage.saved_ratio:>6.0%}"
+        )
+    saved = 1 - total_after / total_before if total_before else 0.0
+    print(f"{'total':<28} {'':>7} {total_before:>12,} {total_after:>12,} {saved:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
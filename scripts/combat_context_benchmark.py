@@ -0,0 +1,104 @@
+"""Compare combat agent context tokens per round with full and with delta context.
+
+Plays a scripted skirmish (the first sample character against goblins) without any
+model calls. Every combat agent turn some HP changes and the turn advances; the
+script then builds the combat context as the prefix-stable layout sends it, once
+in full every turn and once as baseline plus changes. "sent" counts all context
+tokens of a call, "fresh" only those not repeated verbatim from the previous
+call's prefix (what a provider prompt cache cannot serve).
+
+Usage: python scripts/combat_context_benchmark.py [--rounds N] [--goblins N] [--refresh-turns N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.agents.core.types import AgentType, PromptLayout  # noqa: E402
+from app.container import Container  # noqa: E402
+from app.models.combat import CombatEntry  # noqa: E402
+from app.models.game_state import GameState  # noqa: E402
+from app.models.state_revisions import StateSection  # noqa: E402
+from app.services.ai.context.context_service import ContextService  # noqa: E402
+from app.services.ai.context.delta import FULL_REFRESH_TURNS  # noqa: E402
+from app.utils.token_estimator import estimate_tokens  # noqa: E402
+
+
+def _start_skirmish(container: Container, goblins: int) -> GameState:
+    character = container.character_service.get_all_characters()[0]
+    scenario = container.scenario_service.list_scenarios()[0]
+    game_state = container.game_factory.initialize_game(character, scenario.id)
+
+    combat_service = container.combat_service
+    monsters = [combat_service.spawn_free_monster(game_state, "goblin") for _ in range(goblins)]
+    combat_service.start_combat(game_state)
+    combat_service.ensure_player_in_combat(game_state)
+    combat_service.add_participants(game_state, [CombatEntry(entity=monster) for monster in monsters if monster])
+    return game_state
+
+
+def _play_turn(container: Container, game_state: GameState, turn: int) -> None:
+    """Hit a living enemy (or the player every third turn) and advance the turn."""
+    targets = [monster for monster in game_state.monsters if monster.is_alive()]
+    if turn % 3 == 2 or not targets:
+        container.entity_state_service.update_hp(game_state, game_state.character.instance_id, -2)
+    else:
+        container.entity_state_service.update_hp(game_state, targets[turn % len(targets)].instance_id, -3)
+    game_state.combat.next_turn()
+    game_state.bump_revision(StateSection.COMBAT)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=6)
+    parser.add_argument("--goblins", type=int, default=3)
+    parser.add_argument("--refresh-turns", type=int, default=FULL_REFRESH_TURNS)
+    args = parser.parse_args()
+
+    container = Container()
+    game_state = _start_skirmish(container, args.goblins)
+    full = ContextService(container.repository_factory, prompt_layout=PromptLayout.PREFIX_STABLE)
+    delta = ContextService(
+        container.repository_factory,
+        prompt_layout=PromptLayout.PREFIX_STABLE,
+        delta_refresh_turns=args.refresh_turns,
+    )
+
+    per_round: dict[int, list[tuple[int, int, int, int]]] = defaultdict(list)
+    previous_baseline = ""
+    turn = 0
+    while game_state.combat.is_active and game_state.combat.round_number <= args.rounds:
+        round_number = game_state.combat.round_number
+
+        full_context = full.build_context(game_state, AgentType.COMBAT)
+        full_tokens = estimate_tokens(full_context)
+
+        changes = delta.build_context(game_state, AgentType.COMBAT)
+        baseline = delta.build_stable_context(game_state, AgentType.COMBAT)
+        delta_sent = estimate_tokens(baseline) + estimate_tokens(changes)
+        delta_fresh = estimate_tokens(changes) + (estimate_tokens(baseline) if baseline != previous_baseline else 0)
+        previous_baseline = baseline
+
+        # Full context follows the history, so every token of it is fresh each turn
+        per_round[round_number].append((full_tokens, full_tokens, delta_sent, delta_fresh))
+        _play_turn(container, game_state, turn)
+        turn += 1
+
+    print(f"{'round':>5} {'turns':>5} {'full sent':>10} {'full fresh':>10} {'delta sent':>10} {'delta fresh':>11}")
+    totals = [0, 0, 0, 0]
+    for round_number, turns in sorted(per_round.items()):
+        sums = [sum(values) for values in zip(*turns, strict=True)]
+        totals = [total + value for total, value in zip(totals, sums, strict=True)]
+        print(f"{round_number:>5} {len(turns):>5} {sums[0]:>10,} {sums[1]:>10,} {sums[2]:>10,} {sums[3]:>11,}")
+    print(f"{'total':>5} {turn:>5} {totals[0]:>10,} {totals[1]:>10,} {totals[2]:>10,} {totals[3]:>11,}")
+    if totals[1]:
+        print(f"Fresh context tokens with delta: {totals[3] / totals[1]:.0%} of full")
+
+
+if __name__ == "__main__":
+    main()
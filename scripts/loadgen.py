@@ -0,0 +1,245 @@
+"""Drive concurrent games through the full AI pipeline against the local stand-in model.
+
+Creates N games through the game factory, then plays player turns in all of them
+at once via AIService.generate_response, with every agent served by the scripted
+stand-in model (no network calls). Each game plays its turns one after another,
+like a player waiting for the reply; SSE clients subscribed to every game consume
+the broadcasts. Reports throughput, turn latency percentiles, save I/O per turn,
+event-bus queue depth, memory growth per game and SSE fan-out cost.
+
+Usage: python scripts/loadgen.py [--games N] [--turns N] [--sse-clients N] [--think-ms MS] [--script PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import get_settings  # noqa: E402
+from app.container import Container  # noqa: E402
+from app.models.game_state import GameState  # noqa: E402
+from app.services.common.path_resolver import PathResolver  # noqa: E402
+
+DEFAULT_SCRIPT = Path(__file__).resolve().parent / "standin_script.json"
+STANDIN_AGENTS = "narrative,combat,summarizer,npc"
+
+PLAYER_ACTIONS = [
+    "I look around the room for anything unusual.",
+    "I ask the innkeeper what happened at the old mill.",
+    "I head down the road towards the mill.",
+    "I draw my sword and attack the nearest enemy.",
+    "I search the bodies and catch my breath.",
+]
+
+
+@dataclass
+class _Stats:
+    turn_seconds: list[float] = field(default_factory=list)
+    errors: int = 0
+    saves: int = 0
+    save_seconds: float = 0.0
+    save_bytes: int = 0
+    queue_depths: list[int] = field(default_factory=list)
+    publishes: int = 0
+    publish_seconds: float = 0.0
+    deliveries: int = 0
+    received: int = 0
+
+
+def _rss_bytes() -> int:
+    """Resident memory of this process (peak resident memory where /proc is unavailable)."""
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        return int(statm.read_text().split()[1]) * resource.getpagesize()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = max(int(round(percent / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def _configure_environment(script: Path) -> None:
+    """Serve every agent from the stand-in model; placeholders satisfy the required settings."""
+    os.environ["LLM_STANDIN_AGENTS"] = STANDIN_AGENTS
+    os.environ["LLM_STANDIN_SCRIPT"] = str(script)
+    os.environ.setdefault("OPENROUTER_API_KEY", "loadgen")
+    for name in ("NARRATIVE", "COMBAT", "SUMMARIZER", "INDIVIDUAL_NPC", "PUPPETEER_NPC"):
+        os.environ.setdefault(f"{name}_MODEL", "standin")
+    get_settings.cache_clear()
+
+
+def _instrument(container: Container, stats: _Stats) -> None:
+    """Wrap the save manager, event bus and broadcast service instances to collect stats."""
+    save_manager = container.save_manager
+    save_game = save_manager.save_game
+
+    def timed_save(game_state: GameState) -> Path:
+        started = time.perf_counter()
+        save_dir = save_game(game_state)
+        stats.save_seconds += time.perf_counter() - started
+        stats.saves += 1
+        stats.save_bytes += sum(path.stat().st_size for path in save_dir.rglob("*.json"))
+        return save_dir
+
+    setattr(save_manager, "save_game", timed_save)  # noqa: B010
+
+    event_bus = container.event_bus
+    submit_command = event_bus.submit_command
+    command_queue: asyncio.Queue[Any] = getattr(event_bus, "command_queue")  # noqa: B009
+
+    async def tracked_submit(command: Any) -> None:
+        await submit_command(command)
+        stats.queue_depths.append(command_queue.qsize())
+
+    setattr(event_bus, "submit_command", tracked_submit)  # noqa: B010
+
+    broadcast_service = container.broadcast_service
+    publish: Callable[..., Awaitable[None]] = broadcast_service.publish
+    subscribers: dict[str, list[Any]] = getattr(broadcast_service, "subscribers")  # noqa: B009
+
+    async def timed_publish(game_id: str, event: str, data: Any) -> None:
+        stats.deliveries += len(subscribers.get(game_id, []))
+        started = time.perf_counter()
+        await publish(game_id, event, data)
+        stats.publish_seconds += time.perf_counter() - started
+        stats.publishes += 1
+
+    setattr(broadcast_service, "publish", timed_publish)  # noqa: B010
+
+
+async def _consume_sse(container: Container, game_id: str, stats: _Stats) -> None:
+    async for event in container.broadcast_service.subscribe(game_id):
+        if event.get("event") not in ("connected", "heartbeat"):
+            stats.received += 1
+
+
+async def _stop(tasks: list[asyncio.Task[None]]) -> None:
+    # asyncio.wait_for in Python < 3.12 drops a cancellation that races with a queued event,
+    # which leaves the subscriber running, so cancel until the tasks are done
+    while pending := [task for task in tasks if not task.done()]:
+        for task in pending:
+            task.cancel()
+        await asyncio.wait(pending, timeout=0.1)
+
+
+async def _play(
+    container: Container, game_state: GameState, offset: int, args: argparse.Namespace, stats: _Stats
+) -> None:
+    for turn in range(args.turns):
+        action = PLAYER_ACTIONS[(offset + turn) % len(PLAYER_ACTIONS)]
+        started = time.perf_counter()
+        async for response in container.ai_service.generate_response(action, game_state, stream=False):
+            if response.type == "error":
+                stats.errors += 1
+        container.game_service.save_game(game_state)
+        stats.turn_seconds.append(time.perf_counter() - started)
+        if args.think_ms:
+            await asyncio.sleep(args.think_ms / 1000)
+
+
+async def _run(args: argparse.Namespace, save_dir: Path) -> None:
+    _configure_environment(args.script)
+    container = Container()
+    path_resolver = container.path_resolver
+    assert isinstance(path_resolver, PathResolver)
+    path_resolver.saves_dir = save_dir
+    stats = _Stats()
+    _instrument(container, stats)
+
+    character = container.character_service.get_all_characters()[0]
+    scenario = container.scenario_service.list_scenarios()[0]
+
+    gc.collect()
+    memory_before = _rss_bytes()
+    games = [container.game_service.initialize_game(character, scenario.id) for _ in range(args.games)]
+    gc.collect()
+    memory_created = _rss_bytes()
+    setup_saves, setup_save_seconds, setup_save_bytes = stats.saves, stats.save_seconds, stats.save_bytes
+
+    subscriptions = [
+        asyncio.create_task(_consume_sse(container, game.game_id, stats))
+        for game in games
+        for _ in range(args.sse_clients)
+    ]
+    # Let the subscribers register before the first broadcast
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_play(container, game, index, args, stats) for index, game in enumerate(games)))
+    elapsed = time.perf_counter() - started
+    await container.memory_service.wait_for_pending()
+    await container.event_bus.wait_for_completion()
+
+    await _stop(subscriptions)
+    await container.llm_http_client.aclose()
+    gc.collect()
+    memory_played = _rss_bytes()
+
+    turns = len(stats.turn_seconds)
+    ordered = sorted(stats.turn_seconds)
+    saves = stats.saves - setup_saves
+    depths = stats.queue_depths or [0]
+    mib = 1024 * 1024
+
+    print(f"games {args.games}, turns per game {args.turns}, SSE clients per game {args.sse_clients}")
+    print(f"{'turns':<28}{turns:>12,}   ({stats.errors} errors)")
+    print(f"{'throughput':<28}{turns / elapsed if elapsed else 0.0:>12,.1f} turns/s over {elapsed:.2f}s")
+    for label, percent in (("p50", 50), ("p95", 95), ("p99", 99)):
+        print(f"{'turn latency ' + label:<28}{_percentile(ordered, percent) * 1000:>12,.1f} ms")
+    print(f"{'turn latency max':<28}{(ordered[-1] if ordered else 0.0) * 1000:>12,.1f} ms")
+    if turns:
+        print(f"{'saves per turn':<28}{saves / turns:>12,.2f}")
+        print(f"{'save time per turn':<28}{(stats.save_seconds - setup_save_seconds) / turns * 1000:>12,.2f} ms")
+        print(f"{'save bytes per turn':<28}{(stats.save_bytes - setup_save_bytes) / turns / 1024:>12,.1f} KiB")
+    print(f"{'event-bus queue depth':<28}{max(depths):>12,} max, {sum(depths) / len(depths):.2f} mean")
+    print(f"{'memory per game, created':<28}{(memory_created - memory_before) / max(args.games, 1) / mib:>12,.2f} MiB")
+    print(f"{'memory per game, played':<28}{(memory_played - memory_created) / max(args.games, 1) / mib:>12,.2f} MiB")
+    if stats.publishes:
+        print(
+            f"{'SSE publishes':<28}{stats.publishes:>12,}   ({stats.deliveries:,} queued, {stats.received:,} received)"
+        )
+        print(f"{'SSE cost per publish':<28}{stats.publish_seconds / stats.publishes * 1e6:>12,.1f} us")
+        if stats.deliveries:
+            print(f"{'SSE cost per delivery':<28}{stats.publish_seconds / stats.deliveries * 1e6:>12,.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=20, help="Player turns per game")
+    parser.add_argument("--sse-clients", type=int, default=1, help="SSE subscribers per game")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Pause between a game's turns")
+    parser.add_argument("--script", type=Path, default=DEFAULT_SCRIPT, help="Stand-in model script (JSON)")
+    parser.add_argument("--save-dir", type=Path, default=None, help="Keep saves here instead of a temporary directory")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper())
+    save_dir = args.save_dir or Path(tempfile.mkdtemp(prefix="loadgen-saves-"))
+    try:
+        asyncio.run(_run(args, save_dir))
+    finally:
+        if args.save_dir is None:
+            shutil.rmtree(save_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,7 +24,7 @@ from app.models.game_state import GameEventType, GameState, Message, MessageRole
 from app.models.instances.monster_instance import MonsterInstance
 from app.models.instances.npc_instance import NPCInstance
 from app.models.location import DangerLevel
-from app.models.memory import MemoryEventKind, WorldEventContext
+from app.models.memory import LocationExitSummary, MemoryEventKind, NPCSessionSummary, WorldEventContext
 from app.models.npc import NPCImportance
 from app.models.scenario import LocationDescriptions
 from app.models.tool_results import RollDiceResult
@@ -385,6 +385,18 @@ class _StubSummarizer(BaseAgent):
     ) -> str:
         return "npc summary"
 
+    async def summarize_location_exit(
+        self,
+        game_state: GameState,
+        location_id: str,
+        messages: Sequence[Message],
+        npc_messages: Sequence[tuple[NPCInstance, Sequence[Message]]],
+    ) -> LocationExitSummary:
+        return LocationExitSummary(
+            location_summary="location summary",
+            npc_summaries=[NPCSessionSummary(npc_id=npc.instance_id, summary="npc summary") for npc, _ in npc_messages],
+        )
+
     async def summarize_world_update(
         self,
         game_state: GameState,
@@ -394,6 +406,15 @@ class _StubSummarizer(BaseAgent):
     ) -> str:
         return "world summary"
 
+    async def summarize_history(
+        self,
+        game_state: GameState,
+        previous_summary: str,
+        messages: Sequence[Message],
+        max_tokens: int,
+    ) -> str:
+        return "history summary"
+
     async def process(
         self, prompt: str, game_state: GameState, context: str, stream: bool = True
     ) -> AsyncIterator[StreamEvent]:
@@ -0,0 +1,116 @@
+"""Tests for streaming narrative text to clients while the agent runs."""
+
+from collections.abc import AsyncIterator, Callable
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelMessage
+from pydantic_ai.models.function import AgentInfo, DeltaToolCall, DeltaToolCalls, FunctionModel
+
+from app.agents.core.dependencies import AgentDependencies
+from app.agents.narrative.agent import NarrativeAgent
+from app.events.commands.broadcast_commands import BroadcastNarrativeCommand
+from app.models.ai_response import NarrativeResponse, StreamEventType
+
+
+async def _stream_reply(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+    for piece in ("The door ", "creaks ", "open."):
+        yield piece
+
+
+async def _ambush_reply(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str | DeltaToolCalls]:
+    if len(messages) == 1:
+        yield "Goblins leap from the bushes! "
+        yield {0: DeltaToolCall(name="start_combat", json_args="{}", tool_call_id="call-1")}
+    else:
+        yield "Roll for initiative."
+
+
+def _create_agent(
+    streaming: bool,
+    stream_function: Callable[[list[ModelMessage], AgentInfo], AsyncIterator[str | DeltaToolCalls]] = _stream_reply,
+) -> tuple[NarrativeAgent, list[BroadcastNarrativeCommand]]:
+    broadcasts: list[BroadcastNarrativeCommand] = []
+
+    async def submit_and_wait(commands: list[BroadcastNarrativeCommand]) -> None:
+        broadcasts.extend(commands)
+
+    event_bus = Mock()
+    event_bus.submit_and_wait = AsyncMock(side_effect=submit_and_wait)
+    model_agent: Agent[AgentDependencies, str] = Agent(
+        FunctionModel(stream_function=stream_function), deps_type=AgentDependencies
+    )
+
+    @model_agent.tool_plain
+    def start_combat() -> str:
+        return "Combat started"
+
+    agent = NarrativeAgent(
+        agent=model_agent,
+        message_converter=Mock(convert_history=Mock(return_value=[])),
+        event_logger=MagicMock(),
+        metadata_service=MagicMock(),
+        event_bus=event_bus,
+        scenario_service=MagicMock(),
+        repository_provider=MagicMock(),
+        save_manager=MagicMock(),
+        event_manager=MagicMock(),
+        conversation_service=MagicMock(),
+        action_service=MagicMock(),
+        system_prompt="You are the DM.",
+        streaming=streaming,
+    )
+    return agent, broadcasts
+
+
+def _game_state() -> Mock:
+    game_state = Mock()
+    game_state.game_id = "game-1"
+    game_state.conversation_history = []
+    return game_state
+
+
+@pytest.mark.asyncio
+async def test_streams_text_pieces_before_completion() -> None:
+    agent, broadcasts = _create_agent(streaming=True)
+
+    events = [event async for event in agent.process("Open the door", _game_state(), "context")]
+
+    chunks = [command.content for command in broadcasts if command.is_chunk]
+    assert "".join(chunks) == "The door creaks open."
+    assert len(chunks) > 1
+    # The full text is not sent again after streaming; only the end marker follows
+    assert [(command.content, command.is_complete) for command in broadcasts if not command.is_chunk] == [("", True)]
+    assert events[-1].type == StreamEventType.COMPLETE
+    assert isinstance(events[-1].content, NarrativeResponse)
+    assert events[-1].content.narrative == "The door creaks open."
+
+
+@pytest.mark.asyncio
+async def test_broadcasts_full_text_when_streaming_disabled() -> None:
+    agent, broadcasts = _create_agent(streaming=False)
+
+    _ = [event async for event in agent.process("Open the door", _game_state(), "context")]
+
+    assert not any(command.is_chunk for command in broadcasts)
+    assert [(command.content, command.is_complete) for command in broadcasts] == [
+        ("The door creaks open.", False),
+        ("", True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_combat_start_records_all_streamed_text() -> None:
+    agent, broadcasts = _create_agent(streaming=True, stream_function=_ambush_reply)
+    conversation_service = agent.conversation_service
+    assert isinstance(conversation_service, MagicMock)
+
+    events = [event async for event in agent.process("Walk into the woods", _game_state(), "context")]
+
+    # Text written before the tool call was streamed too, so it is part of the saved response
+    streamed = "".join(command.content for command in broadcasts if command.is_chunk)
+    assert streamed == "Goblins leap from the bushes! Roll for initiative."
+    assert isinstance(events[-1].content, NarrativeResponse)
+    assert events[-1].content.narrative == streamed
+    assert conversation_service.record_message.call_args_list[-1].args[2] == streamed
@@ -0,0 +1,186 @@
+"""Tests for the summarizer agent's combat-entry window and batched location-exit summaries."""
+
+from unittest.mock import Mock
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelMessage, ModelRequest, ModelResponse, TextPart, ToolCallPart, UserPromptPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from app.agents.summarizer.agent import COMBAT_ENTRY_MAX_MESSAGES, COMBAT_ENTRY_MAX_TOKENS, SummarizerAgent
+from app.models.game_state import GameState, Message, MessageRole
+from app.models.instances.npc_instance import NPCInstance
+from app.models.memory import MemoryEntry, MemorySource
+from app.utils.token_estimator import estimate_tokens
+from tests.factories import make_game_state, make_npc_instance, make_npc_sheet
+
+
+def _create_agent(
+    model: FunctionModel,
+    combat_entry_max_messages: int = COMBAT_ENTRY_MAX_MESSAGES,
+    combat_entry_max_tokens: int = COMBAT_ENTRY_MAX_TOKENS,
+) -> SummarizerAgent:
+    return SummarizerAgent(
+        agent=Agent(model),
+        context_service=Mock(build_context=Mock(return_value="")),
+        system_prompt="Summarize.",
+        combat_entry_max_messages=combat_entry_max_messages,
+        combat_entry_max_tokens=combat_entry_max_tokens,
+    )
+
+
+def _prompt_text(messages: list[ModelMessage]) -> str:
+    request = messages[-1]
+    assert isinstance(request, ModelRequest)
+    part = request.parts[-1]
+    assert isinstance(part, UserPromptPart)
+    return str(part.content)
+
+
+def _capture_prompts(prompts: list[str]) -> FunctionModel:
+    def reply(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        prompts.append(_prompt_text(messages))
+        return ModelResponse(parts=[TextPart("Goblins attack.")])
+
+    return FunctionModel(reply)
+
+
+def _game_with_history(count: int) -> GameState:
+    game_state = make_game_state()
+    game_state.conversation_history.extend(
+        Message(role=MessageRole.DM, content=f"Turn {idx}: the party presses on through the old woods.")
+        for idx in range(count)
+    )
+    return game_state
+
+
+def _npcs() -> list[NPCInstance]:
+    return [
+        make_npc_instance(npc_sheet=make_npc_sheet(npc_id="mira", display_name="Mira"), instance_id="npc-1"),
+        make_npc_instance(npc_sheet=make_npc_sheet(npc_id="bram", display_name="Bram"), instance_id="npc-2"),
+    ]
+
+
+def _messages() -> list[Message]:
+    return [Message(role=MessageRole.DM, content="Mira sells Bram a map.", npcs_mentioned=["Mira", "Bram"])]
+
+
+def _npc_messages() -> list[tuple[NPCInstance, list[Message]]]:
+    return [(npc, _messages()) for npc in _npcs()]
+
+
+@pytest.mark.asyncio
+async def test_location_exit_summarizes_all_npcs_in_one_call() -> None:
+    calls: list[int] = []
+
+    def reply(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        calls.append(len(info.output_tools))
+        args = {
+            "location_summary": "The party visited the market.",
+            "npc_summaries": [
+                {"npc_id": "npc-1", "summary": "Mira sold a map."},
+                {"npc_id": "npc-2", "summary": "Bram bought a map."},
+            ],
+        }
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, args)])
+
+    agent = _create_agent(FunctionModel(reply))
+
+    result = await agent.summarize_location_exit(make_game_state(), "market", _messages(), _npc_messages())
+
+    assert calls == [1]
+    assert result.location_summary == "The party visited the market."
+    assert result.summary_for("npc-1") == "Mira sold a map."
+    assert result.summary_for("npc-2") == "Bram bought a map."
+
+
+@pytest.mark.asyncio
+async def test_location_exit_falls_back_to_separate_calls() -> None:
+    structured_calls = 0
+
+    def reply(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        nonlocal structured_calls
+        if info.output_tools:
+            structured_calls += 1
+            return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {"location_summary": ""})])
+        return ModelResponse(parts=[TextPart("Separate summary.")])
+
+    agent = _create_agent(FunctionModel(reply))
+
+    result = await agent.summarize_location_exit(make_game_state(), "market", _messages(), _npc_messages())
+
+    assert structured_calls == 2
+    assert result.location_summary == "Separate summary."
+    assert [entry.npc_id for entry in result.npc_summaries] == ["npc-1", "npc-2"]
+    assert result.summary_for("npc-1") == "Separate summary."
+
+
+@pytest.mark.asyncio
+async def test_location_exit_keeps_each_npc_selection_in_transcript() -> None:
+    game_state = _game_with_history(0)
+    mira, bram = _npcs()
+    mira_messages = [
+        Message(role=MessageRole.NPC, content="Mira whispers about the vault.", npcs_mentioned=["Mira"]),
+    ]
+    session = [Message(role=MessageRole.DM, content=f"Market chatter {idx}.") for idx in range(40)]
+    game_state.conversation_history.extend([*mira_messages, *session])
+    transcripts: list[str] = []
+
+    def reply(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        transcripts.append(_prompt_text(messages))
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {"location_summary": "Busy market."})])
+
+    agent = _create_agent(FunctionModel(reply))
+
+    await agent.summarize_location_exit(
+        game_state,
+        "market",
+        [*mira_messages, *session],
+        [(mira, mira_messages), (bram, session[-5:])],
+    )
+
+    # Mira's only message is older than the newest 30 of the session but stays in the batched transcript
+    assert "Mira whispers about the vault." in transcripts[0]
+    assert "Market chatter 9." not in transcripts[0]
+    assert "Market chatter 10." in transcripts[0]
+    assert transcripts[0].index("Mira whispers") < transcripts[0].index("Market chatter 10.")
+
+
+@pytest.mark.asyncio
+async def test_combat_entry_starts_after_latest_memory() -> None:
+    game_state = _game_with_history(10)
+    game_state.scenario_instance.world_memories.append(
+        MemoryEntry(source=MemorySource.WORLD, summary="The bridge collapsed.", since_message_index=3)
+    )
+    location_id = game_state.scenario_instance.current_location_id
+    game_state.get_location_state(location_id).location_memories.append(
+        MemoryEntry(source=MemorySource.LOCATION, summary="The party met a hermit.", since_message_index=6)
+    )
+    prompts: list[str] = []
+
+    summary = await _create_agent(_capture_prompts(prompts)).summarize_for_combat(game_state)
+
+    assert summary == "Goblins attack."
+    assert "The party met a hermit." in prompts[0]
+    assert "The bridge collapsed." not in prompts[0]
+    assert "Turn 6:" not in prompts[0]
+    assert all(f"Turn {idx}:" in prompts[0] for idx in (7, 8, 9))
+
+
+@pytest.mark.asyncio
+async def test_combat_entry_prompt_is_capped() -> None:
+    prompts: list[str] = []
+    agent = _create_agent(_capture_prompts(prompts), combat_entry_max_messages=50, combat_entry_max_tokens=100)
+
+    await agent.summarize_for_combat(_game_with_history(500))
+    game_state = _game_with_history(1)
+    game_state.conversation_history[0].content = "Shouting! " * 500
+    await agent.summarize_for_combat(game_state)
+
+    fixed_tokens = estimate_tokens(
+        "Summarize this context for combat in 2-3 sentences:\nGame context:\n\n\nRecent narrative context:\n"
+        "\n\nFocus on: How combat started, current environment, and any tactical considerations."
+    )
+    assert [estimate_tokens(prompt) - fixed_tokens <= 100 for prompt in prompts] == [True, True]
+    assert "Turn 499:" in prompts[0]
+    assert "Turn 450:" not in prompts[0]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, cast
@@ -13,6 +14,7 @@ from app.api.routers import catalogs
 from app.common.exceptions import RepositoryNotFoundError
 from app.container import container
 from app.models.requests import ResolveNamesRequest
+from app.services.data.name_index import CATALOG_CATEGORIES, CatalogNameIndex
 from tests.factories import make_game_state
 
 
@@ -51,6 +53,10 @@ class StubRepositoryFactory:
     def __init__(self, mapping: dict[str, StubRepo]) -> None:
         self.mapping = mapping
 
+    def get_name_index_for(self, _state: object) -> CatalogNameIndex:
+        repos = {category: self.mapping[attr] for category, attr in CATALOG_CATEGORIES.items()}
+        return CatalogNameIndex.build(cast(Any, repos))
+
     def __getattr__(self, name: str) -> Callable[[object], StubRepo]:
         if name.startswith("get_") and name.endswith("_repository_for"):
             base = name[4:-15]
@@ -136,6 +142,35 @@ class TestCatalogsRouter:
             assert section[key] == self.repos[attr].get_name(key)
             assert "missing" not in section
 
+    async def test_resolve_names_stream_emits_chunked_ndjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(catalogs, "RESOLVE_NAMES_STREAM_CHUNK", 1)
+        request = ResolveNamesRequest(
+            game_id=self.game_state.game_id,
+            items=["item-alpha", "missing", "item-custom"],
+            spells=["spell-alpha"],
+        )
+        response = await catalogs.resolve_names_stream(request)
+
+        body = ""
+        async for chunk in response.body_iterator:
+            body += chunk if isinstance(chunk, str) else bytes(chunk).decode()
+        lines = [json.loads(line) for line in body.splitlines()]
+
+        assert response.media_type == "application/x-ndjson"
+        assert lines == [
+            {"category": "items", "names": {"item-alpha": "item-alpha-name"}},
+            {"category": "items", "names": {"item-custom": "item-custom-name"}},
+            {"category": "spells", "names": {"spell-alpha": "spell-alpha-name"}},
+        ]
+
+    async def test_name_index_skips_unknown_categories(self) -> None:
+        index = CatalogNameIndex({"items": {"a": "A"}})
+
+        assert index.resolve("items", ["a", "b"]) == {"a": "A"}
+        assert index.resolve("spells", ["a"]) == {}
+        assert index.get("items", "a") == "A"
+        assert len(index) == 1
+
     async def test_catalog_list_functions_respect_filters(self) -> None:
         endpoints = [
             (catalogs.list_items, catalogs.get_item, "item_repository"),
@@ -19,6 +19,7 @@ from app.models.tool_results import (
     UpdateHPResult,
     UpdateSpellSlotsResult,
 )
+from app.services.game.entity_resolver import EntityResolver
 from tests.factories import make_game_state
 
 
@@ -26,7 +27,7 @@ class TestCharacterHandler:
     def setup_method(self) -> None:
         self.entity_state_service = create_autospec(IEntityStateService, instance=True)
         self.level_service = create_autospec(ILevelProgressionService, instance=True)
-        self.handler = EntityHandler(self.entity_state_service, self.level_service)
+        self.handler = EntityHandler(self.entity_state_service, self.level_service, EntityResolver())
         self.game_state = make_game_state()
 
     @pytest.mark.asyncio
@@ -12,6 +12,7 @@ from app.models.character import Currency
 from app.models.equipment_slots import EquipmentSlotType
 from app.models.item import InventoryItem
 from app.models.tool_results import AddItemResult, RemoveItemResult
+from app.services.game.entity_resolver import EntityResolver
 from tests.factories import make_game_state, make_npc_instance, make_npc_sheet
 
 
@@ -20,7 +21,12 @@ class TestInventoryHandler:
         self.item_manager_service = create_autospec(IItemManagerService, instance=True)
         self.entity_state_service = create_autospec(IEntityStateService, instance=True)
         self.repository_provider = create_autospec(IRepositoryProvider, instance=True)
-        self.handler = InventoryHandler(self.item_manager_service, self.entity_state_service, self.repository_provider)
+        self.handler = InventoryHandler(
+            self.item_manager_service,
+            self.entity_state_service,
+            self.repository_provider,
+            EntityResolver(),
+        )
         self.game_state = make_game_state()
         self.character_state = self.game_state.character.state
         self.player_id = self.game_state.character.instance_id
@@ -0,0 +1,45 @@
+"""Tests for the append-maintained conversation message index."""
+
+from app.agents.core.types import AgentType
+from app.models.game_state import Message, MessageRole
+from app.models.message_index import MessageIndex
+
+
+def _message(agent_type: AgentType, speaker: str | None = None, combat: int | None = None) -> Message:
+    return Message(
+        role=MessageRole.NPC if speaker else MessageRole.DM,
+        content="...",
+        agent_type=agent_type,
+        speaker_npc_id=speaker,
+        combat_occurrence=combat,
+    )
+
+
+class TestMessageIndex:
+    def test_merges_positions_across_agent_types(self) -> None:
+        history = [
+            _message(AgentType.NARRATIVE),
+            _message(AgentType.COMBAT, combat=1),
+            _message(AgentType.NPC, speaker="npc-tom"),
+            _message(AgentType.NARRATIVE),
+        ]
+        index = MessageIndex()
+        index.sync(history)
+
+        assert index.for_agents([AgentType.NARRATIVE, AgentType.NPC]) == [0, 2, 3]
+        assert index.for_agents([AgentType.NARRATIVE, AgentType.NPC], start=1) == [2, 3]
+        assert index.for_speaker("npc-tom") == [2]
+        assert index.for_combat(1) == [1]
+        assert index.for_combat(2) == []
+
+    def test_sync_indexes_appended_messages_and_rebuilds_on_new_list(self) -> None:
+        history = [_message(AgentType.NARRATIVE)]
+        index = MessageIndex()
+        index.sync(history)
+        history.append(_message(AgentType.NARRATIVE))
+        index.sync(history)
+        assert index.for_agents([AgentType.NARRATIVE]) == [0, 1]
+
+        index.sync([_message(AgentType.COMBAT)])
+        assert index.for_agents([AgentType.NARRATIVE]) == []
+        assert index.for_agents([AgentType.COMBAT]) == [0]
@@ -0,0 +1,57 @@
+"""Tests for GameState section revisions."""
+
+import pytest
+
+from app.models.state_revisions import StateRevisions, StateSection
+from tests.factories import make_game_state, make_npc_instance
+
+
+class TestStateRevisions:
+    def test_bump_is_monotonic_and_per_section(self) -> None:
+        revisions = StateRevisions()
+        base = revisions.get(StateSection.COMBAT)
+
+        first = revisions.bump(StateSection.COMBAT)
+        second = revisions.bump(StateSection.COMBAT)
+
+        assert base < first < second
+        assert revisions.get(StateSection.COMBAT) == second
+        assert revisions.get(StateSection.PARTY) == base
+
+    def test_npc_sections_need_an_id(self) -> None:
+        revisions = StateRevisions()
+
+        with pytest.raises(ValueError):
+            revisions.bump(StateSection.NPC)
+
+        revision = revisions.bump(StateSection.NPC, "npc-1")
+        assert revisions.get(StateSection.NPC, "npc-1") == revision
+        assert revisions.get(StateSection.NPC, "npc-2") == revisions.base
+
+    def test_new_states_never_reuse_revisions(self) -> None:
+        old = StateRevisions()
+        old.bump(StateSection.HISTORY)
+
+        assert StateRevisions().base > old.get(StateSection.HISTORY)
+
+
+class TestGameStateVersionVector:
+    def test_entity_bumps_route_to_sections(self) -> None:
+        game_state = make_game_state()
+        npc = make_npc_instance(instance_id="npc-guard")
+        game_state.npcs.append(npc)
+        before = game_state.version_vector()
+
+        game_state.bump_entity_revision(game_state.character.instance_id)
+        game_state.bump_entity_revision(npc.instance_id)
+        game_state.bump_entity_revision("wolf-1")
+        after = game_state.version_vector()
+
+        changed = {key for key in after if after[key] != before[key]}
+        assert changed == {"character", "npc:npc-guard", "monsters"}
+
+    def test_revisions_are_not_serialized(self) -> None:
+        game_state = make_game_state()
+        game_state.bump_revision(StateSection.PARTY)
+
+        assert "revisions" not in game_state.model_dump()
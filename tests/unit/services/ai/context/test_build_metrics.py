@@ -0,0 +1,67 @@
+"""Tests for per-builder context build instrumentation."""
+
+from unittest.mock import Mock
+
+from app.models.game_state import GameState
+from app.services.ai.context.build_metrics import BuilderTiming, ContextBuildMetrics, ContextPart
+from app.services.ai.context.builders.base import BuildContext, ContextBuilder
+from app.services.ai.context.composition import ContextComposition
+
+
+class FixedBuilder(ContextBuilder):
+    def __init__(self, output: str | None) -> None:
+        self.output = output
+
+    def build(self, game_state: GameState, context: BuildContext) -> str | None:
+        return self.output
+
+
+class EmptyContextBuilder(FixedBuilder):
+    pass
+
+
+def test_composition_reports_one_timing_per_builder_run() -> None:
+    composition = ContextComposition().add(FixedBuilder("alpha beta")).add(EmptyContextBuilder(None))
+    timings: list[BuilderTiming] = []
+
+    composition.build(Mock(spec=GameState), Mock(spec=BuildContext), timings=timings)
+
+    assert [(timing.builder, timing.chars, timing.tokens, timing.level) for timing in timings] == [
+        ("Fixed", 10, 3, "full"),
+        ("Empty", 0, 0, "empty"),
+    ]
+    assert all(timing.seconds >= 0 for timing in timings)
+
+
+def test_metrics_aggregate_per_agent_and_builder() -> None:
+    metrics = ContextBuildMetrics()
+    metrics.record("combat", [BuilderTiming("Combat", None, 0.002, 40, 10, "full")])
+    metrics.record(
+        "combat",
+        [
+            BuilderTiming("Combat", None, 0.004, 80, 20, "full"),
+            BuilderTiming("Spell", "hero", 0.001, 0, 0, "omitted"),
+        ],
+    )
+
+    snapshot = metrics.snapshot()[("combat", ContextPart.FULL)]
+
+    assert snapshot.builds == 2
+    assert snapshot.tokens == 30
+    assert snapshot.max_tokens == 20
+    combat = snapshot.builders["Combat"]
+    assert (combat.runs, combat.tokens, combat.max_tokens) == (2, 30, 20)
+    assert combat.max_seconds == 0.004
+    assert snapshot.builders["Spell"].runs == 1
+
+
+def test_split_context_parts_are_aggregated_apart() -> None:
+    metrics = ContextBuildMetrics()
+    metrics.record("narrative", [BuilderTiming("Combat", None, 0.002, 40, 10, "full")], ContextPart.VOLATILE)
+    metrics.record("narrative", [BuilderTiming("Scenario", None, 0.001, 120, 30, "full")], ContextPart.STABLE)
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot[("narrative", ContextPart.VOLATILE)].builds == 1
+    assert snapshot[("narrative", ContextPart.STABLE)].builds == 1
+    assert snapshot[("narrative", ContextPart.STABLE)].tokens == 30
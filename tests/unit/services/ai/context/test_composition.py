@@ -5,8 +5,9 @@ from unittest.mock import Mock
 from app.models.game_state import GameState
 from app.models.instances.character_instance import CharacterInstance
 from app.models.instances.npc_instance import NPCInstance
-from app.services.ai.context.builders.base import BuildContext, ContextBuilder, EntityContextBuilder
+from app.services.ai.context.builders.base import BuildContext, ContextBuilder, ContextPriority, EntityContextBuilder
 from app.services.ai.context.composition import ContextComposition
+from tests.factories import make_game_state
 
 
 class MockGameStateBuilder(ContextBuilder):
@@ -21,6 +22,42 @@ class MockGameStateBuilder(ContextBuilder):
         return self.output
 
 
+class StableGameStateBuilder(MockGameStateBuilder):
+    """Mock builder whose output belongs to the stable prefix."""
+
+    stable = True
+
+
+class SummarizingBuilder(ContextBuilder):
+    """Builder with a shorter summary variant; subclasses fix the priority."""
+
+    def __init__(self, full: str, summary: str | None) -> None:
+        self.full = full
+        self.summary = summary
+
+    def build(self, game_state: GameState, context: BuildContext) -> str | None:
+        return self.full
+
+    def build_summary(self, game_state: GameState, context: BuildContext) -> str | None:
+        return self.summary
+
+
+class RequiredBuilder(SummarizingBuilder):
+    priority = ContextPriority.REQUIRED
+
+
+class HighBuilder(SummarizingBuilder):
+    priority = ContextPriority.HIGH
+
+
+class NormalBuilder(SummarizingBuilder):
+    priority = ContextPriority.NORMAL
+
+
+class LowBuilder(SummarizingBuilder):
+    priority = ContextPriority.LOW
+
+
 class MockEntityBuilder(EntityContextBuilder):
     """Mock builder that operates on entities."""
 
@@ -215,3 +252,63 @@ class TestContextComposition:
         result = composition.build(game_state, build_context)
 
         assert result == "First\n\nSecond\n\nThird"
+
+    def test_stable_filter_splits_builders(self) -> None:
+        """The stable flag selects which builders run; None runs all of them."""
+        stable = StableGameStateBuilder("Scenario")
+        volatile = MockGameStateBuilder("Combat")
+        composition = ContextComposition().add(stable).add(volatile)
+        game_state = Mock(spec=GameState)
+        build_context = Mock(spec=BuildContext)
+
+        assert composition.build(game_state, build_context, stable=True) == "Scenario"
+        assert composition.build(game_state, build_context, stable=False) == "Combat"
+        assert composition.build(game_state, build_context) == "Scenario\n\nCombat"
+
+
+class TestTokenBudget:
+    """Budget trimming along the full → summary → omitted ladder."""
+
+    @staticmethod
+    def _build(budget: int, *builders: ContextBuilder) -> str:
+        composition = ContextComposition(token_budget=budget)
+        for builder in builders:
+            composition.add(builder)
+        return composition.build(make_game_state(), Mock(spec=BuildContext))
+
+    def test_within_budget_keeps_full_sections(self) -> None:
+        low = LowBuilder("alpha beta gamma", "alpha")
+
+        assert self._build(100, low) == "alpha beta gamma"
+
+    def test_lowest_priority_is_summarized_first(self) -> None:
+        high = HighBuilder("one two six ten", "one")
+        low = LowBuilder("red tan sky fog", "red")
+
+        # Full total is 8 tokens; summarizing the LOW section alone brings it to 5
+        assert self._build(5, high, low) == "one two six ten\n\nred"
+
+    def test_summaries_precede_omissions(self) -> None:
+        high = HighBuilder("one two six ten", "one")
+        low = LowBuilder("red tan sky fog", None)
+
+        # LOW has no summary, but HIGH's summary is tried before anything is dropped
+        assert self._build(5, high, low) == "one\n\nred tan sky fog"
+
+    def test_required_sections_are_never_trimmed(self) -> None:
+        required = RequiredBuilder("one two six ten", "one")
+        normal = NormalBuilder("red tan", "red")
+
+        assert self._build(2, required, normal) == "one two six ten"
+
+    def test_priority_override_on_registration(self) -> None:
+        builder = MockEntityBuilder("alpha beta gamma delta")
+        character = Mock(spec=CharacterInstance)
+        character.instance_id = "hero"
+        composition = (
+            ContextComposition(token_budget=1)
+            .add(RequiredBuilder("kept", None))
+            .add_for_entity(builder, character, ContextPriority.LOW)
+        )
+
+        assert composition.build(make_game_state(), Mock(spec=BuildContext)) == "kept"
@@ -0,0 +1,42 @@
+"""Tests for baseline-plus-changes context rendering."""
+
+from app.services.ai.context.delta import BASELINE_HEADER, CHANGES_HEADER, NO_CHANGES, ContextDeltaTracker
+
+PARTY = "Party:\n- Hero HP 10/10\n" + "\n".join(f"- Ally {index} HP 8/8, AC 14, speed 30" for index in range(6))
+
+
+class TestContextDeltaTracker:
+    def test_first_turn_sends_full_baseline(self) -> None:
+        tracker = ContextDeltaTracker()
+
+        delta = tracker.render("game:combat", 1, [("Combat", "Round 1"), ("Party", PARTY)])
+
+        assert delta.refreshed
+        assert delta.changes == ""
+        assert delta.baseline == f"{BASELINE_HEADER}\n\nRound 1\n\n{PARTY}"
+        assert tracker.baseline("game:combat") == delta.baseline
+
+    def test_later_turns_send_only_changed_lines(self) -> None:
+        tracker = ContextDeltaTracker()
+        tracker.render("game:combat", 1, [("Combat", "Round 1"), ("Party", PARTY)])
+
+        delta = tracker.render("game:combat", 1, [("Party", PARTY.replace("Hero HP 10/10", "Hero HP 6/10"))])
+
+        assert not delta.refreshed
+        assert delta.changes == (
+            f"{CHANGES_HEADER}\n\n## Party (changed)\n- - Hero HP 10/10\n+ - Hero HP 6/10\n\n## Combat (removed)"
+        )
+
+    def test_unchanged_context_is_reported_as_such(self) -> None:
+        tracker = ContextDeltaTracker()
+        tracker.render("game:combat", 1, [("Party", PARTY)])
+
+        assert tracker.render("game:combat", 1, [("Party", PARTY)]).changes == f"{CHANGES_HEADER}\n{NO_CHANGES}"
+
+    def test_refreshes_after_turn_limit_and_on_new_epoch(self) -> None:
+        tracker = ContextDeltaTracker(refresh_turns=1)
+        tracker.render("game:combat", 1, [("Party", PARTY)])
+
+        assert not tracker.render("game:combat", 1, [("Party", PARTY)]).refreshed
+        assert tracker.render("game:combat", 1, [("Party", PARTY)]).refreshed
+        assert tracker.render("game:combat", 2, [("Party", PARTY)]).refreshed
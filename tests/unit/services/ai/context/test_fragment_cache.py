@@ -0,0 +1,113 @@
+"""Tests for revision-keyed reuse of context builder fragments."""
+
+from typing import ClassVar
+from unittest.mock import Mock
+
+from app.models.game_state import GameState
+from app.models.instances.character_instance import CharacterInstance
+from app.models.instances.npc_instance import NPCInstance
+from app.models.state_revisions import StateSection
+from app.services.ai.context.builders.base import BuildContext, ContextBuilder, EntityContextBuilder
+from app.services.ai.context.composition import ContextComposition
+from app.services.ai.context.fragment_cache import ContextFragmentCache
+from tests.factories import make_game_state, make_npc_instance
+
+
+class CombatOnlyBuilder(ContextBuilder):
+    depends_on: ClassVar[frozenset[StateSection] | None] = frozenset({StateSection.COMBAT})
+
+    def __init__(self) -> None:
+        self.call_count = 0
+
+    def build(self, game_state: GameState, context: BuildContext) -> str | None:
+        self.call_count += 1
+        return f"combat #{self.call_count}"
+
+
+class UncachedBuilder(ContextBuilder):
+    def __init__(self) -> None:
+        self.call_count = 0
+
+    def build(self, game_state: GameState, context: BuildContext) -> str | None:
+        self.call_count += 1
+        return "always"
+
+
+class EntityOnlyBuilder(EntityContextBuilder):
+    depends_on: ClassVar[frozenset[StateSection] | None] = frozenset()
+
+    def __init__(self) -> None:
+        self.call_count = 0
+
+    def build(
+        self,
+        game_state: GameState,
+        context: BuildContext,
+        entity: CharacterInstance | NPCInstance,
+    ) -> str | None:
+        self.call_count += 1
+        return entity.instance_id
+
+
+class TestContextFragmentCache:
+    def test_reuses_fragment_until_dependency_changes(self) -> None:
+        game_state = make_game_state()
+        builder = CombatOnlyBuilder()
+        composition = ContextComposition().add(builder)
+        cache = ContextFragmentCache()
+        context = Mock(spec=BuildContext)
+
+        first = composition.build(game_state, context, cache)
+        game_state.bump_revision(StateSection.LOCATION)
+        second = composition.build(game_state, context, cache)
+        game_state.bump_revision(StateSection.COMBAT)
+        third = composition.build(game_state, context, cache)
+
+        assert first == second == "combat #1"
+        assert third == "combat #2"
+        assert (cache.totals.hits, cache.totals.misses) == (1, 2)
+
+    def test_builders_without_dependencies_always_run(self) -> None:
+        game_state = make_game_state()
+        builder = UncachedBuilder()
+        composition = ContextComposition().add(builder)
+        cache = ContextFragmentCache()
+
+        composition.build(game_state, Mock(spec=BuildContext), cache)
+        composition.build(game_state, Mock(spec=BuildContext), cache)
+
+        assert builder.call_count == 2
+        assert cache.totals.uncached == 2
+        assert cache.totals.hit_rate == 0.0
+
+    def test_entity_fragments_track_their_own_revision(self) -> None:
+        npc_a = make_npc_instance(instance_id="npc-a")
+        npc_b = make_npc_instance(instance_id="npc-b")
+        game_state = make_game_state()
+        game_state.npcs = [npc_a, npc_b]
+        builder = EntityOnlyBuilder()
+        composition = ContextComposition().add_for_entities(builder, lambda gs: list(gs.npcs))
+        cache = ContextFragmentCache()
+
+        composition.build(game_state, Mock(spec=BuildContext), cache)
+        game_state.bump_revision(StateSection.NPC, "npc-a")
+        result = composition.build(game_state, Mock(spec=BuildContext), cache)
+
+        assert result == "npc-a\n\nnpc-b"
+        assert builder.call_count == 3
+        assert cache.totals.hits == 1
+
+    def test_clear_and_game_isolation(self) -> None:
+        builder = CombatOnlyBuilder()
+        composition = ContextComposition().add(builder)
+        cache = ContextFragmentCache(max_games=1)
+        first_game = make_game_state(game_id="game-1")
+        second_game = make_game_state(game_id="game-2")
+
+        composition.build(first_game, Mock(spec=BuildContext), cache)
+        composition.build(second_game, Mock(spec=BuildContext), cache)
+        composition.build(first_game, Mock(spec=BuildContext), cache)  # Evicted by game-2
+        cache.clear()
+        composition.build(first_game, Mock(spec=BuildContext), cache)
+
+        assert builder.call_count == 4
@@ -1,5 +1,6 @@
 """Tests for NPC dialogue orchestration steps."""
 
+import asyncio
 from collections.abc import AsyncIterator
 from datetime import datetime
 from unittest.mock import create_autospec
@@ -7,7 +8,8 @@ from unittest.mock import create_autospec
 import pytest
 
 from app.agents.core.base import BaseAgent, ToolFunction
-from app.agents.core.types import AgentType
+from app.agents.core.types import AgentType, NpcDialogueMode
+from app.agents.npc.base import NPCReply
 from app.interfaces.services.ai import IAgentLifecycleService
 from app.interfaces.services.game import IConversationService, IMetadataService
 from app.models.ai_response import StreamEvent, StreamEventType
@@ -54,6 +56,32 @@ class _StubNPCAgent(BaseAgent):
         yield StreamEvent(type=StreamEventType.NARRATIVE_CHUNK, content=self.response_content)
 
 
+class _StubConcurrentNPCAgent(_StubNPCAgent):
+    """Stub NPC agent that generates replies after a delay and logs the call order."""
+
+    def __init__(self, response_content: str, delay: float, log: list[str]) -> None:
+        super().__init__(response_content)
+        self.delay = delay
+        self.log = log
+        self._current: NPCInstance | None = None
+
+    def prepare_for_npc(self, npc: NPCInstance) -> None:
+        super().prepare_for_npc(npc)
+        self._current = npc
+
+    async def generate_reply(self, prompt: str, game_state: GameState, stream: bool = True) -> NPCReply:
+        assert self._current is not None
+        npc, self._current = self._current, None
+        self.log.append(f"start {npc.instance_id}")
+        await asyncio.sleep(self.delay)
+        self.log.append(f"done {npc.instance_id}")
+        return NPCReply(npc=npc, text=f"{self.response_content} ({npc.instance_id})")
+
+    async def deliver_reply(self, game_state: GameState, reply: NPCReply) -> StreamEvent:
+        self.log.append(f"deliver {reply.npc.instance_id}")
+        return StreamEvent(type=StreamEventType.COMPLETE, content=reply.text)
+
+
 class TestDetectNpcDialogueTargets:
     """Tests for DetectNpcDialogueTargets step."""
 
@@ -399,3 +427,77 @@ class TestExecuteNpcDialogue:
         assert result.reason == "No NPC targets to process"
         self.conversation_service.record_message.assert_not_called()
         self.agent_lifecycle_service.get_npc_agent.assert_not_called()
+
+
+class TestExecuteNpcDialogueParallel:
+    """Tests for ExecuteNpcDialogue in parallel mode."""
+
+    def setup_method(self) -> None:
+        self.game_state = make_game_state(game_id="test-game")
+        self.agent_lifecycle_service = create_autospec(IAgentLifecycleService, instance=True)
+        self.conversation_service = create_autospec(IConversationService, instance=True)
+        self.step = ExecuteNpcDialogue(
+            self.agent_lifecycle_service,
+            self.conversation_service,
+            NpcDialogueMode.PARALLEL,
+        )
+        location_id = self.game_state.scenario_instance.current_location_id
+        self.tom = make_npc_instance(
+            npc_sheet=make_npc_sheet(npc_id="npc-tom", display_name="Tom"),
+            instance_id="npc-tom-123",
+            current_location_id=location_id,
+        )
+        self.sara = make_npc_instance(
+            npc_sheet=make_npc_sheet(npc_id="npc-sara", display_name="Sara"),
+            instance_id="npc-sara-456",
+            current_location_id=location_id,
+        )
+        self.game_state.npcs.extend([self.tom, self.sara])
+        self.ctx = OrchestrationContext(
+            user_message="@Tom @Sara hello",
+            game_state=self.game_state,
+            flags=OrchestrationFlags(npc_targets=[self.tom.instance_id, self.sara.instance_id]),
+        )
+
+    @pytest.mark.asyncio
+    async def test_runs_agents_concurrently_and_delivers_in_target_order(self) -> None:
+        log: list[str] = []
+        self.agent_lifecycle_service.get_npc_agent.side_effect = [
+            _StubConcurrentNPCAgent("Tom says hi!", delay=0.05, log=log),
+            _StubConcurrentNPCAgent("Sara waves!", delay=0.0, log=log),
+        ]
+
+        result = await self.step.run(self.ctx)
+
+        assert result.outcome == OrchestrationOutcome.HALT
+        # Sara finishes first, but replies are delivered in target order after both completed
+        assert log == [
+            "start npc-tom-123",
+            "start npc-sara-456",
+            "done npc-sara-456",
+            "done npc-tom-123",
+            "deliver npc-tom-123",
+            "deliver npc-sara-456",
+        ]
+        assert [event.content for event in result.context.events] == [
+            "Tom says hi! (npc-tom-123)",
+            "Sara waves! (npc-sara-456)",
+        ]
+        assert self.game_state.dialogue_session.last_interaction_at is not None
+
+    @pytest.mark.asyncio
+    async def test_npcs_sharing_an_agent_take_turns(self) -> None:
+        log: list[str] = []
+        puppeteer = _StubConcurrentNPCAgent("Hm.", delay=0.0, log=log)
+        self.agent_lifecycle_service.get_npc_agent.return_value = puppeteer
+
+        await self.step.run(self.ctx)
+
+        assert log == [
+            "start npc-tom-123",
+            "done npc-tom-123",
+            "start npc-sara-456",
+            "done npc-sara-456",
+            "deliver npc-tom-123",
+            "deliver npc-sara-456",
+        ]
@@ -0,0 +1,116 @@
+"""Tests for the sliding-window conversation history."""
+
+from collections.abc import Sequence
+from typing import cast
+
+import pytest
+from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
+
+from app.agents.core.types import AgentType
+from app.interfaces.agents.summarizer import ISummarizerAgent
+from app.models.game_state import GameState, Message, MessageRole
+from app.models.history_summary import HistorySummary
+from app.services.ai.history_window_service import (
+    COMPACTION_BATCH_TURNS,
+    SUMMARY_HEADER,
+    HistoryWindowPolicy,
+    HistoryWindowService,
+)
+from app.services.ai.message_converter_service import MessageConverterService
+from tests.factories import make_game_state
+
+
+class _RecordingSummarizer:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, list[str]]] = []
+
+    async def summarize_history(
+        self,
+        game_state: GameState,
+        previous_summary: str,
+        messages: Sequence[Message],
+        max_tokens: int,
+    ) -> str:
+        self.calls.append((previous_summary, [msg.content for msg in messages]))
+        return f"{previous_summary} +{len(messages)}".strip()
+
+
+def _text(message: ModelRequest | ModelResponse) -> str:
+    part = message.parts[0]
+    assert isinstance(part, UserPromptPart | TextPart)
+    return str(part.content)
+
+
+def _add_turns(game_state: GameState, count: int, agent_type: AgentType = AgentType.NARRATIVE) -> None:
+    for turn in range(count):
+        game_state.conversation_history.append(
+            Message(role=MessageRole.PLAYER, content=f"player {turn}", agent_type=agent_type)
+        )
+        game_state.conversation_history.append(
+            Message(role=MessageRole.DM, content=f"dm {turn}", agent_type=agent_type)
+        )
+
+
+def _service(summarizer: _RecordingSummarizer, recent_turns: int = 2, max_tokens: int = 1000) -> HistoryWindowService:
+    policy = HistoryWindowPolicy(recent_turns=recent_turns, max_tokens=max_tokens)
+    return HistoryWindowService(
+        MessageConverterService(),
+        lambda: cast(ISummarizerAgent, summarizer),
+        {AgentType.NARRATIVE: policy},
+    )
+
+
+class TestHistoryWindowService:
+    def test_summary_precedes_uncovered_messages(self) -> None:
+        game_state = make_game_state()
+        _add_turns(game_state, 3)
+        game_state.history_summaries["narrative"] = HistorySummary(summary="The party met Tom.", covered_messages=4)
+
+        history = _service(_RecordingSummarizer()).build_message_history(game_state, AgentType.NARRATIVE)
+
+        assert [_text(message) for message in history] == [
+            f"{SUMMARY_HEADER}\nThe party met Tom.",
+            "player 2",
+            "dm 2",
+        ]
+
+    def test_token_ceiling_keeps_newest_messages(self) -> None:
+        game_state = make_game_state()
+        _add_turns(game_state, 3)
+
+        # "player N" costs 3 tokens and "dm N" 2, so only the last turn fits
+        history = _service(_RecordingSummarizer(), max_tokens=5).build_message_history(game_state, AgentType.NARRATIVE)
+
+        assert [_text(message) for message in history] == ["player 2", "dm 2"]
+
+    def test_agents_without_policy_get_full_history(self) -> None:
+        game_state = make_game_state()
+        _add_turns(game_state, 3, agent_type=AgentType.COMBAT)
+
+        history = _service(_RecordingSummarizer()).build_message_history(game_state, AgentType.COMBAT)
+
+        assert len(history) == 6
+
+    @pytest.mark.asyncio
+    async def test_old_turns_are_folded_in_background(self) -> None:
+        game_state = make_game_state()
+        summarizer = _RecordingSummarizer()
+        service = _service(summarizer, recent_turns=2)
+        _add_turns(game_state, 2 + COMPACTION_BATCH_TURNS)
+
+        service.build_message_history(game_state, AgentType.NARRATIVE)
+        await service.wait_for_compactions()
+        assert summarizer.calls == []
+
+        _add_turns(game_state, 1)
+        first = service.build_message_history(game_state, AgentType.NARRATIVE)
+        await service.wait_for_compactions()
+        second = service.build_message_history(game_state, AgentType.NARRATIVE)
+
+        # The triggering call is still served verbatim; the next one uses the summary
+        assert len(first) == 2 * (3 + COMPACTION_BATCH_TURNS)
+        assert len(summarizer.calls) == 1
+        assert len(summarizer.calls[0][1]) == 2 * (1 + COMPACTION_BATCH_TURNS)
+        assert _text(second[0]) == f"{SUMMARY_HEADER}\n+{2 * (1 + COMPACTION_BATCH_TURNS)}"
+        assert len(second) == 1 + 2 * 2
+        assert game_state.history_summaries["narrative"].covered_messages == len(game_state.conversation_history) - 4
@@ -0,0 +1,77 @@
+"""Unit tests for the shared LLM HTTP client and its pool metrics."""
+
+from typing import Any
+
+import httpx
+import pytest
+
+from app.services.ai.http_client import HttpPoolMetrics, InstrumentedTransport, create_llm_http_client
+
+
+def _client(metrics: HttpPoolMetrics, new_connections: list[bool]) -> httpx.AsyncClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        trace = request.extensions["trace"]
+        if new_connections.pop(0):
+            info: dict[str, Any] = {}
+            await trace("connection.connect_tcp.complete", info)
+            await trace("connection.start_tls.complete", info)
+        return httpx.Response(200, json={"ok": True}, extensions={"http_version": b"HTTP/1.1"})
+
+    return httpx.AsyncClient(transport=InstrumentedTransport(httpx.MockTransport(handler), metrics))
+
+
+@pytest.mark.asyncio
+async def test_counts_reused_connections() -> None:
+    metrics = HttpPoolMetrics(max_connections=4)
+    async with _client(metrics, [True, False, False]) as client:
+        for _ in range(3):
+            response = await client.get("https://example.test/")
+            assert response.json() == {"ok": True}
+
+    snapshot = metrics.snapshot()
+    assert snapshot.requests == 3
+    assert snapshot.connections_opened == 1
+    assert snapshot.tls_handshakes == 1
+    assert snapshot.reused == 2
+    assert snapshot.reuse_ratio == pytest.approx(2 / 3)
+    assert snapshot.in_flight == 0
+    assert snapshot.http_versions == {"HTTP/1.1": 3}
+
+
+@pytest.mark.asyncio
+async def test_streamed_response_holds_connection_until_closed() -> None:
+    metrics = HttpPoolMetrics(max_connections=4)
+    async with _client(metrics, [True]) as client, client.stream("GET", "https://example.test/") as response:
+        assert metrics.snapshot().in_flight == 1
+        assert metrics.snapshot().utilization == pytest.approx(0.25)
+        await response.aread()
+
+    snapshot = metrics.snapshot()
+    assert snapshot.in_flight == 0
+    assert snapshot.peak_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_request_counts_error() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    metrics = HttpPoolMetrics()
+    async with httpx.AsyncClient(transport=InstrumentedTransport(httpx.MockTransport(handler), metrics)) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://example.test/")
+
+    snapshot = metrics.snapshot()
+    assert snapshot.errors == 1
+    assert snapshot.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_create_falls_back_to_http1_without_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.services.ai.http_client.http2_available", lambda: False)
+    metrics = HttpPoolMetrics()
+
+    client = create_llm_http_client(metrics, http2=True, max_connections=7)
+
+    assert metrics.max_connections == 7
+    await client.aclose()
@@ -0,0 +1,126 @@
+"""Unit tests for the record/replay/cache layer around agent model calls."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelMessage, ModelRequest, ModelResponse, TextPart, UserPromptPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from app.agents.core.types import AgentType, LlmCacheMode
+from app.services.ai.llm_cache import CachedModel, LlmCallCache, LlmReplayMissError
+
+
+def _prompt_text(messages: list[ModelMessage]) -> str:
+    request = messages[-1]
+    assert isinstance(request, ModelRequest)
+    part = request.parts[-1]
+    assert isinstance(part, UserPromptPart)
+    return str(part.content)
+
+
+def _counting_model(calls: list[str], delay: float = 0.0) -> FunctionModel:
+    async def reply(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        prompt = _prompt_text(messages)
+        calls.append(prompt)
+        await asyncio.sleep(delay)
+        return ModelResponse(parts=[TextPart(f"Summary of {prompt}")])
+
+    async def stream_reply(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+        calls.append(_prompt_text(messages))
+        for piece in ("The goblins ", "flee."):
+            yield piece
+
+    return FunctionModel(reply, stream_function=stream_reply, model_name="summarizer-model")
+
+
+def _offline_model() -> FunctionModel:
+    def reply(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        raise AssertionError("Replay must not call the model")
+
+    return FunctionModel(reply, model_name="summarizer-model")
+
+
+@pytest.mark.asyncio
+async def test_cache_mode_serves_repeated_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("app.services.ai.llm_cache.time.monotonic", lambda: now[0])
+    calls: list[str] = []
+    cache = LlmCallCache(LlmCacheMode.CACHE, ttl_seconds=60)
+    agent = Agent(CachedModel(_counting_model(calls), cache))
+
+    first = await agent.run("the ambush")
+    second = await agent.run("the ambush")
+    await agent.run("the feast")
+    now[0] += 61
+    await agent.run("the ambush")
+
+    assert first.output == second.output == "Summary of the ambush"
+    assert calls == ["the ambush", "the feast", "the ambush"]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+
+
+@pytest.mark.asyncio
+async def test_cache_mode_does_not_store_empty_responses() -> None:
+    replies = iter(["  ", "The goblins flee."])
+    calls: list[str] = []
+
+    def reply(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        calls.append(_prompt_text(messages))
+        return ModelResponse(parts=[TextPart(next(replies))])
+
+    cache = LlmCallCache(LlmCacheMode.CACHE)
+    agent = Agent(CachedModel(FunctionModel(reply, model_name="summarizer-model"), cache))
+
+    empty = await agent.run("the ambush")
+    retried = await agent.run("the ambush")
+    cached = await agent.run("the ambush")
+
+    assert (empty.output, retried.output, cached.output) == ("  ", "The goblins flee.", "The goblins flee.")
+    assert calls == ["the ambush", "the ambush"]
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_in_flight_call_model_once() -> None:
+    calls: list[str] = []
+    cache = LlmCallCache(LlmCacheMode.CACHE)
+    agent = Agent(CachedModel(_counting_model(calls, delay=0.05), cache))
+
+    results = await asyncio.gather(*(agent.run("the ambush") for _ in range(3)))
+
+    assert [result.output for result in results] == ["Summary of the ambush"] * 3
+    assert calls == ["the ambush"]
+    assert cache.stats.shared == 2
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay_offline(tmp_path: Path) -> None:
+    calls: list[str] = []
+    recorder = Agent(CachedModel(_counting_model(calls), LlmCallCache(LlmCacheMode.RECORD, directory=tmp_path)))
+    recorded = await recorder.run("the ambush")
+    async with recorder.run_stream("the retreat") as stream:
+        recorded_stream = await stream.get_output()
+
+    replay_cache = LlmCallCache(LlmCacheMode.REPLAY, directory=tmp_path)
+    replayer = Agent(CachedModel(_offline_model(), replay_cache))
+    replayed = await replayer.run("the ambush")
+    async with replayer.run_stream("the retreat") as stream:
+        replayed_stream = await stream.get_output()
+
+    assert len(list(tmp_path.glob("*.json"))) == 2
+    assert replayed.output == recorded.output == "Summary of the ambush"
+    assert replayed_stream == recorded_stream == "The goblins flee."
+    assert replay_cache.stats.hits == 2
+    with pytest.raises(LlmReplayMissError):
+        await replayer.run("the feast")
+
+
+def test_cache_mode_applies_to_listed_agents_only(tmp_path: Path) -> None:
+    cache = LlmCallCache(LlmCacheMode.CACHE, cached_agents=[AgentType.SUMMARIZER])
+    recorder = LlmCallCache(LlmCacheMode.RECORD, directory=tmp_path)
+
+    assert cache.applies_to(AgentType.SUMMARIZER)
+    assert not cache.applies_to(AgentType.NARRATIVE)
+    assert recorder.applies_to(AgentType.NARRATIVE)
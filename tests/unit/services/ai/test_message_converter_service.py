@@ -29,12 +29,8 @@ def test_narrative_history_includes_npc_dialogue() -> None:
         ),
     ]
 
-    result = converter.to_pydantic_messages(
-        messages=messages,
-        agent_type=AgentType.NARRATIVE,
-        game_state=game_state,
-        npc_id="",
-    )
+    game_state.conversation_history.extend(messages)
+    result = converter.convert_history(game_state, AgentType.NARRATIVE)
 
     assert len(result) == 2
     assert isinstance(result[0], ModelRequest)
@@ -67,12 +63,8 @@ def test_npc_history_keeps_other_npc_responses() -> None:
         ),
     ]
 
-    result = converter.to_pydantic_messages(
-        messages=messages,
-        agent_type=AgentType.NPC,
-        game_state=game_state,
-        npc_id="npc-123",
-    )
+    game_state.conversation_history.extend(messages)
+    result = converter.convert_history(game_state, AgentType.NPC, npc_id="npc-123")
 
     # Narrative DM line should be filtered out for NPC agents
     assert len(result) == 3
@@ -96,12 +88,8 @@ def test_speaker_prefix_not_duplicated() -> None:
         ),
     ]
 
-    result = converter.to_pydantic_messages(
-        messages=messages,
-        agent_type=AgentType.NPC,
-        game_state=game_state,
-        npc_id="tom-id",
-    )
+    game_state.conversation_history.extend(messages)
+    result = converter.convert_history(game_state, AgentType.NPC, npc_id="tom-id")
 
     assert len(result) == 1
     assert isinstance(result[0], ModelResponse)
@@ -132,12 +120,8 @@ def test_npc_in_party_sees_narrative_messages() -> None:
         ),
     ]
 
-    result = converter.to_pydantic_messages(
-        messages=messages,
-        agent_type=AgentType.NPC,
-        game_state=game_state,
-        npc_id=npc_id,
-    )
+    game_state.conversation_history.extend(messages)
+    result = converter.convert_history(game_state, AgentType.NPC, npc_id=npc_id)
 
     # NPC in party should see all three messages
     assert len(result) == 3
@@ -172,12 +156,8 @@ def test_npc_not_in_party_excludes_narrative_messages() -> None:
         ),
     ]
 
-    result = converter.to_pydantic_messages(
-        messages=messages,
-        agent_type=AgentType.NPC,
-        game_state=game_state,
-        npc_id=npc_id,
-    )
+    game_state.conversation_history.extend(messages)
+    result = converter.convert_history(game_state, AgentType.NPC, npc_id=npc_id)
 
     # NPC not in party should NOT see narrative DM message
     assert len(result) == 2
@@ -185,3 +165,36 @@ def test_npc_not_in_party_excludes_narrative_messages() -> None:
     assert _first_part_content(result[0]) == "@Guard hello"
     assert isinstance(result[1], ModelResponse)
     assert _first_part_content(result[1]) == "Guard: What do you want?"
+
+
+def test_convert_history_extends_cached_view_with_new_messages() -> None:
+    converter = MessageConverterService()
+    game_state = make_game_state()
+    history = game_state.conversation_history
+    history.append(Message(role=MessageRole.PLAYER, content="Hello", agent_type=AgentType.NARRATIVE))
+    history.append(Message(role=MessageRole.DM, content="Combat only", agent_type=AgentType.COMBAT))
+
+    first = converter.convert_history(game_state, AgentType.NARRATIVE)
+    history.append(Message(role=MessageRole.DM, content="Welcome", agent_type=AgentType.NARRATIVE))
+    second = converter.convert_history(game_state, AgentType.NARRATIVE)
+
+    assert [_first_part_content(message) for message in second] == ["Hello", "Welcome"]
+    # Earlier conversions are reused rather than rebuilt
+    assert second[0] is first[0]
+    assert [
+        _first_part_content(message) for message in converter.convert_history(game_state, AgentType.NARRATIVE, start=1)
+    ] == ["Welcome"]
+
+
+def test_convert_history_rebuilds_when_history_is_replaced() -> None:
+    converter = MessageConverterService()
+    game_state = make_game_state()
+    game_state.conversation_history.append(
+        Message(role=MessageRole.PLAYER, content="Old", agent_type=AgentType.NARRATIVE)
+    )
+    converter.convert_history(game_state, AgentType.NARRATIVE)
+
+    game_state.conversation_history = [Message(role=MessageRole.PLAYER, content="New", agent_type=AgentType.NARRATIVE)]
+
+    result = converter.convert_history(game_state, AgentType.NARRATIVE)
+    assert [_first_part_content(message) for message in result] == ["New"]
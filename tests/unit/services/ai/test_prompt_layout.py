@@ -0,0 +1,52 @@
+"""Tests for prompt layouts and prefix reuse tracking."""
+
+from pydantic_ai.messages import ModelMessage, ModelRequest, ModelResponse, SystemPromptPart, TextPart, UserPromptPart
+
+from app.agents.core.types import PromptLayout
+from app.services.ai.prompt_layout import PromptPrefixTracker, PromptSegment, arrange_prompt
+
+HISTORY: list[ModelMessage] = [
+    ModelRequest(parts=[UserPromptPart(content="I open the door.")]),
+    ModelResponse(parts=[TextPart(content="It creaks open.")]),
+]
+
+
+class TestArrangePrompt:
+    def test_inline_sends_context_with_player_line(self) -> None:
+        arranged = arrange_prompt(PromptLayout.INLINE, "You are the DM.", HISTORY, "", "HP 10/10", "Player: Hi")
+
+        assert arranged.message_history == HISTORY
+        assert arranged.user_prompt == "\n\nHP 10/10\n\nPlayer: Hi"
+
+    def test_prefix_stable_orders_most_stable_first(self) -> None:
+        arranged = arrange_prompt(
+            PromptLayout.PREFIX_STABLE, "You are the DM.", HISTORY, "# Scenario", "HP 10/10", "Player: Hi"
+        )
+
+        prefix = arranged.message_history[0]
+        assert isinstance(prefix, ModelRequest)
+        assert isinstance(prefix.parts[0], SystemPromptPart)
+        assert prefix.parts[0].content == "You are the DM."
+        assert isinstance(prefix.parts[1], UserPromptPart)
+        assert prefix.parts[1].content == "# Scenario"
+        assert arranged.message_history[1:] == HISTORY
+        assert arranged.user_prompt == "HP 10/10\n\nPlayer: Hi"
+        assert [segment.name for segment in arranged.segments] == [
+            "system",
+            "stable_context",
+            "history[0]",
+            "history[1]",
+            "volatile_context",
+            "player",
+        ]
+
+
+class TestPromptPrefixTracker:
+    def test_counts_leading_segments_shared_with_previous_call(self) -> None:
+        tracker = PromptPrefixTracker()
+        first = [PromptSegment("system", "a"), PromptSegment("history[0]", "b"), PromptSegment("player", "c")]
+        second = [PromptSegment("system", "a"), PromptSegment("history[0]", "b"), PromptSegment("player", "d")]
+
+        assert tracker.record("game:narrative", first) == 0
+        assert tracker.record("game:narrative", second) == 2
+        assert tracker.record("game:combat", second) == 0
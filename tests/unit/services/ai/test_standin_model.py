@@ -0,0 +1,138 @@
+"""Unit tests for the scripted local stand-in model."""
+
+import random
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic_ai import Agent, RunContext
+from pydantic_ai.messages import AgentStreamEvent, HandleResponseEvent
+
+from app.agents.core.types import AgentType
+from app.models.game_state import GameState
+from app.models.memory import LocationExitSummary
+from app.models.standin_script import LatencyDistribution, LatencyProfile, StandInScript
+from app.services.ai.standin_model import StandInModel
+from app.utils.token_estimator import estimate_tokens
+from tests.factories import make_game_state
+
+
+@dataclass
+class _Deps:
+    game_state: GameState
+
+
+async def _ignore_events(ctx: RunContext[Any], events: AsyncIterable[AgentStreamEvent | HandleResponseEvent]) -> None:
+    async for _ in events:
+        pass
+
+
+def _script(**overrides: Any) -> StandInScript:
+    return StandInScript.model_validate(
+        {
+            "agents": {
+                "combat": {
+                    "turns": [
+                        {
+                            "tool_calls": [
+                                {"tool": "cast_fireball", "args": {}},
+                                {"tool": "update_hp", "args": {"entity_id": "{player_id}", "amount": -3}},
+                                {"tool": "update_hp", "args": {"entity_id": "{enemy_id}", "amount": -5}},
+                            ],
+                            "text": "The goblin strikes.",
+                        },
+                        {"text": "The goblin flees."},
+                    ]
+                }
+            },
+            **overrides,
+        }
+    )
+
+
+def _combat_agent(model: StandInModel, calls: list[tuple[str, int]]) -> Agent[_Deps, str]:
+    agent: Agent[_Deps, str] = Agent(model, deps_type=_Deps)
+
+    @agent.tool
+    async def update_hp(ctx: RunContext[_Deps], entity_id: str, amount: int) -> str:
+        calls.append((entity_id, amount))
+        return "ok"
+
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_plays_scripted_tool_calls_then_rotates_turns() -> None:
+    game_state = make_game_state()
+    calls: list[tuple[str, int]] = []
+    agent = _combat_agent(StandInModel(AgentType.COMBAT, _script()), calls)
+
+    first = await agent.run("Attack!", deps=_Deps(game_state), event_stream_handler=_ignore_events)
+    second = await agent.run("Attack!", deps=_Deps(game_state), event_stream_handler=_ignore_events)
+
+    # The unknown tool and the call without an enemy to fill {enemy_id} are skipped
+    assert calls == [(game_state.character.instance_id, -3)]
+    assert first.output == "The goblin strikes."
+    assert second.output == "The goblin flees."
+
+
+@pytest.mark.asyncio
+async def test_non_streamed_runs_skip_calls_with_placeholders() -> None:
+    calls: list[tuple[str, int]] = []
+    agent = _combat_agent(StandInModel(AgentType.COMBAT, _script()), calls)
+
+    result = await agent.run("Attack!", deps=_Deps(make_game_state()))
+
+    assert calls == []
+    assert result.output == "The goblin strikes."
+
+
+@pytest.mark.asyncio
+async def test_structured_output_is_built_from_script_text() -> None:
+    script = StandInScript.model_validate({"agents": {"summarizer": {"turns": [{"text": "The party rested."}]}}})
+    agent = Agent(StandInModel(AgentType.SUMMARIZER, script))
+
+    result = await agent.run("Summarize", output_type=LocationExitSummary)
+
+    assert result.output == LocationExitSummary(location_summary="The party rested.")
+
+
+@pytest.mark.asyncio
+async def test_waits_latency_then_streams_at_token_throughput(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("app.services.ai.standin_model.asyncio.sleep", fake_sleep)
+    script = _script(latency={"mean_ms": 250}, tokens_per_second=10)
+    agent = _combat_agent(StandInModel(AgentType.COMBAT, script), [])
+    deps = _Deps(make_game_state())
+    await agent.run("Attack!", deps=deps, event_stream_handler=_ignore_events)
+
+    second = await agent.run("Attack!", deps=deps, event_stream_handler=_ignore_events)
+
+    assert second.output == "The goblin flees."
+    assert sleeps[-4] == pytest.approx(0.25)
+    assert sum(sleeps[-3:]) == pytest.approx(estimate_tokens("The goblin flees.") / 10)
+
+
+def test_latency_samples_are_reproducible_and_non_negative() -> None:
+    profile = LatencyProfile(distribution=LatencyDistribution.NORMAL, mean_ms=50, spread_ms=100)
+
+    first = [profile.sample(random.Random(7)) for _ in range(3)]
+    samples = [profile.sample(random.Random(seed)) for seed in range(200)]
+
+    assert first == [first[0]] * 3
+    assert min(samples) == 0.0
+    assert max(samples) > 0.05
+
+
+def test_example_script_is_valid() -> None:
+    script_path = Path(__file__).resolve().parents[4] / "scripts" / "standin_script.json"
+
+    script = StandInScript.model_validate_json(script_path.read_text(encoding="utf-8"))
+
+    assert set(script.agents) == {AgentType.NARRATIVE, AgentType.COMBAT, AgentType.NPC, AgentType.SUMMARIZER}
@@ -13,13 +13,14 @@ from app.models.instances.entity_state import EntityState
 from app.models.item import InventoryItem
 from app.models.spell import Spellcasting, SpellcastingAbility, SpellSlot
 from app.services.character.entity_state_service import EntityStateService
+from app.services.game.entity_resolver import EntityResolver
 from tests.factories import make_game_state, make_monster_instance, make_npc_instance
 
 
 class TestEntityStateService:
     def setup_method(self) -> None:
         self.compute_service = create_autospec(ICharacterComputeService, instance=True)
-        self.service = EntityStateService(self.compute_service)
+        self.service = EntityStateService(self.compute_service, EntityResolver())
         self.game_state = make_game_state()
         self.character = self.game_state.character
         self.character_id = self.character.instance_id
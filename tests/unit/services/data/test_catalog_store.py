@@ -0,0 +1,91 @@
+"""Unit tests for memory-mapped compiled catalogs."""
+
+from __future__ import annotations
+
+import gc
+import json
+from pathlib import Path
+from typing import Any
+
+from app.services.common.path_resolver import PathResolver
+from app.services.data.catalog_store import CatalogEntry, CompiledCatalog, LazyCatalogCache, write_catalog
+from app.services.data.content_pack_registry import ContentPackRegistry
+from app.services.data.repositories.language_repository import LanguageRepository
+
+
+def _write_languages(data_dir: Path, names: dict[str, str]) -> None:
+    data_dir.mkdir(parents=True, exist_ok=True)
+    (data_dir / "metadata.json").write_text(
+        json.dumps({"id": "srd", "name": "SRD", "version": "1", "author": "t", "description": "", "pack_type": "srd"}),
+        encoding="utf-8",
+    )
+    languages = [
+        {"index": index, "name": name, "type": "Standard", "content_pack": "srd", "reference_packs": []}
+        for index, name in names.items()
+    ]
+    (data_dir / "languages.json").write_text(json.dumps({"languages": languages}), encoding="utf-8")
+
+
+class TestCompiledCatalog:
+    def test_round_trip_decodes_entries_on_access(self, tmp_path: Path) -> None:
+        path = tmp_path / "catalog.cat"
+        write_catalog(
+            path,
+            [
+                CatalogEntry(key="common", pack_id="srd", data={"name": "Common"}),
+                CatalogEntry(key="élan", pack_id="homebrew", data={"name": "Élan", "tags": [1, 2]}),
+            ],
+        )
+
+        catalog = CompiledCatalog(path)
+        assert catalog.keys() == ["common", "élan"]
+        assert catalog.pack_ids() == {"common": "srd", "élan": "homebrew"}
+        assert catalog.read("élan") == {"name": "Élan", "tags": [1, 2]}
+
+        parsed: list[dict[str, Any]] = []
+
+        def parse(data: dict[str, Any]) -> str:
+            parsed.append(data)
+            return str(data["name"])
+
+        cache = LazyCatalogCache(catalog, parse)
+        assert "common" in cache and len(cache) == 2
+        assert cache.decoded_count == 0
+        assert cache["common"] == "Common"
+        assert cache["common"] == "Common"
+        assert len(parsed) == 1
+        assert sorted(cache.values()) == ["Common", "Élan"]
+
+    def test_repository_compiles_once_and_recompiles_when_sources_change(self, tmp_path: Path) -> None:
+        data_dir = tmp_path / "data"
+        catalog_dir = tmp_path / "catalogs"
+        _write_languages(data_dir, {"common": "Common", "elvish": "Elvish"})
+        registry = ContentPackRegistry(PathResolver(tmp_path), compiled_catalog_dir=catalog_dir)
+
+        first = LanguageRepository(PathResolver(tmp_path), content_pack_registry=registry, content_packs=["srd"])
+        assert first.list_keys() == ["common", "elvish"]
+        assert first.get_name("elvish") == "Elvish"
+        assert first.get_item_pack_id("common") == "srd"
+        compiled = list(catalog_dir.glob("languages-*.cat"))
+        assert len(compiled) == 1
+
+        # A second repository (e.g. another worker) maps the existing file
+        second = LanguageRepository(PathResolver(tmp_path), content_pack_registry=registry, content_packs=["srd"])
+        assert second.get_name("common") == "Common"
+        assert list(catalog_dir.glob("languages-*.cat")) == compiled
+
+        _write_languages(data_dir, {"common": "Trade Common"})
+        previous = first._cache
+        assert isinstance(previous, LazyCatalogCache)
+        first.reload()
+        # A reader that captured the old cache can still decode entries it had not touched
+        assert not previous._catalog.closed
+        assert previous["common"].name == "Common"
+        mapping = previous._catalog._mmap
+        del previous
+        gc.collect()
+        assert mapping.closed
+        assert first.list_keys() == ["common"]
+        assert first.get_name("common") == "Trade Common"
+        recompiled = list(catalog_dir.glob("languages-*.cat"))
+        assert len(recompiled) == 1 and recompiled != compiled
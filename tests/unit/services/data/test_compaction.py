@@ -0,0 +1,51 @@
+"""Unit tests for catalog compaction."""
+
+from pydantic import BaseModel
+
+from app.models.attributes import Abilities
+from app.services.data.compaction import CatalogCompactor, deep_sizeof
+
+
+class _Entry(BaseModel):
+    index: str
+    school: str
+    abilities: Abilities
+    tags: list[str] = []
+    ratio: float | None = None
+
+
+def _entry(index: str, ratio: float | None = None) -> _Entry:
+    # Build strings at runtime so equal values start out as distinct objects
+    return _Entry(
+        index=index,
+        school="".join(["evo", "cation"]),
+        abilities=Abilities(STR=10, DEX=12, CON=14, INT=8, WIS=10, CHA=10),
+        tags=["".join(["dam", "age"])],
+        ratio=ratio,
+    )
+
+
+class TestCatalogCompactor:
+    def test_shares_equal_values_without_changing_content(self) -> None:
+        first, second = _entry("fireball"), _entry("lightning-bolt")
+        dumps = [first.model_dump(), second.model_dump()]
+        size_before = deep_sizeof([first, second])
+
+        compactor = CatalogCompactor()
+        compacted = [compactor.compact(first), compactor.compact(second)]
+
+        assert compacted == [first, second]
+        assert [item.model_dump() for item in compacted] == dumps
+        assert first.school is second.school
+        assert first.abilities is second.abilities
+        assert first.tags is second.tags
+        assert deep_sizeof(compacted) < size_before
+
+    def test_keeps_values_of_different_types_apart(self) -> None:
+        compactor = CatalogCompactor()
+        first = compactor.compact(_entry("a", ratio=1.0))
+        second = compactor.compact(_entry("b", ratio=None))
+
+        assert first.ratio == 1.0
+        assert second.ratio is None
+        assert first is not second
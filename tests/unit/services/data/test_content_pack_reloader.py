@@ -0,0 +1,147 @@
+"""Unit tests for content pack change detection and hot reload."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from app.models.game_state import GameState
+from app.services.common.path_resolver import PathResolver
+from app.services.data.content_pack_registry import ContentPackRegistry
+from app.services.data.content_pack_reloader import ContentPackReloader
+from app.services.data.content_pack_watcher import ContentPackWatcher
+from app.services.data.repositories.language_repository import LanguageRepository
+from app.services.data.repository_factory import RepositoryFactory, repositories_to_reload
+from tests.factories import make_game_state
+
+
+def _language(index: str, name: str, pack: str = "srd") -> dict[str, Any]:
+    return {"index": index, "name": name, "type": "Standard", "content_pack": pack, "reference_packs": []}
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _write_pack_metadata(pack_dir: Path, pack_id: str, dependencies: list[str] | None = None) -> None:
+    _write_json(
+        pack_dir / "metadata.json",
+        {
+            "id": pack_id,
+            "name": pack_id,
+            "version": "1.0.0",
+            "author": "tests",
+            "description": "",
+            "pack_type": "srd" if pack_id == "srd" else "custom",
+            "dependencies": dependencies or [],
+        },
+    )
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestContentPackReload:
+    def setup_method(self) -> None:
+        self.game_state: GameState = make_game_state()
+
+    def _setup_tree(self, root: Path) -> tuple[Path, Path]:
+        data_dir = root / "data"
+        user_packs = root / "user-data" / "packs"
+        _write_pack_metadata(data_dir, "srd")
+        _write_json(data_dir / "languages.json", {"languages": [_language("common", "Common")]})
+        return data_dir, user_packs
+
+    def test_watcher_reports_only_real_edits(self, tmp_path: Path) -> None:
+        data_dir, user_packs = self._setup_tree(tmp_path)
+        watcher = ContentPackWatcher(data_dir, user_packs)
+
+        assert not watcher.poll()
+
+        # Touching without editing is not a change
+        _bump_mtime(data_dir / "languages.json")
+        assert not watcher.poll()
+
+        _write_json(data_dir / "languages.json", {"languages": [_language("common", "Trade Common")]})
+        changes = watcher.poll()
+        assert changes.data_types == frozenset({"languages"})
+        assert not changes.metadata_changed
+
+        _write_pack_metadata(user_packs / "homebrew", "homebrew", ["srd"])
+        assert watcher.poll().metadata_changed
+
+    def test_repositories_to_reload_puts_dependencies_first(self) -> None:
+        assert repositories_to_reload(["languages"]) == ["language_repository", "monster_repository"]
+        assert repositories_to_reload(["magic_items"]) == ["item_repository"]
+        assert repositories_to_reload(["unknown"]) == []
+
+    def test_reload_swaps_base_and_scoped_repositories(self, tmp_path: Path) -> None:
+        data_dir, user_packs = self._setup_tree(tmp_path)
+        registry = ContentPackRegistry(PathResolver(tmp_path))
+        factory = RepositoryFactory(PathResolver(tmp_path), registry)
+        base_pack_ids = ["srd"]
+        base_languages = LanguageRepository(
+            PathResolver(tmp_path), content_pack_registry=registry, content_packs=base_pack_ids
+        )
+        reloader = ContentPackReloader(
+            watcher=ContentPackWatcher(data_dir, user_packs),
+            content_pack_registry=registry,
+            repository_factory=factory,
+            base_repositories={"language_repository": base_languages},
+            base_pack_ids=base_pack_ids,
+        )
+        notified: list[list[str]] = []
+        reloader.add_listener(lambda attrs: notified.append(list(attrs)))
+
+        self.game_state.content_packs = ["srd"]
+        scoped_languages = factory.get_language_repository_for(self.game_state)
+        assert base_languages.get_name("common") == "Common"
+        assert factory.get_name_index_for(self.game_state).get("languages", "common") == "Common"
+        assert reloader.check_for_changes() is None
+
+        _write_json(data_dir / "languages.json", {"languages": [_language("common", "Trade Common")]})
+        result = reloader.check_for_changes()
+
+        assert result is not None
+        assert result.data_types == ["languages"]
+        assert result.repositories == ["language_repository", "monster_repository"]
+        assert notified == [["language_repository", "monster_repository"]]
+        assert base_languages.get_name("common") == "Trade Common"
+        # Same repository object, new content
+        assert factory.get_language_repository_for(self.game_state) is scoped_languages
+        assert scoped_languages.get_name("common") == "Trade Common"
+        assert factory.get_name_index_for(self.game_state).get("languages", "common") == "Trade Common"
+
+    def test_new_pack_refreshes_registry_and_base_packs(self, tmp_path: Path) -> None:
+        data_dir, user_packs = self._setup_tree(tmp_path)
+        registry = ContentPackRegistry(PathResolver(tmp_path))
+        base_pack_ids = ["srd"]
+        base_languages = LanguageRepository(
+            PathResolver(tmp_path), content_pack_registry=registry, content_packs=base_pack_ids
+        )
+        reloader = ContentPackReloader(
+            watcher=ContentPackWatcher(data_dir, user_packs),
+            content_pack_registry=registry,
+            repository_factory=RepositoryFactory(PathResolver(tmp_path), registry),
+            base_repositories={"language_repository": base_languages},
+            base_pack_ids=base_pack_ids,
+        )
+        assert base_languages.list_keys() == ["common"]
+
+        _write_pack_metadata(user_packs / "homebrew", "homebrew", ["srd"])
+        _write_json(
+            user_packs / "homebrew" / "languages.json",
+            {"languages": [_language("sylvan-cant", "Sylvan Cant", "homebrew")]},
+        )
+        result = reloader.check_for_changes()
+
+        assert result is not None and result.packs_refreshed
+        assert base_pack_ids == ["srd", "homebrew"]
+        assert registry.get_pack("homebrew") is not None
+        assert base_languages.list_keys() == ["common", "sylvan-cant"]
+        assert base_languages.get_item_pack_id("sylvan-cant") == "homebrew"
@@ -0,0 +1,40 @@
+"""Unit tests for DataWarmup."""
+
+from __future__ import annotations
+
+import threading
+
+from app.services.data.warmup import DataWarmup
+
+
+class TestDataWarmup:
+    def test_runs_stages_in_order_and_reports_counts(self) -> None:
+        loaded: list[str] = []
+        lock = threading.Lock()
+
+        def task(name: str, count: int) -> int:
+            with lock:
+                loaded.append(name)
+            return count
+
+        stages = [
+            {"items": lambda: task("items", 3), "spells": lambda: task("spells", 2)},
+            {"scenarios": lambda: task("scenarios", 1)},
+        ]
+        results = DataWarmup(stages, max_workers=2).run()
+
+        assert [result.name for result in results] == ["items", "spells", "scenarios"]
+        assert [result.count for result in results] == [3, 2, 1]
+        assert all(result.ok and result.seconds >= 0 for result in results)
+        assert loaded[-1] == "scenarios"
+
+    def test_failures_are_reported_without_stopping_other_tasks(self) -> None:
+        def broken() -> int:
+            raise ValueError("bad pack")
+
+        results = DataWarmup([{"broken": broken, "fine": lambda: 5}]).run()
+
+        by_name = {result.name: result for result in results}
+        assert not by_name["broken"].ok
+        assert by_name["broken"].error == "ValueError: bad pack"
+        assert by_name["fine"].count == 5
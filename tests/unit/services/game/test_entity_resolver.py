@@ -0,0 +1,93 @@
+"""Unit tests for entity resolver utilities."""
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+
+from app.models.attributes import EntityType
+from app.models.game_state import GameState
+from app.models.state_revisions import StateSection
+from app.services.game import entity_resolver
+from app.services.game.entity_resolver import EntityResolver
+from tests.factories import make_game_state, make_monster_instance, make_npc_instance
+
+
+class TestEntityResolver:
+    def setup_method(self) -> None:
+        self.game_state = make_game_state()
+        self.npc = make_npc_instance(instance_id="npc-guardian")
+        self.monster = make_monster_instance(instance_id="wolf-alpha")
+        self.game_state.npcs.append(self.npc)
+        self.game_state.monsters.append(self.monster)
+        self.player_id = self.game_state.character.instance_id
+        self.resolver = EntityResolver()
+
+    def test_find_similar_entity_exact_and_fuzzy(self, caplog: LogCaptureFixture) -> None:
+        exact = self.resolver.find_similar_entity(self.game_state, EntityType.NPC, self.npc.instance_id)
+        assert exact is self.npc
+
+        caplog.set_level("WARNING", logger="app.services.game.entity_resolver")
+        fuzzy_id = self.npc.instance_id.replace("-", "")
+        fuzzy = self.resolver.find_similar_entity(self.game_state, EntityType.NPC, fuzzy_id)
+        assert fuzzy is self.npc
+        assert any("Fuzzy matched entity ID" in record.message for record in caplog.records)
+
+        player = self.resolver.find_similar_entity(self.game_state, EntityType.PLAYER, self.player_id)
+        assert player is self.game_state.character
+
+        monster = self.resolver.find_similar_entity(self.game_state, EntityType.MONSTER, self.monster.instance_id)
+        assert monster is self.monster
+
+        missing = self.resolver.find_similar_entity(self.game_state, EntityType.MONSTER, "unknown-target")
+        assert missing is None
+
+    def test_resolve_entity_variants(self, caplog: LogCaptureFixture) -> None:
+        monster = self.resolver.resolve_entity_with_fallback(
+            self.game_state,
+            entity_id=self.monster.instance_id,
+            entity_type=EntityType.MONSTER,
+        )
+        assert monster == (self.monster, EntityType.MONSTER)
+
+        missing = self.resolver.resolve_entity_with_fallback(
+            self.game_state,
+            entity_id="unknown",
+            entity_type=EntityType.NPC,
+        )
+        assert missing == (None, None)
+
+        caplog.set_level("WARNING", logger="app.services.game.entity_resolver")
+        npc_fuzzy = self.resolver.resolve_entity_with_fallback(self.game_state, entity_id=self.npc.instance_id.upper())
+        assert npc_fuzzy == (self.npc, EntityType.NPC)
+        assert any(self.npc.instance_id in record.message for record in caplog.records)
+
+        player = self.resolver.resolve_entity_with_fallback(self.game_state, entity_id="player")
+        assert player == (self.game_state.character, EntityType.PLAYER)
+
+    def test_fuzzy_index_follows_added_and_removed_instances(self) -> None:
+        assert self.resolver.find_similar_entity(self.game_state, EntityType.MONSTER, "wolf-alpah") is self.monster
+
+        self.game_state.monsters.remove(self.monster)
+        replacement = make_monster_instance(instance_id="wolf-omega")
+        self.game_state.monsters.append(replacement)
+        self.game_state.bump_revision(StateSection.MONSTERS)
+
+        assert self.resolver.find_similar_entity(self.game_state, EntityType.MONSTER, "wolf-alpah") is None
+        assert self.resolver.find_similar_entity(self.game_state, EntityType.MONSTER, "wolf-omegaa") is replacement
+
+    def test_index_is_resynced_only_when_instances_change(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        scans: list[EntityType] = []
+        instance_ids = entity_resolver._instance_ids
+
+        def counting_instance_ids(game_state: GameState, entity_type: EntityType) -> set[str]:
+            scans.append(entity_type)
+            return instance_ids(game_state, entity_type)
+
+        monkeypatch.setattr(entity_resolver, "_instance_ids", counting_instance_ids)
+        for _ in range(3):
+            assert self.resolver.find_similar_entity(self.game_state, EntityType.MONSTER, "wolf-alpah") is self.monster
+        assert scans == [EntityType.MONSTER]
+
+        self.game_state.monsters.append(make_monster_instance(instance_id="wolf-beta"))
+        self.game_state.bump_revision(StateSection.MONSTERS)
+        assert self.resolver.find_similar_entity(self.game_state, EntityType.MONSTER, "wolf-betta") is not None
+        assert scans == [EntityType.MONSTER, EntityType.MONSTER]
@@ -41,6 +41,7 @@ class TestItemManagerService:
     def test_create_placeholder_for_unknown_item(self) -> None:
         """Test creating a placeholder when item doesn't exist."""
         self.item_repository.validate_reference.return_value = False
+        self.item_repository.find_similar_keys.return_value = []
 
         result = self.item_manager_service.create_inventory_item(self.game_state, "mystery-token", quantity=1)
 
@@ -48,3 +49,24 @@ class TestItemManagerService:
         assert result.name == "Mystery Token"
         # Default type
         assert result.item_type == ItemType.ADVENTURING_GEAR
+
+    def test_misspelled_index_resolves_to_close_catalog_item(self) -> None:
+        """Test a near-miss index uses the existing catalog item instead of a placeholder."""
+        item_def = ItemDefinition(
+            index="potion-of-healing",
+            name="Potion of Healing",
+            type=ItemType.ADVENTURING_GEAR,
+            rarity=ItemRarity.COMMON,
+            description="Restores hit points",
+            weight=0.5,
+            value=50,
+            content_pack="core",
+        )
+        self.item_repository.validate_reference.side_effect = lambda key: key == "potion-of-healing"
+        self.item_repository.find_similar_keys.return_value = ["potion-of-healing"]
+        self.item_repository.get.return_value = item_def
+
+        result = self.item_manager_service.create_inventory_item(self.game_state, "potion-of-healng")
+
+        assert result.index == "potion-of-healing"
+        self.item_repository.get.assert_called_once_with("potion-of-healing")
@@ -13,6 +13,7 @@ from app.models.instances.scenario_instance import ScenarioInstance
 from app.models.location import DangerLevel, LocationConnection, LocationState
 from app.models.monster import MonsterSheet
 from app.models.scenario import LocationDescriptions, ScenarioMonster
+from app.services.game.entity_resolver import EntityResolver
 from app.services.game.location_service import LocationService
 from tests.factories import (
     make_character_instance,
@@ -46,7 +47,10 @@ class TestLocationService:
 
     def setup_method(self) -> None:
         self.monster_manager_service = _FakeMonsterManagerService(created=[])
-        self.service = LocationService(monster_manager_service=self.monster_manager_service)
+        self.service = LocationService(
+            monster_manager_service=self.monster_manager_service,
+            entity_resolver=EntityResolver(),
+        )
 
         self.character_sheet = make_character_sheet()
 
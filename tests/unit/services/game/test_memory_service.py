@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator, Sequence
 from typing import cast
 
@@ -12,9 +13,9 @@ from app.interfaces.agents.summarizer import ISummarizerAgent
 from app.models.ai_response import NarrativeResponse, StreamEvent, StreamEventType
 from app.models.game_state import GameState, Message, MessageRole
 from app.models.instances.npc_instance import NPCInstance
-from app.models.memory import MemoryEventKind, WorldEventContext
+from app.models.memory import LocationExitSummary, MemoryEventKind, NPCSessionSummary, WorldEventContext
 from app.services.game.memory_service import MemoryService
-from tests.factories import make_game_state, make_npc_instance
+from tests.factories import make_game_state, make_npc_instance, make_npc_sheet
 
 
 class _StubSummarizer:
@@ -45,6 +46,24 @@ class _StubSummarizer:
     ) -> str:
         return f"NPC summary for {npc.instance_id}"
 
+    async def summarize_location_exit(
+        self,
+        game_state: GameState,
+        location_id: str,
+        messages: Sequence[Message],
+        npc_messages: Sequence[tuple[NPCInstance, Sequence[Message]]],
+    ) -> LocationExitSummary:
+        return LocationExitSummary(
+            location_summary=await self.summarize_location_session(game_state, location_id, messages),
+            npc_summaries=[
+                NPCSessionSummary(
+                    npc_id=npc.instance_id,
+                    summary=await self.summarize_npc_interactions(game_state, npc, selection),
+                )
+                for npc, selection in npc_messages
+            ],
+        )
+
     async def summarize_world_update(
         self,
         game_state: GameState,
@@ -54,6 +73,15 @@ class _StubSummarizer:
     ) -> str:
         return f"World summary: {event_kind.value}"
 
+    async def summarize_history(
+        self,
+        game_state: GameState,
+        previous_summary: str,
+        messages: Sequence[Message],
+        max_tokens: int,
+    ) -> str:
+        return f"History summary of {len(messages)} messages"
+
     async def process(self, prompt: str, game_state: GameState, stream: bool = True) -> AsyncIterator[StreamEvent]:
         if game_state.game_id == "__noop__":
             yield StreamEvent(
@@ -87,6 +115,7 @@ async def test_memory_service_location_exit_creates_entries_and_updates_cursors(
 
     service = MemoryService(lambda: cast(ISummarizerAgent, _StubSummarizer()))
     await service.on_location_exit(game_state)
+    await service.wait_for_pending()
 
     location_id = game_state.scenario_instance.current_location_id
     location_state = game_state.get_location_state(location_id)
@@ -122,6 +151,7 @@ async def test_memory_service_npc_entries_only_for_present_and_mentioned() -> No
 
     service = MemoryService(lambda: cast(ISummarizerAgent, _StubSummarizer()))
     await service.on_location_exit(game_state)
+    await service.wait_for_pending()
 
     assert present_npc.npc_memories
     assert absent_npc.npc_memories == []
@@ -145,6 +175,7 @@ async def test_memory_service_world_event_creates_world_memory() -> None:
         event_kind=MemoryEventKind.ENCOUNTER_COMPLETED,
         context=WorldEventContext(encounter_id="rescue-mission"),
     )
+    await service.wait_for_pending(game_state.game_id)
 
     world_memories = game_state.scenario_instance.world_memories
     assert len(world_memories) == 1
@@ -152,3 +183,117 @@ async def test_memory_service_world_event_creates_world_memory() -> None:
     assert entry.summary == f"World summary: {MemoryEventKind.ENCOUNTER_COMPLETED.value}"
     assert entry.encounter_id == "rescue-mission"
     assert game_state.scenario_instance.last_world_message_index == len(game_state.conversation_history) - 1
+
+
+class _GatedSummarizer(_StubSummarizer):
+    """Summarizer whose location-exit calls block until released."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.exit_calls: list[tuple[list[str], list[str]]] = []
+
+    async def summarize_location_exit(
+        self,
+        game_state: GameState,
+        location_id: str,
+        messages: Sequence[Message],
+        npc_messages: Sequence[tuple[NPCInstance, Sequence[Message]]],
+    ) -> LocationExitSummary:
+        self.exit_calls.append(([msg.content for msg in messages], [npc.instance_id for npc, _ in npc_messages]))
+        await self.release.wait()
+        return await super().summarize_location_exit(game_state, location_id, messages, npc_messages)
+
+
+def _game_with_two_npcs() -> tuple[GameState, list[NPCInstance]]:
+    game_state = make_game_state(location_id="tavern", location_name="Tavern")
+    location_id = game_state.scenario_instance.current_location_id
+    npcs = [
+        make_npc_instance(
+            npc_sheet=make_npc_sheet(npc_id="mira", display_name="Mira"),
+            instance_id="npc-1",
+            current_location_id=location_id,
+        ),
+        make_npc_instance(
+            npc_sheet=make_npc_sheet(npc_id="bram", display_name="Bram"),
+            instance_id="npc-2",
+            current_location_id=location_id,
+        ),
+    ]
+    game_state.npcs.extend(npcs)
+    game_state.conversation_history.append(
+        Message(
+            role=MessageRole.DM,
+            content="Mira and Bram argue over the last ale.",
+            location=game_state.location,
+            npcs_mentioned=["Mira", "Bram"],
+        )
+    )
+    return game_state, npcs
+
+
+@pytest.mark.asyncio
+async def test_memory_service_location_exit_summarizes_in_background() -> None:
+    game_state, npcs = _game_with_two_npcs()
+    summarizer = _GatedSummarizer()
+    service = MemoryService(lambda: cast(ISummarizerAgent, summarizer))
+
+    await service.on_location_exit(game_state)
+    # Messages added after the exit belong to the next location session
+    game_state.conversation_history.append(
+        Message(role=MessageRole.DM, content="Later.", location=game_state.location, npcs_mentioned=["Mira"])
+    )
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    location_id = game_state.scenario_instance.current_location_id
+    assert game_state.get_location_state(location_id).location_memories == []
+    # The location and both NPCs are summarized in one call, without the later message
+    assert summarizer.exit_calls == [(["Mira and Bram argue over the last ale."], ["npc-1", "npc-2"])]
+
+    summarizer.release.set()
+    await service.wait_for_pending()
+
+    assert len(game_state.get_location_state(location_id).location_memories) == 1
+    assert game_state.scenario_instance.last_location_message_index[location_id] == 0
+    assert [len(npc.npc_memories) for npc in npcs] == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_memory_service_repeated_exit_is_applied_once() -> None:
+    game_state, npcs = _game_with_two_npcs()
+    service = MemoryService(lambda: cast(ISummarizerAgent, _StubSummarizer()))
+
+    await service.on_location_exit(game_state)
+    await service.on_location_exit(game_state)
+    await service.wait_for_pending(game_state.game_id)
+
+    location_id = game_state.scenario_instance.current_location_id
+    assert len(game_state.get_location_state(location_id).location_memories) == 1
+    assert [len(npc.npc_memories) for npc in npcs] == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_memory_service_saves_games_when_captures_apply() -> None:
+    game_state = make_game_state(location_id="keep", location_name="Stormkeep")
+    saves: list[int] = []
+
+    def save_game(state: GameState) -> None:
+        if not saves:
+            saves.append(-1)
+            raise OSError("disk full")
+        saves.append(len(state.scenario_instance.world_memories))
+
+    service = MemoryService(lambda: cast(ISummarizerAgent, _StubSummarizer()), save_game)
+    await service.on_world_event(game_state, event_kind=MemoryEventKind.ENCOUNTER_COMPLETED)
+    await service.wait_for_pending()
+    # Nothing to summarize, nothing applied, nothing saved
+    assert saves == []
+
+    game_state.conversation_history.append(
+        Message(role=MessageRole.PLAYER, content="We raise the banner.", location=game_state.location)
+    )
+    await service.on_world_event(game_state, event_kind=MemoryEventKind.ENCOUNTER_COMPLETED)
+    await service.wait_for_pending()
+
+    # The failed save after the capture is retried once the queue is drained
+    assert saves == [-1, 1]
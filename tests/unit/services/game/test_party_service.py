@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from app.models.npc import NPCImportance
+from app.models.state_revisions import StateSection
 from app.services.game.party_service import PartyService
 from tests.factories import make_game_state, make_npc_instance, make_npc_sheet
 
@@ -47,10 +48,13 @@ class TestPartyService:
         self.game_state.npcs.append(self.minor_npc)
 
     def test_add_member_succeeds_for_major_npc_at_same_location(self) -> None:
+        party_revision = self.game_state.revisions.get(StateSection.PARTY)
+
         self.service.add_member(self.game_state, self.major_npc.instance_id)
 
         assert self.game_state.party.has_member(self.major_npc.instance_id)
         assert len(self.game_state.party.member_ids) == 1
+        assert self.game_state.revisions.get(StateSection.PARTY) > party_revision
 
     def test_add_member_rejects_minor_npc(self) -> None:
         with pytest.raises(ValueError, match="Only major NPCs can join the party"):
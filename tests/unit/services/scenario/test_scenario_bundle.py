@@ -0,0 +1,116 @@
+"""Unit tests for compiled scenario bundles."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from app.models.scenario import ScenarioSheet
+from app.services.common.path_resolver import PathResolver
+from app.services.data.loaders.scenario_loader import ScenarioLoader
+from app.services.scenario.scenario_bundle import ScenarioBundleStore
+
+SOURCE_SCENARIO = Path(__file__).parents[4] / "data" / "scenarios" / "goblin-cave-adventure"
+
+
+class CountingLoader(ScenarioLoader):
+    def __init__(self, path_resolver: PathResolver) -> None:
+        super().__init__(path_resolver)
+        self.loads = 0
+
+    def load(self, path: Path) -> ScenarioSheet:
+        self.loads += 1
+        return super().load(path)
+
+
+class TestScenarioBundleStore:
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path: Path) -> None:
+        self.scenario_dir = tmp_path / "data" / "scenarios" / SOURCE_SCENARIO.name
+        shutil.copytree(SOURCE_SCENARIO, self.scenario_dir)
+        self.bundle_dir = tmp_path / "bundles"
+        self.path_resolver = PathResolver(tmp_path)
+        self.rebuilt: list[ScenarioSheet] = []
+
+    def _store(self) -> tuple[ScenarioBundleStore, CountingLoader]:
+        loader = CountingLoader(self.path_resolver)
+        return ScenarioBundleStore(self.bundle_dir, loader), loader
+
+    def _bundle_path(self) -> Path:
+        return self.bundle_dir / f"{SOURCE_SCENARIO.name}.bundle.json"
+
+    def _edit_scenario(self, **changes: Any) -> None:
+        path = self.scenario_dir / "scenario.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data.update(changes)
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    def test_fresh_bundle_skips_source_assembly(self) -> None:
+        store, loader = self._store()
+        built = store.load(self.scenario_dir, self.rebuilt.append)
+        assert loader.loads == 1
+        assert self._bundle_path().exists()
+
+        store, loader = self._store()
+        # Touching a source without editing it keeps the bundle fresh
+        location = self.scenario_dir / "locations" / "tavern.json"
+        stat = location.stat()
+        os.utime(location, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        loaded = store.load(self.scenario_dir, self.rebuilt.append)
+        store.wait_for_rebuilds()
+
+        assert loader.loads == 0
+        assert loaded == built
+        assert self.rebuilt == []
+        # The touched file's new mtime is recorded, so it is not re-hashed on the next start
+        manifest = json.loads(self._bundle_path().read_text(encoding="utf-8"))["manifest"]
+        assert manifest["files"]["locations/tavern.json"][1] == location.stat().st_mtime_ns
+
+    def test_invalid_bundle_is_rebuilt_from_source(self) -> None:
+        store, _ = self._store()
+        built = store.load(self.scenario_dir, self.rebuilt.append)
+        bundle = json.loads(self._bundle_path().read_text(encoding="utf-8"))
+        bundle["scenario"] = {"title": "From an older ScenarioSheet"}
+        self._bundle_path().write_text(json.dumps(bundle), encoding="utf-8")
+
+        store, loader = self._store()
+        loaded = store.load(self.scenario_dir, self.rebuilt.append)
+
+        assert loaded == built
+        assert loader.loads == 1
+        assert json.loads(self._bundle_path().read_text(encoding="utf-8"))["scenario"]["title"] == built.title
+
+    def test_stale_bundle_is_served_then_rebuilt_in_background(self) -> None:
+        store, _ = self._store()
+        original = store.load(self.scenario_dir, self.rebuilt.append)
+
+        self._edit_scenario(title="The Goblin Cave, Revised")
+        store, loader = self._store()
+        served = store.load(self.scenario_dir, self.rebuilt.append)
+        store.wait_for_rebuilds()
+
+        assert served.title == original.title
+        assert loader.loads == 1
+        assert [scenario.title for scenario in self.rebuilt] == ["The Goblin Cave, Revised"]
+
+        store, loader = self._store()
+        assert store.load(self.scenario_dir, self.rebuilt.append).title == "The Goblin Cave, Revised"
+        store.wait_for_rebuilds()
+        assert loader.loads == 0
+
+    def test_failed_background_rebuild_keeps_previous_bundle(self) -> None:
+        store, _ = self._store()
+        original = store.load(self.scenario_dir, self.rebuilt.append)
+
+        (self.scenario_dir / "scenario.json").write_text("{broken", encoding="utf-8")
+        store, _ = self._store()
+        served = store.load(self.scenario_dir, self.rebuilt.append)
+        store.wait_for_rebuilds()
+
+        assert served == original
+        assert self.rebuilt == []
@@ -0,0 +1,76 @@
+"""Unit tests for ScenarioService sheet caching."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from unittest.mock import create_autospec
+
+import pytest
+
+from app.interfaces.services.character import ICharacterService
+from app.interfaces.services.data import ILoader
+from app.models.scenario import ScenarioSheet
+from app.services.common.path_resolver import PathResolver
+from app.services.scenario.scenario_service import ScenarioService
+
+SOURCE_SCENARIO = Path(__file__).parents[4] / "data" / "scenarios" / "goblin-cave-adventure"
+SCENARIO_ID = "test-scenario"
+
+
+class TestScenarioServiceSheetCache:
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path: Path) -> None:
+        scenario_dir = tmp_path / "data" / "scenarios" / SCENARIO_ID
+        (scenario_dir / "npcs").mkdir(parents=True)
+        (scenario_dir / "monsters").mkdir()
+        shutil.copy(SOURCE_SCENARIO / "npcs" / "barkeep-tom.json", scenario_dir / "npcs")
+        (scenario_dir / "npcs" / "broken.json").write_text("{not json", encoding="utf-8")
+        shutil.copy(SOURCE_SCENARIO / "monsters" / "goblin-boss.json", scenario_dir / "monsters")
+
+        self.scenario_dir = scenario_dir
+        self.character_service = create_autospec(ICharacterService, instance=True)
+        self.character_service.validate_character_references.return_value = []
+        self.service = ScenarioService(
+            path_resolver=PathResolver(tmp_path),
+            scenario_loader=create_autospec(ILoader[ScenarioSheet], instance=True),
+            character_service=self.character_service,
+        )
+
+    def test_npcs_are_parsed_and_validated_once(self) -> None:
+        first = self.service.get_scenario_npc(SCENARIO_ID, "barkeep-tom")
+        (self.scenario_dir / "npcs" / "barkeep-tom.json").unlink()
+        second = self.service.get_scenario_npc(SCENARIO_ID, "barkeep-tom")
+        listed = self.service.list_scenario_npcs(SCENARIO_ID)
+
+        assert first is not None and second is not None
+        assert [npc.id for npc in listed] == [first.id]
+        assert self.character_service.validate_character_references.call_count == 1
+        assert self.service.get_scenario_npc(SCENARIO_ID, "unknown") is None
+
+    def test_returned_sheets_are_independent_copies(self) -> None:
+        npc = self.service.get_scenario_npc(SCENARIO_ID, "barkeep-tom")
+        monster = self.service.get_scenario_monster(SCENARIO_ID, "goblin-boss")
+        assert npc is not None and monster is not None
+        original_name = monster.name
+
+        npc.character.name = "Renamed"
+        monster.name = "Renamed"
+
+        refreshed_npc = self.service.get_scenario_npc(SCENARIO_ID, "barkeep-tom")
+        refreshed_monster = self.service.get_scenario_monster(SCENARIO_ID, "goblin-boss")
+        assert refreshed_npc is not None and refreshed_npc.character.name != "Renamed"
+        assert refreshed_monster is not None and refreshed_monster.name == original_name
+
+    def test_invalid_npc_failure_is_memoized(self) -> None:
+        with pytest.raises(ValueError, match="broken"):
+            self.service.get_scenario_npc(SCENARIO_ID, "broken")
+        (self.scenario_dir / "npcs" / "broken.json").unlink()
+        with pytest.raises(ValueError, match="broken"):
+            self.service.get_scenario_npc(SCENARIO_ID, "broken")
+
+    def test_monsters_are_read_once(self) -> None:
+        assert self.service.get_scenario_monster(SCENARIO_ID, "goblin-boss") is not None
+        (self.scenario_dir / "monsters" / "goblin-boss.json").unlink()
+        assert self.service.get_scenario_monster(SCENARIO_ID, "goblin-boss") is not None
+        assert self.service.get_scenario_monster(SCENARIO_ID, "missing") is None
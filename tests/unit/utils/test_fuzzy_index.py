@@ -0,0 +1,46 @@
+"""Unit tests for the trigram fuzzy index."""
+
+import random
+from difflib import SequenceMatcher
+
+from app.utils import fuzzy_index
+from app.utils.fuzzy_index import FuzzyIndex
+
+
+class TestFuzzyIndex:
+    def test_search_ranks_closest_keys_first(self) -> None:
+        index = FuzzyIndex(["potion-of-healing", "potion-of-heroism", "longsword", "shortsword"])
+
+        matches = index.search("potion-of-healng", limit=2)
+
+        assert [match.key for match in matches] == ["potion-of-healing", "potion-of-heroism"]
+        assert matches[0].score > 0.9
+
+    def test_threshold_and_unrelated_queries(self) -> None:
+        index = FuzzyIndex(["goblin", "hobgoblin"])
+
+        assert index.search("xyz") == []
+        assert [match.key for match in index.search("GOBLIN", threshold=0.85)] == ["goblin"]
+
+    def test_incremental_add_and_discard(self) -> None:
+        index = FuzzyIndex(["wolf-alpha"])
+        index.add("wolf-beta")
+        index.add("wolf-beta")
+        assert len(index) == 2
+
+        index.discard("wolf-alpha")
+        index.discard("missing")
+
+        assert "wolf-alpha" not in index
+        assert [match.key for match in index.search("wolf-alpa")] == ["wolf-beta"]
+
+    def test_small_candidate_sets_match_difflib_best(self) -> None:
+        words = ["goblin", "wolf", "orc", "bandit", "skeleton", "zombie", "guard", "archer", "shaman", "chief"]
+        rng = random.Random(3)
+        keys = {f"{rng.choice(words)}-{rng.choice(words)}-{rng.randint(1, 40)}" for _ in range(150)}
+        assert len(keys) <= fuzzy_index._FULL_SCORING_CANDIDATES
+        index = FuzzyIndex(keys)
+
+        for query in ["bandit", "gob-chief", "skeleton-archer-12", "wolf-goblin-3"]:
+            best = max(SequenceMatcher(None, query, key).ratio() for key in keys)
+            assert index.search(query, limit=1)[0].score == best
@@ -0,0 +1,18 @@
+"""Tests for the local token estimator."""
+
+from app.utils.token_estimator import estimate_tokens
+
+
+def test_empty_text_costs_nothing() -> None:
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("  \n\t") == 0
+
+
+def test_words_and_punctuation() -> None:
+    # "Fireball" -> 2, "(Lvl" -> 1 + 1, "3" -> 1, ")" -> 1, ":" -> 1
+    assert estimate_tokens("Fireball (Lvl 3):") == 7
+
+
+def test_estimate_grows_with_text() -> None:
+    short = "The goblin attacks."
+    assert estimate_tokens(short * 10) > estimate_tokens(short)